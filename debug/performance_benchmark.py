@@ -49,6 +49,7 @@ from typing import Any
 from lift_sys.codegen.xgrammar_generator import XGrammarCodeGenerator
 from lift_sys.ir.models import IntermediateRepresentation
 from lift_sys.ir.schema import IR_JSON_SCHEMA
+from lift_sys.providers.caching import CacheMode, CachingProvider, DiskResponseStore
 from lift_sys.providers.modal_provider import ModalProvider
 
 
@@ -926,6 +927,10 @@ Examples:
 
   # Run with custom warmup runs
   python performance_benchmark.py --parallel --warmup-runs 2
+
+  # Record responses once, then replay them offline
+  python performance_benchmark.py --cache-dir .cache/llm --cache-mode record
+  python performance_benchmark.py --cache-dir .cache/llm --cache-mode replay
         """,
     )
 
@@ -963,6 +968,18 @@ Examples:
         action="store_true",
         help="Disable cost estimation",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache provider responses in this directory (default: no caching)",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=[mode.value for mode in CacheMode],
+        default=CacheMode.READ_WRITE.value,
+        help="read_write, record, or replay (offline, no provider calls) (default: read_write)",
+    )
 
     args = parser.parse_args()
 
@@ -978,10 +995,14 @@ Examples:
     print(f"Suite:        {args.suite} ({len(test_cases)} tests)")
     print(f"Warmup Runs:  {args.warmup_runs}")
     print(f"Output Dir:   {args.output_dir}")
+    if args.cache_dir:
+        print(f"Cache:        {args.cache_dir} ({args.cache_mode})")
     print(f"{'=' * 60}\n")
 
     # Initialize provider (Modal)
     provider = ModalProvider(endpoint_url="https://rand--generate.modal.run")
+    if args.cache_dir:
+        provider = CachingProvider(provider, DiskResponseStore(args.cache_dir), args.cache_mode)
     await provider.initialize(credentials={})  # No credentials needed for Modal
 
     if args.parallel:
@@ -1008,6 +1029,8 @@ Examples:
         )
 
     print("\n✓ Benchmark complete!")
+    if args.cache_dir:
+        print(f"✓ Response cache: {provider.cache_stats()}")
     print(f"✓ Results in: {args.output_dir}/")
 
 
@@ -11,6 +11,7 @@ from enum import Enum
 from typing import Any
 
 from ..ir.models import IntermediateRepresentation, Parameter
+from ..ir.view import IRView
 
 
 class SuggestionCategory(str, Enum):
@@ -97,12 +98,13 @@ class AgentAdvisor:
             "*",
         ]
 
-    def analyze(self, ir: IntermediateRepresentation) -> AnalysisReport:
+    def analyze(self, ir: IntermediateRepresentation | IRView) -> AnalysisReport:
         """
         Perform comprehensive analysis of an IR.
 
         Args:
-            ir: The intermediate representation to analyze
+            ir: The intermediate representation to analyze (a read-only
+                IRView works as well, so serialized IRs need not be decoded)
 
         Returns:
             Complete analysis report with suggestions
@@ -0,0 +1,24 @@
+"""Prometheus metrics endpoint."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ...providers.telemetry import TELEMETRY
+
+router = APIRouter(tags=["system"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Provider call telemetry and HTTP connection metrics for Prometheus."""
+    return PlainTextResponse(TELEMETRY.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/api/metrics/providers")
+async def provider_metrics() -> dict[str, dict[str, object]]:
+    """Provider call telemetry with latency percentiles, as JSON."""
+    return TELEMETRY.summary()
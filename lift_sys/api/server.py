@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Any
 
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from ..auth.oauth_manager import OAuthManager
@@ -24,11 +24,14 @@ from ..codegen import CodeGenerator, CodeGeneratorConfig
 from ..forward_mode.synthesizer import CodeSynthesizer, SynthesizerConfig
 from ..ir.models import IntermediateRepresentation
 from ..ir.parser import IRParser
+from ..ir.view import IRView
 from ..planner.planner import Planner
 from ..providers import (
     AnthropicProvider,
     BaseProvider,
     GeminiProvider,
+    HedgedProvider,
+    KeepWarmProvider,
     LocalVLLMProvider,
     ModalProvider,
     OpenAIProvider,
@@ -41,6 +44,7 @@ from ..services.github_repository import (
     RepositoryAccessError,
     RepositoryMetadata,
 )
+from ..services.http_pool import get_http_pool
 from ..services.orchestrator import HybridOrchestrator
 from ..services.reasoning_service import ReasoningService
 from ..services.verification_service import VerificationService
@@ -49,12 +53,14 @@ from ..spec_sessions import (
     PromptToIRTranslator,
     SpecSessionManager,
 )
+from ..verifier import BatchSMTVerifier
 from .auth import AuthenticatedUser, configure_auth, require_authenticated_user
 from .middleware.rate_limiting import rate_limiter
 from .routes import auth as auth_routes
 from .routes import generate as generate_routes
 from .routes import health as health_routes
 from .routes import ics as ics_routes
+from .routes import metrics as metrics_routes
 from .routes import providers as provider_routes
 from .schemas import (
     AnalysisResponse,
@@ -121,6 +127,7 @@ app.include_router(auth_routes.router)
 app.include_router(provider_routes.router)
 app.include_router(generate_routes.router)
 app.include_router(ics_routes.router)
+app.include_router(metrics_routes.router)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -142,6 +149,9 @@ class AppState:
         self.translator: PromptToIRTranslator | None = None
         self.session_manager: SpecSessionManager | None = None
 
+        # Out-of-process SMT workers (started lazily on first verification)
+        self.smt_verifier = BatchSMTVerifier()
+
         self.progress_log.append(
             {
                 "type": "status",
@@ -184,6 +194,7 @@ class AppState:
             store=self.session_store,
             translator=self.translator,
             planner=self.planner,
+            batch_verifier=self.smt_verifier,
         )
 
     def reset(self) -> None:
@@ -195,6 +206,9 @@ class AppState:
         # Store progress subscribers to preserve them
         old_subscribers = self._progress_subscribers.copy()
 
+        # Stop SMT worker processes before they are replaced
+        self.smt_verifier.close()
+
         # Reinitialize everything
         self.__init__()
 
@@ -341,13 +355,39 @@ async def lifespan(app: FastAPI):
     modal_endpoint_url = os.getenv("MODAL_ENDPOINT_URL")
     if modal_endpoint_url:
         try:
-            modal_provider = ModalProvider(endpoint_url=modal_endpoint_url)
+            modal_provider = ModalProvider(
+                endpoint_url=modal_endpoint_url, stream_url=os.getenv("MODAL_STREAM_URL")
+            )
             await modal_provider.initialize({})
             providers["modal"] = modal_provider
             LOGGER.info(f"Initialized Modal provider with endpoint: {modal_endpoint_url}")
         except Exception as e:
             LOGGER.warning(f"Failed to initialize Modal provider: {e}")
 
+    # Keep Modal warm ahead of demand, e.g. LIFT_SYS_MODAL_KEEP_WARM=anthropic; the value
+    # names the provider that serves requests while Modal is cold ("1": wait for Modal)
+    keep_warm: KeepWarmProvider | None = None
+    keep_warm_fallback = os.getenv("LIFT_SYS_MODAL_KEEP_WARM", "")
+    if keep_warm_fallback and "modal" in providers:
+        keep_warm = KeepWarmProvider(
+            providers["modal"],
+            fallback=providers.get(keep_warm_fallback),
+            scaledown_window=float(os.getenv("LIFT_SYS_MODAL_SCALEDOWN_WINDOW", "120")),
+        )
+        providers["modal"] = keep_warm
+        keep_warm.start()
+        LOGGER.info("Keeping Modal warm (fallback: %s)", keep_warm_fallback)
+
+    # Hedge forward-mode requests across backends, e.g. LIFT_SYS_HEDGED_PROVIDERS=modal,anthropic
+    hedged_names = [
+        name.strip()
+        for name in os.getenv("LIFT_SYS_HEDGED_PROVIDERS", "").split(",")
+        if name.strip() in providers
+    ]
+    if len(hedged_names) > 1:
+        providers["hedged"] = HedgedProvider([providers[name] for name in hedged_names])
+        LOGGER.info("Hedging forward-mode requests across: %s", ", ".join(hedged_names))
+
     local_provider = LocalVLLMProvider(
         structured_runner=_echo_structured_runner,
         text_runner=_echo_text_runner,
@@ -387,7 +427,11 @@ async def lifespan(app: FastAPI):
 
     yield  # App runs during this yield
 
-    # Shutdown (add cleanup code here if needed in future)
+    # Shutdown
+    STATE.smt_verifier.close()
+    if keep_warm is not None:
+        await keep_warm.stop()
+    await get_http_pool().aclose()
 
 
 # Assign lifespan to app router
@@ -497,6 +541,52 @@ async def open_repository(
     return RepoOpenResponse(status="ready", repository=_metadata_to_schema(metadata))
 
 
+async def _verify_lifted_irs(irs: list[IntermediateRepresentation]) -> None:
+    """SMT-check every lifted IR with assertions on the worker pool, streaming progress."""
+    verifiable = [ir for ir in irs if ir.assertions]
+    if not verifiable:
+        return
+
+    await STATE.publish_progress(
+        {
+            "type": "progress",
+            "scope": "reverse",
+            "stage": "smt_verification",
+            "status": "running",
+            "message": f"Verifying invariants for {len(verifiable)} IR(s)",
+        }
+    )
+    counts: dict[str, int] = {}
+    completed = 0
+    async for outcome in STATE.smt_verifier.averify_iter(verifiable):
+        completed += 1
+        counts[outcome.status] = counts.get(outcome.status, 0) + 1
+        await STATE.publish_progress(
+            {
+                "type": "progress",
+                "scope": "reverse",
+                "stage": "smt_verification",
+                "status": "running",
+                "message": (
+                    f"Verified {verifiable[outcome.index].signature.name}: {outcome.status}"
+                ),
+                "current": completed,
+                "total": len(verifiable),
+            }
+        )
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    await STATE.publish_progress(
+        {
+            "type": "progress",
+            "scope": "reverse",
+            "stage": "smt_verification",
+            "status": "completed",
+            "message": f"SMT verification complete ({summary})",
+            "results": counts,
+        }
+    )
+
+
 @app.post("/api/reverse", response_model=IRResponse)
 async def reverse(
     request: ReverseRequest, user: AuthenticatedUser = Depends(require_authenticated_user)
@@ -615,6 +705,7 @@ async def reverse(
             "message": "Candidate invariants inferred",
         }
     )
+    await _verify_lifted_irs(irs)
     await STATE.publish_progress(
         {
             "type": "progress",
@@ -847,7 +938,7 @@ async def create_session(
     if not STATE.session_manager:
         # Get provider from app state - prefer Modal for constrained IR generation
         providers = getattr(app.state, "providers", {})
-        provider = providers.get("modal") or providers.get("anthropic")
+        provider = providers.get("hedged") or providers.get("modal") or providers.get("anthropic")
         STATE.set_config(ConfigRequest(model_endpoint="http://localhost:8001"), provider=provider)
 
     assert STATE.session_manager
@@ -988,14 +1079,16 @@ async def import_reverse_ir(
 
 @app.get("/api/spec-sessions", response_model=SessionListResponse)
 async def list_sessions(
+    limit: int | None = Query(default=None, ge=1),
+    offset: int = Query(default=0, ge=0),
     user: AuthenticatedUser = Depends(require_authenticated_user),
 ) -> SessionListResponse:
-    """List all active sessions."""
+    """List active sessions, most recently updated first."""
     LOGGER.debug("%s listed spec sessions", user.id)
     if not STATE.session_manager:
         return SessionListResponse(sessions=[])
 
-    sessions = STATE.session_manager.list_active_sessions()
+    sessions = STATE.session_manager.list_session_summaries(limit=limit, offset=offset)
 
     return SessionListResponse(
         sessions=[
@@ -1007,7 +1100,7 @@ async def list_sessions(
                 updated_at=s.updated_at,
                 current_draft=s.current_draft.to_dict() if s.current_draft else None,
                 ambiguities=s.get_unresolved_holes(),
-                revision_count=len(s.revisions),
+                revision_count=s.revision_count,
                 metadata=s.metadata,
             )
             for s in sessions
@@ -1055,7 +1148,7 @@ async def resolve_hole(
         raise HTTPException(status_code=404, detail="Session manager not initialized")
 
     try:
-        session = STATE.session_manager.apply_resolution(
+        session = await STATE.session_manager.apply_resolution(
             session_id=session_id,
             hole_id=hole_id,
             resolution_text=request.resolution_text,
@@ -1102,7 +1195,7 @@ async def finalize_session(
         raise HTTPException(status_code=404, detail="Session manager not initialized")
 
     try:
-        ir = STATE.session_manager.finalize(session_id)
+        ir = await STATE.session_manager.finalize(session_id)
 
         # Emit finalization event
         await STATE.publish_progress(
@@ -1487,12 +1580,12 @@ async def rollback_to_version(
         raise HTTPException(status_code=500, detail=f"Rollback failed: {str(e)}")
 
 
-def _analyze_provenance(ir: IntermediateRepresentation) -> dict[str, int]:
+def _analyze_provenance(ir: IntermediateRepresentation | IRView) -> dict[str, int]:
     """
     Analyze provenance sources in an IR and return counts.
 
     Args:
-        ir: The intermediate representation to analyze
+        ir: The intermediate representation (or read-only IRView) to analyze
 
     Returns:
         Dictionary mapping provenance sources to counts
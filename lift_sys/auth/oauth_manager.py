@@ -11,6 +11,7 @@ from urllib.parse import urlencode
 
 import httpx
 
+from ..services.http_pool import get_http_pool
 from .provider_configs import OAuthClientConfig
 from .token_store import TokenStore
 
@@ -109,7 +110,7 @@ class OAuthManager:
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._http_client = get_http_pool().create_async_client()
         return self._http_client
 
     async def aclose(self) -> None:
@@ -5,12 +5,15 @@ Provides both synchronous and asynchronous interfaces for programmatic use.
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from ..services.http_pool import get_http_pool
+
 
 @dataclass
 class IRDraft:
@@ -164,14 +167,18 @@ class SessionClient:
     Supports both sync and async operations. Use async methods for
     concurrent operations or integration with async frameworks.
 
+    The client keeps its HTTP connections open between calls, so batch
+    operations pay for connection setup once. Close it with ``close()`` /
+    ``aclose()`` or use it as a (async) context manager.
+
     Example (sync):
         >>> client = SessionClient("http://localhost:8000")
         >>> session = client.create_session(prompt="A function that adds two numbers")
         >>> print(session.session_id)
 
     Example (async):
-        >>> client = SessionClient("http://localhost:8000")
-        >>> session = await client.acreate_session(prompt="A function that adds")
+        >>> async with SessionClient("http://localhost:8000") as client:
+        ...     session = await client.acreate_session(prompt="A function that adds")
     """
 
     def __init__(
@@ -203,6 +210,56 @@ class SessionClient:
 
         self.timeout = timeout
 
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
+    def _http(self) -> httpx.Client:
+        """Persistent sync HTTP client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = get_http_pool().create_client()
+        return self._client
+
+    def _ahttp(self) -> httpx.AsyncClient:
+        """Persistent async HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_client is None
+            or self._async_client.is_closed
+            or self._async_loop is not loop
+        ):
+            # Connections cannot move between event loops; a client left on a
+            # finished loop (e.g. a previous asyncio.run) is dropped
+            self._async_client = get_http_pool().create_async_client()
+            self._async_loop = loop
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the sync HTTP connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections."""
+        if self._async_client is not None and self._async_loop is asyncio.get_running_loop():
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_loop = None
+        self.close()
+
+    def __enter__(self) -> SessionClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> SessionClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     # Synchronous methods
 
     def create_session(
@@ -227,7 +284,7 @@ class SessionClient:
             httpx.HTTPError: If request fails
         """
         request = CreateSessionRequest(prompt=prompt, ir=ir, source=source, metadata=metadata)
-        response = httpx.post(
+        response = self._http().post(
             f"{self.base_url}/spec-sessions",
             json=request.to_dict(),
             headers=self.headers,
@@ -245,7 +302,7 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        response = httpx.get(
+        response = self._http().get(
             f"{self.base_url}/spec-sessions",
             headers=self.headers,
             timeout=self.timeout,
@@ -265,7 +322,7 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails or session not found
         """
-        response = httpx.get(
+        response = self._http().get(
             f"{self.base_url}/spec-sessions/{session_id}",
             headers=self.headers,
             timeout=self.timeout,
@@ -297,7 +354,7 @@ class SessionClient:
         request = ResolveHoleRequest(
             resolution_text=resolution_text, resolution_type=resolution_type
         )
-        response = httpx.post(
+        response = self._http().post(
             f"{self.base_url}/spec-sessions/{session_id}/holes/{hole_id}/resolve",
             json=request.to_dict(),
             headers=self.headers,
@@ -318,7 +375,7 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails or session has unresolved holes
         """
-        response = httpx.post(
+        response = self._http().post(
             f"{self.base_url}/spec-sessions/{session_id}/finalize",
             headers=self.headers,
             timeout=self.timeout,
@@ -339,7 +396,7 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        response = httpx.get(
+        response = self._http().get(
             f"{self.base_url}/spec-sessions/{session_id}/assists",
             headers=self.headers,
             timeout=self.timeout,
@@ -356,7 +413,7 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        response = httpx.delete(
+        response = self._http().delete(
             f"{self.base_url}/spec-sessions/{session_id}",
             headers=self.headers,
             timeout=self.timeout,
@@ -387,15 +444,14 @@ class SessionClient:
             httpx.HTTPError: If request fails
         """
         request = CreateSessionRequest(prompt=prompt, ir=ir, source=source, metadata=metadata)
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/spec-sessions",
-                json=request.to_dict(),
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return PromptSession.from_dict(response.json())
+        response = await self._ahttp().post(
+            f"{self.base_url}/spec-sessions",
+            json=request.to_dict(),
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return PromptSession.from_dict(response.json())
 
     async def alist_sessions(self) -> SessionListResponse:
         """List all active sessions (async).
@@ -406,14 +462,13 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/spec-sessions",
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return SessionListResponse.from_dict(response.json())
+        response = await self._ahttp().get(
+            f"{self.base_url}/spec-sessions",
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return SessionListResponse.from_dict(response.json())
 
     async def aget_session(self, session_id: str) -> PromptSession:
         """Get details of a specific session (async).
@@ -427,14 +482,13 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails or session not found
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/spec-sessions/{session_id}",
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return PromptSession.from_dict(response.json())
+        response = await self._ahttp().get(
+            f"{self.base_url}/spec-sessions/{session_id}",
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return PromptSession.from_dict(response.json())
 
     async def aresolve_hole(
         self,
@@ -460,15 +514,14 @@ class SessionClient:
         request = ResolveHoleRequest(
             resolution_text=resolution_text, resolution_type=resolution_type
         )
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/spec-sessions/{session_id}/holes/{hole_id}/resolve",
-                json=request.to_dict(),
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return PromptSession.from_dict(response.json())
+        response = await self._ahttp().post(
+            f"{self.base_url}/spec-sessions/{session_id}/holes/{hole_id}/resolve",
+            json=request.to_dict(),
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return PromptSession.from_dict(response.json())
 
     async def afinalize_session(self, session_id: str) -> IRResponse:
         """Finalize a session and return the completed IR (async).
@@ -482,15 +535,14 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails or session has unresolved holes
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/spec-sessions/{session_id}/finalize",
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return IRResponse(ir=data["ir"], metadata=data["metadata"])
+        response = await self._ahttp().post(
+            f"{self.base_url}/spec-sessions/{session_id}/finalize",
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return IRResponse(ir=data["ir"], metadata=data["metadata"])
 
     async def aget_assists(self, session_id: str) -> AssistsResponse:
         """Get actionable suggestions for resolving holes (async).
@@ -504,14 +556,13 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/spec-sessions/{session_id}/assists",
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return AssistsResponse.from_dict(response.json())
+        response = await self._ahttp().get(
+            f"{self.base_url}/spec-sessions/{session_id}/assists",
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return AssistsResponse.from_dict(response.json())
 
     async def adelete_session(self, session_id: str) -> None:
         """Delete a session (async).
@@ -522,10 +573,9 @@ class SessionClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/spec-sessions/{session_id}",
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
+        response = await self._ahttp().delete(
+            f"{self.base_url}/spec-sessions/{session_id}",
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
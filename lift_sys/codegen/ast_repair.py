@@ -4,9 +4,106 @@ Deterministic AST-based code repair.
 Complements AI code generation with mechanical fixes for known bug patterns.
 Instead of asking AI to understand corrections through prompts, we detect and
 fix bugs using deterministic AST transformations.
+
+Repair runs on every generation attempt, so the engine is organized as a
+small pass manager:
+
+1. The code is parsed once.
+2. A single traversal (``_scan_candidates``) finds the nodes each pass could
+   act on. Detection is deliberately a superset of what the transformers
+   fix, and no pass creates a pattern that an earlier scan would have missed.
+3. Only passes with candidates run their transformer, in the fixed order
+   below; ``ast.unparse`` runs only if a pass reported a modification.
+4. Results are cached by a hash of (function name, source), so repeated
+   attempts with identical code skip all of the above.
+
+Per-stage call counts and timings are available from ``pass_stats()``.
 """
 
 import ast
+import hashlib
+import time
+
+from ..ir.fingerprint import IRFingerprintCache
+
+# Pass name -> engine method, in application order
+REPAIR_PASSES: tuple[tuple[str, str], ...] = (
+    ("loop_returns", "_fix_loop_returns"),
+    ("type_checks", "_fix_type_checks"),
+    ("nested_minmax", "_fix_nested_minmax"),
+    ("missing_imports", "_add_missing_imports"),
+    ("missing_returns", "_fix_missing_returns"),
+    ("email_validation", "_fix_email_validation"),
+    ("enumerate_early_return", "_fix_enumerate_early_return"),
+)
+
+# Cached values are 1-tuples so a cached "no repair needed" (None) is
+# distinguishable from a cache miss
+_REPAIR_CACHE: IRFingerprintCache[tuple[str | None]] = IRFingerprintCache(max_size=1024)
+
+
+def get_repair_cache() -> IRFingerprintCache[tuple[str | None]]:
+    """Return the process-wide repair cache shared by ASTRepairEngine instances."""
+    return _REPAIR_CACHE
+
+
+def _scan_candidates(tree: ast.AST) -> set[str]:
+    """
+    Find which repair passes have something to look at, in one traversal.
+
+    Returns:
+        Names of passes (see ``REPAIR_PASSES``) whose pattern may occur
+    """
+    found: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.For):
+            if any(isinstance(stmt, ast.Return) for stmt in node.body):
+                found.add("loop_returns")
+            if (
+                isinstance(node.iter, ast.Call)
+                and isinstance(node.iter.func, ast.Name)
+                and node.iter.func.id == "enumerate"
+            ):
+                found.add("enumerate_early_return")
+        elif isinstance(node, ast.Attribute):
+            value = node.value
+            if isinstance(value, ast.Name):
+                if value.id in MissingImportTransformer.STDLIB_MODULES:
+                    found.add("missing_imports")
+            elif (
+                node.attr == "__name__"
+                and isinstance(value, ast.Call)
+                and isinstance(value.func, ast.Name)
+                and value.func.id == "type"
+            ):
+                found.add("type_checks")
+        elif isinstance(node, ast.If):
+            body = node.body
+            if (
+                isinstance(node.test, ast.Compare)
+                and len(body) >= 2
+                and isinstance(body[0], ast.Assign)
+                and any(isinstance(stmt, ast.If) for stmt in body[1:])
+            ):
+                found.add("nested_minmax")
+        elif isinstance(node, ast.Compare):
+            left = node.left
+            if (
+                len(node.ops) == 1
+                and isinstance(node.ops[0], ast.Gt)
+                and isinstance(left, ast.Call)
+                and isinstance(left.func, ast.Attribute)
+                and left.func.attr == "index"
+            ):
+                found.add("email_validation")
+        elif isinstance(node, ast.FunctionDef):
+            if node.returns is not None and isinstance(node.body[-1], (ast.Assign, ast.Expr)):
+                found.add("missing_returns")
+    return found
+
+
+def _new_stage_stats() -> dict[str, float]:
+    return {"runs": 0, "skipped": 0, "modifications": 0, "total_ms": 0.0}
 
 
 class ASTRepairEngine:
@@ -18,6 +115,23 @@ class ASTRepairEngine:
     - AST repair fixes known mechanical issues (deterministic, 100% for known patterns)
     """
 
+    def __init__(
+        self,
+        cache: IRFingerprintCache[tuple[str | None]] | None = None,
+        enable_cache: bool = True,
+    ):
+        """
+        Initialize the repair engine.
+
+        Args:
+            cache: Result cache keyed by source hash (defaults to the
+                process-wide cache from ``get_repair_cache()``)
+            enable_cache: Set False to always run the repair passes
+        """
+        self.cache = (cache if cache is not None else _REPAIR_CACHE) if enable_cache else None
+        self._stats: dict[str, dict[str, float]] = {}
+        self.reset_stats()
+
     def repair(self, code: str, function_name: str, context: dict | None = None) -> str | None:
         """
         Attempt to repair known bugs in generated code.
@@ -33,47 +147,77 @@ class ASTRepairEngine:
         Raises:
             SyntaxError: If code cannot be parsed
         """
+        key = None
+        if self.cache is not None:
+            key = hashlib.sha256(f"{function_name}\0{code}".encode()).hexdigest()
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached[0]
+
+        repaired_code = self._repair_uncached(code, function_name)
+        if key is not None:
+            self.cache.put(key, (repaired_code,))
+        return repaired_code
+
+    def pass_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get per-stage profiling counters.
+
+        Returns:
+            Mapping of stage ("parse", "scan", each pass name, "unparse") to
+            runs, skipped (pass had no candidates), modifications and total_ms
+        """
+        return {stage: dict(stats) for stage, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Zero the per-stage profiling counters."""
+        stages = ["parse", "scan", *(name for name, _ in REPAIR_PASSES), "unparse"]
+        self._stats = {stage: _new_stage_stats() for stage in stages}
+
+    def cache_stats(self) -> dict[str, object]:
+        """
+        Get repair cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and hit_rate
+            (empty when caching is disabled)
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
+    def _repair_uncached(self, code: str, function_name: str) -> str | None:
+        """Parse once, scan once, and run only the passes with candidates."""
+        start = time.perf_counter()
         try:
             tree = ast.parse(code)
         except SyntaxError as e:
             # Can't repair unparseable code
             raise SyntaxError(f"Cannot repair code with syntax errors: {e}") from e
+        finally:
+            self._record("parse", start)
+
+        start = time.perf_counter()
+        candidates = _scan_candidates(tree)
+        self._record("scan", start)
 
         # Apply repair passes
         modifications = []
-
-        # Pass 1: Fix loop return placement
-        tree, loop_fixes = self._fix_loop_returns(tree, function_name)
-        modifications.extend(loop_fixes)
-
-        # Pass 2: Fix type checking patterns
-        tree, type_fixes = self._fix_type_checks(tree, function_name)
-        modifications.extend(type_fixes)
-
-        # Pass 3: Fix nested min/max checks
-        tree, minmax_fixes = self._fix_nested_minmax(tree, function_name)
-        modifications.extend(minmax_fixes)
-
-        # Pass 4: Add missing stdlib imports
-        tree, import_fixes = self._add_missing_imports(tree, code)
-        modifications.extend(import_fixes)
-
-        # Pass 5: Fix missing return statements
-        tree, return_fixes = self._fix_missing_returns(tree, function_name)
-        modifications.extend(return_fixes)
-
-        # Pass 6: Fix email validation adjacency bugs
-        tree, email_fixes = self._fix_email_validation(tree, function_name)
-        modifications.extend(email_fixes)
-
-        # Pass 7: Fix enumerate loops that accumulate result instead of early return
-        tree, enumerate_fixes = self._fix_enumerate_early_return(tree, function_name)
-        modifications.extend(enumerate_fixes)
+        for name, method in REPAIR_PASSES:
+            if name not in candidates:
+                self._stats[name]["skipped"] += 1
+                continue
+            start = time.perf_counter()
+            if method == "_add_missing_imports":
+                tree, fixes = self._add_missing_imports(tree, code)
+            else:
+                tree, fixes = getattr(self, method)(tree, function_name)
+            self._record(name, start, len(fixes))
+            modifications.extend(fixes)
 
         if not modifications:
             return None  # No repairs needed
 
         # Convert back to code
+        start = time.perf_counter()
         try:
             repaired_code = ast.unparse(tree)
             return repaired_code
@@ -81,6 +225,14 @@ class ASTRepairEngine:
             # If unparsing fails, return None (don't break things)
             print(f"  ⚠️ AST repair failed to unparse: {e}")
             return None
+        finally:
+            self._record("unparse", start)
+
+    def _record(self, stage: str, start: float, modifications: int = 0) -> None:
+        stats = self._stats[stage]
+        stats["runs"] += 1
+        stats["modifications"] += modifications
+        stats["total_ms"] += (time.perf_counter() - start) * 1000
 
     def _fix_loop_returns(self, tree: ast.AST, function_name: str) -> tuple[ast.AST, list[str]]:
         """
@@ -965,4 +1117,4 @@ class EnumerateEarlyReturnTransformer(ast.NodeTransformer):
         return new_body
 
 
-__all__ = ["ASTRepairEngine"]
+__all__ = ["REPAIR_PASSES", "ASTRepairEngine", "get_repair_cache"]
@@ -155,12 +155,47 @@ def get_code_generation_schema() -> dict[str, Any]:
     return CODE_GENERATION_SCHEMA
 
 
+# Stable instruction block shared by every code generation prompt. Prompts start
+# with it and put the function specification last, so providers can cache the
+# block (Anthropic cache_control, vLLM prefix caching).
+CODE_GENERATION_INSTRUCTIONS = """You are an expert Python programmer. Generate a complete, correct implementation for the function specified below.
+
+Requirements:
+-------------
+1. Generate ONLY the function body (not the signature or docstring)
+2. The implementation must be complete and correct
+3. Honor all constraints and assertions
+4. STRICTLY follow the implementation steps if provided (they are NOT optional)
+5. Use clear, idiomatic Python code
+6. Include appropriate error handling
+7. Use efficient algorithms where possible
+8. Add inline comments for complex logic
+
+Output Format:
+--------------
+Provide the implementation as a JSON object with:
+- implementation.body_statements: List of code statements
+- implementation.algorithm: High-level algorithm description
+- imports: Any additional imports needed
+- helper_functions: Any helper functions needed
+
+Each statement should have:
+- type: Type of statement (assignment, return, if_statement, etc.)
+- code: Python code for the statement
+- rationale: Why this statement is needed (optional)
+
+"""
+
+
 def get_prompt_for_code_generation(
     ir_summary: str, signature: str, constraints: list[str], effects: list[str] | None = None
 ) -> str:
     """
     Generate a system prompt for code generation from IR.
 
+    The prompt is ``CODE_GENERATION_INSTRUCTIONS`` followed by the function
+    specification, so everything before the specification is identical across calls.
+
     Args:
         ir_summary: Summary of what the function should do
         signature: Function signature
@@ -186,9 +221,7 @@ Each step corresponds to an operation the function should perform. Do not skip s
 or reorder them. The effects describe the operational semantics that must be preserved.
 """
 
-    return f"""You are an expert Python programmer. Generate a complete, correct implementation for the following function.
-
-Function Specification:
+    return f"""{CODE_GENERATION_INSTRUCTIONS}Function Specification:
 -----------------------
 Purpose: {ir_summary}
 
@@ -197,31 +230,12 @@ Signature: {signature}
 Constraints:
 {constraints_text}
 {effects_section}
-Requirements:
--------------
-1. Generate ONLY the function body (not the signature or docstring)
-2. The implementation must be complete and correct
-3. Honor all constraints and assertions
-4. STRICTLY follow the implementation steps if provided (they are NOT optional)
-5. Use clear, idiomatic Python code
-6. Include appropriate error handling
-7. Use efficient algorithms where possible
-8. Add inline comments for complex logic
-
-Output Format:
---------------
-Provide the implementation as a JSON object with:
-- implementation.body_statements: List of code statements
-- implementation.algorithm: High-level algorithm description
-- imports: Any additional imports needed
-- helper_functions: Any helper functions needed
-
-Each statement should have:
-- type: Type of statement (assignment, return, if_statement, etc.)
-- code: Python code for the statement
-- rationale: Why this statement is needed (optional)
-
 Generate the implementation as valid JSON:"""
 
 
-__all__ = ["CODE_GENERATION_SCHEMA", "get_code_generation_schema", "get_prompt_for_code_generation"]
+__all__ = [
+    "CODE_GENERATION_INSTRUCTIONS",
+    "CODE_GENERATION_SCHEMA",
+    "get_code_generation_schema",
+    "get_prompt_for_code_generation",
+]
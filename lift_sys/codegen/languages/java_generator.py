@@ -10,12 +10,15 @@ from typing import Any
 # DSPy Architecture Integration (Phase A: Minimal Integration)
 from ...dspy_signatures.provider_adapter import ProviderAdapter, ProviderConfig
 from ...ir.models import IntermediateRepresentation
+from ...ir.schema_validator import compile_schema
 from ...providers.base import BaseProvider
 from ..generator import CodeGeneratorConfig, GeneratedCode
 from ..lsp_context import LSPConfig, LSPSemanticContextProvider
 from .java_schema import JAVA_GENERATION_SCHEMA, get_prompt_for_java_generation
 from .java_types import JavaTypeResolver
 
+_IMPLEMENTATION_VALIDATOR = compile_schema(JAVA_GENERATION_SCHEMA)
+
 
 class JavaGenerator:
     """
@@ -526,22 +529,10 @@ class JavaGenerator:
         raise json.JSONDecodeError("No valid JSON found in response", response, 0)
 
     def _validate_implementation(self, impl_json: dict[str, Any]) -> None:
-        """Validate implementation JSON structure."""
-        if "implementation" not in impl_json:
-            raise ValueError("Missing 'implementation' key in JSON")
-
-        impl = impl_json["implementation"]
-
-        if "body_statements" not in impl:
-            raise ValueError("Missing 'body_statements' in implementation")
-
-        if not isinstance(impl["body_statements"], list):
-            raise ValueError("'body_statements' must be a list")
-
-        if len(impl["body_statements"]) == 0:
-            raise ValueError("'body_statements' cannot be empty")
+        """
+        Validate implementation JSON against ``JAVA_GENERATION_SCHEMA``.
 
-        # Validate each statement
-        for stmt in impl["body_statements"]:
-            if "type" not in stmt or "code" not in stmt:
-                raise ValueError("Each statement must have 'type' and 'code'")
+        Raises:
+            SchemaValidationError: (a ValueError) listing every error with its path
+        """
+        _IMPLEMENTATION_VALIDATOR.validate(impl_json)
@@ -8,15 +8,23 @@ from typing import Any
 
 from ..ir.constraint_validator import ConstraintValidator
 from ..ir.models import IntermediateRepresentation
+from ..ir.schema_validator import compile_schema
+from ..ir.stream_parser import StreamingJSONParser
 from ..providers.base import BaseProvider
 from ..validation import AssertionChecker
 from ..validation.ir_interpreter import IRInterpreter
 from .ast_repair import ASTRepairEngine
-from .code_schema import CODE_GENERATION_SCHEMA, get_prompt_for_code_generation
+from .code_schema import (
+    CODE_GENERATION_INSTRUCTIONS,
+    CODE_GENERATION_SCHEMA,
+    get_prompt_for_code_generation,
+)
 from .generator import CodeGenerator, CodeGeneratorConfig, GeneratedCode
 from .multishot import MultishotGenerator
 from .validation import CodeValidator
 
+_IMPLEMENTATION_VALIDATOR = compile_schema(CODE_GENERATION_SCHEMA)
+
 
 class XGrammarCodeGenerator:
     """
@@ -441,14 +449,27 @@ class XGrammarCodeGenerator:
                 schema=CODE_GENERATION_SCHEMA,
                 max_tokens=2000,
                 temperature=temperature,
+                cache_prefix=CODE_GENERATION_INSTRUCTIONS,
             )
             return impl_json
 
+        if self.provider.capabilities.streaming:
+            # Parse while tokens arrive; stops generating on the first schema error
+            return await StreamingJSONParser(_IMPLEMENTATION_VALIDATOR).consume(
+                self.provider.generate_stream(
+                    prompt=prompt,
+                    max_tokens=2000,
+                    temperature=0.3,
+                    cache_prefix=CODE_GENERATION_INSTRUCTIONS,
+                )
+            )
+
         # Fallback to text generation for providers without structured output
         response = await self.provider.generate_text(
             prompt=prompt,
             max_tokens=2000,
             temperature=0.3,
+            cache_prefix=CODE_GENERATION_INSTRUCTIONS,
         )
 
         # Extract JSON from response
@@ -499,34 +520,12 @@ class XGrammarCodeGenerator:
 
     def _validate_implementation(self, impl_json: dict[str, Any]) -> None:
         """
-        Validate implementation JSON structure.
-
-        Args:
-            impl_json: Implementation JSON to validate
+        Validate implementation JSON against ``CODE_GENERATION_SCHEMA``.
 
         Raises:
-            ValueError: If validation fails
+            SchemaValidationError: (a ValueError) listing every error with its path
         """
-        if "implementation" not in impl_json:
-            raise ValueError("Missing required field: implementation")
-
-        impl = impl_json["implementation"]
-
-        if "body_statements" not in impl:
-            raise ValueError("Missing required field: implementation.body_statements")
-
-        if not isinstance(impl["body_statements"], list):
-            raise ValueError("implementation.body_statements must be an array")
-
-        if len(impl["body_statements"]) == 0:
-            raise ValueError("implementation.body_statements cannot be empty")
-
-        # Validate each statement
-        for i, stmt in enumerate(impl["body_statements"]):
-            if "type" not in stmt:
-                raise ValueError(f"Statement {i} missing required field: type")
-            if "code" not in stmt:
-                raise ValueError(f"Statement {i} missing required field: code")
+        _IMPLEMENTATION_VALIDATOR.validate(impl_json)
 
     def _parse_structural_code(self, source_code: str) -> dict[str, Any]:
         """
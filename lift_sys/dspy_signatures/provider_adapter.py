@@ -35,6 +35,8 @@ from typing import Any
 import dspy
 from pydantic import BaseModel, Field
 
+from lift_sys.ir.schema_validator import CompiledSchema, compile_schema
+from lift_sys.ir.stream_parser import StreamingJSONParser
 from lift_sys.providers.base import BaseProvider
 
 
@@ -127,6 +129,9 @@ class ProviderAdapter:
         # Resource tracking (optional, set via set_resource_tracker())
         self._resource_usage: Any | None = None  # ResourceUsage instance
 
+        # Compiled validators for schemas used with streamed text generation
+        self._validators: dict[int, tuple[dict[str, Any], CompiledSchema]] = {}
+
     def set_resource_tracker(self, resource_usage: Any) -> None:
         """
         Set ResourceUsage tracker for token and call counting.
@@ -192,6 +197,24 @@ class ProviderAdapter:
                 # Convert dict response to dspy.Prediction
                 return self._dict_to_prediction(response_dict, signature)
 
+            # Schema without XGrammar: stream and validate while tokens arrive,
+            # stopping generation as soon as the output diverges from the schema
+            elif schema is not None and self.provider.capabilities.streaming:
+                parser = StreamingJSONParser(self._validator(schema))
+                response_dict = await parser.consume(
+                    self.provider.generate_stream(
+                        prompt=prompt,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        top_p=top_p,
+                    )
+                )
+
+                if self.config.track_resources and self._resource_usage is not None:
+                    self._resource_usage.add_tokens(parser.received // 4)
+
+                return self._dict_to_prediction(response_dict, signature)
+
             # Otherwise, use text generation
             else:
                 response_text = await self.provider.generate_text(
@@ -212,6 +235,13 @@ class ProviderAdapter:
         except Exception as e:
             raise ValueError(f"Provider call failed: {e}") from e
 
+    def _validator(self, schema: dict[str, Any]) -> CompiledSchema:
+        """Return the compiled validator for ``schema``, compiling it on first use."""
+        cached = self._validators.get(id(schema))
+        if cached is None or cached[0] is not schema:
+            cached = self._validators[id(schema)] = (schema, compile_schema(schema))
+        return cached[1]
+
     def _dict_to_prediction(
         self, response: dict[str, Any], signature: Any = None
     ) -> dspy.Prediction:
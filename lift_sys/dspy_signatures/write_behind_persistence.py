@@ -0,0 +1,438 @@
+"""
+Write-Behind State Persistence
+
+Buffered variant of StatePersistence (H2) that keeps database round trips out of
+the graph's critical path.
+
+save() and update_node_output() only record the write in memory and return.
+Writes are coalesced per execution (node outputs appended, state updates merged)
+and a background task flushes them in batches: one bulk insert for new
+executions and one upsert for updated ones, executed in a worker thread so the
+event loop never blocks on Supabase.
+
+Design Principles:
+1. Durability Points: flush() at graph end or on error guarantees all buffered
+   writes are stored (or raises); load()/list_states() flush first. Writes a
+   background flush had to drop are reported by the next flush()/aclose()
+2. Bounded Memory: at most ``max_pending`` buffered operations; producers wait
+   for the flusher when the buffer is full (backpressure)
+3. No Read-Modify-Write: node outputs are applied to the last written state kept
+   in memory, so updates need no load() round trip
+4. Retry Safety: failed flushes put the writes back in the buffer, ahead of any
+   newer writes for the same execution. Buffered saves of executions that
+   already exist in the database are dropped and reported, so one conflicting
+   row never blocks the rest of the buffer
+
+A single writer per execution is assumed: flushed rows overwrite provenance and
+state_snapshot with this process's view of the execution.
+
+Usage:
+    persistence = WriteBehindStatePersistence[MyState]()
+
+    await persistence.save(execution_id, graph_state)
+    for node in nodes:
+        ...
+        await persistence.update_node_output(execution_id, node.name, output)
+
+    await persistence.flush()  # Durability point at graph end
+    await persistence.aclose()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from .state_persistence import GraphState, NodeOutput, StatePersistence
+
+# Type variables
+StateT = TypeVar("StateT", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingWrites:
+    """Buffered writes for one execution, coalesced until the next flush."""
+
+    state: GraphState | None = None  # From save(); None for updates only
+    node_outputs: list[dict[str, Any]] = field(default_factory=list)
+    state_updates: dict[str, Any] = field(default_factory=dict)
+    updated_at: str | None = None
+    operations: int = 0
+
+    def merge(self, newer: _PendingWrites) -> None:
+        """Append writes that were buffered after this batch."""
+        self.state = self.state or newer.state
+        self.node_outputs.extend(newer.node_outputs)
+        self.state_updates.update(newer.state_updates)
+        self.updated_at = newer.updated_at or self.updated_at
+        self.operations += newer.operations
+
+
+class WriteBehindStatePersistence(StatePersistence[StateT]):
+    """
+    StatePersistence that buffers writes and flushes them asynchronously in batches.
+
+    Performance:
+        - save()/update_node_output(): no database round trip (in-memory only)
+        - flush(): at most two round trips per batch (bulk insert + upsert),
+          plus one bulk load for executions not written through this instance
+    """
+
+    def __init__(
+        self,
+        supabase_url: str | None = None,
+        supabase_key: str | None = None,
+        flush_interval: float = 0.05,
+        max_pending: int = 1000,
+        max_batch: int = 100,
+        max_cached_executions: int = 256,
+    ) -> None:
+        """
+        Initialize write-behind persistence.
+
+        Args:
+            supabase_url: Supabase project URL (defaults to SUPABASE_URL env var)
+            supabase_key: Supabase service role key (defaults to SUPABASE_SERVICE_KEY env var)
+            flush_interval: Seconds between background flushes
+            max_pending: Maximum buffered operations before writers wait (backpressure)
+            max_batch: Buffered operations that trigger a flush before the interval
+            max_cached_executions: Last written states kept in memory so updates
+                need no read; older executions are re-read at flush time
+        """
+        super().__init__(supabase_url, supabase_key)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.max_cached_executions = max_cached_executions
+
+        self._pending: dict[str, _PendingWrites] = {}
+        self._written: OrderedDict[str, GraphState] = OrderedDict()
+        self._buffered = 0  # Operations pending or being flushed
+        self._flush_lock = asyncio.Lock()
+        self._space_available = asyncio.Event()
+        self._space_available.set()
+        self._wakeup = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        # Executions whose writes were dropped and not yet reported by flush()
+        self._missing: list[str] = []
+        self._duplicates: list[str] = []
+
+    @property
+    def buffered_operations(self) -> int:
+        """Number of operations buffered or currently being flushed."""
+        return self._buffered
+
+    async def save(self, execution_id: UUID | str, state: GraphState) -> None:
+        """
+        Buffer a new graph execution state.
+
+        Raises:
+            ValueError: If the execution was already saved through this instance
+        """
+        execution_id_str = str(execution_id)
+        pending = self._pending.get(execution_id_str)
+        if execution_id_str in self._written or (pending and pending.state):
+            raise ValueError(
+                f"Failed to save state for execution {execution_id_str}: already exists"
+            )
+
+        state = state.model_copy(deep=True)
+        state.updated_at = datetime.now(UTC).isoformat()
+        await self._enqueue(execution_id_str, _PendingWrites(state=state, operations=1))
+
+    async def update_node_output(
+        self, execution_id: UUID | str, node: str, output: dict[str, Any]
+    ) -> None:
+        """
+        Buffer a node execution output for the execution's provenance chain.
+
+        Unknown execution IDs are reported by the flush that tries to write them.
+        """
+        node_output = NodeOutput(
+            node_name=node,
+            signature_name=output.get("signature_name", "unknown"),
+            inputs=output.get("inputs", {}),
+            outputs=output.get("outputs", {}),
+            execution_time_ms=output.get("execution_time_ms"),
+        )
+        writes = _PendingWrites(
+            node_outputs=[node_output.model_dump()],
+            state_updates=dict(output.get("state_updates", {})),
+            updated_at=datetime.now(UTC).isoformat(),
+            operations=1,
+        )
+        await self._enqueue(str(execution_id), writes)
+
+    async def load(self, execution_id: UUID | str) -> GraphState:
+        """Load graph execution state, flushing buffered writes first."""
+        if self._buffered:
+            await self.flush()
+        return await super().load(execution_id)
+
+    async def delete(self, execution_id: UUID | str) -> None:
+        """Delete graph execution state, discarding any buffered writes."""
+        self.discard(execution_id)
+        await super().delete(execution_id)
+
+    async def list_states(self, user_id: str | None = None, limit: int = 100) -> list[GraphState]:
+        """List graph execution states after flushing buffered writes."""
+        await self.flush()
+        return await super().list_states(user_id, limit)
+
+    def discard(self, execution_id: UUID | str) -> None:
+        """Drop buffered writes for an execution without storing them."""
+        execution_id_str = str(execution_id)
+        self._written.pop(execution_id_str, None)
+        pending = self._pending.pop(execution_id_str, None)
+        if pending:
+            self._release(pending.operations)
+
+    async def flush(self) -> None:
+        """
+        Write all buffered operations to the database (durability point).
+
+        Call at graph end and on error paths before reporting results.
+
+        Dropped writes are reported even when an earlier background flush
+        dropped them.
+
+        Raises:
+            KeyError: If buffered node outputs refer to an unknown execution
+                (those writes are dropped)
+            ValueError: If buffered saves refer to executions that already exist
+                in the database (those writes are dropped, the rest are stored),
+                or if the database write fails; then the writes stay buffered
+                until a later flush succeeds or they are discarded
+        """
+        # Always take the flush lock once so an in-flight background flush
+        # has finished before this returns
+        await self._flush_once()
+        while self._pending:
+            await self._flush_once()
+        self._raise_dropped()
+
+    async def aclose(self) -> None:
+        """Flush buffered writes and stop the background flusher."""
+        try:
+            await self.flush()
+        finally:
+            if self._flusher:
+                self._flusher.cancel()
+                try:
+                    await self._flusher
+                except asyncio.CancelledError:
+                    pass
+                self._flusher = None
+
+    async def __aenter__(self) -> WriteBehindStatePersistence[StateT]:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _enqueue(self, execution_id: str, writes: _PendingWrites) -> None:
+        """Buffer writes, waiting for the flusher while the buffer is full."""
+        self._ensure_flusher()
+        while self._buffered >= self.max_pending:
+            self._space_available.clear()
+            self._wakeup.set()
+            await self._space_available.wait()
+
+        pending = self._pending.get(execution_id)
+        if pending:
+            pending.merge(writes)
+        else:
+            self._pending[execution_id] = writes
+        self._buffered += writes.operations
+        if self._buffered >= self.max_batch:
+            self._wakeup.set()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._pending:
+                continue
+            try:
+                await self._flush_once()
+            except Exception as e:
+                # Transient failures stay buffered and are retried on the next tick
+                logger.warning("Background flush of graph states failed: %s", e)
+            if self._missing or self._duplicates:
+                # Kept until flush() reports them to the caller
+                logger.warning(
+                    "Background flush dropped writes for executions %s",
+                    ", ".join(self._duplicates + self._missing),
+                )
+
+    async def _flush_once(self) -> None:
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # Only writes that were not stored are left in the batch
+                self._requeue(batch)
+                raise ValueError(f"Failed to flush buffered graph states: {e}") from e
+
+    def _raise_dropped(self) -> None:
+        """Raise for writes dropped by any flush since the last report."""
+        missing, self._missing = self._missing, []
+        duplicates, self._duplicates = self._duplicates, []
+        if duplicates:
+            message = f"Failed to save state for executions {', '.join(duplicates)}: already exists"
+            if missing:
+                message += f"; no state found for executions {', '.join(missing)}"
+            raise ValueError(message)
+        if missing:
+            raise KeyError(f"No state found for executions {', '.join(missing)}")
+
+    async def _write_batch(self, batch: dict[str, _PendingWrites]) -> None:
+        """Apply and store a batch, removing stored entries from it.
+
+        Executions whose writes are dropped because no state exists, or whose
+        saves are dropped because the execution already exists, are recorded
+        for ``_raise_dropped``.
+        """
+        unknown = [
+            execution_id
+            for execution_id, writes in batch.items()
+            if writes.state is None and execution_id not in self._written
+        ]
+        stored = await asyncio.to_thread(self._fetch_states, unknown) if unknown else {}
+
+        inserts: dict[str, GraphState] = {}
+        updates: dict[str, GraphState] = {}
+        missing = []
+        for execution_id, writes in batch.items():
+            base = writes.state or self._written.get(execution_id) or stored.get(execution_id)
+            if base is None:
+                missing.append(execution_id)
+            elif writes.state:
+                inserts[execution_id] = self._apply(base, writes)
+            else:
+                updates[execution_id] = self._apply(base, writes)
+        self._complete(batch, dict.fromkeys(missing))
+        self._missing.extend(missing)
+
+        if inserts:
+            rows = [_state_row(execution_id, state) for execution_id, state in inserts.items()]
+            # ON CONFLICT DO NOTHING returns only the rows it inserted; a plain insert
+            # would fail the whole batch on one existing execution, on every retry
+            insert = self._table().upsert(rows, on_conflict="execution_id", ignore_duplicates=True)
+            response = await asyncio.to_thread(insert.execute)
+            created = {row["execution_id"] for row in response.data}
+            self._duplicates.extend(
+                execution_id for execution_id in inserts if execution_id not in created
+            )
+            self._complete(
+                batch,
+                {
+                    execution_id: state if execution_id in created else None
+                    for execution_id, state in inserts.items()
+                },
+            )
+        if updates:
+            rows = [_state_row(execution_id, state) for execution_id, state in updates.items()]
+            upsert = self._table().upsert(rows, on_conflict="execution_id")
+            await asyncio.to_thread(upsert.execute)
+            self._complete(batch, updates)
+
+    def _complete(
+        self, batch: dict[str, _PendingWrites], written: dict[str, GraphState | None]
+    ) -> None:
+        """Remove finished entries from ``batch`` and free their buffer space."""
+        for execution_id, state in written.items():
+            self._release(batch.pop(execution_id).operations)
+            if state is not None:
+                self._remember(execution_id, state)
+
+    def _table(self) -> Any:
+        return self.client.table("graph_states")
+
+    def _fetch_states(self, execution_ids: list[str]) -> dict[str, GraphState]:
+        """Load current rows for executions this instance has not written."""
+        response = (
+            self.client.table("graph_states")
+            .select("*")
+            .in_("execution_id", execution_ids)
+            .execute()
+        )
+        return {row["execution_id"]: GraphState(**_state_fields(row)) for row in response.data}
+
+    @staticmethod
+    def _apply(base: GraphState, writes: _PendingWrites) -> GraphState:
+        state = base.model_copy(deep=True)
+        state.provenance.extend(writes.node_outputs)
+        state.state_snapshot.update(writes.state_updates)
+        state.updated_at = writes.updated_at or state.updated_at
+        return state
+
+    def _remember(self, execution_id: str, state: GraphState) -> None:
+        self._written[execution_id] = state
+        self._written.move_to_end(execution_id)
+        while len(self._written) > self.max_cached_executions:
+            self._written.popitem(last=False)
+
+    def _requeue(self, batch: dict[str, _PendingWrites]) -> None:
+        """Put a failed batch back ahead of writes buffered since it was taken."""
+        for execution_id, newer in self._pending.items():
+            if execution_id in batch:
+                batch[execution_id].merge(newer)
+            else:
+                batch[execution_id] = newer
+        self._pending = batch
+
+    def _release(self, operations: int) -> None:
+        self._buffered -= operations
+        if self._buffered < self.max_pending:
+            self._space_available.set()
+
+
+def _state_row(execution_id: str, state: GraphState) -> dict[str, Any]:
+    """Serialize a GraphState into a graph_states row (as StatePersistence.save does)."""
+    return {
+        "id": execution_id,
+        "execution_id": execution_id,
+        "state_snapshot": state.state_snapshot,
+        "state_type": state.state_type,
+        "provenance": state.provenance,
+        "metadata": state.metadata,
+        "user_id": state.user_id,
+        "created_at": state.created_at,
+        "updated_at": state.updated_at,
+    }
+
+
+def _state_fields(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "execution_id": row["execution_id"],
+        "state_snapshot": row["state_snapshot"],
+        "state_type": row["state_type"],
+        "provenance": row.get("provenance", []),
+        "metadata": row.get("metadata", {}),
+        "user_id": row.get("user_id"),
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+    }
+
+
+__all__ = ["WriteBehindStatePersistence"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from typing import Any
 
 from ..ir.constraint_detector import detect_and_apply_constraints
@@ -18,10 +19,56 @@ from ..ir.models import (
     SigClause,
     TypedHole,
 )
-from ..ir.schema import IR_JSON_SCHEMA, get_prompt_for_ir_generation
+from ..ir.schema import IR_GENERATION_INSTRUCTIONS, IR_JSON_SCHEMA, get_prompt_for_ir_generation
+from ..ir.schema_validator import compile_schema
+from ..ir.stream_parser import StreamingJSONParser
 from ..providers.base import BaseProvider
 
 
+def _typed_hole(data: dict[str, Any]) -> TypedHole:
+    return TypedHole(
+        identifier=data["identifier"],
+        type_hint=data["type_hint"],
+        description=data.get("description", ""),
+        constraints=data.get("constraints", {}),
+        kind=HoleKind(data.get("kind", "intent")),
+    )
+
+
+# Validates LLM output against IR_JSON_SCHEMA and builds the clause objects in
+# the same walk; compiled once per process
+_IR_CONVERTER = compile_schema(
+    IR_JSON_SCHEMA,
+    factories={
+        "#/definitions/TypedHole": _typed_hole,
+        "#/properties/intent": lambda data: IntentClause(
+            summary=data["summary"],
+            rationale=data.get("rationale"),
+            holes=data.get("holes", []),
+        ),
+        "#/properties/signature/properties/parameters/items": lambda data: Parameter(
+            name=data["name"],
+            type_hint=data["type_hint"],
+            description=data.get("description"),
+        ),
+        "#/properties/signature": lambda data: SigClause(
+            name=data["name"],
+            parameters=data["parameters"],
+            returns=data.get("returns"),
+            holes=data.get("holes", []),
+        ),
+        "#/properties/effects/items": lambda data: EffectClause(
+            description=data["description"], holes=data.get("holes", [])
+        ),
+        "#/properties/assertions/items": lambda data: AssertClause(
+            predicate=data["predicate"],
+            rationale=data.get("rationale"),
+            holes=data.get("holes", []),
+        ),
+    },
+)
+
+
 class XGrammarIRTranslator:
     """
     Translates natural language prompts to IR using xgrammar-constrained generation.
@@ -46,6 +93,7 @@ class XGrammarIRTranslator:
         prompt: str,
         language: str = "python",
         max_retries: int = 3,
+        on_clause: Callable[[str, Any], None] | None = None,
     ) -> IntermediateRepresentation:
         """
         Translate natural language prompt to IR.
@@ -54,6 +102,11 @@ class XGrammarIRTranslator:
             prompt: User's natural language description
             language: Target programming language
             max_retries: Number of retries if generation fails
+            on_clause: Optional callback for streamed generation, called with
+                ``(field, value)`` as each top-level IR field is complete, e.g.
+                ``("signature", SigClause)`` while the effects are still being
+                generated. Values are previews without provenance, and fields
+                may be delivered again if the attempt is retried.
 
         Returns:
             Valid IntermediateRepresentation
@@ -75,6 +128,7 @@ class XGrammarIRTranslator:
                     schema=self.schema,
                     max_tokens=3072,
                     temperature=0.3,
+                    cache_prefix=IR_GENERATION_INSTRUCTIONS,
                 )
 
                 # Convert to IR objects
@@ -94,20 +148,22 @@ class XGrammarIRTranslator:
         # Fallback to text generation with retry logic for providers without structured output
         for attempt in range(max_retries):
             try:
-                # Generate IR JSON using LLM
-                response = await self.provider.generate_text(
-                    prompt=system_prompt,
-                    max_tokens=3072,
-                    temperature=0.3,  # Lower temperature for more structured output
-                )
-
-                # Extract JSON from response (handle markdown code blocks)
-                ir_json = self._extract_json(response)
-
-                # Validate against schema
-                self._validate_schema(ir_json)
-
-                # Convert to IR objects
+                if self.provider.capabilities.streaming:
+                    # Parse while tokens arrive; stops generating on the first schema error
+                    ir_json = await self._stream_json(system_prompt, on_clause)
+                else:
+                    # Generate IR JSON using LLM
+                    response = await self.provider.generate_text(
+                        prompt=system_prompt,
+                        max_tokens=3072,
+                        temperature=0.3,  # Lower temperature for more structured output
+                        cache_prefix=IR_GENERATION_INSTRUCTIONS,
+                    )
+
+                    # Extract JSON from response (handle markdown code blocks)
+                    ir_json = self._extract_json(response)
+
+                # Validate against the schema and convert to IR objects
                 ir = self._json_to_ir(ir_json, language=language)
 
                 # Add provenance
@@ -130,6 +186,29 @@ class XGrammarIRTranslator:
 
         raise ValueError("Unexpected error in IR generation")
 
+    async def _stream_json(
+        self, system_prompt: str, on_clause: Callable[[str, Any], None] | None
+    ) -> dict[str, Any]:
+        """
+        Generate IR JSON with ``generate_stream``, validating it as it arrives.
+
+        Raises:
+            JSONStreamError: If the output is not a well-formed JSON object
+            SchemaValidationError: As soon as the output diverges from the schema
+        """
+        parser = StreamingJSONParser(
+            _IR_CONVERTER,
+            on_value=(lambda path, value: on_clause(path[0], value)) if on_clause else None,
+        )
+        return await parser.consume(
+            self.provider.generate_stream(
+                prompt=system_prompt,
+                max_tokens=3072,
+                temperature=0.3,
+                cache_prefix=IR_GENERATION_INSTRUCTIONS,
+            )
+        )
+
     def _extract_json(self, response: str) -> dict[str, Any]:
         """
         Extract JSON from LLM response, handling markdown code blocks.
@@ -173,109 +252,23 @@ class XGrammarIRTranslator:
 
         raise json.JSONDecodeError("No valid JSON found in response", response, 0)
 
-    def _validate_schema(self, ir_json: dict[str, Any]) -> None:
-        """
-        Validate IR JSON against schema.
-
-        Args:
-            ir_json: JSON dictionary to validate
-
-        Raises:
-            ValueError: If validation fails
-        """
-        # Check required top-level fields
-        if "intent" not in ir_json:
-            raise ValueError("Missing required field: intent")
-        if "signature" not in ir_json:
-            raise ValueError("Missing required field: signature")
-
-        # Validate intent
-        intent = ir_json["intent"]
-        if not isinstance(intent, dict):
-            raise ValueError("intent must be an object")
-        if "summary" not in intent:
-            raise ValueError("intent.summary is required")
-        if not isinstance(intent["summary"], str):
-            raise ValueError("intent.summary must be a string")
-
-        # Validate signature
-        signature = ir_json["signature"]
-        if not isinstance(signature, dict):
-            raise ValueError("signature must be an object")
-        if "name" not in signature:
-            raise ValueError("signature.name is required")
-        if "parameters" not in signature:
-            raise ValueError("signature.parameters is required")
-        if not isinstance(signature["parameters"], list):
-            raise ValueError("signature.parameters must be an array")
-
-        # Validate each parameter
-        for param in signature["parameters"]:
-            if not isinstance(param, dict):
-                raise ValueError("Each parameter must be an object")
-            if "name" not in param:
-                raise ValueError("Parameter missing required field: name")
-            if "type_hint" not in param:
-                raise ValueError("Parameter missing required field: type_hint")
-
     def _json_to_ir(self, ir_json: dict[str, Any], language: str) -> IntermediateRepresentation:
         """
-        Convert validated JSON to IR objects.
+        Validate JSON against ``IR_JSON_SCHEMA`` and convert it to IR objects.
 
         Args:
-            ir_json: Validated JSON dictionary
+            ir_json: JSON dictionary produced by the LLM
             language: Target programming language
 
         Returns:
             IntermediateRepresentation instance
-        """
-        # Parse intent
-        intent_data = ir_json["intent"]
-        intent = IntentClause(
-            summary=intent_data["summary"],
-            rationale=intent_data.get("rationale"),
-            holes=self._parse_holes(intent_data.get("holes", [])),
-        )
-
-        # Parse signature
-        sig_data = ir_json["signature"]
-        parameters = [
-            Parameter(
-                name=p["name"],
-                type_hint=p["type_hint"],
-                description=p.get("description"),
-            )
-            for p in sig_data["parameters"]
-        ]
-
-        signature = SigClause(
-            name=sig_data["name"],
-            parameters=parameters,
-            returns=sig_data.get("returns"),
-            holes=self._parse_holes(sig_data.get("holes", [])),
-        )
-
-        # Parse effects
-        effects = [
-            EffectClause(
-                description=e["description"],
-                holes=self._parse_holes(e.get("holes", [])),
-            )
-            for e in ir_json.get("effects", [])
-        ]
-
-        # Parse assertions
-        assertions = [
-            AssertClause(
-                predicate=a["predicate"],
-                rationale=a.get("rationale"),
-                holes=self._parse_holes(a.get("holes", [])),
-            )
-            for a in ir_json.get("assertions", [])
-        ]
 
-        # Parse metadata
-        metadata_data = ir_json.get("metadata", {})
+        Raises:
+            SchemaValidationError: (a ValueError) listing every schema error with
+                its path, e.g. ``signature.parameters[0]: Missing 'type_hint'``
+        """
+        converted = _IR_CONVERTER.validate(ir_json)
+        metadata_data = converted.get("metadata", {})
         metadata = Metadata(
             source_path=metadata_data.get("source_path"),
             language=language,
@@ -284,26 +277,13 @@ class XGrammarIRTranslator:
         )
 
         return IntermediateRepresentation(
-            intent=intent,
-            signature=signature,
-            effects=effects,
-            assertions=assertions,
+            intent=converted["intent"],
+            signature=converted["signature"],
+            effects=converted.get("effects", []),
+            assertions=converted.get("assertions", []),
             metadata=metadata,
         )
 
-    def _parse_holes(self, holes_data: list[dict[str, Any]]) -> list[TypedHole]:
-        """Parse typed holes from JSON."""
-        return [
-            TypedHole(
-                identifier=h["identifier"],
-                type_hint=h["type_hint"],
-                description=h.get("description", ""),
-                constraints=h.get("constraints", {}),
-                kind=HoleKind(h.get("kind", "intent")),
-            )
-            for h in holes_data
-        ]
-
     def _add_provenance(
         self, ir: IntermediateRepresentation, original_prompt: str
     ) -> IntermediateRepresentation:
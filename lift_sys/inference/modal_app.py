@@ -201,6 +201,7 @@ class ConstrainedIRGenerator:
             max_model_len=8192,  # Sufficient for IR, reduces memory footprint
             guided_decoding_backend="xgrammar",  # XGrammar for fast JSON schema enforcement
             enforce_eager=enforce_eager,  # Disable torch.compile if VLLM_EAGER=1
+            enable_prefix_caching=True,  # Reuse KV cache for shared prompt prefixes
         )
 
         load_time = time.time() - start
@@ -293,6 +294,9 @@ Generate the IR as valid JSON:
                 "tokens_used": len(output.outputs[0].token_ids),
                 "generation_time_ms": generation_time,
                 "finish_reason": output.outputs[0].finish_reason,
+                # Prompt tokens served from vLLM's prefix cache (shared instructions)
+                "prompt_tokens": len(output.prompt_token_ids or []),
+                "cached_tokens": getattr(output, "num_cached_tokens", None) or 0,
             }
 
         except json.JSONDecodeError as e:
@@ -41,11 +41,13 @@ Endpoints:
     80B Model:
     - Health: https://rand--qwen-80b-health.modal.run (GET)
     - Generate: https://rand--qwen-80b-generate.modal.run (POST)
+    - Generate batch: https://rand--qwen-80b-generate-batch.modal.run (POST)
     - Warmup: https://rand--qwen-80b-warmup.modal.run (GET)
 
     480B Model:
     - Health: https://rand--qwen-480b-health.modal.run (GET)
     - Generate: https://rand--qwen-480b-generate.modal.run (POST)
+    - Generate batch: https://rand--qwen-480b-generate-batch.modal.run (POST)
     - Warmup: https://rand--qwen-480b-warmup.modal.run (GET)
 
 Performance Notes:
@@ -54,6 +56,10 @@ Performance Notes:
     - First request triggers model download and compilation (slow)
     - Subsequent requests use cached models (fast)
     - llguidance ensures schema-compliant JSON output
+    - Batch endpoints generate several prompts in one vLLM call, so
+      concurrent client requests (gathered by ModalProvider) cost one round trip
+    - Automatic prefix caching reuses the KV cache of shared prompt prefixes
+      (the IR/code generation instructions); results report cached_tokens
 """
 
 import modal
@@ -111,6 +117,91 @@ TORCH_COMPILE_CACHE_DIR = "/root/.cache/vllm"
 torch_cache_volume = modal.Volume.from_name("qwen-vllm-torch-cache", create_if_missing=True)
 
 
+def _generate_batch(llm, requests: list[dict]) -> list[dict]:
+    """
+    Generate completions for several requests in one vLLM call.
+
+    Each request takes the same fields as the generate endpoint. vLLM
+    schedules all prompts together, so a batch costs about as much wall time
+    as its longest member. Results are returned in request order with the
+    same shape as ``_generate_impl`` results.
+    """
+    import json
+    import time
+
+    from vllm import SamplingParams
+    from vllm.sampling_params import GuidedDecodingParams
+
+    def failure(message: str, elapsed_ms: float, finish_reason: str = "error", **extra) -> dict:
+        return {
+            "error": message,
+            **extra,
+            "text": None,
+            "tokens_used": 0,
+            "generation_time_ms": elapsed_ms,
+            "finish_reason": finish_reason,
+        }
+
+    start_time = time.time()
+    results: list[dict | None] = [None] * len(requests)
+    prompts: list[str] = []
+    sampling_params: list = []
+    indices: list[int] = []
+    for index, request in enumerate(requests):
+        if not isinstance(request, dict) or "prompt" not in request:
+            results[index] = failure("Missing required field: prompt", 0.0)
+            continue
+        schema = request.get("schema")
+        prompts.append(request["prompt"])
+        sampling_params.append(
+            SamplingParams(
+                temperature=request.get("temperature", 0.3),
+                top_p=request.get("top_p", 0.95),
+                max_tokens=request.get("max_tokens", 2048),
+                guided_decoding=GuidedDecodingParams(json=schema) if schema else None,
+            )
+        )
+        indices.append(index)
+
+    if not prompts:
+        return results
+
+    try:
+        # One call for the whole batch: per-prompt SamplingParams keep schemas separate
+        outputs = llm.generate(prompts, sampling_params)
+    except Exception as e:
+        elapsed = (time.time() - start_time) * 1000
+        for index in indices:
+            results[index] = failure(f"Generation failed: {str(e)}", elapsed)
+        return results
+
+    generation_time = (time.time() - start_time) * 1000
+    for index, output in zip(indices, outputs, strict=True):
+        completion = output.outputs[0]
+        generated_text = completion.text.strip()
+        result_data = generated_text
+        if requests[index].get("schema"):
+            try:
+                result_data = json.loads(generated_text)
+            except json.JSONDecodeError as e:
+                results[index] = failure(
+                    f"Invalid JSON generated: {str(e)}",
+                    generation_time,
+                    finish_reason="json_error",
+                    raw_output=generated_text[:500],
+                )
+                continue
+        results[index] = {
+            "text": result_data,
+            "tokens_used": len(completion.token_ids),
+            "generation_time_ms": generation_time,
+            "finish_reason": completion.finish_reason,
+            "prompt_tokens": len(output.prompt_token_ids or []),
+            "cached_tokens": getattr(output, "num_cached_tokens", None) or 0,
+        }
+    return results
+
+
 # =============================================================================
 # Qwen3-Next-80B-A3B-Instruct-FP8 (80B params, ~3B active)
 # =============================================================================
@@ -174,6 +265,7 @@ class Qwen80BGenerator:
             tensor_parallel_size=2,  # Split across 2 GPUs
             guided_decoding_backend="guidance",  # llguidance for JSON schema
             enforce_eager=True,  # REQUIRED: Disables CUDA graphs to avoid crash
+            enable_prefix_caching=True,  # Reuse KV cache for shared prompt prefixes
         )
 
         load_time = time.time() - start
@@ -260,6 +352,9 @@ class Qwen80BGenerator:
                 "tokens_used": len(output.outputs[0].token_ids),
                 "generation_time_ms": generation_time,
                 "finish_reason": output.outputs[0].finish_reason,
+                # Prompt tokens served from vLLM's prefix cache (shared instructions)
+                "prompt_tokens": len(output.prompt_token_ids or []),
+                "cached_tokens": getattr(output, "num_cached_tokens", None) or 0,
             }
 
         except Exception as e:
@@ -308,6 +403,29 @@ class Qwen80BGenerator:
             top_p=request.get("top_p", 0.95),
         )
 
+    @modal.method()
+    def generate_batch(self, requests: list[dict]) -> list[dict]:
+        """Modal method endpoint for batched generation."""
+        return _generate_batch(self.llm, requests)
+
+    @modal.fastapi_endpoint(method="POST", label="qwen-80b-generate-batch")
+    async def web_generate_batch(self, request: dict) -> dict:
+        """
+        HTTP endpoint for batched generation.
+
+        POST body:
+        {
+            "requests": [...],  # required - list of generate request bodies
+        }
+
+        Returns {"results": [...]} with one generate result per request, in order.
+        """
+        requests = request.get("requests")
+        if not isinstance(requests, list):
+            return {"error": "Missing required field: requests", "status": 400}
+
+        return {"results": _generate_batch(self.llm, requests)}
+
     @modal.fastapi_endpoint(method="GET", label="qwen-80b-warmup")
     async def warmup(self) -> dict:
         """Warm-up endpoint to pre-load model."""
@@ -397,6 +515,7 @@ class Qwen480BGenerator:
             tensor_parallel_size=8,  # Distribute across 8 H100s
             guided_decoding_backend="guidance",  # llguidance for JSON schema
             enforce_eager=True,  # REQUIRED: Disables CUDA graphs to avoid crash
+            enable_prefix_caching=True,  # Reuse KV cache for shared prompt prefixes
         )
 
         load_time = time.time() - start
@@ -484,6 +603,9 @@ class Qwen480BGenerator:
                 "tokens_used": len(output.outputs[0].token_ids),
                 "generation_time_ms": generation_time,
                 "finish_reason": output.outputs[0].finish_reason,
+                # Prompt tokens served from vLLM's prefix cache (shared instructions)
+                "prompt_tokens": len(output.prompt_token_ids or []),
+                "cached_tokens": getattr(output, "num_cached_tokens", None) or 0,
             }
 
         except Exception as e:
@@ -532,6 +654,29 @@ class Qwen480BGenerator:
             top_p=request.get("top_p", 0.95),
         )
 
+    @modal.method()
+    def generate_batch(self, requests: list[dict]) -> list[dict]:
+        """Modal method endpoint for batched generation."""
+        return _generate_batch(self.llm, requests)
+
+    @modal.fastapi_endpoint(method="POST", label="qwen-480b-generate-batch")
+    async def web_generate_batch(self, request: dict) -> dict:
+        """
+        HTTP endpoint for batched generation.
+
+        POST body:
+        {
+            "requests": [...],  # required - list of generate request bodies
+        }
+
+        Returns {"results": [...]} with one generate result per request, in order.
+        """
+        requests = request.get("requests")
+        if not isinstance(requests, list):
+            return {"error": "Missing required field: requests", "status": 400}
+
+        return {"results": _generate_batch(self.llm, requests)}
+
     @modal.fastapi_endpoint(method="GET", label="qwen-480b-warmup")
     async def warmup(self) -> dict:
         """Warm-up endpoint to pre-load model."""
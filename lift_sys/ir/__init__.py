@@ -1,5 +1,8 @@
 """IR package exports."""
 
+from .alignment import AlignmentOp, align_sequences, lcs_matches
+from .codec import IRCodecError, decode_evidence, decode_ir, encode_ir, is_binary_ir
+from .delta import apply_patch, diff_documents
 from .differ import (
     CategoryComparison,
     ComparisonResult,
@@ -9,6 +12,7 @@ from .differ import (
     IRComparer,
     IRDiff,
 )
+from .fingerprint import IRFingerprintCache, fingerprint_payload, ir_fingerprint
 from .merger import (
     ConflictResolution,
     IRMerger,
@@ -18,7 +22,10 @@ from .merger import (
 )
 from .models import *  # noqa: F401,F403
 from .parser import IRParser, ParserConfig
+from .schema_validator import CompiledSchema, SchemaError, SchemaValidationError, compile_schema
+from .stream_parser import JSONStreamError, StreamingJSONParser
 from .versioning import IRVersion, VersionedIR, VersionMetadata
+from .view import IRView
 
 __all__ = [
     "IRParser",
@@ -30,6 +37,9 @@ __all__ = [
     "IRDiff",
     "CategoryComparison",
     "ComparisonResult",
+    "AlignmentOp",
+    "align_sequences",
+    "lcs_matches",
     "IRMerger",
     "MergeStrategy",
     "MergeResult",
@@ -38,4 +48,21 @@ __all__ = [
     "VersionMetadata",
     "IRVersion",
     "VersionedIR",
+    "apply_patch",
+    "IRCodecError",
+    "decode_evidence",
+    "decode_ir",
+    "encode_ir",
+    "is_binary_ir",
+    "IRView",
+    "CompiledSchema",
+    "SchemaError",
+    "SchemaValidationError",
+    "compile_schema",
+    "JSONStreamError",
+    "StreamingJSONParser",
+    "diff_documents",
+    "IRFingerprintCache",
+    "fingerprint_payload",
+    "ir_fingerprint",
 ] + [name for name in globals() if name[0].isupper()]
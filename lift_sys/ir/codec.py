@@ -0,0 +1,310 @@
+"""Compact binary codec for IntermediateRepresentation.
+
+``to_dict()`` → JSON → ``from_dict()`` repeats every field name for every
+clause and rebuilds nested dataclasses through dictionary lookups. This
+codec writes a versioned binary container instead:
+
+- A fixed header (magic, format version, flags, section lengths)
+- A string table: every string field is interned once and referenced by index
+- A core section: clauses as positional arrays in a fixed, schema-defined
+  field order (the field position is the tag), decoded straight into the
+  dataclasses
+- An evidence section holding ``metadata.evidence``, which is rarely read and
+  can be skipped (``decode_ir(..., load_evidence=False)``) or decoded on its
+  own (``decode_evidence``)
+
+Sections are encoded as compact UTF-8 JSON, so every payload is readable
+without optional dependencies. JSON (``to_dict``) remains the format for
+external APIs.
+
+Usage:
+    data = encode_ir(ir)
+    restored = decode_ir(data)
+    evidence = decode_evidence(data)
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from typing import Any
+
+from .models import (
+    AssertClause,
+    EffectClause,
+    HoleKind,
+    IntentClause,
+    IntermediateRepresentation,
+    Metadata,
+    Parameter,
+    Provenance,
+    ProvenanceSource,
+    RelationshipClause,
+    SigClause,
+    TypedHole,
+)
+
+MAGIC = b"LIRB"
+FORMAT_VERSION = 1
+
+# magic, version, flags (reserved, always 0), then byte lengths of the
+# strings/core/evidence sections
+_HEADER = struct.Struct(">4sBBIII")
+
+_HOLE_KINDS = {kind.value: kind for kind in HoleKind}
+_PROVENANCE_SOURCES = {source.value: source for source in ProvenanceSource}
+
+
+class IRCodecError(ValueError):
+    """Raised when a payload is not a valid binary IR."""
+
+
+def is_binary_ir(data: bytes | bytearray | memoryview) -> bool:
+    """Return True if ``data`` starts with the binary IR magic."""
+    return bytes(data[:4]) == MAGIC
+
+
+def encode_ir(ir: IntermediateRepresentation) -> bytes:
+    """
+    Encode an IR into the compact binary format.
+
+    Args:
+        ir: IR to encode
+
+    Returns:
+        Binary payload (see module docstring for the layout)
+    """
+    encoder = _Encoder()
+    core = encoder.core(ir)
+    strings = _dump(encoder.strings)
+    core_bytes = _dump(core)
+    evidence = _dump(ir.metadata.evidence)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(strings), len(core_bytes), len(evidence))
+    return b"".join((header, strings, core_bytes, evidence))
+
+
+def decode_ir(
+    data: bytes | bytearray | memoryview, load_evidence: bool = True
+) -> IntermediateRepresentation:
+    """
+    Decode a binary IR payload.
+
+    Args:
+        data: Payload produced by ``encode_ir``
+        load_evidence: Decode ``metadata.evidence``; when False the evidence
+            section is skipped and the returned IR has an empty evidence list
+
+    Returns:
+        Decoded IntermediateRepresentation
+    """
+    sections = _split(data)
+    strings = _load(sections.strings)
+    core = _load(sections.core)
+    evidence = _load(sections.evidence) if load_evidence else []
+    return _Decoder(strings).ir(core, evidence)
+
+
+def decode_evidence(data: bytes | bytearray | memoryview) -> list[dict[str, object]]:
+    """Decode only the ``metadata.evidence`` section of a binary IR payload."""
+    sections = _split(data)
+    return _load(sections.evidence)
+
+
+class _Sections:
+    __slots__ = ("strings", "core", "evidence")
+
+    def __init__(self, strings, core, evidence) -> None:
+        self.strings = strings
+        self.core = core
+        self.evidence = evidence
+
+
+def _split(data: bytes | bytearray | memoryview) -> _Sections:
+    """Validate the header and slice out the sections without copying."""
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise IRCodecError("Payload is too short to be a binary IR")
+    magic, version, flags, strings_len, core_len, evidence_len = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise IRCodecError("Payload is not a binary IR (bad magic)")
+    if version != FORMAT_VERSION:
+        raise IRCodecError(f"Unsupported binary IR format version {version}")
+    start = _HEADER.size
+    end = start + strings_len + core_len + evidence_len
+    if len(view) < end:
+        raise IRCodecError("Binary IR payload is truncated")
+    if flags:
+        raise IRCodecError(f"Unsupported binary IR flags {flags:#04x}")
+    return _Sections(
+        view[start : start + strings_len],
+        view[start + strings_len : start + strings_len + core_len],
+        view[start + strings_len + core_len : end],
+    )
+
+
+def _dump(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _load(section: memoryview) -> Any:
+    try:
+        return json.loads(bytes(section))
+    except ValueError as exc:
+        raise IRCodecError(f"Corrupt binary IR section: {exc}") from exc
+
+
+class _Encoder:
+    """Flatten IR dataclasses into positional arrays with interned strings."""
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def s(self, value: str | None) -> int | None:
+        if value is None:
+            return None
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def core(self, ir: IntermediateRepresentation) -> list[Any]:
+        s = self.s
+        intent = ir.intent
+        sig = ir.signature
+        meta = ir.metadata
+        return [
+            [
+                s(intent.summary),
+                s(intent.rationale),
+                self.holes(intent.holes),
+                self.prov(intent.provenance),
+            ],
+            [
+                s(sig.name),
+                [
+                    [s(p.name), s(p.type_hint), s(p.description), self.prov(p.provenance)]
+                    for p in sig.parameters
+                ],
+                s(sig.returns),
+                self.holes(sig.holes),
+                self.prov(sig.provenance),
+            ],
+            [[s(e.description), self.holes(e.holes), self.prov(e.provenance)] for e in ir.effects],
+            [
+                [s(a.predicate), s(a.rationale), self.holes(a.holes), self.prov(a.provenance)]
+                for a in ir.assertions
+            ],
+            [
+                [
+                    s(r.from_entity),
+                    s(r.to_entity),
+                    s(r.relationship_type),
+                    r.confidence,
+                    s(r.description),
+                    self.holes(r.holes),
+                    self.prov(r.provenance),
+                ]
+                for r in ir.relationships
+            ],
+            [s(meta.source_path), s(meta.language), s(meta.origin)],
+            [constraint.to_dict() for constraint in ir.constraints],
+        ]
+
+    def holes(self, holes: list[TypedHole]) -> list[Any]:
+        s = self.s
+        return [
+            [s(h.identifier), s(h.type_hint), s(h.description), h.constraints, s(h.kind.value)]
+            for h in holes
+        ]
+
+    def prov(self, prov: Provenance | None) -> list[Any] | None:
+        if not prov:
+            return None
+        s = self.s
+        return [
+            s(prov.source.value),
+            prov.confidence,
+            s(prov.timestamp),
+            s(prov.author),
+            [s(ref) for ref in prov.evidence_refs],
+            prov.metadata,
+        ]
+
+
+class _Decoder:
+    """Rebuild IR dataclasses from positional arrays."""
+
+    def __init__(self, strings: list[str]) -> None:
+        # Every string is already stored once per payload; interning the table
+        # also shares type hints, names and authors across decoded IRs
+        self.strings = [sys.intern(value) for value in strings]
+
+    def s(self, index: int | None) -> str | None:
+        return None if index is None else self.strings[index]
+
+    def ir(self, core: list[Any], evidence: list[dict[str, object]]) -> IntermediateRepresentation:
+        s = self.s
+        intent, sig, effects, assertions, relationships, meta, constraints = core
+        parsed_constraints = []
+        if constraints:
+            from .constraints import parse_constraint
+
+            parsed_constraints = [parse_constraint(data) for data in constraints]
+        return IntermediateRepresentation(
+            intent=IntentClause(
+                s(intent[0]), s(intent[1]), self.holes(intent[2]), self.prov(intent[3])
+            ),
+            signature=SigClause(
+                s(sig[0]),
+                [Parameter(s(p[0]), s(p[1]), s(p[2]), self.prov(p[3])) for p in sig[1]],
+                s(sig[2]),
+                self.holes(sig[3]),
+                self.prov(sig[4]),
+            ),
+            effects=[EffectClause(s(e[0]), self.holes(e[1]), self.prov(e[2])) for e in effects],
+            assertions=[
+                AssertClause(s(a[0]), s(a[1]), self.holes(a[2]), self.prov(a[3]))
+                for a in assertions
+            ],
+            relationships=[
+                RelationshipClause(
+                    s(r[0]), s(r[1]), s(r[2]), r[3], s(r[4]), self.holes(r[5]), self.prov(r[6])
+                )
+                for r in relationships
+            ],
+            metadata=Metadata(s(meta[0]), s(meta[1]), s(meta[2]), evidence),
+            constraints=parsed_constraints,
+        )
+
+    def holes(self, holes: list[Any]) -> list[TypedHole]:
+        strings = self.strings
+        return [
+            TypedHole(strings[h[0]], strings[h[1]], self.s(h[2]), h[3], _HOLE_KINDS[strings[h[4]]])
+            for h in holes
+        ]
+
+    def prov(self, prov: list[Any] | None) -> Provenance | None:
+        if prov is None:
+            return None
+        strings = self.strings
+        return Provenance(
+            _PROVENANCE_SOURCES[strings[prov[0]]],
+            prov[1],
+            strings[prov[2]],
+            self.s(prov[3]),
+            [strings[ref] for ref in prov[4]],
+            prov[5],
+        )
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "IRCodecError",
+    "decode_evidence",
+    "decode_ir",
+    "encode_ir",
+    "is_binary_ir",
+]
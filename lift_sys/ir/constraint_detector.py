@@ -21,6 +21,27 @@ from lift_sys.ir.constraints import (
     ReturnConstraint,
     ReturnRequirement,
 )
+from lift_sys.validation.rules import (
+    ALL_MATCHES_KEYWORDS,
+    FIRST_MATCH_KEYWORDS,
+    LAST_MATCH_KEYWORDS,
+    LOOP_KEYWORDS,
+    POSITION_KEYWORDS,
+    RETURN_KEYWORDS,
+    VALUE_NAME_RULES,
+    scan,
+)
+
+# Loop variable patterns: "for each X", "iterate over X", "loop through X"
+_LOOP_VARIABLE_PATTERNS = [
+    re.compile(r"for each (\w+)"),
+    re.compile(r"iterate over (\w+)"),
+    re.compile(r"loop through (\w+)"),
+    re.compile(r"for every (\w+)"),
+]
+
+# Pattern: "X not adjacent to Y"
+_ADJACENCY_PATTERN = re.compile(r"['\"](\S+)['\"].*not adjacent.*['\"](\S+)['\"]")
 
 if TYPE_CHECKING:
     from lift_sys.ir.constraints import Constraint
@@ -35,71 +56,13 @@ class ConstraintDetector:
     specific constraints should be applied for correct code generation.
     """
 
-    # Patterns for detecting return constraints
-    RETURN_KEYWORDS = [
-        "return",
-        "returns",
-        "compute",
-        "computes",
-        "calculate",
-        "calculates",
-        "count",
-        "counts",
-        "sum",
-        "sums",
-        "result",
-        "output",
-    ]
-
-    # Patterns for detecting loop behavior constraints
-    FIRST_MATCH_KEYWORDS = [
-        "first",
-        "earliest",
-        "initial",
-        "find first",
-        "locate first",
-        "search for first",
-    ]
-
-    LAST_MATCH_KEYWORDS = [
-        "last",
-        "final",
-        "find last",
-        "locate last",
-        "search for last",
-    ]
-
-    ALL_MATCHES_KEYWORDS = [
-        "all",
-        "every",
-        "each",
-        "collect all",
-        "find all",
-        "gather all",
-    ]
-
-    LOOP_KEYWORDS = [
-        "loop",
-        "iterate",
-        "iteration",
-        "for each",
-        "traverse",
-        "walk through",
-    ]
-
-    # Patterns for detecting position constraints
-    POSITION_KEYWORDS = [
-        "adjacent",
-        "next to",
-        "immediately after",
-        "immediately before",
-        "distance",
-        "position",
-        "placement",
-        "between",
-        "not adjacent",
-        "separated",
-    ]
+    # Keyword tables live in the shared rule engine (compiled once)
+    RETURN_KEYWORDS = RETURN_KEYWORDS
+    FIRST_MATCH_KEYWORDS = FIRST_MATCH_KEYWORDS
+    LAST_MATCH_KEYWORDS = LAST_MATCH_KEYWORDS
+    ALL_MATCHES_KEYWORDS = ALL_MATCHES_KEYWORDS
+    LOOP_KEYWORDS = LOOP_KEYWORDS
+    POSITION_KEYWORDS = POSITION_KEYWORDS
 
     def detect_constraints(self, ir: IntermediateRepresentation) -> list[Constraint]:
         """
@@ -150,7 +113,7 @@ class ConstraintDetector:
         combined_text = f"{intent_text} {effects_text}"
 
         # Check if any return keywords are mentioned
-        has_return_keyword = any(keyword in combined_text for keyword in self.RETURN_KEYWORDS)
+        has_return_keyword = scan(combined_text).has("constraint.return")
 
         if not has_return_keyword:
             return None
@@ -191,11 +154,10 @@ class ConstraintDetector:
 
         # Check if looping is mentioned OR if first/last/all keywords present
         # (first/last/all keywords imply iteration even without explicit loop mention)
-        has_loop = any(keyword in combined_text for keyword in self.LOOP_KEYWORDS)
-        has_search_pattern = (
-            any(keyword in combined_text for keyword in self.FIRST_MATCH_KEYWORDS)
-            or any(keyword in combined_text for keyword in self.LAST_MATCH_KEYWORDS)
-            or any(keyword in combined_text for keyword in self.ALL_MATCHES_KEYWORDS)
+        matches = scan(combined_text)
+        has_loop = matches.has("constraint.loop")
+        has_search_pattern = matches.has_any(
+            "constraint.first_match", "constraint.last_match", "constraint.all_matches"
         )
 
         if not has_loop and not has_search_pattern:
@@ -206,17 +168,17 @@ class ConstraintDetector:
         requirement = None
 
         # Check for FIRST match pattern
-        if any(keyword in combined_text for keyword in self.FIRST_MATCH_KEYWORDS):
+        if matches.has("constraint.first_match"):
             search_type = LoopSearchType.FIRST_MATCH
             requirement = LoopRequirement.EARLY_RETURN
 
         # Check for LAST match pattern
-        elif any(keyword in combined_text for keyword in self.LAST_MATCH_KEYWORDS):
+        elif matches.has("constraint.last_match"):
             search_type = LoopSearchType.LAST_MATCH
             requirement = LoopRequirement.ACCUMULATE
 
         # Check for ALL matches pattern
-        elif any(keyword in combined_text for keyword in self.ALL_MATCHES_KEYWORDS):
+        elif matches.has("constraint.all_matches"):
             search_type = LoopSearchType.ALL_MATCHES
             requirement = LoopRequirement.ACCUMULATE
 
@@ -258,7 +220,7 @@ class ConstraintDetector:
         combined_text = f"{intent_text} {effects_text} {assertions_text}"
 
         # Check if position-related keywords are present
-        has_position = any(keyword in combined_text for keyword in self.POSITION_KEYWORDS)
+        has_position = scan(combined_text).has("constraint.position")
 
         # Pattern 1: Email validation (@ and . not adjacent)
         # Always check for email validation since it has well-known semantic constraints
@@ -314,25 +276,11 @@ class ConstraintDetector:
         - Look for "count", "sum", "result", "index", etc. in text
         - Default to "result" if nothing specific found
         """
-        # Common value names in order of preference
-        value_names = [
-            "count",
-            "index",
-            "sum",
-            "total",
-            "result",
-            "value",
-            "output",
-            "answer",
-        ]
-
         combined = f"{intent_text} {effects_text}"
 
-        for name in value_names:
-            if name in combined:
-                return name
-
-        return "result"
+        # Common value names in order of preference
+        rule = scan(combined).first_of(VALUE_NAME_RULES)
+        return rule.removeprefix("value_name.") if rule else "result"
 
     def _extract_loop_variable(self, effects_text: str) -> str | None:
         """
@@ -343,16 +291,8 @@ class ConstraintDetector:
         - "iterate over elements"
         - "loop through values"
         """
-        # Pattern: "for each X", "iterate over X", "loop through X"
-        patterns = [
-            r"for each (\w+)",
-            r"iterate over (\w+)",
-            r"loop through (\w+)",
-            r"for every (\w+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, effects_text)
+        for pattern in _LOOP_VARIABLE_PATTERNS:
+            match = pattern.search(effects_text)
             if match:
                 return match.group(1)
 
@@ -360,13 +300,11 @@ class ConstraintDetector:
 
     def _is_email_validation(self, text: str) -> bool:
         """Check if text describes email validation."""
-        email_keywords = ["email", "e-mail", "@"]
-        return any(keyword in text for keyword in email_keywords)
+        return scan(text).has("constraint.email")
 
     def _is_parentheses_matching(self, text: str) -> bool:
         """Check if text describes parentheses matching."""
-        paren_keywords = ["parenthes", "bracket", "brace", "balanced"]
-        return any(keyword in text for keyword in paren_keywords)
+        return scan(text).has("constraint.parentheses")
 
     def _extract_adjacency_pairs(self, text: str) -> list[tuple[str, str]]:
         """
@@ -383,8 +321,7 @@ class ConstraintDetector:
 
         # Pattern: "X not adjacent to Y"
         # This is a simplified version - could be expanded with more sophisticated NLP
-        pattern = r"['\"](\S+)['\"].*not adjacent.*['\"](\S+)['\"]"
-        matches = re.findall(pattern, text)
+        matches = _ADJACENCY_PATTERN.findall(text)
         pairs.extend(matches)
 
         return pairs
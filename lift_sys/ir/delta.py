@@ -0,0 +1,155 @@
+"""Structural patches between serialized IR documents.
+
+``diff_documents`` computes a compact patch that turns one JSON-like
+document (e.g. ``IntermediateRepresentation.to_dict()``) into another, and
+``apply_patch`` replays it. Patches are plain JSON, so they can be stored and
+serialized alongside version metadata instead of full snapshots.
+
+Patch operations (paths are lists of dict keys and list indices):
+
+- ``{"op": "set", "path": [...], "value": v}``: replace or add a value
+- ``{"op": "del", "path": [...]}``: remove a dict key
+- ``{"op": "splice", "path": [...], "index": i, "delete": n, "insert": [...]}``:
+  replace ``n`` list items at ``i`` with the inserted items
+
+Lists are aligned by element fingerprint (see ``alignment.lcs_matches``), so
+inserting one clause yields one splice rather than rewriting the list.
+Operations are emitted so that list indices always refer to the source
+document and can be applied in order.
+
+Usage:
+    patch = diff_documents(old.to_dict(), new.to_dict())
+    restored = IntermediateRepresentation.from_dict(apply_patch(old.to_dict(), patch))
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from .alignment import lcs_matches
+from .fingerprint import canonical_json
+
+PatchOp = dict[str, Any]
+
+
+def diff_documents(old: Any, new: Any) -> list[PatchOp]:
+    """
+    Compute a patch that transforms ``old`` into ``new``.
+
+    Args:
+        old: Source document (dicts, lists and JSON scalars)
+        new: Target document
+
+    Returns:
+        List of patch operations (empty when the documents are equal)
+    """
+    ops: list[PatchOp] = []
+    _diff(old, new, [], ops)
+    return ops
+
+
+def apply_patch(document: Any, patch: list[PatchOp], in_place: bool = False) -> Any:
+    """
+    Apply a patch produced by ``diff_documents``.
+
+    Args:
+        document: Source document the patch was computed against
+        patch: Patch operations
+        in_place: Mutate ``document`` instead of working on a deep copy
+
+    Returns:
+        The patched document
+    """
+    if not in_place:
+        document = copy.deepcopy(document)
+    for op in patch:
+        kind = op["op"]
+        path = op["path"]
+        if kind == "splice":
+            items = _resolve(document, path)
+            index = op["index"]
+            items[index : index + op["delete"]] = copy.deepcopy(op["insert"])
+        elif not path:
+            if kind != "set":
+                raise ValueError(f"Cannot apply '{kind}' to the document root")
+            document = copy.deepcopy(op["value"])
+        elif kind == "set":
+            _resolve(document, path[:-1])[path[-1]] = copy.deepcopy(op["value"])
+        elif kind == "del":
+            del _resolve(document, path[:-1])[path[-1]]
+        else:
+            raise ValueError(f"Unknown patch operation: {kind!r}")
+    return document
+
+
+def _resolve(document: Any, path: list[Any]) -> Any:
+    for key in path:
+        document = document[key]
+    return document
+
+
+def _identical(old: Any, new: Any) -> bool:
+    """Deep equality that, unlike ``==``, tells ``1``, ``1.0`` and ``True`` apart."""
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_identical(v, new[k]) for k, v in old.items())
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_identical, old, new))
+    return old == new
+
+
+def _diff(old: Any, new: Any, path: list[Any], ops: list[PatchOp]) -> None:
+    if _identical(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "del", "path": [*path, key]})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "set", "path": [*path, key], "value": value})
+            else:
+                _diff(old[key], value, [*path, key], ops)
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        _diff_lists(old, new, path, ops)
+        return
+    ops.append({"op": "set", "path": path, "value": new})
+
+
+def _diff_lists(old: list[Any], new: list[Any], path: list[Any], ops: list[PatchOp]) -> None:
+    """Emit splices for unmatched runs, last run first so indices stay valid."""
+    matches = lcs_matches(
+        [canonical_json(item) for item in old], [canonical_json(item) for item in new]
+    )
+    gaps = []
+    prev_old = prev_new = 0
+    for old_index, new_index in [*matches, (len(old), len(new))]:
+        if old_index > prev_old or new_index > prev_new:
+            gaps.append((prev_old, old_index, prev_new, new_index))
+        prev_old, prev_new = old_index + 1, new_index + 1
+
+    for old_start, old_end, new_start, new_end in reversed(gaps):
+        removed = old[old_start:old_end]
+        added = new[new_start:new_end]
+        if len(removed) == len(added) and all(
+            isinstance(a, dict) and isinstance(b, dict) for a, b in zip(removed, added, strict=True)
+        ):
+            # Same-length run of edited objects: patch each in place
+            for offset, (before, after) in enumerate(zip(removed, added, strict=True)):
+                _diff(before, after, [*path, old_start + offset], ops)
+            continue
+        ops.append(
+            {
+                "op": "splice",
+                "path": path,
+                "index": old_start,
+                "delete": len(removed),
+                "insert": added,
+            }
+        )
+
+
+__all__ = ["PatchOp", "apply_patch", "diff_documents"]
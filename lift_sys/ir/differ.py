@@ -2,6 +2,11 @@
 
 This module provides comprehensive comparison between two IntermediateRepresentations,
 calculating detailed differences and semantic similarity scores.
+
+Parameters, assertions and effects are aligned by content fingerprint (see
+``alignment.py``) instead of by index, so inserting, removing or reordering
+one clause produces one diff rather than a cascade of positional changes.
+Comparing two IRs with the same content fingerprint returns immediately.
 """
 
 from __future__ import annotations
@@ -10,6 +15,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from .alignment import AlignmentOp, align_sequences
+from .fingerprint import ir_fingerprint
 from .models import IntermediateRepresentation
 
 
@@ -36,16 +43,25 @@ class DiffKind(str, Enum):
     PARAMETER_NAME = "parameter_name"
     PARAMETER_TYPE = "parameter_type"
     PARAMETER_DESCRIPTION = "parameter_description"
+    PARAMETER_ADDED = "parameter_added"
+    PARAMETER_REMOVED = "parameter_removed"
+    PARAMETER_MOVED = "parameter_moved"
     RETURN_TYPE = "return_type"
 
     # Assertion diffs
     ASSERTION_COUNT = "assertion_count"
     ASSERTION_PREDICATE = "assertion_predicate"
     ASSERTION_RATIONALE = "assertion_rationale"
+    ASSERTION_ADDED = "assertion_added"
+    ASSERTION_REMOVED = "assertion_removed"
+    ASSERTION_MOVED = "assertion_moved"
 
     # Effect diffs
     EFFECT_COUNT = "effect_count"
     EFFECT_DESCRIPTION = "effect_description"
+    EFFECT_ADDED = "effect_added"
+    EFFECT_REMOVED = "effect_removed"
+    EFFECT_MOVED = "effect_moved"
 
     # Metadata diffs
     METADATA_SOURCE_PATH = "metadata_source_path"
@@ -279,6 +295,9 @@ class IRComparer:
         Returns:
             ComparisonResult with detailed differences and similarity scores.
         """
+        if left is right or ir_fingerprint(left) == ir_fingerprint(right):
+            return self._identical_result(left, right)
+
         intent_comp = self._compare_intent(left, right)
         signature_comp = self._compare_signature(left, right)
         assertion_comp = self._compare_assertions(left, right)
@@ -414,13 +433,76 @@ class IRComparer:
                 )
             )
 
-        # Compare individual parameters
-        for i in range(min(left_param_count, right_param_count)):
-            left_param = left.signature.parameters[i]
-            right_param = right.signature.parameters[i]
+        # Compare individual parameters, aligned by content
+        left_params = left.signature.parameters
+        right_params = right.signature.parameters
+        for op in self._align(
+            left_params,
+            right_params,
+            key=lambda p: (
+                p.name,
+                self._type_key(p.type_hint),
+                None if self.ignore_descriptions else self._string_key(p.description),
+            ),
+            identity=lambda p: p.name,
+        ):
+            if op.kind == "insert":
+                param = right_params[op.right_index]
+                total_fields += 1
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.SIGNATURE,
+                        kind=DiffKind.PARAMETER_ADDED,
+                        path=f"signature.parameters[{op.right_index}]",
+                        left_value=None,
+                        right_value=param.name,
+                        severity=DiffSeverity.ERROR,
+                        message=f"Parameter '{param.name}' added at position {op.right_index}",
+                    )
+                )
+                continue
+            if op.kind == "delete":
+                param = left_params[op.left_index]
+                total_fields += 1
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.SIGNATURE,
+                        kind=DiffKind.PARAMETER_REMOVED,
+                        path=f"signature.parameters[{op.left_index}]",
+                        left_value=param.name,
+                        right_value=None,
+                        severity=DiffSeverity.ERROR,
+                        message=f"Parameter '{param.name}' removed from position {op.left_index}",
+                    )
+                )
+                continue
+
+            i = op.right_index
+            left_param = left_params[op.left_index]
+            right_param = right_params[i]
+            fields = 2 if self.ignore_descriptions else 3
+            total_fields += fields
+            if op.kind == "equal":
+                matches += fields
+                continue
+            if op.kind == "move":
+                matches += fields
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.SIGNATURE,
+                        kind=DiffKind.PARAMETER_MOVED,
+                        path=f"signature.parameters[{i}]",
+                        left_value=op.left_index,
+                        right_value=i,
+                        severity=DiffSeverity.ERROR,
+                        message=(
+                            f"Parameter '{right_param.name}' moved: position {op.left_index} -> {i}"
+                        ),
+                    )
+                )
+                continue
 
             # Parameter name
-            total_fields += 1
             if left_param.name == right_param.name:
                 matches += 1
             else:
@@ -437,7 +519,6 @@ class IRComparer:
                 )
 
             # Parameter type
-            total_fields += 1
             if self._types_equal(left_param.type_hint, right_param.type_hint):
                 matches += 1
             else:
@@ -455,7 +536,6 @@ class IRComparer:
 
             # Parameter description (if not ignoring descriptions)
             if not self.ignore_descriptions:
-                total_fields += 1
                 if self._strings_equal(left_param.description, right_param.description):
                     matches += 1
                 else:
@@ -525,13 +605,71 @@ class IRComparer:
                 )
             )
 
-        # Compare individual assertions
-        for i in range(min(left_count, right_count)):
-            left_assert = left.assertions[i]
+        # Compare individual assertions, aligned by content
+        for op in self._align(
+            left.assertions,
+            right.assertions,
+            key=lambda a: (
+                self._string_key(a.predicate.strip()),
+                None if self.ignore_descriptions else self._string_key(a.rationale),
+            ),
+            identity=lambda a: self._string_key(a.predicate.strip()),
+        ):
+            if op.kind == "insert":
+                total_fields += 1
+                predicate = right.assertions[op.right_index].predicate
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.ASSERTION,
+                        kind=DiffKind.ASSERTION_ADDED,
+                        path=f"assertions[{op.right_index}]",
+                        left_value=None,
+                        right_value=predicate,
+                        severity=DiffSeverity.WARNING,
+                        message=f"Assertion added: {predicate}",
+                    )
+                )
+                continue
+            if op.kind == "delete":
+                total_fields += 1
+                predicate = left.assertions[op.left_index].predicate
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.ASSERTION,
+                        kind=DiffKind.ASSERTION_REMOVED,
+                        path=f"assertions[{op.left_index}]",
+                        left_value=predicate,
+                        right_value=None,
+                        severity=DiffSeverity.WARNING,
+                        message=f"Assertion removed: {predicate}",
+                    )
+                )
+                continue
+
+            i = op.right_index
+            left_assert = left.assertions[op.left_index]
             right_assert = right.assertions[i]
+            fields = 1 if self.ignore_descriptions else 2
+            total_fields += fields
+            if op.kind == "equal":
+                matches += fields
+                continue
+            if op.kind == "move":
+                matches += fields
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.ASSERTION,
+                        kind=DiffKind.ASSERTION_MOVED,
+                        path=f"assertions[{i}]",
+                        left_value=op.left_index,
+                        right_value=i,
+                        severity=DiffSeverity.INFO,
+                        message=f"Assertion moved: position {op.left_index} -> {i}",
+                    )
+                )
+                continue
 
             # Predicate
-            total_fields += 1
             if self._strings_equal(left_assert.predicate.strip(), right_assert.predicate.strip()):
                 matches += 1
             else:
@@ -549,7 +687,6 @@ class IRComparer:
 
             # Rationale (if not ignoring descriptions)
             if not self.ignore_descriptions:
-                total_fields += 1
                 if self._strings_equal(left_assert.rationale, right_assert.rationale):
                     matches += 1
                 else:
@@ -602,23 +739,64 @@ class IRComparer:
                 )
             )
 
-        # Compare individual effects
-        for i in range(min(left_count, right_count)):
-            left_effect = left.effects[i]
-            right_effect = right.effects[i]
-
-            # Effect description
+        # Compare individual effects, aligned by content
+        for op in self._align(
+            left.effects,
+            right.effects,
+            key=lambda e: self._string_key(e.description),
+        ):
             total_fields += 1
-            if self._strings_equal(left_effect.description, right_effect.description):
+            if op.kind == "equal":
+                matches += 1
+            elif op.kind == "insert":
+                description = right.effects[op.right_index].description
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.EFFECT,
+                        kind=DiffKind.EFFECT_ADDED,
+                        path=f"effects[{op.right_index}]",
+                        left_value=None,
+                        right_value=description,
+                        severity=DiffSeverity.WARNING,
+                        message=f"Effect added: {description}",
+                    )
+                )
+            elif op.kind == "delete":
+                description = left.effects[op.left_index].description
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.EFFECT,
+                        kind=DiffKind.EFFECT_REMOVED,
+                        path=f"effects[{op.left_index}]",
+                        left_value=description,
+                        right_value=None,
+                        severity=DiffSeverity.WARNING,
+                        message=f"Effect removed: {description}",
+                    )
+                )
+            elif op.kind == "move":
+                # Effects are ordered steps, so reordering is significant
                 matches += 1
+                diffs.append(
+                    IRDiff(
+                        category=DiffCategory.EFFECT,
+                        kind=DiffKind.EFFECT_MOVED,
+                        path=f"effects[{op.right_index}]",
+                        left_value=op.left_index,
+                        right_value=op.right_index,
+                        severity=DiffSeverity.WARNING,
+                        message=f"Effect moved: position {op.left_index} -> {op.right_index}",
+                    )
+                )
             else:
+                i = op.right_index
                 diffs.append(
                     IRDiff(
                         category=DiffCategory.EFFECT,
                         kind=DiffKind.EFFECT_DESCRIPTION,
                         path=f"effects[{i}].description",
-                        left_value=left_effect.description,
-                        right_value=right_effect.description,
+                        left_value=left.effects[op.left_index].description,
+                        right_value=right.effects[i].description,
                         severity=DiffSeverity.WARNING,
                         message=f"Effect {i} description differs",
                     )
@@ -722,6 +900,57 @@ class IRComparer:
             similarity=similarity,
         )
 
+    def _identical_result(
+        self, left: IntermediateRepresentation, right: IntermediateRepresentation
+    ) -> ComparisonResult:
+        """Build the result for two IRs with identical content (no diffs)."""
+        description_fields = 0 if self.ignore_descriptions else 1
+        param_fields = len(left.signature.parameters) * (2 + description_fields)
+        counts = {
+            DiffCategory.INTENT: 1 + description_fields,
+            DiffCategory.SIGNATURE: 3 + param_fields,
+            DiffCategory.ASSERTION: 1 + len(left.assertions) * (1 + description_fields),
+            DiffCategory.EFFECT: 1 + len(left.effects),
+            DiffCategory.METADATA: 0 if self.ignore_metadata else 4,
+        }
+        comparisons = {
+            category: CategoryComparison(
+                category=category, matches=total, total_fields=total, similarity=1.0
+            )
+            for category, total in counts.items()
+        }
+        return ComparisonResult(
+            left_ir=left,
+            right_ir=right,
+            intent_comparison=comparisons[DiffCategory.INTENT],
+            signature_comparison=comparisons[DiffCategory.SIGNATURE],
+            assertion_comparison=comparisons[DiffCategory.ASSERTION],
+            effect_comparison=comparisons[DiffCategory.EFFECT],
+            metadata_comparison=comparisons[DiffCategory.METADATA],
+            overall_similarity=1.0,
+        )
+
+    @staticmethod
+    def _align(left_items, right_items, key, identity=None) -> list[AlignmentOp]:
+        """Align two clause lists by content key (and optional identity key)."""
+        return align_sequences(
+            [key(item) for item in left_items],
+            [key(item) for item in right_items],
+            [identity(item) for item in left_items] if identity else None,
+            [identity(item) for item in right_items] if identity else None,
+        )
+
+    def _string_key(self, value: str | None) -> str | None:
+        """Normalize a string so key equality matches ``_strings_equal``."""
+        if value is None or self.case_sensitive:
+            return value
+        return value.lower()
+
+    @staticmethod
+    def _type_key(value: str | None) -> str | None:
+        """Normalize a type hint so key equality matches ``_types_equal``."""
+        return " ".join(value.split()) if value is not None else None
+
     def _strings_equal(self, left: str | None, right: str | None) -> bool:
         """Compare two strings with case sensitivity option."""
         if left is None and right is None:
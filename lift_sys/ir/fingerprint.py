@@ -0,0 +1,149 @@
+"""Stable content fingerprints for IR structures.
+
+A fingerprint is a SHA-256 digest over a canonical JSON encoding of
+``IntermediateRepresentation.to_dict()``. Two IRs with the same content
+produce the same fingerprint regardless of object identity, which makes it
+a suitable key for caches of analyses that are pure functions of the IR.
+
+This module also provides ``IRFingerprintCache``, a small thread-safe LRU
+keyed by fingerprint with hit-rate statistics, shared by IR-level caches
+such as the ``IRInterpreter`` result cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+from .models import IntermediateRepresentation
+
+T = TypeVar("T")
+
+
+def canonical_json(payload: Any) -> str:
+    """Encode a payload as canonical JSON (sorted keys, no whitespace)."""
+
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def fingerprint_payload(payload: Any) -> str:
+    """Return the SHA-256 hex digest of a payload's canonical JSON encoding."""
+
+    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+def ir_fingerprint(ir: IntermediateRepresentation) -> str:
+    """
+    Compute a stable content hash for an IR.
+
+    Args:
+        ir: Intermediate representation to fingerprint
+
+    Returns:
+        64-character hex digest that changes whenever any serialised field of
+        the IR (including provenance and metadata) changes
+    """
+
+    return fingerprint_payload(ir.to_dict())
+
+
+class IRFingerprintCache(Generic[T]):
+    """
+    Thread-safe LRU cache keyed by IR fingerprint.
+
+    Example:
+        >>> cache: IRFingerprintCache[str] = IRFingerprintCache(max_size=128)
+        >>> key = ir_fingerprint(ir)
+        >>> value = cache.get(key)
+        >>> if value is None:
+        ...     value = expensive_analysis(ir)
+        ...     cache.put(key, value)
+        >>> cache.stats()["hit_rate"]
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum entries before least-recently-used eviction
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.max_size = max_size
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> T | None:
+        """Return the cached value for a fingerprint, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: T) -> None:
+        """Store a value, evicting the least recently used entry at capacity."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = value
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
+
+
+__all__ = [
+    "IRFingerprintCache",
+    "canonical_json",
+    "fingerprint_payload",
+    "ir_fingerprint",
+]
@@ -2,17 +2,31 @@
 
 This module provides three-way merge functionality for IntermediateRepresentations,
 enabling collaborative workflows with automatic conflict detection and resolution.
+
+Clause lists (parameters, assertions, effects) are merged structurally: each
+branch is aligned against the base by clause identity (``ClauseIdentity``:
+a whitespace-insensitive content hash plus the provenance id), so edits,
+moves and reformatting are tracked per clause instead of showing up as a
+deletion plus an addition. Merge results are memoized by the fingerprints of
+the three inputs.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import copy
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any
 
+from .alignment import align_sequences
+from .codec import decode_ir, encode_ir
 from .differ import DiffCategory, DiffKind, IRComparer
+from .fingerprint import IRFingerprintCache, ir_fingerprint
 from .models import (
     AssertClause,
+    ClauseIdentity,
     EffectClause,
     IntentClause,
     IntermediateRepresentation,
@@ -20,6 +34,7 @@ from .models import (
     Parameter,
     Provenance,
     SigClause,
+    TypedHole,
 )
 
 
@@ -153,18 +168,84 @@ class MergeResult:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _ClauseSpec:
+    """How to merge one kind of clause list."""
+
+    category: DiffCategory
+    fields: tuple[tuple[str, DiffKind], ...]
+    removed_kind: DiffKind
+    label: Callable[[Any], str]
+    match_id: Callable[[Any, ClauseIdentity], Hashable | None]
+    has_holes: bool = True
+
+
+def _effect_label(effect: EffectClause) -> str:
+    return f"effects[description={effect.description[:30]}...]"
+
+
+_PARAMETER_SPEC = _ClauseSpec(
+    category=DiffCategory.SIGNATURE,
+    fields=(
+        ("name", DiffKind.PARAMETER_NAME),
+        ("type_hint", DiffKind.PARAMETER_TYPE),
+        ("description", DiffKind.PARAMETER_DESCRIPTION),
+    ),
+    removed_kind=DiffKind.PARAMETER_REMOVED,
+    label=lambda param: f"signature.parameters[name={param.name}]",
+    match_id=lambda param, identity: param.name,
+    has_holes=False,
+)
+
+_ASSERTION_SPEC = _ClauseSpec(
+    category=DiffCategory.ASSERTION,
+    fields=(
+        ("predicate", DiffKind.ASSERTION_PREDICATE),
+        ("rationale", DiffKind.ASSERTION_RATIONALE),
+    ),
+    removed_kind=DiffKind.ASSERTION_REMOVED,
+    label=lambda assertion: f"assertions[predicate={assertion.predicate}]",
+    match_id=lambda _, identity: identity.provenance_id,
+)
+
+_EFFECT_SPEC = _ClauseSpec(
+    category=DiffCategory.EFFECT,
+    fields=(("description", DiffKind.EFFECT_DESCRIPTION),),
+    removed_kind=DiffKind.EFFECT_REMOVED,
+    label=_effect_label,
+    match_id=lambda _, identity: identity.provenance_id,
+)
+
+
+def _identity_keys(spec: _ClauseSpec, items: list[Any]) -> tuple[list[str], list[Hashable]]:
+    """Content hashes and match ids for alignment; clauses without an id match nothing."""
+    hashes = []
+    ids: list[Hashable] = []
+    for item in items:
+        identity = item.identity
+        hashes.append(identity.content_hash)
+        match_id = spec.match_id(item, identity)
+        ids.append(object() if match_id is None else match_id)
+    return hashes, ids
+
+
 class IRMerger:
     """Performs three-way merge of IntermediateRepresentations."""
 
-    def __init__(self, strategy: MergeStrategy = MergeStrategy.AUTO):
+    def __init__(self, strategy: MergeStrategy = MergeStrategy.AUTO, cache_size: int = 128):
         """
         Initialize the merger with a merge strategy.
 
         Args:
             strategy: Strategy for resolving conflicts.
+            cache_size: Number of merge results memoized by the
+                (base, ours, theirs, strategy) fingerprints.
         """
         self.strategy = strategy
         self.comparer = IRComparer()
+        self._cache: IRFingerprintCache[tuple[bytes, list[MergeConflict], int, bool]] = (
+            IRFingerprintCache(max_size=cache_size)
+        )
 
     def merge(
         self,
@@ -187,22 +268,57 @@ class IRMerger:
         """
         merge_strategy = strategy or self.strategy
 
-        # Compare base with both branches
-        base_to_ours = self.comparer.compare(base, ours)
-        base_to_theirs = self.comparer.compare(base, theirs)
+        key = ":".join([ir_fingerprint(ir) for ir in (base, ours, theirs)] + [merge_strategy.value])
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Callers resolve conflicts in place, so hand out fresh copies; the
+            # merged IR is kept in binary form, which is much cheaper to decode
+            # than to deep-copy
+            payload, conflicts, auto_merged, has_conflicts = cached
+            return MergeResult(
+                merged_ir=decode_ir(payload),
+                conflicts=copy.deepcopy(conflicts),
+                auto_merged_count=auto_merged,
+                has_conflicts=has_conflicts,
+                strategy=merge_strategy,
+            )
+
+        result = self._merge(base, ours, theirs, merge_strategy)
+        self._cache.put(
+            key,
+            (
+                encode_ir(result.merged_ir),
+                copy.deepcopy(result.conflicts),
+                result.auto_merged_count,
+                result.has_conflicts,
+            ),
+        )
+        return result
 
+    def cache_stats(self) -> dict[str, Any]:
+        """Return hit/miss statistics for the merge result cache."""
+        return self._cache.stats()
+
+    def _merge(
+        self,
+        base: IntermediateRepresentation,
+        ours: IntermediateRepresentation,
+        theirs: IntermediateRepresentation,
+        merge_strategy: MergeStrategy,
+    ) -> MergeResult:
+        """Merge without consulting the cache."""
         conflicts = []
         auto_merged = 0
 
         # Merge each category
         merged_intent, intent_conflicts, intent_auto = self._merge_intent(
-            base, ours, theirs, base_to_ours, base_to_theirs, merge_strategy
+            base, ours, theirs, merge_strategy
         )
         conflicts.extend(intent_conflicts)
         auto_merged += intent_auto
 
         merged_signature, sig_conflicts, sig_auto = self._merge_signature(
-            base, ours, theirs, base_to_ours, base_to_theirs, merge_strategy
+            base, ours, theirs, merge_strategy
         )
         conflicts.extend(sig_conflicts)
         auto_merged += sig_auto
@@ -220,7 +336,7 @@ class IRMerger:
         auto_merged += effect_auto
 
         merged_metadata, meta_conflicts, meta_auto = self._merge_metadata(
-            base, ours, theirs, base_to_ours, base_to_theirs, merge_strategy
+            base, ours, theirs, merge_strategy
         )
         conflicts.extend(meta_conflicts)
         auto_merged += meta_auto
@@ -250,8 +366,6 @@ class IRMerger:
         base: IntermediateRepresentation,
         ours: IntermediateRepresentation,
         theirs: IntermediateRepresentation,
-        base_to_ours,
-        base_to_theirs,
         strategy: MergeStrategy,
     ) -> tuple[IntentClause, list[MergeConflict], int]:
         """Merge intent clauses."""
@@ -316,8 +430,6 @@ class IRMerger:
         base: IntermediateRepresentation,
         ours: IntermediateRepresentation,
         theirs: IntermediateRepresentation,
-        base_to_ours,
-        base_to_theirs,
         strategy: MergeStrategy,
     ) -> tuple[SigClause, list[MergeConflict], int]:
         """Merge signature clauses."""
@@ -395,11 +507,10 @@ class IRMerger:
         theirs_params: list[Parameter],
         strategy: MergeStrategy,
     ) -> tuple[list[Parameter], list[MergeConflict], int]:
-        """Merge parameter lists."""
+        """Merge parameter lists, pairing parameters by name rather than position."""
         conflicts = []
-        auto_merged = 0
 
-        # If lengths differ, this is a conflict
+        # Arity is part of the function's contract: differing counts need a decision
         if len(ours_params) != len(theirs_params):
             conflict = MergeConflict(
                 category=DiffCategory.SIGNATURE,
@@ -433,71 +544,9 @@ class IRMerger:
                 # Return ours as placeholder
                 return list(ours_params), conflicts, 0
 
-        # Same length - merge each parameter
-        merged_params = []
-        for i, (base_p, ours_p, theirs_p) in enumerate(
-            zip(base_params, ours_params, theirs_params, strict=False)
-        ):
-            # Merge parameter name
-            name, name_conflict, name_auto = self._merge_field(
-                f"signature.parameters[{i}].name",
-                DiffCategory.SIGNATURE,
-                DiffKind.PARAMETER_NAME,
-                base_p.name,
-                ours_p.name,
-                theirs_p.name,
-                strategy,
-            )
-            if name_conflict:
-                conflicts.append(name_conflict)
-            auto_merged += name_auto
-
-            # Merge parameter type
-            type_hint, type_conflict, type_auto = self._merge_field(
-                f"signature.parameters[{i}].type_hint",
-                DiffCategory.SIGNATURE,
-                DiffKind.PARAMETER_TYPE,
-                base_p.type_hint,
-                ours_p.type_hint,
-                theirs_p.type_hint,
-                strategy,
-            )
-            if type_conflict:
-                conflicts.append(type_conflict)
-            auto_merged += type_auto
-
-            # Merge parameter description
-            description, desc_conflict, desc_auto = self._merge_field(
-                f"signature.parameters[{i}].description",
-                DiffCategory.SIGNATURE,
-                DiffKind.PARAMETER_DESCRIPTION,
-                base_p.description,
-                ours_p.description,
-                theirs_p.description,
-                strategy,
-            )
-            if desc_conflict:
-                conflicts.append(desc_conflict)
-            auto_merged += desc_auto
-
-            # Merge parameter provenance
-            param_provenance = self._merge_provenance(
-                base_p.provenance,
-                ours_p.provenance,
-                theirs_p.provenance,
-                strategy,
-            )
-
-            merged_params.append(
-                Parameter(
-                    name=name,
-                    type_hint=type_hint,
-                    description=description,
-                    provenance=param_provenance,
-                )
-            )
-
-        return merged_params, conflicts, auto_merged
+        return self._merge_clauses(
+            _PARAMETER_SPEC, base_params, ours_params, theirs_params, strategy
+        )
 
     def _merge_assertions(
         self,
@@ -506,80 +555,10 @@ class IRMerger:
         theirs: IntermediateRepresentation,
         strategy: MergeStrategy,
     ) -> tuple[list[AssertClause], list[MergeConflict], int]:
-        """Merge assertion lists."""
-        # For lists like assertions, we use set-based merging
-        # Union of both sets, preserving order where possible
-        base_predicates = {a.predicate for a in base.assertions}
-        ours_predicates = {a.predicate for a in ours.assertions}
-        theirs_predicates = {a.predicate for a in theirs.assertions}
-
-        # Added in ours
-        ours_added = ours_predicates - base_predicates
-        # Added in theirs
-        theirs_added = theirs_predicates - base_predicates
-        # Removed in ours
-        ours_removed = base_predicates - ours_predicates
-        # Removed in theirs
-        theirs_removed = base_predicates - theirs_predicates
-
-        # Start with base
-        merged = list(base.assertions)
-
-        # Remove items deleted in both branches
-        both_removed = ours_removed & theirs_removed
-        merged = [a for a in merged if a.predicate not in both_removed]
-
-        # Handle conflicts where one added and other removed
-        conflicts = []
-        conflict_predicates = (ours_removed & theirs_added) | (theirs_removed & ours_added)
-        for pred in conflict_predicates:
-            conflict = MergeConflict(
-                category=DiffCategory.ASSERTION,
-                kind=DiffKind.ASSERTION_PREDICATE,
-                path=f"assertions[predicate={pred}]",
-                base_value=pred in base_predicates,
-                ours_value=pred in ours_predicates,
-                theirs_value=pred in theirs_predicates,
-                message=f"Assertion '{pred}' modified differently in each branch",
-            )
-
-            if strategy == MergeStrategy.OURS:
-                conflict.resolution = ConflictResolution.TOOK_OURS
-                if pred in ours_predicates:
-                    # Keep/add from ours
-                    assertion = next(a for a in ours.assertions if a.predicate == pred)
-                    if assertion not in merged:
-                        merged.append(assertion)
-                else:
-                    # Remove
-                    merged = [a for a in merged if a.predicate != pred]
-            elif strategy == MergeStrategy.THEIRS:
-                conflict.resolution = ConflictResolution.TOOK_THEIRS
-                if pred in theirs_predicates:
-                    assertion = next(a for a in theirs.assertions if a.predicate == pred)
-                    if assertion not in merged:
-                        merged.append(assertion)
-                else:
-                    merged = [a for a in merged if a.predicate != pred]
-            else:
-                conflict.resolution = ConflictResolution.MANUAL_REQUIRED
-
-            conflicts.append(conflict)
-
-        # Add items that were only added (not in conflict)
-        safe_ours_added = ours_added - theirs_removed
-        safe_theirs_added = theirs_added - ours_removed
-
-        for assertion in ours.assertions:
-            if assertion.predicate in safe_ours_added:
-                merged.append(assertion)
-
-        for assertion in theirs.assertions:
-            if assertion.predicate in safe_theirs_added and assertion not in merged:
-                merged.append(assertion)
-
-        auto_merged = len(safe_ours_added) + len(safe_theirs_added)
-        return merged, conflicts, auto_merged
+        """Merge assertion lists by clause identity."""
+        return self._merge_clauses(
+            _ASSERTION_SPEC, base.assertions, ours.assertions, theirs.assertions, strategy
+        )
 
     def _merge_effects(
         self,
@@ -588,77 +567,252 @@ class IRMerger:
         theirs: IntermediateRepresentation,
         strategy: MergeStrategy,
     ) -> tuple[list[EffectClause], list[MergeConflict], int]:
-        """Merge effect lists (similar to assertions)."""
-        # Use set-based merging on descriptions
-        base_descs = {e.description for e in base.effects}
-        ours_descs = {e.description for e in ours.effects}
-        theirs_descs = {e.description for e in theirs.effects}
+        """Merge effect lists by clause identity."""
+        return self._merge_clauses(
+            _EFFECT_SPEC, base.effects, ours.effects, theirs.effects, strategy
+        )
 
-        ours_added = ours_descs - base_descs
-        theirs_added = theirs_descs - base_descs
-        ours_removed = base_descs - ours_descs
-        theirs_removed = base_descs - theirs_descs
+    def _merge_clauses(
+        self,
+        spec: _ClauseSpec,
+        base_items: list[Any],
+        ours_items: list[Any],
+        theirs_items: list[Any],
+        strategy: MergeStrategy,
+    ) -> tuple[list[Any], list[MergeConflict], int]:
+        """
+        Three-way merge of a clause list over clause identities.
 
-        merged = list(base.effects)
-        both_removed = ours_removed & theirs_removed
-        merged = [e for e in merged if e.description not in both_removed]
+        Each branch is aligned against the base (``align_sequences`` on the
+        content hash, then the identity id, then position), so every base
+        clause is classified per branch as kept, moved, edited or deleted:
 
-        conflicts = []
-        conflict_descs = (ours_removed & theirs_added) | (theirs_removed & ours_added)
-        for desc in conflict_descs:
-            conflict = MergeConflict(
-                category=DiffCategory.EFFECT,
-                kind=DiffKind.EFFECT_DESCRIPTION,
-                path=f"effects[description={desc[:30]}...]",
-                base_value=desc in base_descs,
-                ours_value=desc in ours_descs,
-                theirs_value=desc in theirs_descs,
-                message="Effect modified differently in each branch",
+        - Edited in one branch: take that edit. Edited in both: merge field by
+          field, conflicting only on fields both branches changed differently
+        - Deleted in one branch and untouched in the other: delete. Deleted in
+          one branch and edited in the other: conflict
+        - Added in either branch: insert after the clause it follows in that
+          branch (identical additions on both sides are inserted once)
+        - Moved in their branch only: follow their position; otherwise our
+          order is kept
+
+        Returns:
+            Tuple of (merged_items, conflicts, auto_merged_count)
+        """
+        base_keys = _identity_keys(spec, base_items)
+        ours_keys = _identity_keys(spec, ours_items)
+        theirs_keys = _identity_keys(spec, theirs_items)
+        ours_ops = align_sequences(base_keys[0], ours_keys[0], base_keys[1], ours_keys[1])
+        theirs_ops = align_sequences(base_keys[0], theirs_keys[0], base_keys[1], theirs_keys[1])
+        ours_hashes = ours_keys[0]
+        theirs_hashes = theirs_keys[0]
+        ours_of = {op.left_index: op for op in ours_ops if op.left_index is not None}
+        theirs_of = {op.left_index: op for op in theirs_ops if op.left_index is not None}
+
+        conflicts: list[MergeConflict] = []
+        auto_merged = 0
+
+        # Resolve every base clause (None = deleted)
+        resolved: dict[tuple[str, int], Any] = {}
+        for index, base_item in enumerate(base_items):
+            ours_op = ours_of[index]
+            theirs_op = theirs_of[index]
+            ours_item = None if ours_op.kind == "delete" else ours_items[ours_op.right_index]
+            theirs_item = (
+                None if theirs_op.kind == "delete" else theirs_items[theirs_op.right_index]
             )
+            label = spec.label(base_item)
 
-            if strategy == MergeStrategy.OURS:
-                conflict.resolution = ConflictResolution.TOOK_OURS
-                if desc in ours_descs:
-                    effect = next(e for e in ours.effects if e.description == desc)
-                    if effect not in merged:
-                        merged.append(effect)
-                else:
-                    merged = [e for e in merged if e.description != desc]
-            elif strategy == MergeStrategy.THEIRS:
-                conflict.resolution = ConflictResolution.TOOK_THEIRS
-                if desc in theirs_descs:
-                    effect = next(e for e in theirs.effects if e.description == desc)
-                    if effect not in merged:
-                        merged.append(effect)
+            if ours_item is None or theirs_item is None:
+                if ours_item is None and theirs_item is None:
+                    merged = None
                 else:
-                    merged = [e for e in merged if e.description != desc]
+                    kept, kept_op = (
+                        (theirs_item, theirs_op) if ours_item is None else (ours_item, ours_op)
+                    )
+                    if kept_op.kind in ("equal", "move"):
+                        merged = None  # untouched on the other side: deletion wins
+                        auto_merged += 1
+                    else:
+                        merged, conflict = self._resolve_removal(
+                            spec, label, base_item, ours_item, theirs_item, strategy
+                        )
+                        conflicts.append(conflict)
+            elif ours_op.kind in ("equal", "move") and theirs_op.kind in ("equal", "move"):
+                # Same content on all sides (up to whitespace); keep any reformatting
+                merged = theirs_item if base_item == ours_item else ours_item
+            elif ours_op.kind in ("equal", "move"):
+                merged = theirs_item
+                auto_merged += 1
+            elif (
+                theirs_op.kind in ("equal", "move")
+                or ours_hashes[ours_op.right_index] == theirs_hashes[theirs_op.right_index]
+            ):
+                merged = ours_item
+                auto_merged += 1
             else:
-                conflict.resolution = ConflictResolution.MANUAL_REQUIRED
-
-            conflicts.append(conflict)
-
-        # Add safe additions
-        safe_ours_added = ours_added - theirs_removed
-        safe_theirs_added = theirs_added - ours_removed
-
-        for effect in ours.effects:
-            if effect.description in safe_ours_added:
-                merged.append(effect)
+                merged, field_conflicts, field_auto = self._merge_clause_fields(
+                    spec, label, base_item, ours_item, theirs_item, strategy
+                )
+                conflicts.extend(field_conflicts)
+                auto_merged += field_auto
+            resolved[("base", index)] = merged
+
+        # Our order is the skeleton; deleted base clauses stay in it as anchors
+        skeleton: list[tuple[str, int]] = []
+        added_by_us: dict[str, list[int]] = defaultdict(list)
+        for op in ours_ops:
+            if op.kind == "insert":
+                token = ("ours", op.right_index)
+                resolved[token] = ours_items[op.right_index]
+                added_by_us[ours_hashes[op.right_index]].append(op.right_index)
+                auto_merged += 1
+            else:
+                token = ("base", op.left_index)
+            skeleton.append(token)
+
+        # Their additions and moves are attached after the clause they follow
+        head = ("head", 0)
+        following: dict[tuple[str, int], list[tuple[str, int]]] = defaultdict(list)
+        relocated: set[tuple[str, int]] = set()
+        previous = head
+        for op in theirs_ops:
+            if op.kind == "delete":
+                continue
+            if op.kind == "insert":
+                same = added_by_us.get(theirs_hashes[op.right_index])
+                if same:
+                    previous = ("ours", same.pop(0))
+                    continue
+                token = ("theirs", op.right_index)
+                resolved[token] = theirs_items[op.right_index]
+                following[previous].append(token)
+                auto_merged += 1
+            else:
+                token = ("base", op.left_index)
+                if op.kind == "move" and ours_of[op.left_index].kind != "move":
+                    relocated.add(token)
+                    following[previous].append(token)
+                    auto_merged += 1
+            previous = token
+
+        merged_items: list[Any] = []
+
+        def emit_following(anchor: tuple[str, int]) -> None:
+            stack = list(reversed(following.get(anchor, ())))
+            while stack:
+                token = stack.pop()
+                if resolved[token] is not None:
+                    merged_items.append(resolved[token])
+                stack.extend(reversed(following.get(token, ())))
+
+        # Their additions after an anchor go after our own additions at that anchor
+        pending = [head]
+        for token in skeleton:
+            if token[0] == "base":
+                for anchor in pending:
+                    emit_following(anchor)
+                pending = []
+            if token in relocated:
+                continue
+            if resolved[token] is not None:
+                merged_items.append(resolved[token])
+            pending.append(token)
+        for anchor in pending:
+            emit_following(anchor)
+
+        return merged_items, conflicts, auto_merged
+
+    def _resolve_removal(
+        self,
+        spec: _ClauseSpec,
+        label: str,
+        base_item: Any,
+        ours_item: Any,
+        theirs_item: Any,
+        strategy: MergeStrategy,
+    ) -> tuple[Any, MergeConflict]:
+        """Resolve a clause deleted in one branch and edited in the other."""
+        conflict = MergeConflict(
+            category=spec.category,
+            kind=spec.removed_kind,
+            path=label,
+            base_value=base_item.to_dict(),
+            ours_value=ours_item.to_dict() if ours_item is not None else None,
+            theirs_value=theirs_item.to_dict() if theirs_item is not None else None,
+            message=f"'{label}' was removed in one branch and edited in the other",
+        )
+        if strategy == MergeStrategy.OURS:
+            conflict.resolution = ConflictResolution.TOOK_OURS
+            merged = ours_item
+        elif strategy == MergeStrategy.THEIRS:
+            conflict.resolution = ConflictResolution.TOOK_THEIRS
+            merged = theirs_item
+        elif strategy == MergeStrategy.BASE:
+            conflict.resolution = ConflictResolution.KEPT_BASE
+            merged = base_item
+        else:
+            conflict.resolution = ConflictResolution.MANUAL_REQUIRED
+            # Keep the edited clause as placeholder so the edit is not lost
+            merged = ours_item if ours_item is not None else theirs_item
+        conflict.resolved_value = merged.to_dict() if merged is not None else None
+        return merged, conflict
 
-        for effect in theirs.effects:
-            if effect.description in safe_theirs_added and effect not in merged:
-                merged.append(effect)
+    def _merge_clause_fields(
+        self,
+        spec: _ClauseSpec,
+        label: str,
+        base_item: Any,
+        ours_item: Any,
+        theirs_item: Any,
+        strategy: MergeStrategy,
+    ) -> tuple[Any, list[MergeConflict], int]:
+        """Merge a clause edited in both branches field by field."""
+        conflicts = []
+        auto_merged = 0
+        values: dict[str, Any] = {}
+        for attr, kind in spec.fields:
+            value, conflict, auto = self._merge_field(
+                f"{label}.{attr}",
+                spec.category,
+                kind,
+                getattr(base_item, attr),
+                getattr(ours_item, attr),
+                getattr(theirs_item, attr),
+                strategy,
+            )
+            if conflict:
+                conflicts.append(conflict)
+            auto_merged += auto
+            values[attr] = value
+        if spec.has_holes:
+            values["holes"] = self._merge_holes(base_item.holes, ours_item.holes, theirs_item.holes)
+        values["provenance"] = self._merge_provenance(
+            base_item.provenance, ours_item.provenance, theirs_item.provenance, strategy
+        )
+        return replace(base_item, **values), conflicts, auto_merged
 
-        auto_merged = len(safe_ours_added) + len(safe_theirs_added)
-        return merged, conflicts, auto_merged
+    def _merge_holes(
+        self,
+        base_holes: list[TypedHole],
+        ours_holes: list[TypedHole],
+        theirs_holes: list[TypedHole],
+    ) -> list[TypedHole]:
+        """Take the changed hole list, or the union by identifier if both changed."""
+        if base_holes == ours_holes:
+            return list(theirs_holes)
+        if base_holes == theirs_holes:
+            return list(ours_holes)
+        merged = list(ours_holes)
+        seen = {hole.identifier for hole in merged}
+        merged.extend(hole for hole in theirs_holes if hole.identifier not in seen)
+        return merged
 
     def _merge_metadata(
         self,
         base: IntermediateRepresentation,
         ours: IntermediateRepresentation,
         theirs: IntermediateRepresentation,
-        base_to_ours,
-        base_to_theirs,
         strategy: MergeStrategy,
     ) -> tuple[Metadata, list[MergeConflict], int]:
         """Merge metadata."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import sys
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -11,6 +13,18 @@ if TYPE_CHECKING:
     from lift_sys.ir.constraints import Constraint
 
 
+def _intern(value: str | None) -> str | None:
+    """
+    Intern a vocabulary string (type hint, name, author, reference id).
+
+    Deserialising creates a fresh copy of every string per payload, so when
+    thousands of IRs are loaded the same few type hints, authors and paths
+    dominate memory. Interned values are shared by all loaded IRs. Free
+    text (summaries, predicates) is left alone.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 class HoleKind(str, Enum):
     """Enumeration describing the semantic purpose of a typed hole."""
 
@@ -81,8 +95,8 @@ class Provenance:
             source=ProvenanceSource(data.get("source", ProvenanceSource.UNKNOWN.value)),
             confidence=data.get("confidence", 1.0),
             timestamp=data.get("timestamp", datetime.now(UTC).isoformat() + "Z"),
-            author=data.get("author"),
-            evidence_refs=data.get("evidence_refs", []),
+            author=_intern(data.get("author")),
+            evidence_refs=[_intern(ref) for ref in data.get("evidence_refs", [])],
             metadata=data.get("metadata", {}),
         )
 
@@ -112,6 +126,37 @@ class Provenance:
         return cls(source=ProvenanceSource.MERGE, author=author, **kwargs)
 
 
+@dataclass(frozen=True, slots=True)
+class ClauseIdentity:
+    """
+    Stable identity of a clause, used to track it across edits and merges.
+
+    The content hash ignores whitespace differences, so reformatting a
+    predicate does not change it. The provenance id survives content edits
+    as long as the clause keeps its provenance record.
+    """
+
+    content_hash: str
+    """Hash of the clause's whitespace-normalised content fields."""
+
+    provenance_id: str | None
+    """``source:author:timestamp`` of the clause's provenance, if any."""
+
+    @classmethod
+    def of(cls, *content: str | None, provenance: Provenance | None = None) -> ClauseIdentity:
+        """Build an identity from content fields and an optional provenance."""
+        digest = hashlib.blake2b(digest_size=16)
+        for value in content:
+            digest.update(" ".join((value or "").split()).encode("utf-8"))
+            digest.update(b"\x1f")
+        provenance_id = None
+        if provenance is not None:
+            provenance_id = (
+                f"{provenance.source.value}:{provenance.author or ''}:{provenance.timestamp}"
+            )
+        return cls(digest.hexdigest(), provenance_id)
+
+
 @dataclass(slots=True)
 class TypedHole:
     """Explicit representation of an unknown value in the IR."""
@@ -162,6 +207,13 @@ class Parameter:
     description: str | None = None
     provenance: Provenance | None = None
 
+    @property
+    def identity(self) -> ClauseIdentity:
+        """Stable identity for alignment and merging (see ``ClauseIdentity``)."""
+        return ClauseIdentity.of(
+            self.name, self.type_hint, self.description, provenance=self.provenance
+        )
+
     def to_dict(self) -> dict[str, object]:
         result = {
             "name": self.name,
@@ -199,6 +251,11 @@ class EffectClause:
     holes: list[TypedHole] = field(default_factory=list)
     provenance: Provenance | None = None
 
+    @property
+    def identity(self) -> ClauseIdentity:
+        """Stable identity for alignment and merging (see ``ClauseIdentity``)."""
+        return ClauseIdentity.of(self.description, provenance=self.provenance)
+
     def to_dict(self) -> dict[str, object]:
         result = {
             "description": self.description,
@@ -216,6 +273,11 @@ class AssertClause:
     holes: list[TypedHole] = field(default_factory=list)
     provenance: Provenance | None = None
 
+    @property
+    def identity(self) -> ClauseIdentity:
+        """Stable identity for alignment and merging (see ``ClauseIdentity``)."""
+        return ClauseIdentity.of(self.predicate, self.rationale, provenance=self.provenance)
+
     def to_dict(self) -> dict[str, object]:
         result = {
             "predicate": self.predicate,
@@ -352,6 +414,21 @@ class IntermediateRepresentation:
 
         return result
 
+    def to_bytes(self) -> bytes:
+        """Serialise the IR into the compact binary format (see ``codec.py``)."""
+
+        from lift_sys.ir.codec import encode_ir
+
+        return encode_ir(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> IntermediateRepresentation:
+        """Create an IR instance from a payload produced by ``to_bytes``."""
+
+        from lift_sys.ir.codec import decode_ir
+
+        return decode_ir(data)
+
     @classmethod
     def from_dict(cls, payload: dict[str, object]) -> IntermediateRepresentation:
         """Create an IR instance from a dictionary."""
@@ -369,7 +446,7 @@ class IntermediateRepresentation:
                         kind = HoleKind(kind)
                     hole = TypedHole(
                         identifier=hole_data["identifier"],
-                        type_hint=hole_data["type_hint"],
+                        type_hint=_intern(hole_data["type_hint"]),
                         description=hole_data.get("description", ""),
                         constraints=hole_data.get("constraints", {}),
                         kind=kind,
@@ -397,8 +474,8 @@ class IntermediateRepresentation:
             if isinstance(param, dict):
                 parameters.append(
                     Parameter(
-                        name=param["name"],
-                        type_hint=param["type_hint"],
+                        name=_intern(param["name"]),
+                        type_hint=_intern(param["type_hint"]),
                         description=param.get("description"),
                         provenance=parse_provenance(param.get("provenance")),
                     )
@@ -409,7 +486,7 @@ class IntermediateRepresentation:
         signature = SigClause(
             name=signature_data["name"],
             parameters=parameters,
-            returns=signature_data.get("returns"),
+            returns=_intern(signature_data.get("returns")),
             holes=parse_holes(signature_data.get("holes", [])),
             provenance=parse_provenance(signature_data.get("provenance")),
         )
@@ -443,9 +520,9 @@ class IntermediateRepresentation:
         # Parse relationships (Phase 2)
         relationships = [
             RelationshipClause(
-                from_entity=rel["from_entity"],
-                to_entity=rel["to_entity"],
-                relationship_type=rel["relationship_type"],
+                from_entity=_intern(rel["from_entity"]),
+                to_entity=_intern(rel["to_entity"]),
+                relationship_type=_intern(rel["relationship_type"]),
                 confidence=rel.get("confidence", 0.8),
                 description=rel.get("description", ""),
                 holes=parse_holes(rel.get("holes", [])),
@@ -456,9 +533,9 @@ class IntermediateRepresentation:
 
         metadata_payload = payload.get("metadata", {}) or {}
         metadata = Metadata(
-            source_path=metadata_payload.get("source_path"),
-            language=metadata_payload.get("language"),
-            origin=metadata_payload.get("origin"),
+            source_path=_intern(metadata_payload.get("source_path")),
+            language=_intern(metadata_payload.get("language")),
+            origin=_intern(metadata_payload.get("origin")),
             evidence=list(metadata_payload.get("evidence", [])),
         )
 
@@ -490,6 +567,7 @@ __all__ = [
     "HoleKind",
     "ProvenanceSource",
     "Provenance",
+    "ClauseIdentity",
     "TypedHole",
     "IntentClause",
     "Parameter",
@@ -1,7 +1,17 @@
-"""Parser for the lift-sys Intermediate Representation."""
+"""Parser for the lift-sys Intermediate Representation.
+
+The LALR parser is compiled once per process and shared by every
+``IRParser`` instance, with the IR transformer inlined into the parser
+callbacks so that parsing builds IR objects directly instead of an
+intermediate parse tree. Set ``LIFT_SYS_IR_GRAMMAR_CACHE`` to a file path to
+also persist the compiled parse tables on disk, so new processes skip
+grammar analysis entirely.
+"""
 
 from __future__ import annotations
 
+import os
+import threading
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
@@ -183,17 +193,54 @@ class _IRTransformer(Transformer):
         return str(token)
 
 
+# One compiled parser per typed-hole setting (the transformer is baked in)
+_COMPILED_PARSERS: dict[bool, Lark] = {}
+_COMPILED_PARSERS_LOCK = threading.Lock()
+
+
+def _build_parser(allow_typed_holes: bool = True, cache: str | bool = False) -> Lark:
+    """Compile the IR grammar into an LALR parser that emits IR objects."""
+    return Lark(
+        _GRAMMAR,
+        start="ir",
+        parser="lalr",
+        transformer=_IRTransformer(allow_typed_holes=allow_typed_holes),
+        cache=cache,
+    )
+
+
+def get_compiled_parser(allow_typed_holes: bool = True) -> Lark:
+    """
+    Return the process-wide compiled IR parser.
+
+    Args:
+        allow_typed_holes: Whether typed holes are accepted (a parser is
+            compiled for each setting on first use)
+
+    Returns:
+        Lark LALR parser whose ``parse()`` returns an IntermediateRepresentation
+    """
+    parser = _COMPILED_PARSERS.get(allow_typed_holes)
+    if parser is not None:
+        return parser
+    with _COMPILED_PARSERS_LOCK:
+        parser = _COMPILED_PARSERS.get(allow_typed_holes)
+        if parser is None:
+            cache_path = os.getenv("LIFT_SYS_IR_GRAMMAR_CACHE") or False
+            parser = _build_parser(allow_typed_holes, cache=cache_path)
+            _COMPILED_PARSERS[allow_typed_holes] = parser
+    return parser
+
+
 class IRParser:
     """High level wrapper around the Lark generated parser."""
 
     def __init__(self, config: ParserConfig | None = None) -> None:
         self.config = config or ParserConfig()
-        self._parser = Lark(_GRAMMAR, start="ir", parser="lalr")
+        self._parser = get_compiled_parser(self.config.allow_typed_holes)
 
     def parse(self, source: str) -> IntermediateRepresentation:
-        tree = self._parser.parse(source)
-        transformer = _IRTransformer(allow_typed_holes=self.config.allow_typed_holes)
-        return transformer.transform(tree)  # type: ignore[return-value]
+        return self._parser.parse(source)  # type: ignore[return-value]
 
     def parse_file(self, path: str | Path) -> IntermediateRepresentation:
         content = Path(path).read_text(encoding="utf8")
@@ -246,4 +293,4 @@ class IRParser:
         return " " * indent + "{" + entries + "}"
 
 
-__all__ = ["IRParser", "ParserConfig"]
+__all__ = ["IRParser", "ParserConfig", "get_compiled_parser"]
@@ -317,17 +317,9 @@ def get_ir_schema() -> dict[str, Any]:
     return IR_JSON_SCHEMA
 
 
-def get_prompt_for_ir_generation(user_prompt: str) -> str:
-    """
-    Generate a system prompt that instructs the LLM to create IR from user input.
-
-    Args:
-        user_prompt: Natural language description from user
-
-    Returns:
-        Formatted prompt for LLM with IR schema instructions
-    """
-    return f"""You are an expert at converting natural language specifications into formal intermediate representations (IR).
+# Stable instruction block shared by every IR generation prompt. Prompts start
+# with it so providers can cache it (Anthropic cache_control, vLLM prefix caching).
+IR_GENERATION_INSTRUCTIONS = """You are an expert at converting natural language specifications into formal intermediate representations (IR).
 
 Given a natural language description of a function, generate a JSON object following the lift-sys IR schema.
 
@@ -429,10 +421,31 @@ Important guidelines:
    - Specify exact order of checks
    - Specify exact return values for each branch
 
-User's request:
+"""
+
+
+def get_prompt_for_ir_generation(user_prompt: str) -> str:
+    """
+    Generate a system prompt that instructs the LLM to create IR from user input.
+
+    The prompt is ``IR_GENERATION_INSTRUCTIONS`` followed by the user's request,
+    so everything before the request is identical across calls.
+
+    Args:
+        user_prompt: Natural language description from user
+
+    Returns:
+        Formatted prompt for LLM with IR schema instructions
+    """
+    return f"""{IR_GENERATION_INSTRUCTIONS}User's request:
 {user_prompt}
 
 Generate the IR as valid JSON matching the schema:"""
 
 
-__all__ = ["IR_JSON_SCHEMA", "get_ir_schema", "get_prompt_for_ir_generation"]
+__all__ = [
+    "IR_GENERATION_INSTRUCTIONS",
+    "IR_JSON_SCHEMA",
+    "get_ir_schema",
+    "get_prompt_for_ir_generation",
+]
@@ -0,0 +1,432 @@
+"""Compiled JSON-schema validation for LLM output.
+
+``compile_schema`` turns a JSON schema (the draft-07 subset used by
+``IR_JSON_SCHEMA`` and the code generation schemas) into a tree of closures
+once, so validating a document is a single walk with no schema
+interpretation. The walk collects every error with a precise path
+(``signature.parameters[1].name``) that can be fed back to the model on
+retry.
+
+Object nodes can be given factories, keyed by JSON pointer into the schema
+(``"#/definitions/TypedHole"``, ``"#/properties/effects/items"``). A factory
+receives the validated (and already converted) object and returns the value
+to use in its place, so validation and conversion to IR objects happen in the
+same pass.
+
+Supported keywords: ``type``, ``properties``, ``required``,
+``additionalProperties``, ``items``, ``minItems``, ``enum``, ``const``,
+``pattern``, ``minLength``, ``oneOf`` and local ``$ref``. Annotations such as
+``description`` and ``default`` are ignored.
+
+Usage:
+    validator = compile_schema(TYPESCRIPT_GENERATION_SCHEMA)
+    validator.validate(impl_json)  # raises SchemaValidationError
+
+    converter = compile_schema(IR_JSON_SCHEMA, factories={"#/definitions/TypedHole": make_hole})
+    converted = converter.validate(ir_json)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+# A path is a linked list of (parent, key) pairs, only formatted on error
+_Path = tuple[Any, str | int] | None
+_Check = Callable[[Any, _Path, list["SchemaError"]], Any]
+
+_TYPE_NAMES = {
+    dict: "object",
+    list: "array",
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    type(None): "null",
+}
+
+
+def _is_integer(value: Any) -> bool:
+    return type(value) is int or (type(value) is float and value.is_integer())
+
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "number": lambda value: type(value) in (int, float),
+    "null": lambda value: value is None,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaError:
+    """One validation failure."""
+
+    path: str
+    """Location in the document (empty for the root)."""
+
+    message: str
+    """What is wrong at that location."""
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a document does not match its schema."""
+
+    MAX_REPORTED = 5
+
+    def __init__(self, errors: list[SchemaError]):
+        self.errors = errors
+        shown = "; ".join(str(error) for error in errors[: self.MAX_REPORTED])
+        hidden = len(errors) - self.MAX_REPORTED
+        super().__init__(f"{shown} (+{hidden} more)" if hidden > 0 else shown)
+
+
+class CompiledSchema:
+    """A JSON schema compiled into a validating (and converting) function."""
+
+    def __init__(
+        self,
+        schema: Mapping[str, Any],
+        factories: Mapping[str, Callable[[dict[str, Any]], Any]] | None = None,
+    ):
+        """
+        Compile a schema.
+
+        Args:
+            schema: JSON schema (draft-07 subset, see module docstring)
+            factories: Optional converters for object nodes, keyed by JSON
+                pointer into ``schema``
+        """
+        self.schema = schema
+        self._factories = dict(factories or {})
+        self._used_factories: set[str] = set()
+        self._nodes: dict[str, _Check] = {}
+        self._resolved: dict[str, tuple[str, Mapping[str, Any]]] = {}
+        self._refs: dict[str, tuple[_Check, bool]] = {}
+        self._pending_refs: set[str] = set()
+        self._check, _ = self._compile_ref("#")
+        unused = set(self._factories) - self._used_factories
+        if unused:
+            raise ValueError(f"Factories for unknown schema nodes: {sorted(unused)}")
+
+    def validate(self, document: Any) -> Any:
+        """
+        Validate ``document`` and return it, converted by the factories.
+
+        Raises:
+            SchemaValidationError: With every error found, if any
+        """
+        errors: list[SchemaError] = []
+        result = self._check(document, None, errors)
+        if errors:
+            raise SchemaValidationError(errors)
+        return result
+
+    def errors(self, document: Any) -> list[SchemaError]:
+        """Return every validation error in ``document`` (empty if valid)."""
+        errors: list[SchemaError] = []
+        self._check(document, None, errors)
+        return errors
+
+    def is_valid(self, document: Any) -> bool:
+        """Return True if ``document`` matches the schema."""
+        return not self.errors(document)
+
+    def validate_at(self, pointer: str, value: Any, path: Sequence[str | int] = ()) -> Any:
+        """
+        Validate ``value`` against the schema node at ``pointer`` only.
+
+        Used to check parts of a document as they arrive (see ``stream_parser``).
+
+        Args:
+            pointer: JSON pointer of the node, e.g. ``"#/properties/signature"``
+            value: Value to validate
+            path: Location of ``value`` in the document, used in error paths
+
+        Returns:
+            ``value``, converted by the factories
+
+        Raises:
+            KeyError: If the schema has no node at ``pointer``
+            SchemaValidationError: With every error found, if any
+        """
+        linked: _Path = None
+        for key in path:
+            linked = (linked, key)
+        errors: list[SchemaError] = []
+        result = self._nodes[pointer](value, linked, errors)
+        if errors:
+            raise SchemaValidationError(errors)
+        return result
+
+    def resolve(self, pointer: str) -> tuple[str, Mapping[str, Any]]:
+        """Return the pointer and schema node at ``pointer``, following ``$ref``."""
+        resolved = self._resolved.get(pointer)
+        if resolved is None:
+            node: Any = self.schema
+            for part in pointer[2:].split("/") if pointer != "#" else ():
+                node = node[part]
+            resolved = self.resolve(node["$ref"]) if "$ref" in node else (pointer, node)
+            self._resolved[pointer] = resolved
+        return resolved
+
+    # -- compilation -----------------------------------------------------------------
+
+    def _factory(self, pointer: str) -> Callable[[dict[str, Any]], Any] | None:
+        factory = self._factories.get(pointer)
+        if factory is not None:
+            self._used_factories.add(pointer)
+        return factory
+
+    def _compile(self, node: Mapping[str, Any], pointer: str) -> tuple[_Check, bool]:
+        """Compile ``node``; return its check and whether it converts values."""
+        if "$ref" in node:
+            compiled = self._compile_ref(node["$ref"])
+            self._nodes[pointer] = compiled[0]
+            return compiled
+
+        checks: list[_Check] = []
+        converts = False
+
+        if "type" in node:
+            checks.append(_type_check(node["type"]))
+        if "enum" in node:
+            allowed = list(node["enum"])
+            checks.append(_predicate(lambda v: v in allowed, f"must be one of {allowed}"))
+        if "const" in node:
+            const = node["const"]
+            checks.append(_predicate(lambda v: v == const, f"must be {const!r}"))
+        if "pattern" in node:
+            pattern = re.compile(node["pattern"])
+            checks.append(
+                _predicate(
+                    lambda v: not isinstance(v, str) or pattern.search(v) is not None,
+                    f"does not match pattern {node['pattern']!r}",
+                )
+            )
+        if "minLength" in node:
+            min_length = node["minLength"]
+            checks.append(
+                _predicate(
+                    lambda v: not isinstance(v, str) or len(v) >= min_length,
+                    f"must be at least {min_length} characters",
+                )
+            )
+        if "minItems" in node:
+            min_items = node["minItems"]
+            message = (
+                "cannot be empty" if min_items == 1 else f"must have at least {min_items} items"
+            )
+            checks.append(
+                _predicate(lambda v: not isinstance(v, list) or len(v) >= min_items, message)
+            )
+
+        if "oneOf" in node:
+            branches = [
+                self._compile(branch, f"{pointer}/oneOf/{index}")
+                for index, branch in enumerate(node["oneOf"])
+            ]
+            # Alternatives are only validated; factories inside them are not applied
+            checks.append(_one_of([check for check, _ in branches]))
+
+        structure: _Check | None = None
+        structure_type: type = dict
+        if "properties" in node or "required" in node or "additionalProperties" in node:
+            structure, child_converts = self._compile_object(node, pointer)
+            converts = converts or child_converts
+        elif "items" in node:
+            structure, converts_items = self._compile_array(node["items"], f"{pointer}/items")
+            structure_type = list
+            converts = converts or converts_items
+
+        factory = self._factory(pointer)
+        check = _combine(checks, structure, structure_type, factory)
+        self._nodes[pointer] = check
+        return check, converts or factory is not None
+
+    def _compile_ref(self, ref: str) -> tuple[_Check, bool]:
+        if ref != "#" and not ref.startswith("#/"):
+            raise ValueError(f"Only local $ref is supported, got {ref!r}")
+        if ref in self._refs:
+            return self._refs[ref]
+        refs = self._refs
+        if ref in self._pending_refs:
+            # Recursive definition: resolve the compiled check at call time
+            return (lambda value, path, errors: refs[ref][0](value, path, errors)), False
+        self._pending_refs.add(ref)
+        target: Any = self.schema
+        for part in ref[2:].split("/") if ref != "#" else ():
+            target = target[part]
+        refs[ref] = self._compile(target, ref)
+        self._pending_refs.discard(ref)
+        return refs[ref]
+
+    def _compile_object(self, node: Mapping[str, Any], pointer: str) -> tuple[_Check, bool]:
+        properties = {
+            name: self._compile(child, f"{pointer}/properties/{name}")
+            for name, child in node.get("properties", {}).items()
+        }
+        property_checks = {name: check for name, (check, _) in properties.items()}
+        converts = any(child_converts for _, child_converts in properties.values())
+        required = list(node.get("required", ()))
+        additional = node.get("additionalProperties", True)
+        additional_check: _Check | None = None
+        if isinstance(additional, Mapping):
+            additional_check, additional_converts = self._compile(
+                additional, f"{pointer}/additionalProperties"
+            )
+            converts = converts or additional_converts
+
+        def check_object(value: dict[str, Any], path: _Path, errors: list[SchemaError]) -> Any:
+            for name in required:
+                if name not in value:
+                    errors.append(SchemaError(_format(path), f"Missing '{name}'"))
+            result = {} if converts else value
+            for key, item in value.items():
+                child = property_checks.get(key)
+                if child is None:
+                    if additional is False:
+                        errors.append(SchemaError(_format(path), f"unexpected property '{key}'"))
+                        continue
+                    if additional_check is not None:
+                        item = additional_check(item, (path, key), errors)
+                else:
+                    item = child(item, (path, key), errors)
+                if converts:
+                    result[key] = item
+            return result
+
+        return check_object, converts
+
+    def _compile_array(self, items: Mapping[str, Any], pointer: str) -> tuple[_Check, bool]:
+        item_check, converts = self._compile(items, pointer)
+
+        def check_array(value: list[Any], path: _Path, errors: list[SchemaError]) -> Any:
+            if converts:
+                return [item_check(item, (path, i), errors) for i, item in enumerate(value)]
+            for index, item in enumerate(value):
+                item_check(item, (path, index), errors)
+            return value
+
+        return check_array, converts
+
+
+def compile_schema(
+    schema: Mapping[str, Any],
+    factories: Mapping[str, Callable[[dict[str, Any]], Any]] | None = None,
+) -> CompiledSchema:
+    """
+    Compile a JSON schema into a reusable validator.
+
+    Compile once (e.g. at module import) and reuse the result; compiling is
+    far more expensive than validating.
+
+    Args:
+        schema: JSON schema (draft-07 subset, see module docstring)
+        factories: Optional converters for object nodes, keyed by JSON pointer
+
+    Returns:
+        CompiledSchema
+    """
+    return CompiledSchema(schema, factories)
+
+
+def _format(path: _Path) -> str:
+    parts: list[str | int] = []
+    while path is not None:
+        path, key = path
+        parts.append(key)
+    text = ""
+    for key in reversed(parts):
+        text += f"[{key}]" if isinstance(key, int) else (f".{key}" if text else key)
+    return text
+
+
+def _type_name(value: Any) -> str:
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def _type_check(expected: str | list[str]) -> _Check:
+    names = [expected] if isinstance(expected, str) else list(expected)
+    tests = [_TYPE_CHECKS[name] for name in names]
+    label = " or ".join(names)
+
+    def check_type(value: Any, path: _Path, errors: list[SchemaError]) -> bool:
+        for test in tests:
+            if test(value):
+                return True
+        errors.append(SchemaError(_format(path), f"expected {label}, got {_type_name(value)}"))
+        return False
+
+    return check_type
+
+
+def _predicate(test: Callable[[Any], bool], message: str) -> _Check:
+    def check(value: Any, path: _Path, errors: list[SchemaError]) -> bool:
+        if test(value):
+            return True
+        errors.append(SchemaError(_format(path), message))
+        return False
+
+    return check
+
+
+def _one_of(branches: list[_Check]) -> _Check:
+    def check_one_of(value: Any, path: _Path, errors: list[SchemaError]) -> bool:
+        attempts = []
+        for branch in branches:
+            branch_errors: list[SchemaError] = []
+            branch(value, path, branch_errors)
+            attempts.append(branch_errors)
+        matched = sum(1 for attempt in attempts if not attempt)
+        if matched == 1:
+            return True
+        if matched == 0:
+            # Report the closest alternative rather than every branch
+            errors.extend(min(attempts, key=len))
+        else:
+            errors.append(
+                SchemaError(_format(path), f"matches {matched} alternatives, expected exactly one")
+            )
+        return False
+
+    return check_one_of
+
+
+def _combine(
+    checks: list[_Check],
+    structure: _Check | None,
+    structure_type: type,
+    factory: Callable[[dict[str, Any]], Any] | None,
+) -> _Check:
+    """Run keyword checks, then the structural walk, then the factory."""
+
+    def check(value: Any, path: _Path, errors: list[SchemaError]) -> Any:
+        for keyword_check in checks:
+            if not keyword_check(value, path, errors):
+                return value
+        if structure is None or not isinstance(value, structure_type):
+            return value
+        before = len(errors)
+        result = structure(value, path, errors)
+        if factory is not None and len(errors) == before:
+            return factory(result)
+        return result
+
+    return check
+
+
+__all__ = [
+    "CompiledSchema",
+    "SchemaError",
+    "SchemaValidationError",
+    "compile_schema",
+]
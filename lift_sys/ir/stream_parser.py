@@ -0,0 +1,330 @@
+"""Incremental JSON parsing of streamed LLM output.
+
+``StreamingJSONParser`` consumes a completion chunk by chunk (as yielded by
+``BaseProvider.generate_stream``) instead of waiting for the full text and
+then searching it for braces. Leading prose or a Markdown fence before the
+first ``{`` is skipped, and everything after the closing ``}`` is ignored.
+
+When given a ``CompiledSchema`` the parser checks the document while it is
+still arriving:
+
+- an unexpected property fails as soon as its name is complete
+- a container of the wrong type fails on its opening bracket
+- every completed value is validated against its schema node
+
+The first failure raises ``SchemaValidationError`` (or ``JSONStreamError``
+for malformed JSON); ``consume`` then closes the stream so the provider
+stops generating. Completed values near the root are handed to ``on_value``
+(converted by the schema's factories) before the rest of the document has
+arrived, e.g. the signature while the effects are still being generated.
+
+Usage:
+    parser = StreamingJSONParser(compile_schema(IR_JSON_SCHEMA), on_value=callback)
+    document = await parser.consume(provider.generate_stream(prompt))
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from .schema_validator import CompiledSchema, SchemaError, SchemaValidationError
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_NUMBER = re.compile(r"[-+0-9.eE]+")
+_LITERALS = {"true": True, "false": False, "null": None}
+_CLOSERS = {"}": dict, "]": list}
+
+
+class JSONStreamError(ValueError):
+    """Raised when streamed output is not a single well-formed JSON object."""
+
+
+class _Frame:
+    """An open object or array."""
+
+    __slots__ = ("container", "pointer", "path", "key", "key_pointer", "state")
+
+    def __init__(self, container: dict | list, pointer: str | None, path: tuple) -> None:
+        self.container = container
+        self.pointer = pointer
+        self.path = path
+        self.key: str | None = None
+        self.key_pointer: str | None = None
+        self.state = "first"  # first, key, colon, value, next
+
+
+class StreamingJSONParser:
+    """Parse (and optionally validate) one JSON object fed in chunks."""
+
+    def __init__(
+        self,
+        schema: CompiledSchema | None = None,
+        on_value: Callable[[tuple[str | int, ...], Any], None] | None = None,
+        emit_depth: int = 1,
+    ):
+        """
+        Create a parser.
+
+        Args:
+            schema: Optional compiled schema to validate against while parsing
+            on_value: Called with ``(path, value)`` for each completed value
+                whose path is at most ``emit_depth`` long (the root excluded)
+            emit_depth: Maximum depth of values handed to ``on_value``
+        """
+        self.schema = schema
+        self.on_value = on_value
+        self.emit_depth = emit_depth
+        self.received = 0
+        """Characters fed so far."""
+        self.done = False
+        """Whether the root object is complete."""
+        self._buffer = ""
+        self._offset = 0  # characters already dropped from the buffer
+        self._stack: list[_Frame] = []
+        self._document: Any = None
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of output.
+
+        Returns:
+            True once the root object is complete (later chunks are ignored)
+
+        Raises:
+            JSONStreamError: If the output is not well-formed JSON
+            SchemaValidationError: If the output diverges from the schema
+        """
+        self.received += len(chunk)
+        if self.done:
+            return True
+        self._buffer += chunk
+        position = self._parse(self._buffer)
+        self._offset += position
+        self._buffer = self._buffer[position:]
+        return self.done
+
+    def finish(self) -> Any:
+        """
+        Return the parsed document once the stream has ended.
+
+        Raises:
+            JSONStreamError: If no complete JSON object was received
+        """
+        if not self.done:
+            if not self._stack:
+                raise JSONStreamError("No JSON object found in response")
+            raise JSONStreamError("Response ended before the JSON object was complete")
+        return self._document
+
+    async def consume(self, chunks: AsyncIterator[str]) -> Any:
+        """
+        Feed an async stream of chunks and return the parsed document.
+
+        The stream is closed as soon as the document is complete or invalid,
+        which cancels the rest of the generation.
+        """
+        try:
+            async for chunk in chunks:
+                if self.feed(chunk):
+                    break
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        return self.finish()
+
+    # -- parsing ---------------------------------------------------------------------
+
+    def _parse(self, text: str) -> int:
+        """Parse as far as possible; return the position of the first unconsumed character."""
+        stack = self._stack
+        position = 0
+        end = len(text)
+        while not self.done:
+            if not stack:
+                start = text.find("{", position)
+                if start == -1:
+                    return end
+                stack.append(_Frame({}, self._root_pointer(), ()))
+                position = start + 1
+                continue
+
+            position = _WHITESPACE.match(text, position).end()
+            if position == end:
+                break
+            char = text[position]
+            frame = stack[-1]
+            state = frame.state
+            is_object = type(frame.container) is dict
+
+            if state == "next":
+                if char == ",":
+                    frame.state = "key" if is_object else "value"
+                    position += 1
+                elif _CLOSERS.get(char) is type(frame.container):
+                    position += 1
+                    self._close()
+                else:
+                    self._syntax_error(position, "expected ',' or a closing bracket")
+            elif state == "colon":
+                if char != ":":
+                    self._syntax_error(position, "expected ':'")
+                frame.state = "value"
+                position += 1
+            elif state == "first" and _CLOSERS.get(char) is type(frame.container):
+                position += 1
+                self._close()
+            elif is_object and state != "value":
+                if char != '"':
+                    self._syntax_error(position, "expected a property name")
+                match = _STRING.match(text, position)
+                if match is None:
+                    break
+                self._start_key(frame, self._decode(match.group(), position))
+                frame.state = "colon"
+                position = match.end()
+            else:
+                next_position = self._value(frame, text, position)
+                if next_position is None:
+                    break
+                position = next_position
+        return position
+
+    def _value(self, frame: _Frame, text: str, position: int) -> int | None:
+        """Parse a value starting at ``position``; None if more input is needed."""
+        if type(frame.container) is dict:
+            key: str | int = frame.key
+            pointer = frame.key_pointer
+        else:
+            key = len(frame.container)
+            pointer = self._child_pointer(frame, key)
+        path = (*frame.path, key)
+        char = text[position]
+
+        if char in "{[":
+            container: dict | list = {} if char == "{" else []
+            self._check_container(pointer, container, path)
+            self._stack.append(_Frame(container, pointer, path))
+            return position + 1
+
+        if char == '"':
+            match = _STRING.match(text, position)
+            if match is None:
+                return None
+            value = self._decode(match.group(), position)
+        elif char in "-0123456789":
+            match = _NUMBER.match(text, position)
+            if match.end() == len(text):
+                return None  # the number may continue in the next chunk
+            value = self._decode(match.group(), position)
+        else:
+            for literal, literal_value in _LITERALS.items():
+                if text.startswith(literal, position):
+                    value = literal_value
+                    match = None
+                    position += len(literal)
+                    break
+                if literal.startswith(text[position:]):
+                    return None
+            else:
+                self._syntax_error(position, "expected a value")
+        self._complete(frame, value, pointer, path)
+        return match.end() if match is not None else position
+
+    def _close(self) -> None:
+        frame = self._stack.pop()
+        value = frame.container
+        if not self._stack:
+            if self.schema is not None and frame.pointer is not None:
+                self.schema.validate_at(frame.pointer, value)
+            self._document = value
+            self.done = True
+            return
+        self._complete(self._stack[-1], value, frame.pointer, frame.path)
+
+    def _complete(
+        self, parent: _Frame, value: Any, pointer: str | None, path: tuple[str | int, ...]
+    ) -> None:
+        """Validate a completed value, hand it to ``on_value`` and attach it."""
+        converted = value
+        if self.schema is not None and pointer is not None:
+            converted = self.schema.validate_at(pointer, value, path)
+        if self.on_value is not None and len(path) <= self.emit_depth:
+            self.on_value(path, converted)
+        if type(parent.container) is dict:
+            parent.container[parent.key] = value
+        else:
+            parent.container.append(value)
+        parent.state = "next"
+
+    # -- schema tracking -------------------------------------------------------------
+
+    def _root_pointer(self) -> str | None:
+        return self.schema.resolve("#")[0] if self.schema is not None else None
+
+    def _start_key(self, frame: _Frame, key: str) -> None:
+        frame.key = key
+        frame.key_pointer = self._child_pointer(frame, key)
+
+    def _child_pointer(self, frame: _Frame, key: str | int) -> str | None:
+        """Pointer of the schema node for ``key`` (None when unconstrained)."""
+        if frame.pointer is None:
+            return None
+        node = self.schema.resolve(frame.pointer)[1]
+        if isinstance(key, int):
+            if isinstance(node.get("items"), dict):
+                return self.schema.resolve(f"{frame.pointer}/items")[0]
+            return None
+        if key in node.get("properties", {}):
+            return self.schema.resolve(f"{frame.pointer}/properties/{key}")[0]
+        additional = node.get("additionalProperties", True)
+        if additional is False:
+            raise SchemaValidationError(
+                [SchemaError(_format(frame.path), f"unexpected property '{key}'")]
+            )
+        if isinstance(additional, dict):
+            return self.schema.resolve(f"{frame.pointer}/additionalProperties")[0]
+        return None
+
+    def _check_container(self, pointer: str | None, container: dict | list, path: tuple) -> None:
+        """Fail on an opening bracket whose container type the schema rejects."""
+        if pointer is None:
+            return
+        expected = self.schema.resolve(pointer)[1].get("type")
+        if expected is None:
+            return
+        names = [expected] if isinstance(expected, str) else list(expected)
+        actual = "object" if type(container) is dict else "array"
+        if actual not in names:
+            raise SchemaValidationError(
+                [SchemaError(_format(path), f"expected {' or '.join(names)}, got {actual}")]
+            )
+
+    # -- errors ----------------------------------------------------------------------
+
+    def _decode(self, token: str, position: int) -> Any:
+        try:
+            return json.loads(token)
+        except json.JSONDecodeError as exc:
+            self._syntax_error(position, f"invalid token {token[:40]!r} ({exc.msg})")
+
+    def _syntax_error(self, position: int, message: str) -> None:
+        path = _format(self._stack[-1].path) if self._stack else ""
+        location = f" in {path}" if path else ""
+        raise JSONStreamError(
+            f"Invalid JSON at character {self._offset + position}{location}: {message}"
+        )
+
+
+def _format(path: tuple[str | int, ...]) -> str:
+    text = ""
+    for key in path:
+        text += f"[{key}]" if isinstance(key, int) else (f".{key}" if text else key)
+    return text
+
+
+__all__ = ["JSONStreamError", "StreamingJSONParser"]
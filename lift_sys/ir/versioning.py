@@ -1,14 +1,37 @@
-"""IR versioning and history management."""
+"""IR versioning and history management.
+
+Versions are stored as a delta chain: every ``keyframe_interval``-th version
+keeps a full serialized snapshot, and the versions in between keep only a
+structural patch against their parent (see ``delta.py``) plus the parent
+diff without the IR snapshots it was computed from. Historical versions
+are reconstructed on demand from the nearest keyframe, and reconstructed
+versions and version comparisons are kept in small per-history LRU caches.
+Memory use and serialized size therefore grow with the size of the changes
+rather than with the number of versions times the IR size.
+"""
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
-from .differ import ComparisonResult, IRComparer
+from .delta import PatchOp, apply_patch, diff_documents
+from .differ import CategoryComparison, ComparisonResult, IRComparer
+from .fingerprint import IRFingerprintCache
 from .models import IntermediateRepresentation
 
+_DIFF_CATEGORIES = (
+    "intent_comparison",
+    "signature_comparison",
+    "assertion_comparison",
+    "effect_comparison",
+    "metadata_comparison",
+)
+
 
 @dataclass(slots=True)
 class VersionMetadata:
@@ -79,12 +102,51 @@ class IRVersion:
         )
 
 
+@dataclass(slots=True)
+class _VersionRecord:
+    """Stored form of one version: a keyframe snapshot or a patch to its parent."""
+
+    version_metadata: VersionMetadata
+    """Version metadata (``diff_from_parent`` is kept separately in ``diff``)"""
+
+    snapshot: dict[str, Any] | None = None
+    """Full ``IntermediateRepresentation.to_dict()`` for keyframes"""
+
+    patch: list[PatchOp] | None = None
+    """Structural patch from the parent's serialized IR for delta versions"""
+
+    diff: dict[str, Any] | None = None
+    """Serialized parent diff without the left/right IR snapshots"""
+
+
+def _strip_diff(diff: ComparisonResult) -> dict[str, Any]:
+    """Serialize a parent diff without the IRs it was computed from."""
+    data = {name: getattr(diff, name).to_dict() for name in _DIFF_CATEGORIES}
+    data["overall_similarity"] = diff.overall_similarity
+    return data
+
+
+def _restore_diff(
+    data: dict[str, Any], left: IntermediateRepresentation, right: IntermediateRepresentation
+) -> ComparisonResult:
+    """Rebuild a parent diff stored by ``_strip_diff``."""
+    categories = {name: CategoryComparison.from_dict(data[name]) for name in _DIFF_CATEGORIES}
+    return ComparisonResult(
+        left_ir=left,
+        right_ir=right,
+        overall_similarity=data.get("overall_similarity", 1.0),
+        **categories,
+    )
+
+
 class VersionedIR:
     """
     Wrapper for IntermediateRepresentation with version history.
 
     Manages a linear version history of an IR, with each version
-    tracking its parent, changes, and metadata.
+    tracking its parent, changes, and metadata. History is stored as a
+    delta chain with periodic keyframes; ``IRVersion`` objects are
+    reconstructed on demand.
     """
 
     def __init__(
@@ -92,6 +154,8 @@ class VersionedIR:
         current_ir: IntermediateRepresentation | None = None,
         initial_author: str | None = None,
         initial_metadata: dict[str, Any] | None = None,
+        keyframe_interval: int = 16,
+        cache_size: int = 32,
     ):
         """
         Initialize a new versioned IR.
@@ -100,9 +164,23 @@ class VersionedIR:
             current_ir: Initial IR (creates version 1)
             initial_author: Author of the initial version
             initial_metadata: Additional metadata for the initial version
+            keyframe_interval: Store a full snapshot every N versions; the
+                versions in between store patches against their parent
+            cache_size: Maximum reconstructed versions (and version
+                comparisons) kept in the LRU caches
         """
-        self._versions: list[IRVersion] = []
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be positive, got {keyframe_interval}")
+        self.keyframe_interval = keyframe_interval
+        self._records: list[_VersionRecord] = []
         self._comparer = IRComparer()
+        self._version_cache: IRFingerprintCache[IRVersion] = IRFingerprintCache(max_size=cache_size)
+        self._comparison_cache: IRFingerprintCache[ComparisonResult] = IRFingerprintCache(
+            max_size=cache_size
+        )
+        # Latest version, kept materialized so new versions can be diffed cheaply
+        self._head_ir: IntermediateRepresentation | None = None
+        self._head_dict: dict[str, Any] | None = None
 
         if current_ir:
             self.create_version(
@@ -115,19 +193,21 @@ class VersionedIR:
     @property
     def current_version(self) -> int:
         """Get the current version number."""
-        return len(self._versions)
+        return len(self._records)
 
     @property
     def current_ir(self) -> IntermediateRepresentation | None:
         """Get the current IR."""
-        if not self._versions:
+        if not self._records:
             return None
-        return self._versions[-1].ir
+        if self._head_ir is None:
+            self._head_ir = self.get_version(len(self._records)).ir
+        return self._head_ir
 
     @property
     def versions(self) -> list[IRVersion]:
         """Get all versions (read-only access)."""
-        return self._versions.copy()
+        return list(self._iter_versions(1, len(self._records)))
 
     def create_version(
         self,
@@ -150,14 +230,14 @@ class VersionedIR:
         Returns:
             The new version number
         """
-        new_version = len(self._versions) + 1
-        parent_version = new_version - 1 if self._versions else None
+        new_version = len(self._records) + 1
+        parent_version = new_version - 1 if self._records else None
+        ir_dict = ir.to_dict()
 
         # Compute diff from parent
         diff_from_parent = None
         if parent_version is not None:
-            parent_ir = self._versions[parent_version - 1].ir
-            diff_from_parent = self._comparer.compare(parent_ir, ir)
+            diff_from_parent = self._comparer.compare(self.current_ir, ir)
 
         version_metadata = VersionMetadata(
             version=new_version,
@@ -165,13 +245,31 @@ class VersionedIR:
             created_at=datetime.now(UTC).isoformat() + "Z",
             author=author,
             change_summary=change_summary,
-            diff_from_parent=diff_from_parent,
             tags=tags or [],
             metadata=metadata or {},
         )
 
-        ir_version = IRVersion(ir=ir, version_metadata=version_metadata)
-        self._versions.append(ir_version)
+        record = _VersionRecord(
+            version_metadata=version_metadata,
+            diff=_strip_diff(diff_from_parent) if diff_from_parent else None,
+        )
+        if self._is_keyframe(new_version):
+            record.snapshot = ir_dict
+        else:
+            record.patch = diff_documents(self._head_snapshot(), ir_dict)
+        self._records.append(record)
+
+        self._head_ir = ir
+        self._head_dict = ir_dict
+        self._version_cache.put(
+            str(new_version),
+            IRVersion(
+                ir=ir,
+                version_metadata=dataclasses.replace(
+                    version_metadata, diff_from_parent=diff_from_parent
+                ),
+            ),
+        )
 
         return new_version
 
@@ -185,9 +283,12 @@ class VersionedIR:
         Returns:
             The IR version or None if not found
         """
-        if version < 1 or version > len(self._versions):
+        if version < 1 or version > len(self._records):
             return None
-        return self._versions[version - 1]
+        cached = self._version_cache.get(str(version))
+        if cached is not None:
+            return cached
+        return next(self._iter_versions(version, version))
 
     def get_version_range(self, start: int, end: int) -> list[IRVersion]:
         """
@@ -200,9 +301,9 @@ class VersionedIR:
         Returns:
             List of IR versions in the range
         """
-        if start < 1 or end > len(self._versions) or start > end:
+        if start < 1 or end > len(self._records) or start > end:
             return []
-        return self._versions[start - 1 : end]
+        return list(self._iter_versions(start, end))
 
     def get_versions_by_author(self, author: str) -> list[IRVersion]:
         """
@@ -214,7 +315,11 @@ class VersionedIR:
         Returns:
             List of versions by that author
         """
-        return [v for v in self._versions if v.version_metadata.author == author]
+        return [
+            self.get_version(record.version_metadata.version)
+            for record in self._records
+            if record.version_metadata.author == author
+        ]
 
     def get_versions_by_tag(self, tag: str) -> list[IRVersion]:
         """
@@ -226,7 +331,11 @@ class VersionedIR:
         Returns:
             List of versions with that tag
         """
-        return [v for v in self._versions if tag in v.version_metadata.tags]
+        return [
+            self.get_version(record.version_metadata.version)
+            for record in self._records
+            if tag in record.version_metadata.tags
+        ]
 
     def compare_versions(self, version1: int, version2: int) -> ComparisonResult | None:
         """
@@ -239,13 +348,20 @@ class VersionedIR:
         Returns:
             Comparison result or None if versions not found
         """
+        key = f"{version1}:{version2}"
+        cached = self._comparison_cache.get(key)
+        if cached is not None:
+            return cached
+
         v1 = self.get_version(version1)
         v2 = self.get_version(version2)
 
         if not v1 or not v2:
             return None
 
-        return self._comparer.compare(v1.ir, v2.ir)
+        comparison = self._comparer.compare(v1.ir, v2.ir)
+        self._comparison_cache.put(key, comparison)
+        return comparison
 
     def get_history_summary(self) -> list[dict[str, Any]]:
         """
@@ -256,14 +372,14 @@ class VersionedIR:
         """
         return [
             {
-                "version": v.version_metadata.version,
-                "created_at": v.version_metadata.created_at,
-                "author": v.version_metadata.author,
-                "change_summary": v.version_metadata.change_summary,
-                "tags": v.version_metadata.tags,
-                "has_changes": v.version_metadata.diff_from_parent is not None,
+                "version": record.version_metadata.version,
+                "created_at": record.version_metadata.created_at,
+                "author": record.version_metadata.author,
+                "change_summary": record.version_metadata.change_summary,
+                "tags": record.version_metadata.tags,
+                "has_changes": record.diff is not None,
             }
-            for v in self._versions
+            for record in self._records
         ]
 
     def rollback_to_version(self, version: int) -> int | None:
@@ -298,12 +414,12 @@ class VersionedIR:
         Returns:
             True if successful, False if version not found
         """
-        v = self.get_version(version)
-        if not v:
+        if version < 1 or version > len(self._records):
             return False
 
-        if tag not in v.version_metadata.tags:
-            v.version_metadata.tags.append(tag)
+        tags = self._records[version - 1].version_metadata.tags
+        if tag not in tags:
+            tags.append(tag)
         return True
 
     def remove_tag_from_version(self, version: int, tag: str) -> bool:
@@ -317,12 +433,12 @@ class VersionedIR:
         Returns:
             True if successful, False if version not found or tag not present
         """
-        v = self.get_version(version)
-        if not v:
+        if version < 1 or version > len(self._records):
             return False
 
-        if tag in v.version_metadata.tags:
-            v.version_metadata.tags.remove(tag)
+        tags = self._records[version - 1].version_metadata.tags
+        if tag in tags:
+            tags.remove(tag)
             return True
         return False
 
@@ -330,12 +446,25 @@ class VersionedIR:
         """
         Serialize the entire version history to a dictionary.
 
+        Keyframe versions carry a full ``ir``; the others carry a ``patch``
+        against their parent. Parent diffs are stored without IR snapshots.
+
         Returns:
             Dictionary representation
         """
+        versions = []
+        for record in self._records:
+            entry: dict[str, Any] = {"version_metadata": record.version_metadata.to_dict()}
+            if record.snapshot is not None:
+                entry["ir"] = record.snapshot
+            else:
+                entry["patch"] = record.patch
+            entry["diff"] = record.diff
+            versions.append(entry)
         return {
             "current_version": self.current_version,
-            "versions": [v.to_dict() for v in self._versions],
+            "keyframe_interval": self.keyframe_interval,
+            "versions": versions,
         }
 
     @classmethod
@@ -343,16 +472,120 @@ class VersionedIR:
         """
         Deserialize from a dictionary.
 
+        Accepts both the delta format written by ``to_dict`` and the older
+        format where every version carries a full ``ir`` and parent diff.
+
         Args:
             data: Dictionary representation
 
         Returns:
             VersionedIR instance
         """
-        versioned_ir = cls()
-        versioned_ir._versions = [IRVersion.from_dict(v) for v in data.get("versions", [])]
+        versioned_ir = cls(keyframe_interval=data.get("keyframe_interval", 16))
+        # Last full document seen and the patches applied since, used to
+        # convert legacy full snapshots into patches
+        previous: dict[str, Any] | None = None
+        pending: list[PatchOp] = []
+        for entry in data.get("versions", []):
+            metadata_data = entry["version_metadata"]
+            metadata = VersionMetadata.from_dict({**metadata_data, "diff_from_parent": None})
+            record = _VersionRecord(version_metadata=metadata, diff=entry.get("diff"))
+            legacy_diff = metadata_data.get("diff_from_parent")
+            if record.diff is None and legacy_diff:
+                record.diff = {
+                    key: legacy_diff[key]
+                    for key in (*_DIFF_CATEGORIES, "overall_similarity")
+                    if key in legacy_diff
+                }
+
+            if "patch" in entry:
+                record.patch = entry["patch"]
+                pending.extend(record.patch)
+            elif previous is None or versioned_ir._is_keyframe(metadata.version):
+                record.snapshot = entry["ir"]
+                previous, pending = entry["ir"], []
+            else:
+                parent = apply_patch(previous, pending) if pending else previous
+                record.patch = diff_documents(parent, entry["ir"])
+                previous, pending = entry["ir"], []
+            versioned_ir._records.append(record)
         return versioned_ir
 
+    # ------------------------------------------------------------------
+    # Delta chain
+    # ------------------------------------------------------------------
+
+    def _is_keyframe(self, version: int) -> bool:
+        return (version - 1) % self.keyframe_interval == 0
+
+    def _head_snapshot(self) -> dict[str, Any]:
+        """Serialized IR of the latest version."""
+        if self._head_dict is None:
+            self._head_dict = self.current_ir.to_dict()
+        return self._head_dict
+
+    def _iter_versions(self, start: int, end: int) -> Iterator[IRVersion]:
+        """
+        Reconstruct versions ``start..end`` (inclusive) in order.
+
+        Replays patches once from the nearest keyframe at or before
+        ``start``, populating the version cache along the way.
+        """
+        if start > end:
+            return
+        # Start one version early so the parent diff of ``start`` can be rebuilt
+        keyframe = max(start - 1, 1)
+        while self._records[keyframe - 1].snapshot is None:
+            keyframe -= 1
+
+        document: dict[str, Any] | None = None
+        previous_ir: IntermediateRepresentation | None = None
+        for version in range(keyframe, end + 1):
+            record = self._records[version - 1]
+            if record.snapshot is not None:
+                document = apply_patch(record.snapshot, [])
+            else:
+                document = apply_patch(document, record.patch, in_place=True)
+            if version < start - 1:
+                continue
+
+            cached = self._version_cache.get(str(version))
+            if cached is None:
+                # from_dict keeps nested dicts (provenance metadata, hole
+                # constraints), and ``document`` is patched in place below
+                ir = IntermediateRepresentation.from_dict(copy.deepcopy(document))
+                diff = None
+                if record.diff is not None and previous_ir is not None:
+                    diff = _restore_diff(record.diff, previous_ir, ir)
+                cached = IRVersion(
+                    ir=ir,
+                    version_metadata=dataclasses.replace(
+                        record.version_metadata, diff_from_parent=diff
+                    ),
+                )
+                if version >= start:
+                    self._version_cache.put(str(version), cached)
+            previous_ir = cached.ir
+            if version >= start:
+                yield cached
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Get storage and cache statistics.
+
+        Returns:
+            Dictionary with keyframe/delta counts and version/comparison
+            cache statistics
+        """
+        keyframes = sum(1 for record in self._records if record.snapshot is not None)
+        return {
+            "versions": len(self._records),
+            "keyframes": keyframes,
+            "deltas": len(self._records) - keyframes,
+            "version_cache": self._version_cache.stats(),
+            "comparison_cache": self._comparison_cache.stats(),
+        }
+
     def get_change_log(self, start_version: int = 1, end_version: int | None = None) -> str:
         """
         Generate a human-readable changelog.
@@ -0,0 +1,395 @@
+"""Read-only, lazily decoded views over serialized IRs.
+
+Many read paths (session listings, provenance scans, advisor analysis) only
+touch a few fields of an IR, yet ``IntermediateRepresentation.from_dict``
+rebuilds every clause up front. ``IRView`` wraps a serialized IR instead:
+
+- a ``to_dict()`` payload (already parsed JSON)
+- JSON text (``str`` or ``bytes``), parsed on first access
+- the compact binary format from ``codec.py``, whose core section is decoded
+  on first access and whose evidence section is decoded only when
+  ``metadata.evidence`` is read
+
+Attributes mirror the dataclasses in ``models.py`` (``view.intent.summary``,
+``view.signature.parameters[0].type_hint``, ``view.effects[0].provenance.source``,
+``view.typed_holes()``), and each nested value is built the first time it is
+read. Views are read-only: list fields are returned as tuples and attributes
+cannot be assigned. Use ``to_ir()`` to get a mutable IR.
+
+Usage:
+    view = IRView(row["ir_content"])
+    name = view.signature.name
+    holes = len(view.typed_holes())
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from .codec import _load, _split, decode_ir, is_binary_ir
+from .models import HoleKind, IntermediateRepresentation, ProvenanceSource
+
+# A field spec: (dict key, position in the binary layout, converter, JSON default).
+# Positions follow the positional arrays written by ``codec._Encoder``.
+_FieldSpec = tuple[str, int, Callable[[Any, list[str] | None], Any], Any]
+
+
+def _str(raw: Any, strings: list[str] | None) -> Any:
+    if strings is None or raw is None:
+        return raw
+    return strings[raw]
+
+
+def _raw(raw: Any, strings: list[str] | None) -> Any:
+    return raw
+
+
+def _str_tuple(raw: Any, strings: list[str] | None) -> tuple[str, ...]:
+    if strings is None:
+        return tuple(raw or ())
+    return tuple(strings[index] for index in raw)
+
+
+def _hole_kind(raw: Any, strings: list[str] | None) -> HoleKind:
+    return HoleKind(_str(raw, strings))
+
+
+def _provenance_source(raw: Any, strings: list[str] | None) -> ProvenanceSource:
+    return ProvenanceSource(_str(raw, strings))
+
+
+def _holes(raw: Any, strings: list[str] | None) -> tuple[_HoleView, ...]:
+    return tuple(_HoleView(hole, strings) for hole in raw or ())
+
+
+def _provenance(raw: Any, strings: list[str] | None) -> _ProvenanceView | None:
+    return _ProvenanceView(raw, strings) if raw else None
+
+
+def _parameters(raw: Any, strings: list[str] | None) -> tuple[_ParameterView, ...]:
+    return tuple(_ParameterView(param, strings) for param in raw or ())
+
+
+class _RecordView:
+    """Lazily converted, read-only attribute view over a dict or positional array."""
+
+    __slots__ = ("_data", "_strings", "_cache")
+
+    _FIELDS: ClassVar[dict[str, _FieldSpec]] = {}
+
+    def __init__(self, data: dict[str, Any] | list[Any], strings: list[str] | None) -> None:
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_strings", strings)
+        object.__setattr__(self, "_cache", {})
+
+    def __getattr__(self, name: str) -> Any:
+        spec = type(self)._FIELDS.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        key, index, convert, default = spec
+        strings = self._strings
+        raw = self._data.get(key, default) if strings is None else self._data[index]
+        value = cache[name] = convert(raw, strings)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+
+class _ProvenanceView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "source": ("source", 0, _provenance_source, ProvenanceSource.UNKNOWN.value),
+        "confidence": ("confidence", 1, _raw, 1.0),
+        "timestamp": ("timestamp", 2, _str, None),
+        "author": ("author", 3, _str, None),
+        "evidence_refs": ("evidence_refs", 4, _str_tuple, ()),
+        "metadata": ("metadata", 5, _raw, {}),
+    }
+
+
+class _HoleView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "identifier": ("identifier", 0, _str, None),
+        "type_hint": ("type_hint", 1, _str, None),
+        "description": ("description", 2, _str, ""),
+        "constraints": ("constraints", 3, _raw, {}),
+        "kind": ("kind", 4, _hole_kind, HoleKind.INTENT.value),
+    }
+
+    def label(self) -> str:
+        """Return a human friendly label for visualisations."""
+        return f"<?{self.identifier}: {self.type_hint}?>"
+
+
+class _IntentView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "summary": ("summary", 0, _str, None),
+        "rationale": ("rationale", 1, _str, None),
+        "holes": ("holes", 2, _holes, ()),
+        "provenance": ("provenance", 3, _provenance, None),
+    }
+
+
+class _ParameterView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "name": ("name", 0, _str, None),
+        "type_hint": ("type_hint", 1, _str, None),
+        "description": ("description", 2, _str, None),
+        "provenance": ("provenance", 3, _provenance, None),
+    }
+
+
+class _SignatureView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "name": ("name", 0, _str, None),
+        "parameters": ("parameters", 1, _parameters, ()),
+        "returns": ("returns", 2, _str, None),
+        "holes": ("holes", 3, _holes, ()),
+        "provenance": ("provenance", 4, _provenance, None),
+    }
+
+
+class _EffectView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "description": ("description", 0, _str, None),
+        "holes": ("holes", 1, _holes, ()),
+        "provenance": ("provenance", 2, _provenance, None),
+    }
+
+
+class _AssertionView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "predicate": ("predicate", 0, _str, None),
+        "rationale": ("rationale", 1, _str, None),
+        "holes": ("holes", 2, _holes, ()),
+        "provenance": ("provenance", 3, _provenance, None),
+    }
+
+
+class _RelationshipView(_RecordView):
+    __slots__ = ()
+    _FIELDS = {
+        "from_entity": ("from_entity", 0, _str, None),
+        "to_entity": ("to_entity", 1, _str, None),
+        "relationship_type": ("relationship_type", 2, _str, None),
+        "confidence": ("confidence", 3, _raw, 0.8),
+        "description": ("description", 4, _str, ""),
+        "holes": ("holes", 5, _holes, ()),
+        "provenance": ("provenance", 6, _provenance, None),
+    }
+
+
+class _MetadataView(_RecordView):
+    __slots__ = ("_load_evidence",)
+    _FIELDS = {
+        "source_path": ("source_path", 0, _str, None),
+        "language": ("language", 1, _str, None),
+        "origin": ("origin", 2, _str, None),
+    }
+
+    def __init__(
+        self,
+        data: dict[str, Any] | list[Any],
+        strings: list[str] | None,
+        load_evidence: Callable[[], list[dict[str, object]]],
+    ) -> None:
+        super().__init__(data, strings)
+        object.__setattr__(self, "_load_evidence", load_evidence)
+
+    def __getattr__(self, name: str) -> Any:
+        if name != "evidence":
+            return super().__getattr__(name)
+        cache = self._cache
+        if "evidence" not in cache:
+            cache["evidence"] = tuple(self._load_evidence())
+        return cache["evidence"]
+
+
+class IRView:
+    """
+    Read-only view over a serialized IntermediateRepresentation.
+
+    Args:
+        payload: ``to_dict()`` output, JSON text, or a binary payload from
+            ``encode_ir``
+    """
+
+    __slots__ = ("_payload", "_binary", "_document", "_strings", "_core", "_cache")
+
+    def __init__(self, payload: dict[str, Any] | str | bytes | bytearray | memoryview) -> None:
+        binary = not isinstance(payload, dict | str) and is_binary_ir(payload)
+        object.__setattr__(self, "_payload", payload)
+        object.__setattr__(self, "_binary", binary)
+        object.__setattr__(self, "_document", payload if isinstance(payload, dict) else None)
+        object.__setattr__(self, "_strings", None)
+        object.__setattr__(self, "_core", None)
+        object.__setattr__(self, "_cache", {})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("IRView is read-only")
+
+    @property
+    def is_binary(self) -> bool:
+        """True if the view wraps the binary format."""
+        return self._binary
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    @property
+    def intent(self) -> _IntentView:
+        return self._section("intent", 0, _IntentView)
+
+    @property
+    def signature(self) -> _SignatureView:
+        return self._section("signature", 1, _SignatureView)
+
+    @property
+    def effects(self) -> tuple[_EffectView, ...]:
+        cache = self._cache
+        if "effects" not in cache:
+            raw, strings = self._raw("effects", 2, [])
+            cache["effects"] = tuple(
+                # Legacy payloads store effects as plain strings
+                _EffectView({"description": effect}, None)
+                if isinstance(effect, str)
+                else _EffectView(effect, strings)
+                for effect in raw
+            )
+        return cache["effects"]
+
+    @property
+    def assertions(self) -> tuple[_AssertionView, ...]:
+        return self._sequence("assertions", 3, _AssertionView)
+
+    @property
+    def relationships(self) -> tuple[_RelationshipView, ...]:
+        return self._sequence("relationships", 4, _RelationshipView)
+
+    @property
+    def metadata(self) -> _MetadataView:
+        cache = self._cache
+        if "metadata" not in cache:
+            raw, strings = self._raw("metadata", 5, None)
+            if self._binary:
+                cache["metadata"] = _MetadataView(raw, strings, self._binary_evidence)
+            else:
+                raw = raw or {}
+                cache["metadata"] = _MetadataView(raw, None, lambda: list(raw.get("evidence", [])))
+        return cache["metadata"]
+
+    @property
+    def constraints(self) -> tuple[Any, ...]:
+        cache = self._cache
+        if "constraints" not in cache:
+            raw, _ = self._raw("constraints", 6, [])
+            parsed = []
+            if raw:
+                from .constraints import parse_constraint
+
+                for data in raw:
+                    try:
+                        parsed.append(parse_constraint(data))
+                    except (KeyError, ValueError):
+                        continue  # from_dict skips invalid constraints as well
+            cache["constraints"] = tuple(parsed)
+        return cache["constraints"]
+
+    # ------------------------------------------------------------------
+    # IntermediateRepresentation-compatible helpers
+    # ------------------------------------------------------------------
+
+    def typed_holes(self) -> list[_HoleView]:
+        """Return every typed hole contained within the IR."""
+        holes: list[_HoleView] = []
+        holes.extend(self.intent.holes)
+        holes.extend(self.signature.holes)
+        for effect in self.effects:
+            holes.extend(effect.holes)
+        for assertion in self.assertions:
+            holes.extend(assertion.holes)
+        for relationship in self.relationships:
+            holes.extend(relationship.holes)
+        return holes
+
+    def to_ir(self) -> IntermediateRepresentation:
+        """Fully deserialize into a (mutable) IntermediateRepresentation."""
+        if self._binary:
+            return decode_ir(self._payload)
+        return IntermediateRepresentation.from_dict(self._json())
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Return the IR as a ``to_dict()``-style payload.
+
+        JSON-backed views return the wrapped payload itself (no conversion);
+        binary-backed views are decoded first.
+        """
+        if self._binary:
+            return self.to_ir().to_dict()
+        return self._json()
+
+    def __repr__(self) -> str:
+        backing = "binary" if self._binary else "json"
+        return f"IRView({backing}, name={self.signature.name!r})"
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def _json(self) -> dict[str, Any]:
+        if self._document is None:
+            object.__setattr__(self, "_document", json.loads(self._payload))
+        return self._document
+
+    def _binary_core(self) -> tuple[list[str], list[Any]]:
+        if self._core is None:
+            sections = _split(self._payload)
+            object.__setattr__(self, "_strings", _load(sections.strings))
+            object.__setattr__(self, "_core", _load(sections.core))
+        return self._strings, self._core
+
+    def _binary_evidence(self) -> list[dict[str, object]]:
+        sections = _split(self._payload)
+        return _load(sections.evidence)
+
+    def _raw(self, key: str, index: int, default: Any) -> tuple[Any, list[str] | None]:
+        """Return a top-level section's raw data and the string table (binary only)."""
+        if self._binary:
+            strings, core = self._binary_core()
+            return core[index], strings
+        return self._json().get(key, default), None
+
+    def _section(self, key: str, index: int, view_type: type[_RecordView]) -> Any:
+        cache = self._cache
+        if key not in cache:
+            raw, strings = self._raw(key, index, None)
+            cache[key] = view_type(raw, strings)
+        return cache[key]
+
+    def _sequence(self, key: str, index: int, view_type: type[_RecordView]) -> tuple[Any, ...]:
+        cache = self._cache
+        if key not in cache:
+            raw, strings = self._raw(key, index, [])
+            cache[key] = tuple(view_type(item, strings) for item in raw or ())
+        return cache[key]
+
+
+__all__ = ["IRView"]
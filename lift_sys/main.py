@@ -5,7 +5,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.reactive import reactive
@@ -20,6 +19,7 @@ from textual.widgets import (
 )
 
 from lift_sys.client import PromptSession, SessionClient
+from lift_sys.services.http_pool import get_http_pool
 
 API_URL = "http://localhost:8000"
 
@@ -96,6 +96,10 @@ class LiftSysApp(App):
         yield self.status_panel
         yield Footer()
 
+    async def on_unmount(self) -> None:
+        await self.session_client.aclose()
+        await get_http_pool().aclose()
+
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input is self.endpoint_input or event.input is self.temperature_input:
             await self.configure_backend()
@@ -108,29 +112,29 @@ class LiftSysApp(App):
         endpoint = self.endpoint_input.value
         temperature = float(self.temperature_input.value or 0.0)
         payload = {"model_endpoint": endpoint, "temperature": temperature}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{API_URL}/config", json=payload)
-            response.raise_for_status()
+        client = get_http_pool().async_client()
+        response = await client.post(f"{API_URL}/config", json=payload)
+        response.raise_for_status()
         self.state.endpoint = endpoint
         self.state.temperature = temperature
         self.status_panel.message = "Configuration saved"
 
     async def open_repo(self) -> None:
         identifier = self.repo_input.value
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{API_URL}/repos/open", json={"identifier": identifier})
-            response.raise_for_status()
+        client = get_http_pool().async_client()
+        response = await client.post(f"{API_URL}/repos/open", json={"identifier": identifier})
+        response.raise_for_status()
         self.state.repository = identifier
         self.status_panel.message = f"Repository {identifier} opened"
 
     async def action_refresh_plan(self) -> None:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{API_URL}/plan")
-            if response.status_code == 404:
-                self.plan_panel.update("Plan not initialised")
-                return
-            response.raise_for_status()
-            plan = response.json()
+        client = get_http_pool().async_client()
+        response = await client.get(f"{API_URL}/plan")
+        if response.status_code == 404:
+            self.plan_panel.update("Plan not initialised")
+            return
+        response.raise_for_status()
+        plan = response.json()
         rendered = "\n".join(
             f"- {step['identifier']}: {step['description']}" for step in plan["steps"]
         )
@@ -148,13 +152,13 @@ class LiftSysApp(App):
         if not self.state.repository:
             self.status_panel.message = "Open a repository first"
             return
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{API_URL}/reverse",
-                json={"module": module, "queries": ["security/default"], "entrypoint": "main"},
-            )
-            response.raise_for_status()
-            payload = response.json()
+        client = get_http_pool().async_client()
+        response = await client.post(
+            f"{API_URL}/reverse",
+            json={"module": module, "queries": ["security/default"], "entrypoint": "main"},
+        )
+        response.raise_for_status()
+        payload = response.json()
         self.state.ir = payload["ir"]
         self.ir_panel.update(str(self.state.ir))
         self.status_panel.message = "IR lifted"
@@ -2,7 +2,10 @@
 
 from .anthropic_provider import AnthropicProvider
 from .base import BaseProvider, ProviderCapabilities
+from .caching import CacheMode, CachingProvider, DiskResponseStore, ReplayMissError
 from .gemini_provider import GeminiProvider
+from .hedging import HedgedProvider, NoBackendAvailableError
+from .keep_warm import KeepWarmProvider
 from .local_vllm_provider import LocalVLLMProvider
 from .modal_provider import ModalProvider
 from .openai_provider import OpenAIProvider
@@ -10,9 +13,16 @@ from .openai_provider import OpenAIProvider
 __all__ = [
     "AnthropicProvider",
     "BaseProvider",
+    "CacheMode",
+    "CachingProvider",
+    "DiskResponseStore",
+    "ReplayMissError",
     "ProviderCapabilities",
     "GeminiProvider",
+    "HedgedProvider",
+    "KeepWarmProvider",
     "LocalVLLMProvider",
     "ModalProvider",
+    "NoBackendAvailableError",
     "OpenAIProvider",
 ]
@@ -8,6 +8,9 @@ from typing import Any
 from anthropic import AsyncAnthropic
 
 from .base import BaseProvider, ProviderCapabilities
+from .prompt_cache import split_prompt
+from .streaming import measure_stream
+from .telemetry import record_usage
 
 
 class AnthropicProvider(BaseProvider):
@@ -29,7 +32,8 @@ class AnthropicProvider(BaseProvider):
         if not token:
             raise ValueError("Anthropic credentials require an access token or API key")
         self._api_key = token
-        self._client = AsyncAnthropic(api_key=token)
+        # base_url is optional (e.g. a proxy or a local test server)
+        self._client = AsyncAnthropic(api_key=token, base_url=credentials.get("base_url"))
 
     async def generate_text(
         self,
@@ -38,34 +42,100 @@ class AnthropicProvider(BaseProvider):
         temperature: float = 0.7,
         model: str | None = None,
         system_prompt: str | None = None,
+        cache_prefix: str | None = None,
         **_: Any,
     ) -> str:
         if not self._client:
             raise RuntimeError("Anthropic provider not initialized")
 
-        kwargs = {
+        kwargs = self._message_kwargs(
+            prompt, max_tokens, temperature, model, system_prompt, cache_prefix
+        )
+        response = await self._client.messages.create(**kwargs)
+        self._record_usage(response.usage)
+
+        # Extract text from response
+        return "".join(block.text for block in response.content if hasattr(block, "text"))
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        cache_prefix: str | None = None,
+        **_: Any,
+    ) -> AsyncIterator[str]:
+        """Yield text deltas from the Messages streaming API as they arrive."""
+        if not self._client:
+            raise RuntimeError("Anthropic provider not initialized")
+
+        kwargs = self._message_kwargs(
+            prompt, max_tokens, temperature, model, system_prompt, cache_prefix
+        )
+        async for text in measure_stream(self._text_stream(kwargs), self.stream_metrics):
+            yield text
+
+    async def _text_stream(self, kwargs: dict[str, Any]) -> AsyncIterator[str]:
+        # Leaving the context (including via aclose()) closes the HTTP response
+        async with self._client.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+            self._record_usage((await stream.get_final_message()).usage)
+
+    def _message_kwargs(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        model: str | None,
+        system_prompt: str | None,
+        cache_prefix: str | None = None,
+    ) -> dict[str, Any]:
+        content: str | list[dict[str, Any]] = prompt
+        parts = split_prompt(prompt, cache_prefix)
+        if parts is not None:
+            # Cache breakpoint after the shared prefix; only the suffix is new per request
+            prefix, suffix = parts
+            content = [
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": suffix},
+            ]
+
+        kwargs: dict[str, Any] = {
             "model": model or self._default_model,
             "max_tokens": max_tokens,
             "temperature": temperature,
             "messages": [
                 {
                     "role": "user",
-                    "content": prompt,
+                    "content": content,
                 }
             ],
         }
 
         if system_prompt:
             kwargs["system"] = system_prompt
-
-        response = await self._client.messages.create(**kwargs)
-
-        # Extract text from response
-        return "".join(block.text for block in response.content if hasattr(block, "text"))
-
-    async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
-        text = await self.generate_text(prompt, **kwargs)
-        yield text
+        return kwargs
+
+    def _record_usage(self, usage: Any) -> None:
+        """Record prompt-cache and token usage reported by the Messages API."""
+        counts = {
+            name: value if isinstance(value := getattr(usage, name, None), int) else 0
+            for name in (
+                "input_tokens",
+                "output_tokens",
+                "cache_read_input_tokens",
+                "cache_creation_input_tokens",
+            )
+        }
+        cached = counts["cache_read_input_tokens"]
+        written = counts["cache_creation_input_tokens"]
+        # input_tokens only counts tokens after the last cache breakpoint
+        prompt_tokens = counts["input_tokens"] + cached + written
+        self.prompt_cache_metrics.record(prompt_tokens, cached, written)
+        record_usage(prompt_tokens, counts["output_tokens"])
 
     async def generate_structured(self, prompt: str, schema: dict, **_: Any) -> dict:
         raise NotImplementedError("Anthropic structured output is not yet implemented")
@@ -6,6 +6,10 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
+from .prompt_cache import PromptCacheMetrics
+from .streaming import StreamMetrics
+from .telemetry import instrument_provider
+
 
 @dataclass(slots=True)
 class ProviderCapabilities:
@@ -21,10 +25,19 @@ class BaseProvider(ABC):
 
     name: str
     capabilities: ProviderCapabilities
+    stream_metrics: StreamMetrics
+    prompt_cache_metrics: PromptCacheMetrics
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every provider call is timed and recorded in provider telemetry
+        instrument_provider(cls)
 
     def __init__(self, name: str, capabilities: ProviderCapabilities) -> None:
         self.name = name
         self.capabilities = capabilities
+        self.stream_metrics = StreamMetrics()
+        self.prompt_cache_metrics = PromptCacheMetrics()
 
     @abstractmethod
     async def initialize(self, credentials: dict) -> None:
@@ -77,6 +90,12 @@ class BaseProvider(ABC):
 
         return self.name
 
+    @property
+    def telemetry_name(self) -> str:
+        """Name this provider's calls are recorded under in provider telemetry."""
+
+        return self.name
+
     async def ensure_initialized(self, credentials: dict | None) -> None:
         """Ensure provider is initialized with credentials."""
 
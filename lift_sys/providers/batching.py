@@ -0,0 +1,108 @@
+"""Client-side micro-batching of concurrent provider calls.
+
+``MicroBatcher`` collects items submitted concurrently and hands them to a
+batch function together: a batch is sent when ``max_batch_size`` items are
+queued or ``window`` seconds after the first item arrived, whichever comes
+first. Each caller awaits only its own result; the batch function returns
+one result (or exception) per item, in order.
+
+A caller that is cancelled while waiting is dropped from its batch if the
+batch has not been sent yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Gather concurrent submissions into batches."""
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[T]], Awaitable[list[R | BaseException]]],
+        window: float = 0.015,
+        max_batch_size: int = 16,
+    ):
+        """
+        Create a batcher.
+
+        Args:
+            send_batch: Sends a batch and returns one result or exception per item
+            window: Seconds to wait for more items after the first one is queued
+            max_batch_size: Queue length that sends a batch immediately
+        """
+        self.send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._queue: list[tuple[T, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+        self.batches_sent = 0
+        self.items_sent = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of items per batch sent."""
+        if self.batches_sent == 0:
+            return 0.0
+        return self.items_sent / self.batches_sent
+
+    async def submit(self, item: T) -> R:
+        """Queue ``item`` and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._queue.append((item, future))
+        if len(self._queue) >= self.max_batch_size:
+            self._send_queued()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._send_queued)
+        return await future
+
+    async def flush(self) -> None:
+        """Send queued items now and wait for every batch in flight."""
+        self._send_queued()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _send_queued(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        self.batches_sent += 1
+        self.items_sent += len(batch)
+        try:
+            results = await self.send_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch returned {len(results)} results for {len(batch)} items")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            results = [exc] * len(batch)
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue  # caller gave up
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+__all__ = ["MicroBatcher"]
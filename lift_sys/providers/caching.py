@@ -0,0 +1,354 @@
+"""Response caching and record/replay for providers.
+
+``CachingProvider`` wraps any ``BaseProvider`` and answers repeated requests
+from a ``ResponseStore`` instead of calling the model again. Requests are
+keyed on (provider, model, operation, prompt, schema, sampling parameters).
+
+Sampled output is not reused by default: a request whose temperature is
+above zero bypasses the cache unless the caller passes an explicit ``seed``.
+When the caller does not pass a temperature, the wrapped provider's
+default for that method decides.
+
+Modes (``CacheMode``):
+
+- ``read_write``: serve hits, call the provider on a miss and store the result
+- ``record``: always call the provider and store every result (including
+  sampled ones), overwriting earlier recordings
+- ``replay``: never call the provider; every response must come from the
+  store (a miss raises ``ReplayMissError``), so suites run offline and
+  deterministically
+
+``DiskResponseStore`` keeps one JSON file per response under a directory and
+evicts the least recently used entries beyond ``max_entries``/``max_bytes``.
+
+Usage:
+    provider = CachingProvider(ModalProvider(url), DiskResponseStore(".cache/llm"))
+    provider = CachingProvider(inner, store, mode=CacheMode.REPLAY)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from enum import Enum
+from pathlib import Path
+from typing import Any, Protocol
+
+from .base import BaseProvider
+
+# Request parameters that never change the output
+_IGNORED_PARAMS = frozenset({"timeout", "stream", "cache_prefix"})
+
+
+class CacheMode(str, Enum):
+    """How ``CachingProvider`` uses its store."""
+
+    READ_WRITE = "read_write"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class ResponseStore(Protocol):
+    """Storage backend for cached responses."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the stored response for ``key``, or None."""
+
+    def put(self, key: str, response: Any, request: dict[str, Any]) -> None:
+        """Store ``response`` (with the request that produced it) under ``key``."""
+
+
+class DiskResponseStore:
+    """One JSON file per response, with LRU eviction by access time.
+
+    Files live under ``<directory>/<key[:2]>/<key>.json`` and hold the
+    request alongside the response, so recordings can be inspected and
+    committed as fixtures. Writes are atomic (write then rename); reads touch
+    the file's modification time, which orders eviction.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_entries: int | None = 10_000,
+        max_bytes: int | None = None,
+    ):
+        """
+        Create a store.
+
+        Args:
+            directory: Directory holding the response files (created on demand)
+            max_entries: Maximum number of responses kept (None for unbounded)
+            max_bytes: Maximum total size of the response files (None for unbounded)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # path -> (last access, size); built on the first write
+        self._index: dict[Path, tuple[float, int]] | None = None
+        self._total_bytes = 0
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        if self._index is not None and path in self._index:
+            self._index[path] = (now, self._index[path][1])
+        return payload["response"]
+
+    def put(self, key: str, response: Any, request: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(
+            {"key": key, "request": request, "response": response, "created_at": time.time()},
+            indent=2,
+            sort_keys=True,
+        ).encode("utf-8")
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+
+        index = self._load_index()
+        self._total_bytes -= index.get(path, (0.0, 0))[1]
+        index[path] = (time.time(), len(data))
+        self._total_bytes += len(data)
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._load_index())
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        for path in self._load_index():
+            path.unlink(missing_ok=True)
+        self._index = {}
+        self._total_bytes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> dict[Path, tuple[float, int]]:
+        if self._index is None:
+            self._index = {}
+            for path in self.directory.glob("*/*.json"):
+                stat = path.stat()
+                self._index[path] = (stat.st_mtime, stat.st_size)
+            self._total_bytes = sum(size for _, size in self._index.values())
+        return self._index
+
+    def _evict(self) -> None:
+        index = self._index
+        over_entries = self.max_entries is not None and len(index) > self.max_entries
+        over_bytes = self.max_bytes is not None and self._total_bytes > self.max_bytes
+        if not (over_entries or over_bytes):
+            return
+        for path, (_, size) in sorted(index.items(), key=lambda item: item[1][0]):
+            if (self.max_entries is None or len(index) <= self.max_entries) and (
+                self.max_bytes is None or self._total_bytes <= self.max_bytes
+            ):
+                break
+            path.unlink(missing_ok=True)
+            del index[path]
+            self._total_bytes -= size
+
+
+class CachingProvider(BaseProvider):
+    """Provider decorator that caches, records and replays responses."""
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        store: ResponseStore,
+        mode: CacheMode | str = CacheMode.READ_WRITE,
+        model_id: str | None = None,
+    ):
+        """
+        Wrap ``provider``.
+
+        Args:
+            provider: Provider to call on cache misses
+            store: Where responses are kept
+            mode: ``read_write``, ``record`` or ``replay`` (see module docstring)
+            model_id: Model identity used in cache keys when the caller does
+                not pass ``model`` (defaults to the provider's default model or
+                endpoint URL)
+        """
+        super().__init__(name=provider.name, capabilities=provider.capabilities)
+        self.provider = provider
+        self.store = store
+        self.mode = CacheMode(mode)
+        self.model_id = (
+            model_id
+            or getattr(provider, "_default_model", None)
+            or getattr(provider, "endpoint_url", None)
+        )
+        self.stream_metrics = provider.stream_metrics
+        self.prompt_cache_metrics = provider.prompt_cache_metrics
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific attributes (endpoint_url, aclose, ...) come from the inner provider
+        provider = self.__dict__.get("provider")
+        if provider is None:
+            raise AttributeError(name)
+        return getattr(provider, name)
+
+    async def initialize(self, credentials: dict) -> None:
+        if self.mode is not CacheMode.REPLAY:
+            await self.provider.initialize(credentials)
+
+    async def generate_text(self, prompt: str, **kwargs: Any) -> str:
+        # Parameters the caller leaves out keep the inner provider's defaults
+        request = self._request("text", prompt, None, kwargs, self.provider.generate_text)
+        return await self._cached(request, lambda: self.provider.generate_text(prompt, **kwargs))
+
+    async def generate_structured(self, prompt: str, schema: dict, **kwargs: Any) -> dict:
+        request = self._request(
+            "structured", prompt, schema, kwargs, self.provider.generate_structured
+        )
+        return await self._cached(
+            request, lambda: self.provider.generate_structured(prompt, schema, **kwargs)
+        )
+
+    async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+        """Replay a cached response as one chunk, or stream and record the result."""
+        request = self._request("text", prompt, None, kwargs, self.provider.generate_stream)
+        key = request["key"]
+        if self._readable(request):
+            cached = self.store.get(key)
+            if cached is not None:
+                self.hits += 1
+                yield cached
+                return
+            if self.mode is CacheMode.REPLAY:
+                raise ReplayMissError(f"No recorded response for {self.name} request {key}")
+        self._count_call(request)
+
+        chunks: list[str] = []
+        async for chunk in self.provider.generate_stream(prompt, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete streams are stored; a consumer that stops early never gets here
+        if self._writable(request):
+            self.store.put(key, "".join(chunks), request["request"])
+
+    async def check_health(self) -> bool:
+        if self.mode is CacheMode.REPLAY:
+            return True
+        return await self.provider.check_health()
+
+    @property
+    def telemetry_name(self) -> str:
+        # ``name`` is the inner provider's (it keys the cache), so calls through
+        # the wrapper get their own series instead of counting twice
+        return f"cache-{self.provider.name}"
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.provider.supports_streaming
+
+    @property
+    def supports_structured_output(self) -> bool:
+        return self.provider.supports_structured_output
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit, miss and bypass counts."""
+        return {"hits": self.hits, "misses": self.misses, "bypassed": self.bypassed}
+
+    # -- internals -------------------------------------------------------------------
+
+    def _request(
+        self,
+        operation: str,
+        prompt: str,
+        schema: dict | None,
+        params: dict[str, Any],
+        method: Any,
+    ) -> dict[str, Any]:
+        """Describe a request and derive its cache key."""
+        params = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS}
+        model = params.pop("model", None) or self.model_id
+        temperature = params.get("temperature", _default(method, "temperature"))
+        described = {
+            "provider": self.name,
+            "model": model,
+            "operation": operation,
+            "prompt": prompt,
+            "schema": schema,
+            "params": params,
+        }
+        encoded = json.dumps(described, sort_keys=True, separators=(",", ":"), default=str)
+        return {
+            "key": hashlib.sha256(encoded.encode("utf-8")).hexdigest(),
+            "request": described,
+            # Sampled output is only reproducible with an explicit seed
+            "deterministic": not temperature or params.get("seed") is not None,
+        }
+
+    def _readable(self, request: dict[str, Any]) -> bool:
+        if self.mode is CacheMode.REPLAY:
+            return True
+        return self.mode is CacheMode.READ_WRITE and request["deterministic"]
+
+    def _writable(self, request: dict[str, Any]) -> bool:
+        return self.mode is CacheMode.RECORD or request["deterministic"]
+
+    def _count_call(self, request: dict[str, Any]) -> None:
+        if self.mode is CacheMode.READ_WRITE and not request["deterministic"]:
+            self.bypassed += 1
+        else:
+            self.misses += 1
+
+    async def _cached(self, request: dict[str, Any], call: Any) -> Any:
+        key = request["key"]
+        if self._readable(request):
+            cached = self.store.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            if self.mode is CacheMode.REPLAY:
+                raise ReplayMissError(f"No recorded response for {self.name} request {key}")
+        self._count_call(request)
+        response = await call()
+        if self._writable(request):
+            self.store.put(key, response, request["request"])
+        return response
+
+
+def _default(method: Any, name: str) -> Any:
+    """Default value of parameter ``name`` of ``method`` (None if it has none)."""
+    try:
+        parameter = inspect.signature(method).parameters.get(name)
+    except (TypeError, ValueError):
+        return None
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        return None
+    return parameter.default
+
+
+__all__ = [
+    "CacheMode",
+    "CachingProvider",
+    "DiskResponseStore",
+    "ReplayMissError",
+    "ResponseStore",
+]
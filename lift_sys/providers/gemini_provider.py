@@ -8,7 +8,9 @@ from typing import Any
 
 import httpx
 
+from ..services.http_pool import get_http_pool
 from .base import BaseProvider, ProviderCapabilities
+from .telemetry import record_usage
 
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models"
 DEFAULT_MODEL = "gemini-1.5-pro"
@@ -63,6 +65,8 @@ class GeminiProvider(BaseProvider):
         )
         response.raise_for_status()
         data = response.json()
+        usage = data.get("usageMetadata") or {}
+        record_usage(usage.get("promptTokenCount"), usage.get("candidatesTokenCount"))
         return "".join(part.get("text", "") for part in data["candidates"][0]["content"]["parts"])
 
     async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
@@ -92,6 +96,8 @@ class GeminiProvider(BaseProvider):
         )
         response.raise_for_status()
         data = response.json()
+        usage = data.get("usageMetadata") or {}
+        record_usage(usage.get("promptTokenCount"), usage.get("candidatesTokenCount"))
         content = data["candidates"][0]["content"]["parts"][0].get("text", "{}")
         return json.loads(content)
 
@@ -107,11 +113,9 @@ class GeminiProvider(BaseProvider):
         return True
 
     async def _ensure_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        # Shared pooled client unless one was injected
+        return self._client or get_http_pool().async_client()
 
     async def aclose(self) -> None:
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        # The shared client and its connections are closed by the pool
+        self._client = None
@@ -0,0 +1,491 @@
+"""Hedged requests and latency-aware failover across providers.
+
+``HedgedProvider`` fronts an ordered list of backend providers. Each request
+goes to the first available backend; if it has not answered after that
+backend's recent p95 latency (bounded by ``min_hedge_delay`` and
+``max_hedge_delay``), a hedge request goes to the next backend. The first
+valid result wins and the other request is cancelled, which closes its HTTP
+connection.
+
+Every backend has rolling latency and error-rate statistics
+(``BackendStats``) and a ``CircuitBreaker``. When a backend's recent error
+rate crosses the threshold its circuit opens and requests skip it
+(failover); after ``reset_timeout`` one probe request is let through, and a
+success closes the circuit again. A backend that fails outright is replaced
+by the next one immediately rather than after the hedge delay.
+
+Each operation only goes to backends that support it: structured generation
+races the backends with ``structured_output`` (e.g. Modal's XGrammar path),
+streams use backends with ``streaming``, and plain text uses all of them.
+
+Usage:
+    provider = HedgedProvider([modal_provider, anthropic_provider])
+    ir = await XGrammarIRTranslator(provider).translate(prompt)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from .base import BaseProvider, ProviderCapabilities
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class NoBackendAvailableError(RuntimeError):
+    """Raised when no backend can serve a request."""
+
+
+@dataclass
+class BackendStats:
+    """Rolling latency and outcome window for one backend.
+
+    Attributes:
+        window: Number of recent requests kept
+        latencies: Latencies of recent successful requests (seconds)
+        outcomes: Recent request outcomes (True for success)
+        requests: Total completed requests
+        failures: Total failed requests
+    """
+
+    window: int = 50
+    latencies: deque[float] = field(default_factory=deque)
+    outcomes: deque[bool] = field(default_factory=deque)
+    requests: int = 0
+    failures: int = 0
+
+    def __post_init__(self) -> None:
+        self.latencies = deque(self.latencies, maxlen=self.window)
+        self.outcomes = deque(self.outcomes, maxlen=self.window)
+
+    def record(self, success: bool, latency: float | None = None) -> None:
+        """Record one completed request."""
+        self.requests += 1
+        self.outcomes.append(success)
+        if success and latency is not None:
+            self.latencies.append(latency)
+        if not success:
+            self.failures += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Nearest-rank latency percentile in seconds (None without samples)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    @property
+    def p50(self) -> float | None:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        return self.percentile(95)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed requests in the window."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def reset_window(self) -> None:
+        """Forget recent outcomes (after a circuit recovers)."""
+        self.outcomes.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export statistics as dictionary."""
+        p50, p95 = self.p50, self.p95
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "error_rate": self.error_rate,
+            "p50_ms": p50 * 1000 if p50 is not None else None,
+            "p95_ms": p95 * 1000 if p95 is not None else None,
+        }
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker with a single half-open probe.
+
+    Transitions:
+    - CLOSED: Normal operation; opens when the error rate over the last
+      ``window`` requests reaches ``error_threshold`` (after ``min_requests``)
+    - OPEN: Requests are refused until ``reset_timeout`` seconds have passed
+    - HALF_OPEN: One probe request is allowed; success closes the circuit,
+      failure opens it again
+    """
+
+    def __init__(
+        self,
+        error_threshold: float = 0.5,
+        min_requests: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.error_threshold = error_threshold
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    def available(self) -> bool:
+        """Whether a request could be sent now (does not change state)."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self._probing:
+            return False
+        return self._clock() - self._opened_at >= self.reset_timeout
+
+    def acquire(self) -> bool:
+        """Claim permission to send a request (claims the probe when half-open)."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if not self.available():
+            return False
+        self.state = CircuitState.HALF_OPEN
+        self._probing = True
+        return True
+
+    def release(self) -> None:
+        """Give back an unused probe (the request was cancelled)."""
+        self._probing = False
+
+    def record(self, success: bool, stats: BackendStats) -> None:
+        """Update state after a request whose outcome is already in ``stats``."""
+        if self.state is CircuitState.HALF_OPEN:
+            self._probing = False
+            if success:
+                self.state = CircuitState.CLOSED
+                stats.reset_window()
+            else:
+                self._open()
+            return
+        if (
+            self.state is CircuitState.CLOSED
+            and len(stats.outcomes) >= self.min_requests
+            and stats.error_rate >= self.error_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+
+@dataclass
+class _Backend:
+    provider: BaseProvider
+    stats: BackendStats
+    breaker: CircuitBreaker
+
+
+class HedgedProvider(BaseProvider):
+    """Provider that hedges and fails over across several backends."""
+
+    def __init__(
+        self,
+        providers: Sequence[BaseProvider],
+        hedge_percentile: float = 95.0,
+        initial_hedge_delay: float = 5.0,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 30.0,
+        min_samples: int = 5,
+        max_hedges: int = 1,
+        error_threshold: float = 0.5,
+        reset_timeout: float = 30.0,
+        window: int = 50,
+        validator: Callable[[Any], bool] | None = None,
+    ):
+        """
+        Create a hedged provider.
+
+        Args:
+            providers: Backends in priority order (at least one)
+            hedge_percentile: Latency percentile of the primary after which a
+                hedge request is sent
+            initial_hedge_delay: Hedge delay (seconds) until a backend has
+                ``min_samples`` latency samples
+            min_hedge_delay: Lower bound on the hedge delay (seconds)
+            max_hedge_delay: Upper bound on the hedge delay (seconds)
+            min_samples: Latency samples needed before percentiles are trusted
+            max_hedges: Hedge requests allowed per call (0 disables hedging)
+            error_threshold: Error rate that opens a backend's circuit
+            reset_timeout: Seconds an open circuit waits before a probe
+            window: Number of recent requests kept per backend
+            validator: Predicate a result must satisfy to win (invalid results
+                count as backend failures)
+        """
+        if not providers:
+            raise ValueError("HedgedProvider needs at least one backend provider")
+        super().__init__(
+            name="hedged",
+            capabilities=ProviderCapabilities(
+                # Requests are only routed to backends that support the operation
+                streaming=any(p.capabilities.streaming for p in providers),
+                structured_output=any(p.capabilities.structured_output for p in providers),
+                # Text requests may land on any backend, so reasoning must be shared
+                reasoning=all(p.capabilities.reasoning for p in providers),
+            ),
+        )
+        self.backends = [
+            _Backend(
+                provider=provider,
+                stats=BackendStats(window=window),
+                breaker=CircuitBreaker(
+                    error_threshold=error_threshold,
+                    min_requests=min_samples,
+                    reset_timeout=reset_timeout,
+                ),
+            )
+            for provider in providers
+        ]
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.min_samples = min_samples
+        self.max_hedges = max_hedges
+        self.validator = validator
+
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    async def initialize(self, credentials: dict) -> None:
+        """Backends are initialized individually; nothing to do here."""
+
+    async def generate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> str:
+        return await self._race(
+            lambda provider: provider.generate_text(
+                prompt, max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+        )
+
+    async def generate_structured(self, prompt: str, schema: dict, **kwargs: Any) -> dict:
+        return await self._race(
+            lambda provider: provider.generate_structured(prompt, schema, **kwargs),
+            capability="structured_output",
+        )
+
+    async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Stream from the first backend that produces a chunk.
+
+        Streams are not hedged (both backends would bill the full generation);
+        a backend that fails before its first chunk is replaced by the next.
+        """
+        last_error: Exception | None = None
+        for backend in self._candidates("streaming"):
+            if not backend.breaker.acquire():
+                continue
+            start = time.perf_counter()
+            stream = backend.provider.generate_stream(prompt, **kwargs)
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                self._record(backend, True, time.perf_counter() - start)
+                return
+            except Exception as exc:
+                self._record(backend, False)
+                await stream.aclose()
+                self.failovers += 1
+                last_error = exc
+                continue
+            except BaseException:
+                backend.breaker.release()
+                raise
+
+            ttft = time.perf_counter() - start
+            try:
+                yield first
+                async for chunk in stream:
+                    yield chunk
+            except GeneratorExit:
+                backend.breaker.release()
+                raise
+            except Exception:
+                self._record(backend, False)
+                raise
+            else:
+                self._record(backend, True, ttft)
+            finally:
+                await stream.aclose()
+            return
+        raise NoBackendAvailableError("No backend produced a stream") from last_error
+
+    async def check_health(self) -> bool:
+        results = await asyncio.gather(
+            *(backend.provider.check_health() for backend in self.backends),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.capabilities.streaming
+
+    @property
+    def supports_structured_output(self) -> bool:
+        return self.capabilities.structured_output
+
+    def backend_stats(self) -> dict[str, Any]:
+        """Return per-backend latency, error rate and circuit state, plus hedge counts."""
+        return {
+            "backends": {
+                backend.provider.name: {
+                    **backend.stats.to_dict(),
+                    "circuit": backend.breaker.state.value,
+                }
+                for backend in self.backends
+            },
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+        }
+
+    # -- internals -------------------------------------------------------------------
+
+    def _candidates(self, capability: str | None = None) -> list[_Backend]:
+        """Backends to try, best first.
+
+        Only backends whose capabilities include ``capability`` (a
+        ``ProviderCapabilities`` field) are considered. Backends with an open
+        circuit are skipped; if none is left, ``NoBackendAvailableError`` is
+        raised without sending a request. Once every remaining backend has
+        enough samples they are ordered by p50 latency; before that the
+        configured priority order is kept.
+        """
+        capable = [
+            backend
+            for backend in self.backends
+            if capability is None or getattr(backend.provider.capabilities, capability)
+        ]
+        if not capable:
+            raise NoBackendAvailableError(f"No backend supports {capability}")
+        available = [backend for backend in capable if backend.breaker.available()]
+        if not available:
+            raise NoBackendAvailableError("Every backend circuit is open")
+        if all(len(backend.stats.latencies) >= self.min_samples for backend in available):
+            available.sort(key=lambda backend: backend.stats.p50)
+        return available
+
+    def _hedge_delay(self, backend: _Backend) -> float:
+        if len(backend.stats.latencies) < self.min_samples:
+            delay = self.initial_hedge_delay
+        else:
+            delay = backend.stats.percentile(self.hedge_percentile)
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, delay))
+
+    def _record(self, backend: _Backend, success: bool, latency: float | None = None) -> None:
+        previous = backend.breaker.state
+        backend.stats.record(success, latency)
+        backend.breaker.record(success, backend.stats)
+        if backend.breaker.state is not previous:
+            LOGGER.warning(
+                "Circuit for provider '%s' is now %s (error rate %.0f%%)",
+                backend.provider.name,
+                backend.breaker.state.value,
+                backend.stats.error_rate * 100,
+            )
+
+    def _valid(self, result: Any) -> bool:
+        return self.validator is None or self.validator(result)
+
+    async def _race(
+        self, call: Callable[[BaseProvider], Awaitable[Any]], capability: str | None = None
+    ) -> Any:
+        """Run ``call`` on the best backend with ``capability``, hedging and failing over."""
+        loop = asyncio.get_running_loop()
+        queue = iter(self._candidates(capability))
+        pending: dict[asyncio.Task, tuple[_Backend, float, bool]] = {}
+        hedges = 0
+        hedge_at = math.inf
+        last_error: Exception | None = None
+
+        def launch(hedge: bool) -> bool:
+            nonlocal hedge_at
+            for backend in queue:
+                if backend.breaker.acquire():
+                    task = asyncio.ensure_future(call(backend.provider))
+                    pending[task] = (backend, time.perf_counter(), hedge)
+                    hedge_at = loop.time() + self._hedge_delay(backend)
+                    return True
+            return False
+
+        try:
+            launch(hedge=False)
+            while True:
+                if not pending:
+                    if not launch(hedge=False):
+                        raise NoBackendAvailableError("All backends failed") from last_error
+                    self.failovers += 1
+                    continue
+
+                timeout = None
+                if hedges < self.max_hedges:
+                    timeout = max(0.0, hedge_at - loop.time())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if launch(hedge=True):
+                        hedges += 1
+                        self.hedges += 1
+                    else:
+                        hedges = self.max_hedges  # nothing left to hedge with
+                    continue
+
+                for task in done:
+                    backend, start, hedge = pending.pop(task)
+                    error = task.exception()
+                    if error is None and self._valid(task.result()):
+                        self._record(backend, True, time.perf_counter() - start)
+                        if hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    self._record(backend, False)
+                    last_error = error or ValueError(
+                        f"Invalid result from provider '{backend.provider.name}'"
+                    )
+                    LOGGER.info("Provider '%s' failed: %s", backend.provider.name, last_error)
+        finally:
+            for task, (backend, _, _) in pending.items():
+                task.cancel()
+                backend.breaker.release()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+__all__ = [
+    "BackendStats",
+    "CircuitBreaker",
+    "CircuitState",
+    "HedgedProvider",
+    "NoBackendAvailableError",
+]
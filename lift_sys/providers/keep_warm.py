@@ -0,0 +1,430 @@
+"""Predictive keep-warm scheduling and cold-start masking for GPU endpoints.
+
+Modal scales an idle inference container down after its scaledown window,
+and the next request waits through a multi-minute model load.
+``KeepWarmProvider`` fronts such a provider (the primary) and:
+
+- records request arrivals in a ``DemandForecaster``, which predicts the
+  arrival rate from recent traffic and from the same time of day in
+  previous weeks
+- runs a scheduler that pings the primary's warmup endpoint while a request
+  is likely within the scaledown window, starting early enough to absorb a
+  cold start before predicted demand, and stops pinging when no demand is
+  expected so the container can scale down
+- routes requests to a warm fallback provider while the primary is cold
+  and starts warming it in the background
+- exports cold-start incidence and latency (``KeepWarmMetrics``)
+
+Usage:
+    provider = KeepWarmProvider(modal_provider, fallback=anthropic_provider)
+    provider.start()
+    ...
+    await provider.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from .base import BaseProvider
+
+LOGGER = logging.getLogger(__name__)
+
+WEEK_SECONDS = 7 * 24 * 3600
+
+
+class WarmState(str, Enum):
+    """Believed state of the primary's container."""
+
+    COLD = "cold"
+    WARMING = "warming"
+    WARM = "warm"
+
+
+class DemandForecaster:
+    """Predict request arrival rates from recent and seasonal traffic.
+
+    The recent rate is an exponentially decayed arrival count. The seasonal
+    rate is the average arrival rate of the same ``bucket_seconds`` slot in
+    up to ``history`` previous seasons (weeks by default) since the first
+    recorded arrival. The prediction is the larger of the two.
+    """
+
+    def __init__(
+        self,
+        half_life: float = 300.0,
+        bucket_seconds: float = 900.0,
+        season_seconds: float = WEEK_SECONDS,
+        history: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Create a forecaster.
+
+        Args:
+            half_life: Seconds after which a past arrival counts half as much
+            bucket_seconds: Width of a seasonal slot
+            season_seconds: Length of the repeating traffic pattern
+            history: Previous seasons averaged for the seasonal rate
+            clock: Wall-clock time source (seconds since the epoch)
+        """
+        self.half_life = half_life
+        self.bucket_seconds = bucket_seconds
+        self.season_seconds = season_seconds
+        self.history = history
+        self._clock = clock
+        self._level = 0.0
+        self._level_at = 0.0
+        self._buckets: dict[tuple[int, int], int] = {}
+        self._first_season: int | None = None
+
+    def record(self, at: float | None = None) -> None:
+        """Record one request arrival."""
+        at = self._clock() if at is None else at
+        self._level = self._decayed_level(at) + 1
+        self._level_at = at
+        key = self._slot(at)
+        if self._first_season is None:
+            self._first_season = key[0]
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        oldest = key[0] - self.history
+        for stale in [slot for slot in self._buckets if slot[0] < oldest]:
+            del self._buckets[stale]
+
+    def recent_rate(self, at: float | None = None) -> float:
+        """Decayed arrival rate (requests per second) at ``at``."""
+        at = self._clock() if at is None else at
+        # Mean lifetime of the exponential decay turns the level into a rate
+        return self._decayed_level(at) * math.log(2) / self.half_life
+
+    def seasonal_rate(self, at: float | None = None) -> float:
+        """Average rate of the slot containing ``at`` in previous seasons."""
+        at = self._clock() if at is None else at
+        season, bucket = self._slot(at)
+        if self._first_season is None or season <= self._first_season:
+            return 0.0
+        seasons = range(max(season - self.history, self._first_season), season)
+        counts = [self._buckets.get((previous, bucket), 0) for previous in seasons]
+        return sum(counts) / (len(counts) * self.bucket_seconds)
+
+    def predicted_rate(self, at: float) -> float:
+        """Predicted arrival rate at future time ``at``."""
+        return max(self.recent_rate(min(at, self._clock())), self.seasonal_rate(at))
+
+    def demand_probability(self, horizon: float, lead: float = 0.0) -> float:
+        """Probability of at least one request in ``[now + lead, now + lead + horizon]``."""
+        start = self._clock() + lead
+        # Poisson arrivals; the rate is sampled at both ends of the interval
+        rate = max(self.predicted_rate(start), self.predicted_rate(start + horizon))
+        return 1 - math.exp(-rate * horizon)
+
+    def _decayed_level(self, at: float) -> float:
+        elapsed = max(0.0, at - self._level_at)
+        return self._level * 0.5 ** (elapsed / self.half_life)
+
+    def _slot(self, at: float) -> tuple[int, int]:
+        season, offset = divmod(at, self.season_seconds)
+        return int(season), int(offset // self.bucket_seconds)
+
+
+@dataclass
+class KeepWarmMetrics:
+    """Keep-warm activity and cold-start statistics.
+
+    Attributes:
+        warmup_pings: Warmup requests sent to the primary
+        cold_starts: Primary requests or pings that hit a cold container
+        cold_start_seconds: Total latency of those cold starts
+        max_cold_start_seconds: Longest cold start observed
+        cold_start_requests: Primary requests that waited for a cold start
+        primary_requests: Requests served by the primary
+        fallback_requests: Requests routed to the fallback while the primary was cold
+    """
+
+    warmup_pings: int = 0
+    cold_starts: int = 0
+    cold_start_seconds: float = 0.0
+    max_cold_start_seconds: float = 0.0
+    cold_start_requests: int = 0
+    primary_requests: int = 0
+    fallback_requests: int = 0
+
+    @property
+    def avg_cold_start_seconds(self) -> float:
+        """Average cold-start latency."""
+        if self.cold_starts == 0:
+            return 0.0
+        return self.cold_start_seconds / self.cold_starts
+
+    @property
+    def cold_start_rate(self) -> float:
+        """Fraction of primary requests that waited for a cold start."""
+        if self.primary_requests == 0:
+            return 0.0
+        return self.cold_start_requests / self.primary_requests
+
+    def record_cold_start(self, seconds: float) -> None:
+        """Record one cold start."""
+        self.cold_starts += 1
+        self.cold_start_seconds += seconds
+        self.max_cold_start_seconds = max(self.max_cold_start_seconds, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export metrics as dictionary."""
+        return {
+            "warmup_pings": self.warmup_pings,
+            "cold_starts": self.cold_starts,
+            "avg_cold_start_seconds": self.avg_cold_start_seconds,
+            "max_cold_start_seconds": self.max_cold_start_seconds,
+            "cold_start_requests": self.cold_start_requests,
+            "cold_start_rate": self.cold_start_rate,
+            "primary_requests": self.primary_requests,
+            "fallback_requests": self.fallback_requests,
+        }
+
+
+class KeepWarmProvider(BaseProvider):
+    """Provider that keeps a cold-starting primary warm ahead of demand."""
+
+    def __init__(
+        self,
+        primary: BaseProvider,
+        fallback: BaseProvider | None = None,
+        scaledown_window: float = 120.0,
+        ping_interval: float | None = None,
+        expected_cold_start: float = 420.0,
+        cold_start_threshold: float = 20.0,
+        demand_threshold: float = 0.2,
+        check_interval: float = 30.0,
+        forecaster: DemandForecaster | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Create a keep-warm provider.
+
+        Args:
+            primary: Provider whose container scales down when idle (e.g. ModalProvider)
+            fallback: Warm provider used while the primary is cold (None waits for
+                the primary)
+            scaledown_window: Idle seconds after which the primary scales down
+            ping_interval: Seconds between keep-warm pings (half the scaledown
+                window by default)
+            expected_cold_start: Seconds a cold start takes; warming starts this
+                long before predicted demand
+            cold_start_threshold: Primary latency (seconds) taken as a cold start
+            demand_threshold: Probability of a request within the scaledown window
+                above which the primary is kept warm
+            check_interval: Seconds between scheduler checks
+            forecaster: Arrival-rate forecaster (created with ``clock`` by default)
+            clock: Wall-clock time source
+        """
+        super().__init__(name=f"keep-warm-{primary.name}", capabilities=primary.capabilities)
+        # Streaming and cache metrics describe the backend that did the work
+        self.stream_metrics = primary.stream_metrics
+        self.prompt_cache_metrics = primary.prompt_cache_metrics
+        self.primary = primary
+        self.fallback = fallback
+        self.scaledown_window = scaledown_window
+        self.ping_interval = ping_interval if ping_interval is not None else scaledown_window / 2
+        self.expected_cold_start = expected_cold_start
+        self.cold_start_threshold = cold_start_threshold
+        self.demand_threshold = demand_threshold
+        self.check_interval = check_interval
+        self.forecaster = forecaster or DemandForecaster(clock=clock)
+        self._clock = clock
+        self.metrics = KeepWarmMetrics()
+
+        self._warm_at: float | None = None
+        self._warming: asyncio.Task | None = None
+        self._scheduler: asyncio.Task | None = None
+
+    @property
+    def state(self) -> WarmState:
+        """Believed state of the primary's container."""
+        if self._warming is not None and not self._warming.done():
+            return WarmState.WARMING
+        if self._warm_at is not None and self._clock() - self._warm_at < self.scaledown_window:
+            return WarmState.WARM
+        return WarmState.COLD
+
+    async def initialize(self, credentials: dict) -> None:
+        """Backends are initialized individually; nothing to do here."""
+
+    async def generate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> str:
+        provider = self._route(lambda capabilities: True)
+        call = provider.generate_text(
+            prompt, max_tokens=max_tokens, temperature=temperature, **kwargs
+        )
+        return await self._serve(provider, call)
+
+    async def generate_structured(self, prompt: str, schema: dict, **kwargs: Any) -> dict:
+        provider = self._route(lambda capabilities: capabilities.structured_output)
+        return await self._serve(provider, provider.generate_structured(prompt, schema, **kwargs))
+
+    async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+        provider = self._route(lambda capabilities: capabilities.streaming)
+        if provider is not self.primary:
+            async for chunk in provider.generate_stream(prompt, **kwargs):
+                yield chunk
+            return
+
+        start = time.perf_counter()
+        first = True
+        async for chunk in provider.generate_stream(prompt, **kwargs):
+            if first:
+                # Time to first chunk is what a cold container delays
+                self._primary_served(time.perf_counter() - start)
+                first = False
+            yield chunk
+
+    async def check_health(self) -> bool:
+        if await self.primary.check_health():
+            return True
+        return self.fallback is not None and await self.fallback.check_health()
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.capabilities.streaming
+
+    @property
+    def supports_structured_output(self) -> bool:
+        return self.capabilities.structured_output
+
+    def start(self) -> None:
+        """Start the keep-warm scheduler on the running event loop."""
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._run_scheduler())
+
+    async def stop(self) -> None:
+        """Stop the scheduler and any warmup in progress."""
+        for task in (self._scheduler, self._warming):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._scheduler = None
+        self._warming = None
+
+    async def aclose(self) -> None:
+        await self.stop()
+
+    async def warm_up(self) -> bool:
+        """Warm the primary now and wait for it; returns whether it is warm."""
+        await self._ensure_warming()
+        return self.state is WarmState.WARM
+
+    async def tick(self) -> bool:
+        """
+        Run one scheduler check: ping the primary if demand is expected.
+
+        Returns:
+            Whether a warmup ping was sent
+        """
+        state = self.state
+        if state is WarmState.WARMING:
+            return False
+        # A cold container needs a head start of one cold start before demand arrives
+        lead = self.expected_cold_start if state is WarmState.COLD else 0.0
+        probability = self.forecaster.demand_probability(self.scaledown_window, lead)
+        if probability < self.demand_threshold:
+            return False
+        if state is WarmState.WARM and self._clock() - self._warm_at < self.ping_interval:
+            return False
+        LOGGER.debug("Keeping %s warm (demand probability %.2f)", self.primary.name, probability)
+        await self._ensure_warming()
+        return True
+
+    def keep_warm_stats(self) -> dict[str, Any]:
+        """Return warm state, predicted demand and cold-start metrics."""
+        now = self._clock()
+        return {
+            "state": self.state.value,
+            "predicted_rate": self.forecaster.predicted_rate(now),
+            "demand_probability": self.forecaster.demand_probability(self.scaledown_window),
+            **self.metrics.to_dict(),
+        }
+
+    # -- internals -------------------------------------------------------------------
+
+    def _route(self, supports: Callable[[Any], bool]) -> BaseProvider:
+        """Record the arrival and pick the primary, or the fallback while it is cold."""
+        self.forecaster.record()
+        if self.state is WarmState.WARM:
+            return self.primary
+        self._ensure_warming()
+        if self.fallback is not None and supports(self.fallback.capabilities):
+            self.metrics.fallback_requests += 1
+            return self.fallback
+        return self.primary
+
+    async def _serve(self, provider: BaseProvider, call: Any) -> Any:
+        if provider is not self.primary:
+            return await call
+        start = time.perf_counter()
+        result = await call
+        self._primary_served(time.perf_counter() - start)
+        return result
+
+    def _primary_served(self, latency: float) -> None:
+        self.metrics.primary_requests += 1
+        if latency >= self.cold_start_threshold:
+            self.metrics.cold_start_requests += 1
+            self._cold_start(latency)
+        self._warm_at = self._clock()
+
+    def _cold_start(self, latency: float) -> None:
+        self.metrics.record_cold_start(latency)
+        LOGGER.warning("Provider '%s' cold start took %.1fs", self.primary.name, latency)
+
+    def _ensure_warming(self) -> asyncio.Task:
+        if self._warming is None or self._warming.done():
+            self._warming = asyncio.ensure_future(self._warm())
+        return self._warming
+
+    async def _warm(self) -> None:
+        warmup = getattr(self.primary, "warmup", None) or self.primary.check_health
+        self.metrics.warmup_pings += 1
+        start = time.perf_counter()
+        try:
+            ready = await warmup()
+        except Exception as exc:
+            LOGGER.warning("Warmup of provider '%s' failed: %s", self.primary.name, exc)
+            return
+        if not ready:
+            LOGGER.warning("Warmup of provider '%s' was not acknowledged", self.primary.name)
+            return
+        latency = time.perf_counter() - start
+        if latency >= self.cold_start_threshold:
+            self._cold_start(latency)
+        self._warm_at = self._clock()
+
+    async def _run_scheduler(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.warning("Keep-warm check failed: %s", exc)
+            await asyncio.sleep(self.check_interval)
+
+
+__all__ = [
+    "DemandForecaster",
+    "KeepWarmMetrics",
+    "KeepWarmProvider",
+    "WarmState",
+]
@@ -2,29 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from ..services.http_pool import get_http_pool
 from .base import BaseProvider, ProviderCapabilities
+from .batching import MicroBatcher
+from .streaming import iter_sse, measure_stream
+from .telemetry import record_usage
+
+LOGGER = logging.getLogger(__name__)
+
+# Generation requests wait through cold starts (Qwen3-30B takes ~6-7 min)
+_REQUEST_OPTIONS: dict[str, Any] = {
+    "timeout": httpx.Timeout(600.0, connect=10.0),
+    "follow_redirects": True,
+}
 
 
 class ModalProvider(BaseProvider):
     """Provider that uses Modal.com for GPU-accelerated constrained generation."""
 
-    def __init__(self, endpoint_url: str):
+    def __init__(
+        self,
+        endpoint_url: str,
+        stream_url: str | None = None,
+        batch_url: str | None = None,
+        batch_window: float = 0.015,
+        max_batch_size: int = 16,
+    ):
         """
         Initialize Modal provider.
 
         Args:
             endpoint_url: URL to the generate endpoint (e.g., https://rand--generate.modal.run)
                          For label-based URLs, this should be the direct generate endpoint URL.
+            stream_url: URL of a server-sent events endpoint used by generate_stream();
+                        streaming is only advertised when this is configured
+            batch_url: URL of the batch generate endpoint (derived from endpoint_url
+                       when omitted)
+            batch_window: Seconds concurrent generate_structured() calls are gathered
+                          into one batch request (0 disables batching)
+            max_batch_size: Maximum prompts per batch request
         """
         super().__init__(
             name="modal",
             capabilities=ProviderCapabilities(
-                streaming=False,
+                streaming=stream_url is not None,
                 structured_output=True,  # XGrammar enables schema-constrained generation
                 reasoning=True,
             ),
@@ -42,14 +71,46 @@ class ModalProvider(BaseProvider):
             # If neither pattern matches, use same URL (will fail, but that's expected)
             self.health_url = endpoint_url
 
+        # Warmup endpoint loads the model (health does not start a GPU container)
+        if "-generate.modal.run" in endpoint_url:
+            self.warmup_url = endpoint_url.replace("-generate.modal.run", "-warmup.modal.run")
+        elif "/generate" in endpoint_url:
+            self.warmup_url = endpoint_url.replace("/generate", "/warmup")
+        else:
+            self.warmup_url = endpoint_url
+
+        # The stock vLLM deployment has no streaming endpoint, so it is never derived
+        self.stream_url = stream_url.rstrip("/") if stream_url is not None else None
+
+        # Batch endpoint: <label>-generate.modal.run -> <label>-generate-batch.modal.run
+        if batch_url is not None:
+            self.batch_url = batch_url.rstrip("/")
+        elif "-generate.modal.run" in endpoint_url:
+            self.batch_url = self.endpoint_url.replace(
+                "-generate.modal.run", "-generate-batch.modal.run"
+            )
+        else:
+            self.batch_url = f"{self.endpoint_url}_batch"
+
+        # Concurrent structured calls are sent together; vLLM generates a batch in one pass
+        self._batcher: MicroBatcher[dict[str, Any], Any] | None = None
+        if batch_window > 0 and max_batch_size > 1:
+            self._batcher = MicroBatcher(self._send_batch, batch_window, max_batch_size)
+        self._batch_endpoint_available = True
+
+        # Injected client (tests); otherwise the pooled client of the running loop
         self._client: httpx.AsyncClient | None = None
+        self._initialized = False
 
     async def initialize(self, credentials: dict[str, Any]) -> None:
-        """Initialize HTTP client."""
-        self._client = httpx.AsyncClient(
-            timeout=600.0,  # 10 minutes for cold starts (Qwen3-30B takes ~6-7 min)
-            follow_redirects=True,
-        )
+        """Mark the provider ready; requests use the shared pooled HTTP client."""
+        self._initialized = True
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None and not self._initialized:
+            raise RuntimeError("Modal provider not initialized. Call initialize() first.")
+        # Resolved per call, so each event loop gets its own pooled client
+        return self._client or get_http_pool().async_client()
 
     async def generate_structured(
         self,
@@ -76,47 +137,96 @@ class ModalProvider(BaseProvider):
             RuntimeError: If Modal provider not initialized
             httpx.HTTPStatusError: If API request fails
         """
-        if not self._client:
-            raise RuntimeError("Modal provider not initialized. Call initialize() first.")
+        await self._ensure_client()
+
+        payload = {
+            "prompt": prompt,
+            "schema": schema,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": kwargs.get("top_p", 0.95),
+        }
+        if self._batcher is not None:
+            result = await self._batcher.submit(payload)
+        else:
+            result = await self._generate_one(payload)
+        # Unpacked by the caller, so usage is attributed to its own call
+        return self._result_text(result)
 
+    async def _generate_one(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST a single request to the generate endpoint and return its result."""
+        client = await self._ensure_client()
         try:
-            response = await self._client.post(
+            response = await client.post(
                 self.endpoint_url,  # Direct endpoint URL (label-based or path-based)
-                json={
-                    "prompt": prompt,
-                    "schema": schema,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                    "top_p": kwargs.get("top_p", 0.95),
-                },
+                json=payload,
+                **_REQUEST_OPTIONS,
             )
             response.raise_for_status()
+            return response.json()
 
-            result = response.json()
-
-            # Check for errors in the response
-            if "error" in result:
-                error_msg = result["error"]
-                raw_output = result.get("raw_output", "")
-                raise ValueError(
-                    f"Modal inference error: {error_msg}\n"
-                    f"Raw output (first 500 chars): {raw_output[:500]}"
-                )
+        except httpx.HTTPStatusError as e:
+            raise self._http_error(e) from e
 
-            # The Modal endpoint returns the generated text/JSON in the "text" field
-            # For schema-constrained generation, this will be a JSON object
-            return result["text"]
+    async def _send_batch(self, payloads: list[dict[str, Any]]) -> list[Any]:
+        """Send gathered requests as one batch request (one result or exception each)."""
+        if len(payloads) == 1 or not self._batch_endpoint_available:
+            return await asyncio.gather(
+                *(self._generate_one(payload) for payload in payloads), return_exceptions=True
+            )
 
+        client = await self._ensure_client()
+        try:
+            response = await client.post(
+                self.batch_url, json={"requests": payloads}, **_REQUEST_OPTIONS
+            )
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            # Include response body in error for debugging
-            error_body = ""
-            try:
-                error_body = e.response.text
-            except Exception:
-                pass
+            if e.response.status_code not in (404, 405):
+                raise self._http_error(e) from e
+            # Older deployments have no batch endpoint; send requests individually
+            LOGGER.warning("Modal batch endpoint %s unavailable, batching disabled", self.batch_url)
+            self._batch_endpoint_available = False
+            return await self._send_batch(payloads)
+
+        results = response.json().get("results", [])
+        if len(results) != len(payloads):
             raise ValueError(
-                f"Modal API error (HTTP {e.response.status_code}): {error_body[:500]}"
-            ) from e
+                f"Modal batch endpoint returned {len(results)} results for {len(payloads)} prompts"
+            )
+        return results
+
+    def _result_text(self, result: dict[str, Any]) -> Any:
+        """Extract the generated output from an endpoint result."""
+        # vLLM prefix caching: the endpoint reports how much of the prompt was cached
+        if isinstance(result.get("prompt_tokens"), int):
+            self.prompt_cache_metrics.record(
+                result["prompt_tokens"], result.get("cached_tokens") or 0
+            )
+        record_usage(result.get("prompt_tokens"), result.get("tokens_used"))
+
+        # Check for errors in the response
+        if "error" in result:
+            error_msg = result["error"]
+            raw_output = result.get("raw_output", "")
+            raise ValueError(
+                f"Modal inference error: {error_msg}\n"
+                f"Raw output (first 500 chars): {raw_output[:500]}"
+            )
+
+        # The Modal endpoint returns the generated text/JSON in the "text" field
+        # For schema-constrained generation, this will be a JSON object
+        return result["text"]
+
+    @staticmethod
+    def _http_error(e: httpx.HTTPStatusError) -> ValueError:
+        # Include response body in error for debugging
+        error_body = ""
+        try:
+            error_body = e.response.text
+        except Exception:
+            pass
+        return ValueError(f"Modal API error (HTTP {e.response.status_code}): {error_body[:500]}")
 
     async def generate_text(
         self,
@@ -142,11 +252,13 @@ class ModalProvider(BaseProvider):
 
         Note: Health endpoint is lightweight and doesn't trigger GPU/model loading.
         """
-        if not self._client:
+        try:
+            client = await self._ensure_client()
+        except RuntimeError:
             return False
 
         try:
-            response = await self._client.get(
+            response = await client.get(
                 self.health_url,  # Use dedicated health URL
                 timeout=10.0,  # Allow time for cold start
             )
@@ -154,28 +266,97 @@ class ModalProvider(BaseProvider):
         except Exception:
             return False
 
+    async def warmup(self) -> bool:
+        """
+        Start the model container (if needed) and wait until it is ready.
+
+        Returns immediately when the container is warm; a cold container
+        answers after the model has loaded. Used by ``KeepWarmProvider``.
+        """
+        try:
+            client = await self._ensure_client()
+        except RuntimeError:
+            return False
+
+        try:
+            response = await client.get(self.warmup_url, **_REQUEST_OPTIONS)
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
     async def generate_stream(
         self,
         prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        schema: dict | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
         """
-        Generate streaming tokens (not supported by Modal provider).
+        Yield generated text incrementally from the streaming endpoint.
+
+        The endpoint answers with server-sent events. Each ``data:`` payload is
+        either ``{"text": "..."}`` or a vLLM OpenAI-compatible completion chunk
+        (``{"choices": [{"text": "..."}]}``), and ``data: [DONE]`` ends the
+        stream. Chunks are read from the socket only as the caller consumes
+        them, and closing the generator closes the connection.
+
+        Args:
+            prompt: Prompt to complete
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            schema: Optional JSON schema to constrain generation with XGrammar
+            **kwargs: Additional parameters (top_p, etc.)
 
-        Modal provider focuses on schema-constrained generation which doesn't support streaming.
-        Use AnthropicProvider for streaming text generation.
+        Raises:
+            NotImplementedError: If no stream_url is configured
+            RuntimeError: If Modal provider not initialized
+            ValueError: If the endpoint reports an error
         """
-        raise NotImplementedError(
-            "Modal provider does not support streaming. "
-            "Use AnthropicProvider for streaming text generation."
-        )
-        # Make this a proper async generator
-        yield ""  # Unreachable, but satisfies type checker
+        if self.stream_url is None:
+            raise NotImplementedError(
+                "Modal provider has no streaming endpoint. Pass stream_url to enable streaming."
+            )
+        await self._ensure_client()
+
+        payload: dict[str, Any] = {
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": kwargs.get("top_p", 0.95),
+            "stream": True,
+        }
+        if schema is not None:
+            payload["schema"] = schema
+        async for text in measure_stream(self._sse_text(payload), self.stream_metrics):
+            yield text
+
+    async def _sse_text(self, payload: dict[str, Any]) -> AsyncIterator[str]:
+        client = await self._ensure_client()
+        async with client.stream(
+            "POST", self.stream_url, json=payload, **_REQUEST_OPTIONS
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                raise ValueError(
+                    f"Modal API error (HTTP {response.status_code}): {response.text[:500]}"
+                )
+            async for _event, data in iter_sse(response.aiter_lines()):
+                if data == "[DONE]":
+                    return
+                message = json.loads(data)
+                if "error" in message:
+                    raise ValueError(f"Modal inference error: {message['error']}")
+                if "text" in message:
+                    yield message["text"]
+                else:
+                    choice = message.get("choices", [{}])[0]
+                    yield choice.get("text") or choice.get("delta", {}).get("content") or ""
 
     @property
     def supports_streaming(self) -> bool:
-        """Modal provider does not support streaming."""
-        return False
+        """Modal provider streams over server-sent events when stream_url is configured."""
+        return self.stream_url is not None
 
     @property
     def supports_structured_output(self) -> bool:
@@ -183,10 +364,12 @@ class ModalProvider(BaseProvider):
         return True
 
     async def aclose(self) -> None:
-        """Close HTTP client connection."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Send any gathered requests, then release the HTTP client."""
+        if self._batcher is not None:
+            await self._batcher.flush()
+        # The shared client and its connections are closed by the pool
+        self._client = None
+        self._initialized = False
 
 
 __all__ = ["ModalProvider"]
@@ -8,7 +8,9 @@ from typing import Any
 
 import httpx
 
+from ..services.http_pool import get_http_pool
 from .base import BaseProvider, ProviderCapabilities
+from .telemetry import record_usage
 
 OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
 
@@ -64,6 +66,8 @@ class OpenAIProvider(BaseProvider):
         )
         response.raise_for_status()
         data = response.json()
+        usage = data.get("usage") or {}
+        record_usage(usage.get("prompt_tokens"), usage.get("completion_tokens"))
         return data["choices"][0]["message"].get("content", "")
 
     async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
@@ -92,6 +96,8 @@ class OpenAIProvider(BaseProvider):
         )
         response.raise_for_status()
         data = response.json()
+        usage = data.get("usage") or {}
+        record_usage(usage.get("prompt_tokens"), usage.get("completion_tokens"))
         message = data["choices"][0]["message"]
         content = message.get("content", "{}")
         return json.loads(content)
@@ -108,11 +114,9 @@ class OpenAIProvider(BaseProvider):
         return True
 
     async def _ensure_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        # Shared pooled client unless one was injected
+        return self._client or get_http_pool().async_client()
 
     async def aclose(self) -> None:
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        # The shared client and its connections are closed by the pool
+        self._client = None
@@ -0,0 +1,89 @@
+"""Prompt-prefix caching support shared by providers.
+
+Prompt builders put their large, unchanging instruction block first (for
+example ``IR_GENERATION_INSTRUCTIONS``) and pass it to the provider as the
+``cache_prefix`` keyword. The full ``prompt`` is still sent, so providers
+that do not cache simply ignore the hint:
+
+- ``AnthropicProvider`` sends the prefix as its own content block with a
+  ``cache_control`` breakpoint, so repeated prefixes are read from the cache
+- vLLM on Modal caches matching prompt prefixes automatically
+  (``enable_prefix_caching``); the endpoint reports cached token counts
+
+Every provider exposes ``provider.prompt_cache_metrics`` with the prompt
+tokens processed and how many of them were served from the cache.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class PromptCacheMetrics:
+    """Aggregate prompt-cache metrics for one provider.
+
+    Attributes:
+        requests: Requests that reported token usage
+        cache_hits: Requests that read at least one prompt token from the cache
+        prompt_tokens: Prompt tokens processed (cached or not)
+        cached_tokens: Prompt tokens read from the cache
+        cache_write_tokens: Prompt tokens written to the cache
+    """
+
+    requests: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests with a prefix cache hit."""
+        if self.requests == 0:
+            return 0.0
+        return self.cache_hits / self.requests
+
+    @property
+    def token_savings(self) -> float:
+        """Fraction of prompt tokens served from the cache."""
+        if self.prompt_tokens == 0:
+            return 0.0
+        return self.cached_tokens / self.prompt_tokens
+
+    def record(self, prompt_tokens: int, cached_tokens: int = 0, cache_write_tokens: int = 0):
+        """Record token usage of one request."""
+        self.requests += 1
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+        self.cache_write_tokens += cache_write_tokens
+        if cached_tokens > 0:
+            self.cache_hits += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export metrics as dictionary."""
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "hit_rate": self.hit_rate,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "token_savings": self.token_savings,
+        }
+
+
+def split_prompt(prompt: str, cache_prefix: str | None) -> tuple[str, str] | None:
+    """
+    Split ``prompt`` into its cacheable prefix and the rest.
+
+    Returns:
+        ``(prefix, suffix)``, or None when ``prompt`` does not start with ``cache_prefix``
+    """
+    if not cache_prefix or not prompt.startswith(cache_prefix) or prompt == cache_prefix:
+        return None
+    return cache_prefix, prompt[len(cache_prefix) :]
+
+
+__all__ = ["PromptCacheMetrics", "split_prompt"]
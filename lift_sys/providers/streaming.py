@@ -0,0 +1,144 @@
+"""Token streaming helpers shared by providers.
+
+Providers stream by pulling from the HTTP response only when the consumer
+asks for the next chunk, so a slow consumer applies backpressure all the way
+to the socket. Closing the generator (``aclose()``, or breaking out of an
+``async for``) exits the response context and drops the connection, which
+cancels the generation upstream.
+
+``measure_stream`` wraps a provider's chunk iterator and records
+time-to-first-token and stream outcomes in ``StreamMetrics``; every provider
+exposes one as ``provider.stream_metrics``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StreamMetrics:
+    """Aggregate streaming metrics for one provider.
+
+    Attributes:
+        streams_started: Streams that were iterated
+        streams_completed: Streams that ran to the end
+        streams_cancelled: Streams closed early by the consumer
+        streams_failed: Streams that raised
+        chunks: Non-empty chunks yielded
+        ttft_sum: Sum of time-to-first-token measurements (seconds)
+        ttft_count: Number of time-to-first-token measurements
+        last_ttft: Most recent time-to-first-token (seconds)
+    """
+
+    streams_started: int = 0
+    streams_completed: int = 0
+    streams_cancelled: int = 0
+    streams_failed: int = 0
+    chunks: int = 0
+
+    ttft_sum: float = 0.0
+    ttft_count: int = 0
+    last_ttft: float | None = None
+
+    @property
+    def avg_ttft_ms(self) -> float:
+        """Average time to first token in milliseconds."""
+        if self.ttft_count == 0:
+            return 0.0
+        return (self.ttft_sum / self.ttft_count) * 1000
+
+    def record_first_token(self, seconds: float) -> None:
+        """Record a time-to-first-token measurement."""
+        self.ttft_sum += seconds
+        self.ttft_count += 1
+        self.last_ttft = seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export metrics as dictionary."""
+        return {
+            "streams": {
+                "started": self.streams_started,
+                "completed": self.streams_completed,
+                "cancelled": self.streams_cancelled,
+                "failed": self.streams_failed,
+            },
+            "chunks": self.chunks,
+            "time_to_first_token": {
+                "avg_ms": self.avg_ttft_ms,
+                "last_ms": self.last_ttft * 1000 if self.last_ttft is not None else None,
+                "count": self.ttft_count,
+            },
+        }
+
+
+async def measure_stream(chunks: AsyncIterator[str], metrics: StreamMetrics) -> AsyncIterator[str]:
+    """
+    Yield non-empty chunks from ``chunks`` while recording ``metrics``.
+
+    Time to first token is measured from the first request for a chunk (which
+    is when the provider sends its request) to the first non-empty chunk.
+    """
+    metrics.streams_started += 1
+    start = time.perf_counter()
+    first = True
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            if first:
+                metrics.record_first_token(time.perf_counter() - start)
+                first = False
+            metrics.chunks += 1
+            yield chunk
+    except GeneratorExit:
+        metrics.streams_cancelled += 1
+        raise
+    except BaseException:
+        metrics.streams_failed += 1
+        raise
+    else:
+        metrics.streams_completed += 1
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def iter_sse(lines: AsyncIterator[str]) -> AsyncIterator[tuple[str, str]]:
+    """
+    Parse server-sent events from a line iterator.
+
+    Args:
+        lines: Response lines without line terminators (``httpx.Response.aiter_lines()``)
+
+    Yields:
+        ``(event, data)`` pairs; ``event`` is ``"message"`` when not given and
+        multi-line data is joined with newlines
+    """
+    event = "message"
+    data: list[str] = []
+    async for line in lines:
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event = "message"
+            data = []
+            continue
+        if line.startswith(":"):
+            continue  # comment / keep-alive
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+__all__ = ["StreamMetrics", "iter_sse", "measure_stream"]
@@ -0,0 +1,424 @@
+"""Per-call provider telemetry with HDR-style histograms and Prometheus export.
+
+Every ``BaseProvider`` subclass is instrumented when it is defined. Each call
+to ``generate_text``, ``generate_structured`` or ``generate_stream`` is
+recorded in the process-wide ``TELEMETRY`` registry, labelled by provider
+name and operation:
+
+- total latency, and time to first chunk for streams
+- input and output tokens, taken from the usage the provider reports for
+  the call in progress via ``record_usage()`` (no estimates)
+- HTTP retries made by the shared client pool during the call
+- cost, from the provider's ``CostModel`` (per token, or per GPU-second for
+  Modal, using the same prices as ``optimization.metrics.route_cost``)
+
+Values go into log-linear histograms with bounded relative error (HDR
+style), so percentiles stay accurate without keeping samples.
+``ProviderTelemetry.render_prometheus()`` exports everything in the
+Prometheus text format; the API serves it at ``/metrics``.
+
+Series are labelled with ``provider.telemetry_name``. Wrapper providers
+(hedged, caching, keep-warm) are recorded under their own name, separate
+from their backends; tokens and cost belong to the backend call that did
+the work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import functools
+import inspect
+import math
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..services.http_pool import get_http_pool
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+TOKEN_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536)
+
+
+class Histogram:
+    """Log-linear histogram (HDR style) with fixed Prometheus buckets.
+
+    Each power of two is split into ``sub_buckets`` linear buckets, so a
+    percentile is off by at most ``1 / sub_buckets`` of its value. Counts for
+    the Prometheus ``bounds`` are kept exactly.
+    """
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS, sub_buckets: int = 32):
+        self.bounds = tuple(sorted(bounds))
+        self.sub_buckets = sub_buckets
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._buckets: dict[tuple[int, int], int] = {}
+        self._bound_counts = [0] * len(self.bounds)
+
+    def record(self, value: float) -> None:
+        """Record one value."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        key = self._key(value)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        index = bisect.bisect_left(self.bounds, value)
+        if index < len(self.bounds):
+            self._bound_counts[index] += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Value at ``percent`` (0-100), or None when empty."""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen >= rank:
+                return min(max(self._upper(key), self.min), self.max)
+        return self.max
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """``(upper bound, cumulative count)`` pairs, ending with ``+Inf``."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.bounds, self._bound_counts, strict=True):
+            total += count
+            pairs.append((bound, total))
+        pairs.append((math.inf, self.count))
+        return pairs
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export summary statistics as dictionary."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max if self.count else None,
+        }
+
+    def _key(self, value: float) -> tuple[int, int]:
+        if value <= 0:
+            return (-(2**31), 0)
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent
+        return exponent, int((mantissa - 0.5) * 2 * self.sub_buckets)
+
+    def _upper(self, key: tuple[int, int]) -> float:
+        exponent, sub = key
+        if exponent == -(2**31):
+            return 0.0
+        return (0.5 + (sub + 1) / (2 * self.sub_buckets)) * 2.0**exponent
+
+
+@dataclass(frozen=True)
+class CostModel:
+    """Price of a provider's calls in USD.
+
+    Attributes:
+        input_per_mtok: Price per million input tokens
+        output_per_mtok: Price per million output tokens
+        per_second: Price per second of call latency (GPU time)
+    """
+
+    input_per_mtok: float = 0.0
+    output_per_mtok: float = 0.0
+    per_second: float = 0.0
+
+    def cost(self, input_tokens: int, output_tokens: int, seconds: float) -> float:
+        """Cost of one call."""
+        return (
+            input_tokens * self.input_per_mtok / 1_000_000
+            + output_tokens * self.output_per_mtok / 1_000_000
+            + seconds * self.per_second
+        )
+
+
+DEFAULT_COST_MODELS: dict[str, CostModel] = {
+    "anthropic": CostModel(input_per_mtok=3.00, output_per_mtok=15.00),
+    "openai": CostModel(input_per_mtok=2.50, output_per_mtok=10.00),
+    "gemini": CostModel(input_per_mtok=1.25, output_per_mtok=5.00),
+    # H100 GPU-seconds; batched calls share the GPU, so this is an upper bound
+    "modal": CostModel(per_second=0.003),
+}
+
+
+@dataclass
+class CallRecord:
+    """Measurements of one provider call in progress."""
+
+    provider: Any
+    operation: str
+    started: float = field(default_factory=time.perf_counter)
+    first_chunk: float | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    retries: int = 0
+
+
+@dataclass
+class CallSeries:
+    """Aggregated telemetry of one provider and operation."""
+
+    requests: dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    latency: Histogram = field(default_factory=Histogram)
+    ttft: Histogram = field(default_factory=Histogram)
+    input_token_counts: Histogram = field(default_factory=lambda: Histogram(TOKEN_BUCKETS))
+    output_token_counts: Histogram = field(default_factory=lambda: Histogram(TOKEN_BUCKETS))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export telemetry as dictionary."""
+        return {
+            "requests": dict(self.requests),
+            "retries": self.retries,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": self.cost_usd,
+            "latency_seconds": self.latency.to_dict(),
+            "ttft_seconds": self.ttft.to_dict(),
+        }
+
+
+class ProviderTelemetry:
+    """Registry of per-provider call telemetry."""
+
+    def __init__(self, cost_models: dict[str, CostModel] | None = None):
+        self.cost_models = dict(DEFAULT_COST_MODELS if cost_models is None else cost_models)
+        self._series: dict[tuple[str, str], CallSeries] = {}
+
+    def observe(self, record: CallRecord, outcome: str) -> None:
+        """Add a finished call with ``outcome`` (success, error or cancelled)."""
+        name = record.provider.telemetry_name
+        series = self._series.get((name, record.operation))
+        if series is None:
+            series = self._series[(name, record.operation)] = CallSeries()
+
+        latency = time.perf_counter() - record.started
+        series.requests[outcome] = series.requests.get(outcome, 0) + 1
+        series.retries += record.retries
+        series.latency.record(latency)
+        if record.first_chunk is not None:
+            series.ttft.record(record.first_chunk - record.started)
+
+        input_tokens = record.input_tokens or 0
+        output_tokens = record.output_tokens or 0
+        if record.input_tokens is not None:
+            series.input_tokens += input_tokens
+            series.input_token_counts.record(input_tokens)
+        if record.output_tokens is not None:
+            series.output_tokens += output_tokens
+            series.output_token_counts.record(output_tokens)
+        model = self.cost_models.get(name)
+        if model is not None:
+            series.cost_usd += model.cost(input_tokens, output_tokens, latency)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Telemetry per ``provider.operation``."""
+        return {
+            f"{provider}.{operation}": series.to_dict()
+            for (provider, operation), series in sorted(self._series.items())
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        self._series.clear()
+
+    def render_prometheus(self) -> str:
+        """Export provider and HTTP connection telemetry in Prometheus text format."""
+        lines: list[str] = []
+        items = sorted(self._series.items())
+
+        def header(name: str, kind: str, text: str) -> None:
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        header("lift_sys_provider_requests_total", "counter", "Provider calls by outcome.")
+        for (provider, operation), series in items:
+            for outcome, count in sorted(series.requests.items()):
+                labels = _labels(provider=provider, operation=operation, outcome=outcome)
+                lines.append(f"lift_sys_provider_requests_total{labels} {count}")
+
+        counters = [
+            ("lift_sys_provider_retries_total", "HTTP retries during provider calls.", "retries"),
+            ("lift_sys_provider_cost_usd_total", "Estimated cost of provider calls.", "cost_usd"),
+        ]
+        for name, text, attribute in counters:
+            header(name, "counter", text)
+            for (provider, operation), series in items:
+                labels = _labels(provider=provider, operation=operation)
+                lines.append(f"{name}{labels} {_number(getattr(series, attribute))}")
+
+        header("lift_sys_provider_tokens_total", "counter", "Tokens reported by providers.")
+        for (provider, operation), series in items:
+            for direction in ("input", "output"):
+                labels = _labels(provider=provider, operation=operation, direction=direction)
+                count = getattr(series, f"{direction}_tokens")
+                lines.append(f"lift_sys_provider_tokens_total{labels} {count}")
+
+        histograms = [
+            ("lift_sys_provider_latency_seconds", "Total provider call latency.", "latency"),
+            ("lift_sys_provider_ttft_seconds", "Time to first streamed chunk.", "ttft"),
+            ("lift_sys_provider_input_tokens", "Input tokens per call.", "input_token_counts"),
+            ("lift_sys_provider_output_tokens", "Output tokens per call.", "output_token_counts"),
+        ]
+        for name, text, attribute in histograms:
+            header(name, "histogram", text)
+            for (provider, operation), series in items:
+                histogram: Histogram = getattr(series, attribute)
+                for bound, count in histogram.cumulative_buckets():
+                    le = "+Inf" if math.isinf(bound) else _number(bound)
+                    labels = _labels(provider=provider, operation=operation, le=le)
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = _labels(provider=provider, operation=operation)
+                lines.append(f"{name}_sum{labels} {_number(histogram.sum)}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+
+        connections = get_http_pool().connection_metrics()
+        http_counters = [
+            ("lift_sys_http_requests_total", "Outbound HTTP requests.", "requests"),
+            ("lift_sys_http_retries_total", "Outbound HTTP retries.", "retries"),
+            ("lift_sys_http_connections_opened_total", "New connections.", "connections_opened"),
+        ]
+        for name, text, key in http_counters:
+            header(name, "counter", text)
+            for host, metrics in sorted(connections.items()):
+                lines.append(f"{name}{_labels(host=host)} {metrics[key]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    pairs = (f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+TELEMETRY = ProviderTelemetry()
+
+_current_call: ContextVar[CallRecord | None] = ContextVar("provider_call", default=None)
+
+
+def record_usage(input_tokens: int | None = None, output_tokens: int | None = None) -> None:
+    """Attach token usage reported by a provider API to the call in progress."""
+    call = _current_call.get()
+    if call is None:
+        return
+    if isinstance(input_tokens, int):
+        call.input_tokens = (call.input_tokens or 0) + input_tokens
+    if isinstance(output_tokens, int):
+        call.output_tokens = (call.output_tokens or 0) + output_tokens
+
+
+def _count_retry(_request: Any) -> None:
+    call = _current_call.get()
+    if call is not None:
+        call.retries += 1
+
+
+get_http_pool().add_retry_listener(_count_retry)
+
+
+def _outcome(exc: BaseException) -> str:
+    return "cancelled" if isinstance(exc, asyncio.CancelledError | GeneratorExit) else "error"
+
+
+def _instrument_call(operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def instrumented(self, *args: Any, **kwargs: Any) -> Any:
+        current = _current_call.get()
+        if current is not None and current.provider is self:
+            # super() call from a subclass; already recorded by the outer call
+            return await method(self, *args, **kwargs)
+        record = CallRecord(self, operation)
+        token = _current_call.set(record)
+        try:
+            result = await method(self, *args, **kwargs)
+        except BaseException as exc:
+            TELEMETRY.observe(record, _outcome(exc))
+            raise
+        finally:
+            _current_call.reset(token)
+        TELEMETRY.observe(record, "success")
+        return result
+
+    return instrumented
+
+
+def _instrument_stream(method: Callable[..., AsyncIterator[str]]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def instrumented(self, *args: Any, **kwargs: Any) -> AsyncIterator[str]:
+        current = _current_call.get()
+        if current is not None and current.provider is self:
+            async for chunk in method(self, *args, **kwargs):
+                yield chunk
+            return
+        record = CallRecord(self, method.__name__)
+        stream = method(self, *args, **kwargs)
+        try:
+            while True:
+                # The context variable is set only while the provider produces a chunk,
+                # never while the caller holds the stream between chunks
+                token = _current_call.set(record)
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    _current_call.reset(token)
+                if record.first_chunk is None:
+                    record.first_chunk = time.perf_counter()
+                yield chunk
+        except BaseException as exc:
+            TELEMETRY.observe(record, _outcome(exc))
+            raise
+        finally:
+            await stream.aclose()
+        TELEMETRY.observe(record, "success")
+
+    return instrumented
+
+
+def instrument_provider(cls: type) -> None:
+    """Record telemetry for the generate methods ``cls`` defines itself."""
+    for name in ("generate_text", "generate_structured", "generate_stream"):
+        method = cls.__dict__.get(name)
+        if method is None or getattr(method, "__instrumented__", False):
+            continue
+        if inspect.isasyncgenfunction(method):
+            wrapped = _instrument_stream(method)
+        elif inspect.iscoroutinefunction(method):
+            wrapped = _instrument_call(name, method)
+        else:
+            continue
+        wrapped.__instrumented__ = True
+        setattr(cls, name, wrapped)
+
+
+__all__ = [
+    "CallRecord",
+    "CostModel",
+    "DEFAULT_COST_MODELS",
+    "Histogram",
+    "ProviderTelemetry",
+    "TELEMETRY",
+    "instrument_provider",
+    "record_usage",
+]
@@ -15,6 +15,7 @@ from git import Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
 from ..auth.token_store import TokenStore
+from .http_pool import get_http_pool
 
 
 class RepositoryAccessError(Exception):
@@ -201,8 +202,8 @@ class GitHubRepositoryClient:
     async def _ensure_client(self) -> httpx.AsyncClient:
         async with self._client_lock:
             if self._http_client is None:
-                self._http_client = httpx.AsyncClient(
-                    base_url="https://api.github.com", timeout=30.0
+                self._http_client = get_http_pool().create_async_client(
+                    base_url="https://api.github.com"
                 )
             return self._http_client
 
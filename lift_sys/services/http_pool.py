@@ -0,0 +1,416 @@
+"""Shared, pooled HTTP clients for outbound calls.
+
+``HTTPClientPool`` builds httpx clients that keep connections alive in
+per-host connection pools (``HostPoolConfig``), speak HTTP/2 when the ``h2``
+package is installed, use split connect/read/write/pool timeouts, retry
+transient failures with jittered exponential backoff (``RetryPolicy``) and
+record per-host connection metrics (``ConnectionMetrics``).
+
+``get_http_pool().async_client()`` returns one shared client per event loop.
+Providers and services use it instead of opening their own client, so calls
+to the same host reuse warm (already TLS-negotiated) connections. Shared
+clients are closed by the pool (the API server does this on shutdown), not
+by their users. ``create_client()`` and ``create_async_client()`` build
+dedicated clients with the same transport settings, e.g. for
+``SessionClient``.
+
+Usage:
+    client = get_http_pool().async_client()
+    response = await client.post(url, json=payload, timeout=MODAL_TIMEOUT)
+    print(get_http_pool().connection_metrics())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import random
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=10.0)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class HostPoolConfig:
+    """Connection pool settings for one host (or host pattern).
+
+    Attributes:
+        max_connections: Maximum open connections
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        http2: Negotiate HTTP/2 when the server and ``h2`` support it
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+
+    def limits(self) -> httpx.Limits:
+        """httpx pool limits for this host."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+# URL patterns (httpx mount syntax) with pools tuned for their traffic
+DEFAULT_HOST_POOLS: dict[str, HostPoolConfig] = {
+    # Batched and hedged generation keeps many requests in flight at once
+    "all://*.modal.run": HostPoolConfig(max_connections=64, max_keepalive_connections=32),
+    "all://api.github.com": HostPoolConfig(max_connections=10, max_keepalive_connections=5),
+}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a request.
+
+    Requests whose connection could not be established are always retried.
+    Responses with a status in ``retry_statuses`` (the server did not process
+    the request) are retried for every method; ``idempotent_retry_statuses``
+    and dropped connections are retried only for idempotent methods, since
+    the server may already have acted on the request.
+
+    Attributes:
+        max_retries: Retries after the first attempt
+        backoff_base: Upper bound of the first backoff (seconds)
+        backoff_max: Upper bound of any backoff, including ``Retry-After``
+        retry_statuses: Statuses retried for any method
+        idempotent_retry_statuses: Statuses retried for idempotent methods
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    retry_statuses: frozenset[int] = frozenset({429, 503})
+    idempotent_retry_statuses: frozenset[int] = frozenset({502, 504})
+
+    def retries_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Whether ``response`` should be retried (ignoring the attempt budget)."""
+        if response.status_code in self.retry_statuses:
+            return True
+        return (
+            request.method in IDEMPOTENT_METHODS
+            and response.status_code in self.idempotent_retry_statuses
+        )
+
+    def retries_error(self, request: httpx.Request, exc: httpx.TransportError) -> bool:
+        """Whether a transport error should be retried (ignoring the attempt budget)."""
+        if isinstance(exc, httpx.ConnectError | httpx.ConnectTimeout | httpx.PoolTimeout):
+            return True
+        return request.method in IDEMPOTENT_METHODS and isinstance(
+            exc, httpx.ReadError | httpx.RemoteProtocolError
+        )
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based), with full jitter."""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+@dataclass
+class ConnectionMetrics:
+    """Outbound request and connection counts for one host.
+
+    Attributes:
+        requests: Requests sent, including retries
+        retries: Requests that were retries of an earlier attempt
+        errors: Requests that failed without a response after all retries
+        connections_opened: New TCP connections opened
+        tls_handshakes: TLS handshakes performed
+        total_latency: Summed seconds until response headers arrived
+    """
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of requests sent over an already open connection."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+    @property
+    def avg_latency(self) -> float:
+        """Average seconds until response headers arrived."""
+        if self.requests == 0:
+            return 0.0
+        return self.total_latency / self.requests
+
+    def observe(self, event: str) -> None:
+        """Count a connection event reported by httpcore's ``trace`` extension."""
+        if event.endswith(("connect_tcp.complete", "connect_unix_socket.complete")):
+            self.connections_opened += 1
+        elif event.endswith("start_tls.complete"):
+            self.tls_handshakes += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export metrics as dictionary."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "reuse_rate": self.reuse_rate,
+            "avg_latency": self.avg_latency,
+        }
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+class _AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Retry and measure requests sent through an inner async transport."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, pool: HTTPClientPool):
+        self._inner = inner
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self._pool.metrics_for(request.url.host)
+        if "trace" not in request.extensions:
+
+            async def trace(event: str, _info: dict[str, Any]) -> None:
+                metrics.observe(event)
+
+            request.extensions = {**request.extensions, "trace": trace}
+
+        policy = self._pool.retry
+        attempt = 0
+        while True:
+            metrics.requests += 1
+            started = time.perf_counter()
+            try:
+                response = await self._inner.handle_async_request(request)
+            except httpx.TransportError as exc:
+                if attempt >= policy.max_retries or not policy.retries_error(request, exc):
+                    metrics.errors += 1
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                metrics.total_latency += time.perf_counter() - started
+                if attempt >= policy.max_retries or not policy.retries_response(request, response):
+                    return response
+                delay = policy.backoff(attempt, _retry_after(response))
+                await response.aclose()
+            attempt += 1
+            metrics.retries += 1
+            self._pool.notify_retry(request)
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _PooledTransport(httpx.BaseTransport):
+    """Retry and measure requests sent through an inner sync transport."""
+
+    def __init__(self, inner: httpx.BaseTransport, pool: HTTPClientPool):
+        self._inner = inner
+        self._pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self._pool.metrics_for(request.url.host)
+        if "trace" not in request.extensions:
+            request.extensions = {
+                **request.extensions,
+                "trace": lambda event, _info: metrics.observe(event),
+            }
+
+        policy = self._pool.retry
+        attempt = 0
+        while True:
+            metrics.requests += 1
+            started = time.perf_counter()
+            try:
+                response = self._inner.handle_request(request)
+            except httpx.TransportError as exc:
+                if attempt >= policy.max_retries or not policy.retries_error(request, exc):
+                    metrics.errors += 1
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                metrics.total_latency += time.perf_counter() - started
+                if attempt >= policy.max_retries or not policy.retries_response(request, response):
+                    return response
+                delay = policy.backoff(attempt, _retry_after(response))
+                response.close()
+            attempt += 1
+            metrics.retries += 1
+            self._pool.notify_retry(request)
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class HTTPClientPool:
+    """Factory and owner of pooled httpx clients."""
+
+    def __init__(
+        self,
+        hosts: dict[str, HostPoolConfig] | None = None,
+        default: HostPoolConfig | None = None,
+        retry: RetryPolicy | None = None,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    ):
+        """
+        Create a pool.
+
+        Args:
+            hosts: Pool settings per httpx URL pattern, added to ``DEFAULT_HOST_POOLS``
+            default: Pool settings for hosts without a pattern
+            retry: Retry policy for every client built by this pool
+            timeout: Default timeouts (callers may pass ``timeout=`` per request)
+        """
+        self.hosts = {**DEFAULT_HOST_POOLS, **(hosts or {})}
+        self.default = default or HostPoolConfig()
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self._metrics: dict[str, ConnectionMetrics] = {}
+        # httpx async clients must stay on the event loop that first used them
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._sync_client: httpx.Client | None = None
+        self._retry_listeners: list[Callable[[httpx.Request], None]] = []
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._async_clients[loop] = self.create_async_client()
+        return client
+
+    def sync_client(self) -> httpx.Client:
+        """Shared sync client."""
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = self.create_client()
+        return self._sync_client
+
+    def create_async_client(
+        self, *, inner_transport: httpx.AsyncBaseTransport | None = None, **kwargs: Any
+    ) -> httpx.AsyncClient:
+        """
+        Build a dedicated async client using this pool's transport settings.
+
+        Args:
+            inner_transport: Send requests through this transport instead of
+                pooled network connections (e.g. ``httpx.MockTransport``)
+            **kwargs: Passed to ``httpx.AsyncClient`` (``base_url``, ``headers``, ...)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if inner_transport is not None:
+            return httpx.AsyncClient(
+                transport=_AsyncPooledTransport(inner_transport, self), **kwargs
+            )
+        return httpx.AsyncClient(
+            transport=self._async_transport(self.default),
+            mounts={pattern: self._async_transport(cfg) for pattern, cfg in self.hosts.items()},
+            **kwargs,
+        )
+
+    def create_client(
+        self, *, inner_transport: httpx.BaseTransport | None = None, **kwargs: Any
+    ) -> httpx.Client:
+        """Build a dedicated sync client using this pool's transport settings."""
+        kwargs.setdefault("timeout", self.timeout)
+        if inner_transport is not None:
+            return httpx.Client(transport=_PooledTransport(inner_transport, self), **kwargs)
+        return httpx.Client(
+            transport=self._sync_transport(self.default),
+            mounts={pattern: self._sync_transport(cfg) for pattern, cfg in self.hosts.items()},
+            **kwargs,
+        )
+
+    def metrics_for(self, host: str) -> ConnectionMetrics:
+        """Metrics of ``host``, created on first use."""
+        metrics = self._metrics.get(host)
+        if metrics is None:
+            metrics = self._metrics[host] = ConnectionMetrics()
+        return metrics
+
+    def add_retry_listener(self, listener: Callable[[httpx.Request], None]) -> None:
+        """Call ``listener`` with the request each time a request is retried."""
+        self._retry_listeners.append(listener)
+
+    def notify_retry(self, request: httpx.Request) -> None:
+        """Tell retry listeners that ``request`` is about to be retried."""
+        for listener in self._retry_listeners:
+            listener(request)
+
+    def connection_metrics(self) -> dict[str, dict[str, Any]]:
+        """Connection metrics of every host contacted so far."""
+        return {host: metrics.to_dict() for host, metrics in self._metrics.items()}
+
+    async def aclose(self) -> None:
+        """Close the shared clients (async clients of other event loops are dropped)."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.pop(loop, None)
+        self._async_clients.clear()
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared sync client."""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    def _async_transport(self, config: HostPoolConfig) -> httpx.AsyncBaseTransport:
+        inner = httpx.AsyncHTTPTransport(
+            http2=config.http2 and HTTP2_AVAILABLE, limits=config.limits()
+        )
+        return _AsyncPooledTransport(inner, self)
+
+    def _sync_transport(self, config: HostPoolConfig) -> httpx.BaseTransport:
+        inner = httpx.HTTPTransport(http2=config.http2 and HTTP2_AVAILABLE, limits=config.limits())
+        return _PooledTransport(inner, self)
+
+
+_default_pool: HTTPClientPool | None = None
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Process-wide HTTP client pool."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = HTTPClientPool()
+    return _default_pool
+
+
+__all__ = [
+    "ConnectionMetrics",
+    "DEFAULT_HOST_POOLS",
+    "DEFAULT_TIMEOUT",
+    "HTTP2_AVAILABLE",
+    "HTTPClientPool",
+    "HostPoolConfig",
+    "RetryPolicy",
+    "get_http_pool",
+]
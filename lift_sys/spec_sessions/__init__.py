@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from .manager import SpecSessionManager
-from .models import HoleResolution, IRDraft, PromptRevision, PromptSession
+from .models import HoleResolution, IRDraft, PromptRevision, PromptSession, SessionSummary
 from .storage import InMemorySessionStore, SessionStore
-from .supabase_store import SupabaseSessionStore
+from .supabase_store import AsyncSupabaseSessionStore, StaleSessionError, SupabaseSessionStore
 from .translator import PromptToIRTranslator
 
 __all__ = [
@@ -13,9 +13,12 @@ __all__ = [
     "PromptRevision",
     "IRDraft",
     "HoleResolution",
+    "SessionSummary",
     "SessionStore",
     "InMemorySessionStore",
     "SupabaseSessionStore",
+    "AsyncSupabaseSessionStore",
+    "StaleSessionError",
     "PromptToIRTranslator",
     "SpecSessionManager",
 ]
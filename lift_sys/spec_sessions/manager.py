@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
 from ..ir.models import (
     AssertClause,
     EffectClause,
@@ -12,8 +15,9 @@ from ..ir.models import (
     TypedHole,
 )
 from ..planner.planner import Planner
-from ..verifier.smt_checker import SMTChecker
-from .models import HoleResolution, IRDraft, PromptRevision, PromptSession
+from ..verifier.batch import BatchSMTVerifier
+from ..verifier.smt_checker import SMTChecker, SMTResult
+from .models import HoleResolution, IRDraft, PromptRevision, PromptSession, SessionSummary
 from .storage import SessionStore
 from .translator import PromptToIRTranslator
 
@@ -27,11 +31,17 @@ class SpecSessionManager:
         translator: PromptToIRTranslator,
         planner: Planner,
         verifier: SMTChecker | None = None,
+        batch_verifier: BatchSMTVerifier | None = None,
     ):
         self.store = store
         self.translator = translator
         self.planner = planner
         self.verifier = verifier or SMTChecker()
+        # The incremental checker is not thread-safe; checks run off the event loop
+        self._verifier_lock = threading.Lock()
+        # When set, SMT checks run out of process (pinned per session) so a
+        # slow solver call never blocks the caller past the hard timeout
+        self.batch_verifier = batch_verifier
 
     async def create_from_prompt(
         self,
@@ -294,11 +304,19 @@ class SpecSessionManager:
         """Retrieve a session by ID."""
         return self.store.get(session_id)
 
-    def list_active_sessions(self) -> list[PromptSession]:
-        """List all active sessions."""
-        return self.store.list_active()
+    def list_active_sessions(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[PromptSession]:
+        """List active sessions, one page at a time."""
+        return self.store.list_active(limit=limit, offset=offset)
+
+    def list_session_summaries(
+        self, status: str | None = "active", limit: int | None = None, offset: int = 0
+    ) -> list[SessionSummary]:
+        """List session summaries without loading revision or draft history."""
+        return self.store.list_summaries(status=status, limit=limit, offset=offset)
 
-    def apply_resolution(
+    async def apply_resolution(
         self,
         session_id: str,
         hole_id: str,
@@ -355,7 +373,7 @@ class SpecSessionManager:
 
         # Verify with SMT if assertions present
         if new_draft.ir.assertions:
-            smt_results = self._verify_assertions(new_draft.ir)
+            smt_results = await self._verify_assertions(new_draft.ir, session_id)
             new_draft.smt_results = smt_results
 
             # Check for contradictions
@@ -379,7 +397,7 @@ class SpecSessionManager:
 
         return session
 
-    def finalize(self, session_id: str) -> IntermediateRepresentation:
+    async def finalize(self, session_id: str) -> IntermediateRepresentation:
         """
         Finalize a session and return the completed IR.
 
@@ -413,7 +431,7 @@ class SpecSessionManager:
 
         # Final SMT verification
         if draft.ir.assertions:
-            smt_results = self._verify_assertions(draft.ir)
+            smt_results = await self._verify_assertions(draft.ir, session_id)
             if any(result.get("status") == "unsat" for result in smt_results):
                 raise ValueError("Cannot finalize: SMT verification failed")
 
@@ -452,19 +470,73 @@ class SpecSessionManager:
 
         return assists
 
-    def _verify_assertions(self, ir: IntermediateRepresentation) -> list[dict]:
-        """Verify IR assertions using SMT checker."""
-        results = []
-        for assertion in ir.assertions:
-            result = self.verifier.verify(assertion.predicate)
-            results.append(
-                {
-                    "predicate": assertion.predicate,
-                    "status": result.status,
-                    "model": result.model if hasattr(result, "model") else None,
-                }
-            )
-        return results
+    async def _verify_assertions(
+        self, ir: IntermediateRepresentation, session_id: str | None = None
+    ) -> list[dict]:
+        """
+        Verify IR assertions using the SMT checker.
+
+        The checker is incremental, so re-verifying after a hole resolution
+        only re-asserts the predicates that changed. When the assertions are
+        contradictory, the predicates in the unsat core are reported as
+        "unsat" and the remaining ones as "sat". With a batch verifier the
+        check runs in the worker process assigned to the session; otherwise
+        it runs in a thread. Either way the event loop is never blocked.
+        """
+        if self.batch_verifier is not None:
+            [outcome] = [
+                outcome
+                async for outcome in self.batch_verifier.averify_iter([ir], affinity=[session_id])
+            ]
+            if outcome.result is None:
+                reason = "timeout" if outcome.timed_out else outcome.error
+                return self._unknown_results(ir, reason)
+            result = outcome.result
+        else:
+            try:
+                result = await asyncio.to_thread(self._verify_locally, ir)
+            except ValueError as exc:
+                # Predicates outside the supported expression subset can't be checked
+                return self._unknown_results(ir, str(exc))
+
+        if result.success:
+            status_for = dict.fromkeys((a.predicate for a in ir.assertions), "sat")
+        elif result.reason == "unsat":
+            core = set(result.unsat_core)
+            status_for = {
+                a.predicate: "unsat" if not core or a.predicate in core else "sat"
+                for a in ir.assertions
+            }
+        else:
+            status_for = dict.fromkeys((a.predicate for a in ir.assertions), "unknown")
+
+        return [
+            {
+                "predicate": assertion.predicate,
+                "status": status_for[assertion.predicate],
+                "model": result.model or None,
+                "reason": result.reason,
+            }
+            for assertion in ir.assertions
+        ]
+
+    def _verify_locally(self, ir: IntermediateRepresentation) -> SMTResult:
+        """Run the in-process checker; called from a worker thread."""
+        with self._verifier_lock:
+            return self.verifier.verify(ir)
+
+    @staticmethod
+    def _unknown_results(ir: IntermediateRepresentation, reason: str | None) -> list[dict]:
+        """Mark every assertion as unverifiable with the given reason."""
+        return [
+            {
+                "predicate": assertion.predicate,
+                "status": "unknown",
+                "model": None,
+                "reason": reason,
+            }
+            for assertion in ir.assertions
+        ]
 
     def _generate_suggestion(self, hole, ir: IntermediateRepresentation) -> str:
         """Generate context-aware suggestion for a hole."""
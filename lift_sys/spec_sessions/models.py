@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from ..ir.models import IntermediateRepresentation
+from ..ir.view import IRView
 
 
 @dataclass(slots=True)
@@ -42,10 +43,15 @@ class PromptRevision:
 
 @dataclass(slots=True)
 class IRDraft:
-    """Versioned IR snapshot."""
+    """Versioned IR snapshot.
+
+    ``ir`` is an ``IRView`` when the draft was loaded with
+    ``from_dict(..., lazy=True)`` for a read-only path; call ``materialize()``
+    before mutating it.
+    """
 
     version: int
-    ir: IntermediateRepresentation
+    ir: IntermediateRepresentation | IRView
     validation_status: str  # "pending" | "valid" | "contradictory" | "incomplete"
     smt_results: list[dict[str, Any]] = field(default_factory=list)
     ambiguities: list[str] = field(default_factory=list)  # Unresolved hole identifiers
@@ -63,11 +69,18 @@ class IRDraft:
             "metadata": self.metadata,
         }
 
+    def materialize(self) -> IntermediateRepresentation:
+        """Replace a lazy IR view with a full IntermediateRepresentation."""
+        if isinstance(self.ir, IRView):
+            self.ir = self.ir.to_ir()
+        return self.ir
+
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> IRDraft:
+    def from_dict(cls, data: dict[str, Any], lazy: bool = False) -> IRDraft:
+        """Deserialize a draft; with ``lazy=True`` the IR is wrapped in an IRView."""
         return cls(
             version=data["version"],
-            ir=IntermediateRepresentation.from_dict(data["ir"]),
+            ir=IRView(data["ir"]) if lazy else IntermediateRepresentation.from_dict(data["ir"]),
             validation_status=data["validation_status"],
             smt_results=data.get("smt_results", []),
             ambiguities=data.get("ambiguities", []),
@@ -137,6 +150,10 @@ class PromptSession:
     source: str = "prompt"  # "prompt" | "reverse_mode"
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Row version assigned by the storage backend (optimistic concurrency);
+    # None until the session has been stored or loaded
+    storage_version: int | None = None
+
     @classmethod
     def create_new(
         cls,
@@ -236,4 +253,41 @@ class PromptSession:
         return session
 
 
-__all__ = ["PromptSession", "PromptRevision", "IRDraft", "HoleResolution"]
+@dataclass(slots=True)
+class SessionSummary:
+    """Listing view of a session without its revision, draft or resolution history."""
+
+    session_id: str
+    created_at: str
+    updated_at: str
+    status: str
+    source: str = "prompt"
+    revision_count: int = 0
+    draft_count: int = 0
+    hole_count: int = 0
+    current_draft: IRDraft | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_session(cls, session: PromptSession) -> SessionSummary:
+        return cls(
+            session_id=session.session_id,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            status=session.status,
+            source=session.source,
+            revision_count=len(session.revisions),
+            draft_count=len(session.ir_drafts),
+            hole_count=len(session.pending_resolutions),
+            current_draft=session.current_draft,
+            metadata=session.metadata,
+        )
+
+    def get_unresolved_holes(self) -> list[str]:
+        """Get list of hole IDs that still need resolution."""
+        if not self.current_draft:
+            return []
+        return self.current_draft.get_unresolved_holes()
+
+
+__all__ = ["PromptSession", "PromptRevision", "IRDraft", "HoleResolution", "SessionSummary"]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Protocol
 
-from .models import PromptSession
+from .models import PromptSession, SessionSummary
 
 
 class SessionStore(Protocol):
@@ -22,12 +23,18 @@ class SessionStore(Protocol):
         """Update an existing session."""
         ...
 
-    def list_active(self) -> list[PromptSession]:
-        """List all active (non-finalized, non-abandoned) sessions."""
+    def list_active(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List active (non-finalized, non-abandoned) sessions, one page at a time."""
         ...
 
-    def list_all(self) -> list[PromptSession]:
-        """List all sessions regardless of status."""
+    def list_all(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List sessions regardless of status, one page at a time."""
+        ...
+
+    def list_summaries(
+        self, status: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> list[SessionSummary]:
+        """List session summaries without loading their history."""
         ...
 
     def delete(self, session_id: str) -> None:
@@ -56,13 +63,22 @@ class InMemorySessionStore:
             raise KeyError(f"Session {session.session_id} not found")
         self._sessions[session.session_id] = session
 
-    def list_active(self) -> list[PromptSession]:
-        """List all active (non-finalized, non-abandoned) sessions."""
-        return [s for s in self._sessions.values() if s.status == "active"]
+    def list_active(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List active (non-finalized, non-abandoned) sessions, one page at a time."""
+        active = [s for s in self._sessions.values() if s.status == "active"]
+        return _page(_newest_first(active), limit, offset)
 
-    def list_all(self) -> list[PromptSession]:
-        """List all sessions regardless of status."""
-        return list(self._sessions.values())
+    def list_all(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List sessions regardless of status, one page at a time."""
+        return _page(_newest_first(self._sessions.values()), limit, offset)
+
+    def list_summaries(
+        self, status: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> list[SessionSummary]:
+        """List session summaries without loading their history."""
+        sessions = [s for s in self._sessions.values() if status is None or s.status == status]
+        page = _page(_newest_first(sessions), limit, offset)
+        return [SessionSummary.from_session(s) for s in page]
 
     def delete(self, session_id: str) -> None:
         """Delete a session by ID."""
@@ -74,4 +90,19 @@ class InMemorySessionStore:
         self._sessions.clear()
 
 
+def _newest_first(sessions: Iterable[PromptSession]) -> list[PromptSession]:
+    """Order sessions most recently updated first, like the Supabase store.
+
+    Ties on ``updated_at`` are broken by session ID so pages stay stable.
+    """
+    by_id = sorted(sessions, key=lambda s: s.session_id)
+    return sorted(by_id, key=lambda s: s.updated_at, reverse=True)
+
+
+def _page(items: list, limit: int | None, offset: int) -> list:
+    """Slice one page out of an already ordered listing."""
+    end = None if limit is None else offset + limit
+    return items[offset:end]
+
+
 __all__ = ["SessionStore", "InMemorySessionStore"]
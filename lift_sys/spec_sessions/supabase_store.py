@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
+from postgrest.exceptions import APIError
 from supabase import Client, create_client
 
-from .models import HoleResolution, IRDraft, PromptRevision, PromptSession
+from .models import HoleResolution, IRDraft, PromptRevision, PromptSession, SessionSummary
+
+# Maximum number of IDs per ``in.(...)`` filter, keeping request URLs well
+# under PostgREST/proxy limits (a UUID is 36 characters)
+_IN_QUERY_CHUNK_SIZE = 100
+
+_SUMMARY_COLUMNS = (
+    "id,status,source,revision_count,draft_count,hole_count,"
+    "current_ir,metadata,created_at,updated_at"
+)
+
+# Errors raised by the upsert_session RPC (migration 011)
+_SQLSTATE_SERIALIZATION_FAILURE = "40001"
+_SQLSTATE_NO_DATA_FOUND = "P0002"
+
+
+class StaleSessionError(RuntimeError):
+    """Raised when a session was modified by another writer since it was loaded."""
+
+    def __init__(self, session_id: str, expected_version: int | None) -> None:
+        super().__init__(
+            f"Session {session_id} was modified concurrently (expected version {expected_version})"
+        )
+        self.session_id = session_id
+        self.expected_version = expected_version
 
 
 class SupabaseSessionStore:
@@ -29,6 +55,7 @@ class SupabaseSessionStore:
         url: str | None = None,
         key: str | None = None,
         user_id: str | None = None,
+        client: Client | None = None,
     ) -> None:
         """Initialize Supabase client.
 
@@ -36,24 +63,28 @@ class SupabaseSessionStore:
             url: Supabase project URL (defaults to SUPABASE_URL env var)
             key: Supabase API key (defaults to SUPABASE_SERVICE_KEY env var)
             user_id: User ID for RLS enforcement (required for user operations)
+            client: Preconfigured Supabase client (url and key are then optional)
         """
         self.url = url or os.getenv("SUPABASE_URL")
         self.key = key or os.getenv("SUPABASE_SERVICE_KEY")
 
-        if not self.url or not self.key:
-            raise ValueError(
-                "SUPABASE_URL and SUPABASE_SERVICE_KEY must be provided "
-                "or set as environment variables"
-            )
+        if client is None:
+            if not self.url or not self.key:
+                raise ValueError(
+                    "SUPABASE_URL and SUPABASE_SERVICE_KEY must be provided "
+                    "or set as environment variables"
+                )
+            client = create_client(self.url, self.key)
 
-        self.client: Client = create_client(self.url, self.key)
+        self.client: Client = client
         self.user_id = user_id
 
     def create(self, session: PromptSession) -> str:
         """Store a new session and return its ID.
 
-        Stores the session in the sessions table, then stores all revisions,
-        drafts, and resolutions in their respective tables.
+        Inserts the session row through the ``upsert_session`` RPC, then
+        bulk-inserts all revisions, drafts, and resolutions (one request per
+        table).
 
         Args:
             session: PromptSession to store
@@ -68,39 +99,14 @@ class SupabaseSessionStore:
         if not self.user_id:
             raise ValueError("user_id must be set to create sessions")
 
-        # Store main session record
-        session_data = {
-            "id": session.session_id,
-            "user_id": self.user_id,
-            "status": session.status,
-            "source": session.source,
-            "original_input": self._get_original_input(session),
-            "current_ir": self._serialize_current_draft(session),
-            "revision_count": len(session.revisions),
-            "draft_count": len(session.ir_drafts),
-            "hole_count": len(session.pending_resolutions),
-            "metadata": session.metadata,
-            "created_at": self._normalize_timestamp(session.created_at),
-            "updated_at": self._normalize_timestamp(session.updated_at),
-        }
-
-        self.client.table("sessions").insert(session_data).execute()
-
-        # Store revisions
-        for idx, revision in enumerate(session.revisions):
-            self._store_revision(session.session_id, idx + 1, revision)
-
-        # Store IR drafts
-        for idx, draft in enumerate(session.ir_drafts):
-            self._store_draft(session.session_id, idx + 1, draft)
-
-        # Store pending resolutions
-        for resolution in session.pending_resolutions:
-            self._store_resolution(session.session_id, resolution)
+        stored = self._upsert_session_row(session, expected_version=0)
+        for table, rows in self._new_child_rows(session, stored).items():
+            self._insert_rows(table, rows)
 
+        session.storage_version = stored["version"]
         return session.session_id
 
-    def get(self, session_id: str) -> PromptSession | None:
+    def get(self, session_id: str, lazy_ir: bool = False) -> PromptSession | None:
         """Retrieve a session by ID.
 
         Fetches the session from the sessions table, then fetches all associated
@@ -108,184 +114,108 @@ class SupabaseSessionStore:
 
         Args:
             session_id: UUID of session to retrieve
+            lazy_ir: Wrap draft IRs in read-only IRViews instead of fully
+                deserializing them (for listing and other read-only paths)
 
         Returns:
             PromptSession if found, None otherwise
         """
-        # Fetch main session record
-        response = self.client.table("sessions").select("*").eq("id", session_id).execute()
+        sessions = self.get_many([session_id], lazy_ir=lazy_ir)
+        return sessions[0] if sessions else None
 
-        if not response.data:
-            return None
+    def get_many(self, session_ids: list[str], lazy_ir: bool = False) -> list[PromptSession]:
+        """Retrieve several sessions at once.
 
-        session_row = response.data[0]
-
-        # Fetch revisions
-        revisions_response = (
-            self.client.table("session_revisions")
-            .select("*")
-            .eq("session_id", session_id)
-            .order("revision_number")
-            .execute()
-        )
-
-        revisions = [self._parse_revision(rev_row) for rev_row in revisions_response.data]
-
-        # Fetch drafts
-        drafts_response = (
-            self.client.table("session_drafts")
-            .select("*")
-            .eq("session_id", session_id)
-            .order("draft_number")
-            .execute()
-        )
-
-        ir_drafts = [self._parse_draft(draft_row) for draft_row in drafts_response.data]
-
-        # Fetch resolutions
-        resolutions_response = (
-            self.client.table("hole_resolutions")
-            .select("*")
-            .eq("session_id", session_id)
-            .order("created_at")
-            .execute()
-        )
+        Issues one query per table (sessions, revisions, drafts, resolutions)
+        regardless of how many sessions are requested, and assembles the
+        sessions in memory.
 
-        pending_resolutions = [
-            self._parse_resolution(res_row) for res_row in resolutions_response.data
-        ]
-
-        # Reconstruct PromptSession
-        session = PromptSession(
-            session_id=session_row["id"],
-            created_at=session_row["created_at"],
-            updated_at=session_row["updated_at"],
-            status=session_row["status"],
-            revisions=revisions,
-            ir_drafts=ir_drafts,
-            current_draft=ir_drafts[-1] if ir_drafts else None,
-            pending_resolutions=pending_resolutions,
-            source=session_row["source"],
-            metadata=session_row.get("metadata", {}),
-        )
+        Args:
+            session_ids: UUIDs of sessions to retrieve
+            lazy_ir: Wrap draft IRs in read-only IRViews
 
-        return session
+        Returns:
+            Sessions in the order of ``session_ids``; unknown IDs are skipped
+        """
+        rows = {row["id"]: row for row in self._select_in("sessions", "id", session_ids)}
+        return self._load_sessions([rows[sid] for sid in session_ids if sid in rows], lazy_ir)
 
     def update(self, session: PromptSession) -> None:
         """Update an existing session.
 
-        Updates the main session record and syncs all revisions, drafts, and
-        resolutions. This is a full sync operation - existing records are kept
-        but new ones are added.
+        Writes the session row with a single ``upsert_session`` RPC, which
+        also reports which child rows are already stored, then bulk-inserts
+        the new revisions, drafts, and resolutions. Existing child rows are
+        kept; new ones are appended.
+
+        If the session was loaded or stored through a Supabase store, the
+        write only succeeds while the stored row still has the same version
+        (optimistic concurrency); the session's ``storage_version`` is
+        advanced on success.
 
         Args:
             session: PromptSession with updated data
 
         Raises:
             KeyError: If session not found in database
+            StaleSessionError: If the session was modified since it was loaded
         """
-        # Check if session exists
-        existing = self.client.table("sessions").select("id").eq("id", session.session_id).execute()
-
-        if not existing.data:
-            raise KeyError(f"Session {session.session_id} not found")
-
-        # Update main session record
-        session_updates = {
-            "status": session.status,
-            "current_ir": self._serialize_current_draft(session),
-            "revision_count": len(session.revisions),
-            "draft_count": len(session.ir_drafts),
-            "hole_count": len(session.pending_resolutions),
-            "metadata": session.metadata,
-            "updated_at": self._normalize_timestamp(session.updated_at),
-        }
-
-        if session.status == "finalized":
-            session_updates["finalized_at"] = self._normalize_timestamp(session.updated_at)
+        stored = self._upsert_session_row(session, expected_version=session.storage_version)
+        for table, rows in self._new_child_rows(session, stored).items():
+            self._insert_rows(table, rows)
 
-        self.client.table("sessions").update(session_updates).eq("id", session.session_id).execute()
+        session.storage_version = stored["version"]
 
-        # Sync revisions (append new ones)
-        existing_revisions = (
-            self.client.table("session_revisions")
-            .select("revision_number")
-            .eq("session_id", session.session_id)
-            .execute()
-        )
-
-        existing_count = len(existing_revisions.data)
-        new_revisions = session.revisions[existing_count:]
-
-        for idx, revision in enumerate(new_revisions, start=existing_count + 1):
-            self._store_revision(session.session_id, idx, revision)
-
-        # Sync drafts (append new ones)
-        existing_drafts = (
-            self.client.table("session_drafts")
-            .select("draft_number")
-            .eq("session_id", session.session_id)
-            .execute()
-        )
-
-        existing_draft_count = len(existing_drafts.data)
-        new_drafts = session.ir_drafts[existing_draft_count:]
-
-        for idx, draft in enumerate(new_drafts, start=existing_draft_count + 1):
-            self._store_draft(session.session_id, idx, draft)
-
-        # Sync resolutions (append new ones)
-        existing_resolutions = (
-            self.client.table("hole_resolutions")
-            .select("hole_id")
-            .eq("session_id", session.session_id)
-            .execute()
-        )
+    def list_active(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List active (non-finalized, non-abandoned) sessions.
 
-        existing_hole_ids = {res["hole_id"] for res in existing_resolutions.data}
+        Draft IRs are returned as read-only IRViews. A page of sessions costs
+        four queries in total, however many sessions it contains.
 
-        for resolution in session.pending_resolutions:
-            if resolution.hole_id not in existing_hole_ids:
-                self._store_resolution(session.session_id, resolution)
-
-    def list_active(self) -> list[PromptSession]:
-        """List all active (non-finalized, non-abandoned) sessions.
+        Args:
+            limit: Maximum number of sessions to return (all if None)
+            offset: Number of sessions to skip, most recently updated first
 
         Returns:
             List of active PromptSessions (status='active')
         """
-        if not self.user_id:
-            raise ValueError("user_id must be set to list sessions")
+        rows = self._list_rows("*", status="active", limit=limit, offset=offset)
+        return self._load_sessions(rows, lazy_ir=True)
 
-        response = (
-            self.client.table("sessions")
-            .select("id")
-            .eq("user_id", self.user_id)
-            .eq("status", "active")
-            .order("updated_at", desc=True)
-            .execute()
-        )
+    def list_all(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List all sessions regardless of status.
 
-        return [self.get(row["id"]) for row in response.data if self.get(row["id"])]
+        Draft IRs are returned as read-only IRViews. A page of sessions costs
+        four queries in total, however many sessions it contains.
 
-    def list_all(self) -> list[PromptSession]:
-        """List all sessions regardless of status.
+        Args:
+            limit: Maximum number of sessions to return (all if None)
+            offset: Number of sessions to skip, most recently updated first
 
         Returns:
             List of all PromptSessions for the current user
         """
-        if not self.user_id:
-            raise ValueError("user_id must be set to list sessions")
+        rows = self._list_rows("*", limit=limit, offset=offset)
+        return self._load_sessions(rows, lazy_ir=True)
 
-        response = (
-            self.client.table("sessions")
-            .select("id")
-            .eq("user_id", self.user_id)
-            .order("updated_at", desc=True)
-            .execute()
-        )
+    def list_summaries(
+        self, status: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> list[SessionSummary]:
+        """List session summaries in a single query.
 
-        return [self.get(row["id"]) for row in response.data if self.get(row["id"])]
+        Uses the denormalized counters and ``current_ir`` column of the
+        sessions table, so no revision, draft, or resolution rows are read.
+
+        Args:
+            status: Only include sessions with this status (all if None)
+            limit: Maximum number of summaries to return (all if None)
+            offset: Number of summaries to skip, most recently updated first
+
+        Returns:
+            List of SessionSummaries for the current user
+        """
+        rows = self._list_rows(_SUMMARY_COLUMNS, status=status, limit=limit, offset=offset)
+        return [self._parse_summary(row) for row in rows]
 
     def delete(self, session_id: str) -> None:
         """Delete a session by ID.
@@ -298,6 +228,103 @@ class SupabaseSessionStore:
         """
         self.client.table("sessions").delete().eq("id", session_id).execute()
 
+    # Helper methods for bulk loading
+
+    def _list_rows(
+        self,
+        columns: str,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Fetch one page of the current user's session rows, newest first."""
+        if not self.user_id:
+            raise ValueError("user_id must be set to list sessions")
+
+        query = self.client.table("sessions").select(columns).eq("user_id", self.user_id)
+        if status is not None:
+            query = query.eq("status", status)
+        # Order by id as well so pages stay stable when updated_at ties
+        query = query.order("updated_at", desc=True).order("id")
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+
+        return query.execute().data
+
+    def _select_in(
+        self,
+        table: str,
+        column: str,
+        values: list[str],
+        order: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Select rows whose ``column`` is in ``values``.
+
+        Values are sent in chunks to keep the PostgREST query string bounded;
+        a page of up to ``_IN_QUERY_CHUNK_SIZE`` sessions takes one request.
+        """
+        rows: list[dict[str, Any]] = []
+        for start in range(0, len(values), _IN_QUERY_CHUNK_SIZE):
+            query = (
+                self.client.table(table)
+                .select("*")
+                .in_(column, values[start : start + _IN_QUERY_CHUNK_SIZE])
+            )
+            if order:
+                query = query.order(order)
+            rows.extend(query.execute().data)
+        return rows
+
+    def _load_sessions(
+        self, session_rows: list[dict[str, Any]], lazy_ir: bool = False
+    ) -> list[PromptSession]:
+        """Fetch child rows for ``session_rows`` in bulk and assemble sessions."""
+        if not session_rows:
+            return []
+
+        session_ids = [row["id"] for row in session_rows]
+        revisions = self._group_by_session(
+            self._select_in("session_revisions", "session_id", session_ids, "revision_number")
+        )
+        drafts = self._group_by_session(
+            self._select_in("session_drafts", "session_id", session_ids, "draft_number")
+        )
+        resolutions = self._group_by_session(
+            self._select_in("hole_resolutions", "session_id", session_ids, "created_at")
+        )
+
+        sessions = []
+        for row in session_rows:
+            ir_drafts = [self._parse_draft(d, lazy=lazy_ir) for d in drafts.get(row["id"], [])]
+            sessions.append(
+                PromptSession(
+                    session_id=row["id"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                    status=row["status"],
+                    revisions=[self._parse_revision(r) for r in revisions.get(row["id"], [])],
+                    ir_drafts=ir_drafts,
+                    current_draft=ir_drafts[-1] if ir_drafts else None,
+                    pending_resolutions=[
+                        self._parse_resolution(r) for r in resolutions.get(row["id"], [])
+                    ],
+                    source=row["source"],
+                    metadata=row.get("metadata", {}),
+                    storage_version=row.get("version"),
+                )
+            )
+        return sessions
+
+    @staticmethod
+    def _group_by_session(rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        """Group child rows by session_id, preserving their query order."""
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(row["session_id"], []).append(row)
+        return grouped
+
     # Helper methods for serialization/deserialization
 
     def _normalize_timestamp(self, timestamp: str) -> str:
@@ -334,11 +361,89 @@ class SupabaseSessionStore:
             return None
         return session.current_draft.to_dict()
 
-    def _store_revision(
+    def _session_row(self, session: PromptSession) -> dict[str, Any]:
+        """Serialize a session into the ``p_session`` argument of upsert_session."""
+        row = {
+            "id": session.session_id,
+            "user_id": self.user_id,
+            "status": session.status,
+            "source": session.source,
+            "original_input": self._get_original_input(session),
+            "current_ir": self._serialize_current_draft(session),
+            "revision_count": len(session.revisions),
+            "draft_count": len(session.ir_drafts),
+            "hole_count": len(session.pending_resolutions),
+            "metadata": session.metadata,
+            "created_at": self._normalize_timestamp(session.created_at),
+            "updated_at": self._normalize_timestamp(session.updated_at),
+        }
+
+        if session.status == "finalized":
+            row["finalized_at"] = self._normalize_timestamp(session.updated_at)
+
+        return row
+
+    def _upsert_session_row(
+        self, session: PromptSession, expected_version: int | None
+    ) -> dict[str, Any]:
+        """Insert or version-checked update of the session row in one round trip.
+
+        Returns:
+            The new row version plus the highest stored revision/draft numbers
+            and stored hole IDs (see migration 011)
+        """
+        try:
+            response = self.client.rpc(
+                "upsert_session",
+                {"p_session": self._session_row(session), "p_expected_version": expected_version},
+            ).execute()
+        except APIError as e:
+            if e.code == _SQLSTATE_NO_DATA_FOUND:
+                raise KeyError(f"Session {session.session_id} not found") from e
+            if e.code == _SQLSTATE_SERIALIZATION_FAILURE:
+                raise StaleSessionError(session.session_id, expected_version) from e
+            raise
+
+        return response.data
+
+    def _new_child_rows(
+        self, session: PromptSession, stored: dict[str, Any]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Build the child rows not yet stored, keyed by table name."""
+        revision_start = stored["revision_number"]
+        draft_start = stored["draft_number"]
+        stored_hole_ids = set(stored["hole_ids"])
+
+        return {
+            "session_revisions": [
+                self._revision_row(session.session_id, number, revision)
+                for number, revision in enumerate(
+                    session.revisions[revision_start:], start=revision_start + 1
+                )
+            ],
+            "session_drafts": [
+                self._draft_row(session.session_id, number, draft)
+                for number, draft in enumerate(
+                    session.ir_drafts[draft_start:], start=draft_start + 1
+                )
+            ],
+            "hole_resolutions": [
+                self._resolution_row(session.session_id, resolution)
+                for resolution in session.pending_resolutions
+                if resolution.hole_id not in stored_hole_ids
+            ],
+        }
+
+    def _insert_rows(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Insert ``rows`` into ``table`` with a single bulk request."""
+        if rows:
+            self.client.table(table).insert(rows).execute()
+
+    def _revision_row(
         self, session_id: str, revision_number: int, revision: PromptRevision
-    ) -> None:
-        """Store a single revision in session_revisions table."""
-        revision_data = {
+    ) -> dict[str, Any]:
+        """Serialize a revision into a session_revisions row."""
+        return {
             "session_id": session_id,
             "revision_number": revision_number,
             "source": revision.revision_type,
@@ -348,11 +453,9 @@ class SupabaseSessionStore:
             "created_at": self._normalize_timestamp(revision.timestamp),
         }
 
-        self.client.table("session_revisions").insert(revision_data).execute()
-
-    def _store_draft(self, session_id: str, draft_number: int, draft: IRDraft) -> None:
-        """Store a single IR draft in session_drafts table."""
-        draft_data = {
+    def _draft_row(self, session_id: str, draft_number: int, draft: IRDraft) -> dict[str, Any]:
+        """Serialize an IR draft into a session_drafts row."""
+        return {
             "session_id": session_id,
             "draft_number": draft_number,
             "ir_content": draft.to_dict(),
@@ -363,11 +466,9 @@ class SupabaseSessionStore:
             "created_at": self._normalize_timestamp(draft.created_at),
         }
 
-        self.client.table("session_drafts").insert(draft_data).execute()
-
-    def _store_resolution(self, session_id: str, resolution: HoleResolution) -> None:
-        """Store a single hole resolution in hole_resolutions table."""
-        resolution_data = {
+    def _resolution_row(self, session_id: str, resolution: HoleResolution) -> dict[str, Any]:
+        """Serialize a hole resolution into a hole_resolutions row."""
+        return {
             "session_id": session_id,
             "hole_id": resolution.hole_id,
             "hole_type": self._map_resolution_type(resolution.resolution_type),
@@ -381,8 +482,6 @@ class SupabaseSessionStore:
             "created_at": self._normalize_timestamp(resolution.timestamp),
         }
 
-        self.client.table("hole_resolutions").insert(resolution_data).execute()
-
     def _map_resolution_type(self, resolution_type: str) -> str:
         """Map PromptSession resolution type to database hole_type enum."""
         mapping = {
@@ -403,9 +502,25 @@ class SupabaseSessionStore:
             metadata=row.get("metadata", {}),
         )
 
-    def _parse_draft(self, row: dict[str, Any]) -> IRDraft:
+    def _parse_draft(self, row: dict[str, Any], lazy: bool = False) -> IRDraft:
         """Parse database row into IRDraft."""
-        return IRDraft.from_dict(row["ir_content"])
+        return IRDraft.from_dict(row["ir_content"], lazy=lazy)
+
+    def _parse_summary(self, row: dict[str, Any]) -> SessionSummary:
+        """Parse a sessions row into a SessionSummary."""
+        current_ir = row.get("current_ir")
+        return SessionSummary(
+            session_id=row["id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            status=row["status"],
+            source=row["source"],
+            revision_count=row.get("revision_count", 0),
+            draft_count=row.get("draft_count", 0),
+            hole_count=row.get("hole_count", 0),
+            current_draft=IRDraft.from_dict(current_ir, lazy=True) if current_ir else None,
+            metadata=row.get("metadata", {}),
+        )
 
     def _parse_resolution(self, row: dict[str, Any]) -> HoleResolution:
         """Parse database row into HoleResolution."""
@@ -420,4 +535,71 @@ class SupabaseSessionStore:
         )
 
 
-__all__ = ["SupabaseSessionStore"]
+class AsyncSupabaseSessionStore:
+    """Asynchronous facade over SupabaseSessionStore for use in async handlers.
+
+    Every database call runs in a worker thread so the event loop is never
+    blocked on a Supabase round trip. Writes issue the ``upsert_session`` RPC
+    first and then insert new revisions, drafts, and resolutions concurrently,
+    so an update costs two round trips of latency.
+    """
+
+    def __init__(self, store: SupabaseSessionStore | None = None, **kwargs: Any) -> None:
+        """Initialize the async store.
+
+        Args:
+            store: Synchronous store to delegate to
+            **kwargs: Passed to SupabaseSessionStore when ``store`` is None
+        """
+        self.store = store or SupabaseSessionStore(**kwargs)
+
+    async def create(self, session: PromptSession) -> str:
+        """Store a new session and return its ID."""
+        if not self.store.user_id:
+            raise ValueError("user_id must be set to create sessions")
+        await self._write(session, expected_version=0)
+        return session.session_id
+
+    async def get(self, session_id: str, lazy_ir: bool = False) -> PromptSession | None:
+        """Retrieve a session by ID."""
+        return await asyncio.to_thread(self.store.get, session_id, lazy_ir)
+
+    async def get_many(self, session_ids: list[str], lazy_ir: bool = False) -> list[PromptSession]:
+        """Retrieve several sessions at once."""
+        return await asyncio.to_thread(self.store.get_many, session_ids, lazy_ir)
+
+    async def update(self, session: PromptSession) -> None:
+        """Update an existing session (see SupabaseSessionStore.update)."""
+        await self._write(session, expected_version=session.storage_version)
+
+    async def list_active(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List active sessions, one page at a time."""
+        return await asyncio.to_thread(self.store.list_active, limit, offset)
+
+    async def list_all(self, limit: int | None = None, offset: int = 0) -> list[PromptSession]:
+        """List sessions regardless of status, one page at a time."""
+        return await asyncio.to_thread(self.store.list_all, limit, offset)
+
+    async def list_summaries(
+        self, status: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> list[SessionSummary]:
+        """List session summaries without loading their history."""
+        return await asyncio.to_thread(self.store.list_summaries, status, limit, offset)
+
+    async def delete(self, session_id: str) -> None:
+        """Delete a session by ID."""
+        await asyncio.to_thread(self.store.delete, session_id)
+
+    async def _write(self, session: PromptSession, expected_version: int | None) -> None:
+        stored = await asyncio.to_thread(self.store._upsert_session_row, session, expected_version)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self.store._insert_rows, table, rows)
+                for table, rows in self.store._new_child_rows(session, stored).items()
+                if rows
+            )
+        )
+        session.storage_version = stored["version"]
+
+
+__all__ = ["SupabaseSessionStore", "AsyncSupabaseSessionStore", "StaleSessionError"]
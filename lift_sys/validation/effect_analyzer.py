@@ -26,6 +26,17 @@ import re
 from dataclasses import dataclass, field
 
 from lift_sys.ir.models import IntermediateRepresentation
+from lift_sys.validation.rules import (
+    OPERATION_RULES,
+    OPERATION_VERBS,
+    TYPE_KEYWORDS,
+    TYPE_RULES,
+    scan,
+)
+
+_RETURN_TARGET_RE = re.compile(r"return\s+(?:the\s+)?(\w+)", re.IGNORECASE)
+_INTO_TARGET_RE = re.compile(r"into\s+(?:a\s+)?(?:the\s+)?(\w+(?:\s+\w+)?)")
+_NON_WORD_RE = re.compile(r"[^\w]")
 
 
 @dataclass
@@ -138,39 +149,9 @@ class EffectChainAnalyzer:
     5. Check if effect chain returns a value
     """
 
-    # Common verbs that indicate operations
-    OPERATION_VERBS = {
-        # Data transformation
-        "split": ["split", "divide", "separate", "break"],
-        "join": ["join", "combine", "concatenate", "merge"],
-        "filter": ["filter", "select", "keep", "exclude"],
-        "map": ["map", "transform", "convert", "apply"],
-        "reduce": ["reduce", "aggregate", "accumulate"],
-        # Iteration
-        "iterate": ["iterate", "loop", "traverse", "walk through", "go through"],
-        # Computation
-        "count": ["count", "tally", "sum", "total"],
-        "calculate": ["calculate", "compute", "determine", "find"],
-        "check": ["check", "test", "verify", "validate"],
-        # Data access
-        "get": ["get", "retrieve", "fetch", "extract", "obtain"],
-        "find": ["find", "search", "locate", "look for"],
-        # Control flow
-        "return": ["return", "output", "yield", "give back"],
-        "if": ["if", "when", "in case"],
-        "else": ["else", "otherwise"],
-    }
-
-    # Type hints that can be inferred from descriptions
-    TYPE_KEYWORDS = {
-        "int": ["integer", "int", "number", "count", "index"],
-        "str": ["string", "str", "text", "word"],
-        "bool": ["boolean", "bool", "true", "false"],
-        "float": ["float", "decimal", "real number"],
-        "list": ["list", "array", "collection", "elements"],
-        "dict": ["dict", "dictionary", "map", "object"],
-        "tuple": ["tuple", "pair"],
-    }
+    # Keyword tables live in the shared rule engine (compiled once)
+    OPERATION_VERBS = OPERATION_VERBS
+    TYPE_KEYWORDS = TYPE_KEYWORDS
 
     def analyze(self, ir: IntermediateRepresentation) -> ExecutionTrace:
         """
@@ -235,15 +216,12 @@ class EffectChainAnalyzer:
 
     def _detect_operation(self, description: str) -> str | None:
         """Detect the primary operation in an effect description."""
-        for operation, keywords in self.OPERATION_VERBS.items():
-            if any(keyword in description for keyword in keywords):
-                return operation
-        return None
+        rule = scan(description).first_of(OPERATION_RULES)
+        return rule.removeprefix("op.") if rule else None
 
     def _is_return_effect(self, description: str) -> bool:
         """Check if effect is a return statement."""
-        return_keywords = ["return", "output", "yield", "give back", "send back"]
-        return any(keyword in description for keyword in return_keywords)
+        return scan(description).has("return.effect")
 
     def _handle_return(self, description: str, effect_index: int, trace: ExecutionTrace) -> None:
         """Handle a return effect."""
@@ -251,7 +229,7 @@ class EffectChainAnalyzer:
         # Patterns: "Return the X", "Return X", "Output X"
 
         # Look for "return the <variable_name>"
-        match = re.search(r"return\s+(?:the\s+)?(\w+)", description, re.IGNORECASE)
+        match = _RETURN_TARGET_RE.search(description)
         if match:
             var_name = match.group(1)
             value = trace.get_value(var_name)
@@ -301,7 +279,7 @@ class EffectChainAnalyzer:
         desc_lower = description.lower()
 
         # Pattern 1: "... into <variable>"
-        match = re.search(r"into\s+(?:a\s+)?(?:the\s+)?(\w+(?:\s+\w+)?)", desc_lower)
+        match = _INTO_TARGET_RE.search(desc_lower)
         if match:
             var_phrase = match.group(1).strip()
             var_name = self._extract_variable_name(var_phrase)
@@ -369,7 +347,7 @@ class EffectChainAnalyzer:
         var_name = "_".join(words)
 
         # Clean up
-        var_name = re.sub(r"[^\w]", "", var_name)
+        var_name = _NON_WORD_RE.sub("", var_name)
 
         return var_name or "value"
 
@@ -386,21 +364,24 @@ class EffectChainAnalyzer:
         """
         desc_with_context = f"{description} {context}".lower()
 
-        # Check for each type
-        for type_name, keywords in self.TYPE_KEYWORDS.items():
-            if any(keyword in desc_with_context for keyword in keywords):
-                # Handle list types with element types
-                if type_name == "list":
-                    # Check if we can infer element type
-                    if any(kw in desc_with_context for kw in self.TYPE_KEYWORDS["str"]):
-                        return "list[str]"
-                    elif any(kw in desc_with_context for kw in self.TYPE_KEYWORDS["int"]):
-                        return "list[int]"
-                    else:
-                        return "list[Any]"
-                return type_name
-
-        return "Any"
+        matches = scan(desc_with_context)
+
+        # First matching type wins
+        rule = matches.first_of(TYPE_RULES)
+        if rule is None:
+            return "Any"
+
+        type_name = rule.removeprefix("type.")
+        # Handle list types with element types
+        if type_name == "list":
+            # Check if we can infer element type
+            if matches.has("type.str"):
+                return "list[str]"
+            elif matches.has("type.int"):
+                return "list[int]"
+            else:
+                return "list[Any]"
+        return type_name
 
     def _check_return_value(self, ir: IntermediateRepresentation, trace: ExecutionTrace) -> None:
         """
@@ -14,12 +14,18 @@ Usage:
     else:
         # Proceed with code generation
         code = generator.generate(ir)
+
+Results are memoized in a process-wide LRU keyed by the IR content
+fingerprint (see ``lift_sys.ir.fingerprint``), so re-interpreting an
+unchanged IR skips the analyzers entirely. Use ``interpreter.cache_stats()``
+for hit-rate metrics.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from lift_sys.ir.fingerprint import IRFingerprintCache, ir_fingerprint
 from lift_sys.ir.models import IntermediateRepresentation
 from lift_sys.validation.effect_analyzer import EffectChainAnalyzer, ExecutionTrace, SemanticIssue
 from lift_sys.validation.logic_error_detector import LogicErrorDetector
@@ -85,6 +91,14 @@ class InterpretationResult:
         return "\n".join(lines)
 
 
+_INTERPRETATION_CACHE: IRFingerprintCache[InterpretationResult] = IRFingerprintCache(max_size=512)
+
+
+def get_interpretation_cache() -> IRFingerprintCache[InterpretationResult]:
+    """Return the process-wide interpretation cache shared by IRInterpreter instances."""
+    return _INTERPRETATION_CACHE
+
+
 class IRInterpreter:
     """
     IR Interpreter for semantic validation.
@@ -97,11 +111,25 @@ class IRInterpreter:
     Use this before code generation to catch semantic errors early.
     """
 
-    def __init__(self):
-        """Initialize IR interpreter with all components."""
+    def __init__(
+        self,
+        cache: IRFingerprintCache[InterpretationResult] | None = None,
+        enable_cache: bool = True,
+    ):
+        """
+        Initialize IR interpreter with all components.
+
+        Args:
+            cache: Result cache keyed by IR fingerprint (defaults to the
+                process-wide cache from ``get_interpretation_cache()``)
+            enable_cache: Set False to always run the full analysis
+        """
         self.analyzer = EffectChainAnalyzer()
         self.validator = SemanticValidator()
         self.detector = LogicErrorDetector()
+        self.cache = (
+            (cache if cache is not None else _INTERPRETATION_CACHE) if enable_cache else None
+        )
 
     def interpret(self, ir: IntermediateRepresentation) -> InterpretationResult:
         """
@@ -113,6 +141,35 @@ class IRInterpreter:
         Returns:
             InterpretationResult with trace, validation, and issues
         """
+        if self.cache is None:
+            return self._interpret_uncached(ir)
+
+        key = ir_fingerprint(ir)
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = self._interpret_uncached(ir)
+            self.cache.put(key, cached)
+
+        # Bind the result to the caller's IR object; the analyses are shared
+        return InterpretationResult(
+            ir=ir,
+            trace=cached.trace,
+            validation=cached.validation,
+            all_issues=list(cached.all_issues),
+        )
+
+    def cache_stats(self) -> dict[str, object]:
+        """
+        Get interpretation cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and hit_rate
+            (empty when caching is disabled)
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
+    def _interpret_uncached(self, ir: IntermediateRepresentation) -> InterpretationResult:
+        """Run every analysis pass over the IR without consulting the cache."""
         # Step 1: Build symbolic execution trace
         trace = self.analyzer.analyze(ir)
 
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 from lift_sys.ir.models import IntermediateRepresentation
 from lift_sys.validation.effect_analyzer import ExecutionTrace, SemanticIssue
+from lift_sys.validation.rules import scan
 
 
 class LogicErrorDetector:
@@ -79,14 +80,13 @@ class LogicErrorDetector:
         effect_texts = [e.description.lower() for e in ir.effects]
         all_effects = " ".join(effect_texts)
 
+        # Check if there's an immediate return when found
+        has_immediate_return = any(
+            "return" in e and scan(e).has("return.immediate_marker") for e in effect_texts
+        )
+
         # Pattern 1: Intent says "first" but implementation might return "last"
         if "first" in intent_text:
-            # Check if there's an immediate return when found
-            has_immediate_return = any(
-                "return" in e and ("when" in e or "if" in e or "immediately" in e)
-                for e in effect_texts
-            )
-
             # Check for enumerate usage
             has_enumerate = any("enumerate" in e for e in effect_texts)
 
@@ -104,9 +104,7 @@ class LogicErrorDetector:
                 )
 
             # Check for any loop that might have this issue
-            has_loop = any(
-                keyword in all_effects for keyword in ["iterate", "loop", "for", "while", "through"]
-            )
+            has_loop = scan(all_effects).has("loop.any")
 
             if has_loop and not has_immediate_return:
                 # General warning for first/last confusion
@@ -122,11 +120,6 @@ class LogicErrorDetector:
 
         # Pattern 2: "Last" in intent but might return first
         if "last" in intent_text:
-            has_immediate_return = any(
-                "return" in e and ("when" in e or "if" in e or "immediately" in e)
-                for e in effect_texts
-            )
-
             if has_immediate_return:
                 # Risk: returning immediately might give first instead of last
                 issues.append(
@@ -167,23 +160,23 @@ class LogicErrorDetector:
         all_effects = " ".join(effect_texts)
 
         # Check if this is a validation function
-        is_validation = any(
-            keyword in intent_text for keyword in ["valid", "validate", "check", "verify", "ensure"]
-        )
-
-        if not is_validation:
+        if not scan(intent_text).has("intent.validation"):
             return issues
 
+        effect_matches = [scan(e) for e in effect_texts]
+        all_matches = scan(all_effects)
+
         # Pattern 1: Email validation
         if "email" in intent_text:
-            has_at_check = "@" in all_effects or "at sign" in all_effects
-            has_dot_check = "." in all_effects or "dot" in all_effects or "period" in all_effects
+            has_at_check = all_matches.has("email.at_check")
+            has_dot_check = all_matches.has("email.dot_check")
 
             if has_at_check and has_dot_check:
                 # Both @ and . are checked, but are they checked properly?
                 # Check if "after" relationship is specified
                 has_after_check = any(
-                    "after" in e and ("@" in e or "at" in e) for e in effect_texts
+                    "after" in e and m.has("email.at_reference")
+                    for e, m in zip(effect_texts, effect_matches, strict=True)
                 )
 
                 if not has_after_check:
@@ -199,7 +192,7 @@ class LogicErrorDetector:
                     )
 
                 # Check for domain validation
-                has_domain_check = any("domain" in e or "after @" in e for e in effect_texts)
+                has_domain_check = any(m.has("email.domain_check") for m in effect_matches)
 
                 if not has_domain_check:
                     issues.append(
@@ -236,12 +229,9 @@ class LogicErrorDetector:
 
         # Pattern 2: Phone validation
         if "phone" in intent_text:
-            has_digit_check = any("digit" in e or "number" in e for e in effect_texts)
-            has_length_check = any("length" in e or "digits" in e for e in effect_texts)
-            has_format_check = any(
-                keyword in all_effects
-                for keyword in ["format", "pattern", "dash", "hyphen", "parenthes"]
-            )
+            has_digit_check = any(m.has("phone.digit_check") for m in effect_matches)
+            has_length_check = any(m.has("phone.length_check") for m in effect_matches)
+            has_format_check = all_matches.has("phone.format_check")
 
             if not has_digit_check and not has_length_check:
                 issues.append(
@@ -256,10 +246,7 @@ class LogicErrorDetector:
         # Pattern 3: Password validation
         if "password" in intent_text:
             has_length_check = any("length" in e for e in effect_texts)
-            has_complexity_check = any(
-                keyword in all_effects
-                for keyword in ["uppercase", "lowercase", "digit", "special", "character"]
-            )
+            has_complexity_check = all_matches.has("password.complexity_check")
 
             if not has_length_check:
                 issues.append(
@@ -293,10 +280,7 @@ class LogicErrorDetector:
         # Find first effect that contains "return"
         return_index = None
         for i, effect in enumerate(ir.effects):
-            effect_lower = effect.description.lower()
-            if any(
-                keyword in effect_lower for keyword in ["return", "output", "yield", "give back"]
-            ):
+            if scan(effect.description.lower()).has("return.statement"):
                 return_index = i
                 break
 
@@ -307,9 +291,7 @@ class LogicErrorDetector:
 
             # Check if these are conditional returns (which is okay)
             return_effect = ir.effects[return_index].description.lower()
-            is_conditional = any(
-                keyword in return_effect for keyword in ["if", "when", "else", "otherwise"]
-            )
+            is_conditional = scan(return_effect).has("return.conditional_marker")
 
             if not is_conditional:
                 # Unconditional return followed by more effects
@@ -0,0 +1,327 @@
+"""
+Shared keyword rule engine for IR text analysis.
+
+The validation analyzers (EffectChainAnalyzer, SemanticValidator,
+LogicErrorDetector) and the ConstraintDetector all classify IR text by
+substring keywords ("iterate", "first", "give back", ...). Instead of each
+method looping over its own inline keyword list, every keyword table lives
+here and is compiled once into a single trie-shaped regular expression.
+
+Scanning a text field is a single pass that reports every rule with at least
+one keyword occurring in the text (substring semantics, identical to
+``any(keyword in text for keyword in keywords)``). Scan results are memoized
+per text, so the same effect description is only scanned once no matter how
+many detectors inspect it.
+
+Usage:
+    matches = VALIDATION_RULES.scan("iterate through the list and return the first")
+    matches.has("loop.any")                 # True
+    matches.first_of(OPERATION_RULES)       # "op.iterate"
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+# ---------------------------------------------------------------------------
+# Keyword tables
+# ---------------------------------------------------------------------------
+
+# EffectChainAnalyzer: common verbs that indicate operations (order is priority)
+OPERATION_VERBS: dict[str, list[str]] = {
+    # Data transformation
+    "split": ["split", "divide", "separate", "break"],
+    "join": ["join", "combine", "concatenate", "merge"],
+    "filter": ["filter", "select", "keep", "exclude"],
+    "map": ["map", "transform", "convert", "apply"],
+    "reduce": ["reduce", "aggregate", "accumulate"],
+    # Iteration
+    "iterate": ["iterate", "loop", "traverse", "walk through", "go through"],
+    # Computation
+    "count": ["count", "tally", "sum", "total"],
+    "calculate": ["calculate", "compute", "determine", "find"],
+    "check": ["check", "test", "verify", "validate"],
+    # Data access
+    "get": ["get", "retrieve", "fetch", "extract", "obtain"],
+    "find": ["find", "search", "locate", "look for"],
+    # Control flow
+    "return": ["return", "output", "yield", "give back"],
+    "if": ["if", "when", "in case"],
+    "else": ["else", "otherwise"],
+}
+
+# EffectChainAnalyzer: type hints that can be inferred from descriptions (order is priority)
+TYPE_KEYWORDS: dict[str, list[str]] = {
+    "int": ["integer", "int", "number", "count", "index"],
+    "str": ["string", "str", "text", "word"],
+    "bool": ["boolean", "bool", "true", "false"],
+    "float": ["float", "decimal", "real number"],
+    "list": ["list", "array", "collection", "elements"],
+    "dict": ["dict", "dictionary", "map", "object"],
+    "tuple": ["tuple", "pair"],
+}
+
+# SemanticValidator: words that refer to a parameter of a given type
+PARAMETER_TYPE_KEYWORDS: dict[str, list[str]] = {
+    "str": ["string", "text", "word", "character"],
+    "int": ["integer", "number", "count", "index"],
+    "bool": ["boolean", "true", "false", "flag"],
+    "float": ["float", "decimal", "number"],
+    "list": ["list", "array", "collection", "items", "elements"],
+    "dict": ["dict", "dictionary", "map", "object"],
+}
+
+# ConstraintDetector keyword tables
+RETURN_KEYWORDS = [
+    "return",
+    "returns",
+    "compute",
+    "computes",
+    "calculate",
+    "calculates",
+    "count",
+    "counts",
+    "sum",
+    "sums",
+    "result",
+    "output",
+]
+
+FIRST_MATCH_KEYWORDS = [
+    "first",
+    "earliest",
+    "initial",
+    "find first",
+    "locate first",
+    "search for first",
+]
+
+LAST_MATCH_KEYWORDS = [
+    "last",
+    "final",
+    "find last",
+    "locate last",
+    "search for last",
+]
+
+ALL_MATCHES_KEYWORDS = [
+    "all",
+    "every",
+    "each",
+    "collect all",
+    "find all",
+    "gather all",
+]
+
+LOOP_KEYWORDS = [
+    "loop",
+    "iterate",
+    "iteration",
+    "for each",
+    "traverse",
+    "walk through",
+]
+
+POSITION_KEYWORDS = [
+    "adjacent",
+    "next to",
+    "immediately after",
+    "immediately before",
+    "distance",
+    "position",
+    "placement",
+    "between",
+    "not adjacent",
+    "separated",
+]
+
+# Common names for a returned value, in order of preference
+VALUE_NAMES = ["count", "index", "sum", "total", "result", "value", "output", "answer"]
+
+_RULE_TABLE: dict[str, list[str]] = {
+    **{f"op.{name}": keywords for name, keywords in OPERATION_VERBS.items()},
+    **{f"type.{name}": keywords for name, keywords in TYPE_KEYWORDS.items()},
+    **{f"param_type.{name}": keywords for name, keywords in PARAMETER_TYPE_KEYWORDS.items()},
+    **{f"value_name.{name}": [name] for name in VALUE_NAMES},
+    # EffectChainAnalyzer
+    "return.effect": ["return", "output", "yield", "give back", "send back"],
+    # LogicErrorDetector
+    "return.statement": ["return", "output", "yield", "give back"],
+    "return.immediate_marker": ["when", "if", "immediately"],
+    "return.conditional_marker": ["if", "when", "else", "otherwise"],
+    "loop.any": ["iterate", "loop", "for", "while", "through"],
+    "intent.validation": ["valid", "validate", "check", "verify", "ensure"],
+    "email.at_check": ["@", "at sign"],
+    "email.dot_check": [".", "dot", "period"],
+    "email.at_reference": ["@", "at"],
+    "email.domain_check": ["domain", "after @"],
+    "phone.digit_check": ["digit", "number"],
+    "phone.length_check": ["length", "digits"],
+    "phone.format_check": ["format", "pattern", "dash", "hyphen", "parenthes"],
+    "password.complexity_check": ["uppercase", "lowercase", "digit", "special", "character"],
+    # SemanticValidator
+    "assertion.return_reference": ["return", "result", "output"],
+    "assertion.suspicious_reference": ["result", "output", "computed", "calculated"],
+    # ConstraintDetector
+    "constraint.return": RETURN_KEYWORDS,
+    "constraint.first_match": FIRST_MATCH_KEYWORDS,
+    "constraint.last_match": LAST_MATCH_KEYWORDS,
+    "constraint.all_matches": ALL_MATCHES_KEYWORDS,
+    "constraint.loop": LOOP_KEYWORDS,
+    "constraint.position": POSITION_KEYWORDS,
+    "constraint.email": ["email", "e-mail", "@"],
+    "constraint.parentheses": ["parenthes", "bracket", "brace", "balanced"],
+}
+
+# Ordered rule names for "first matching rule wins" lookups
+OPERATION_RULES = tuple(f"op.{name}" for name in OPERATION_VERBS)
+TYPE_RULES = tuple(f"type.{name}" for name in TYPE_KEYWORDS)
+VALUE_NAME_RULES = tuple(f"value_name.{name}" for name in VALUE_NAMES)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class RuleMatches:
+    """Rules and keywords matched in one scanned text."""
+
+    rules: frozenset[str]
+    """Names of every rule with at least one keyword in the text"""
+
+    keywords: frozenset[str]
+    """Every registered keyword occurring in the text"""
+
+    def has(self, rule: str) -> bool:
+        """Check whether a rule matched."""
+        return rule in self.rules
+
+    def has_any(self, *rules: str) -> bool:
+        """Check whether any of the given rules matched."""
+        return any(rule in self.rules for rule in rules)
+
+    def first_of(self, rules: Iterable[str]) -> str | None:
+        """Return the first rule (in the given priority order) that matched."""
+        for rule in rules:
+            if rule in self.rules:
+                return rule
+        return None
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex alternation factored by common prefix.
+
+    At any text position the pattern matches the longest keyword starting
+    there, and the regex engine only explores branches whose next character
+    matches.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + render(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+class KeywordRuleSet:
+    """
+    A table of named keyword rules compiled into one scanner.
+
+    Each rule is a list of literal keywords; a rule matches a text when any of
+    its keywords is a substring of the text. All keywords from all rules are
+    compiled into a single lookahead regex, so a scan is one pass over the
+    text regardless of how many rules exist.
+    """
+
+    def __init__(self, rules: Mapping[str, Iterable[str]], cache_size: int = 4096):
+        """
+        Compile the rule table.
+
+        Args:
+            rules: Mapping of rule name to keywords
+            cache_size: Number of distinct texts whose scan results are memoized
+        """
+        self.rules: dict[str, tuple[str, ...]] = {
+            name: tuple(keywords) for name, keywords in rules.items()
+        }
+
+        collected: dict[str, set[str]] = {}
+        for name, keywords in self.rules.items():
+            for keyword in keywords:
+                if not keyword:
+                    raise ValueError(f"Rule '{name}' contains an empty keyword")
+                collected.setdefault(keyword, set()).add(name)
+        self._keyword_rules: dict[str, frozenset[str]] = {
+            kw: frozenset(names) for kw, names in collected.items()
+        }
+
+        # A match reports the longest keyword starting at a position; every
+        # shorter keyword starting there is one of its prefixes.
+        self._prefixes: dict[str, tuple[str, ...]] = {
+            keyword: tuple(other for other in collected if keyword.startswith(other))
+            for keyword in collected
+        }
+        self._pattern = re.compile(f"(?=({_trie_pattern(collected)}))")
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _scan(self, text: str) -> RuleMatches:
+        """Scan a text once and collect every matched rule and keyword."""
+        keywords: set[str] = set()
+        for match in self._pattern.finditer(text):
+            keywords.update(self._prefixes[match.group(1)])
+        rules: set[str] = set()
+        for keyword in keywords:
+            rules.update(self._keyword_rules[keyword])
+        return RuleMatches(rules=frozenset(rules), keywords=frozenset(keywords))
+
+    def keywords(self, rule: str) -> tuple[str, ...]:
+        """Return the keywords registered for a rule."""
+        return self.rules[rule]
+
+
+VALIDATION_RULES = KeywordRuleSet(_RULE_TABLE)
+"""Rule set shared by the validation analyzers and the constraint detector."""
+
+
+def scan(text: str) -> RuleMatches:
+    """Scan already-lowercased text against the shared validation rules."""
+    return VALIDATION_RULES.scan(text)
+
+
+__all__ = [
+    "ALL_MATCHES_KEYWORDS",
+    "FIRST_MATCH_KEYWORDS",
+    "KeywordRuleSet",
+    "LAST_MATCH_KEYWORDS",
+    "LOOP_KEYWORDS",
+    "OPERATION_RULES",
+    "OPERATION_VERBS",
+    "PARAMETER_TYPE_KEYWORDS",
+    "POSITION_KEYWORDS",
+    "RETURN_KEYWORDS",
+    "RuleMatches",
+    "TYPE_KEYWORDS",
+    "TYPE_RULES",
+    "VALIDATION_RULES",
+    "VALUE_NAMES",
+    "VALUE_NAME_RULES",
+    "scan",
+]
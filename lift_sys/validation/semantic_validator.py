@@ -20,6 +20,7 @@ from dataclasses import dataclass
 
 from lift_sys.ir.models import IntermediateRepresentation
 from lift_sys.validation.effect_analyzer import ExecutionTrace, SemanticIssue
+from lift_sys.validation.rules import PARAMETER_TYPE_KEYWORDS, scan
 
 
 @dataclass
@@ -165,6 +166,7 @@ class SemanticValidator:
 
         # Get all effect descriptions
         effect_text = " ".join([e.description.lower() for e in ir.effects])
+        effect_matches = scan(effect_text)
 
         # Check each parameter
         for param in ir.signature.parameters:
@@ -175,10 +177,10 @@ class SemanticValidator:
             if param_name not in effect_text:
                 # Check if it's referenced by type (e.g., "input string" for "text" parameter)
                 param_type = param.type_hint or ""
-                type_keywords = self._get_type_keywords(param_type)
+                type_family = self._get_type_family(param_type)
 
                 # If neither name nor type keywords appear, parameter might be unused
-                if not any(keyword in effect_text for keyword in type_keywords):
+                if not (type_family and effect_matches.has(f"param_type.{type_family}")):
                     issues.append(
                         SemanticIssue(
                             severity="warning",
@@ -233,10 +235,12 @@ class SemanticValidator:
             # If assertion seems to reference computed values, check they exist
             # This is a simple heuristic - could be improved
             if not referenced_values:
+                predicate_matches = scan(predicate)
+
                 # Check if assertion references return value
-                if trace.return_value and any(
-                    keyword in predicate
-                    for keyword in ["return", "result", "output", trace.return_value.name]
+                if trace.return_value and (
+                    predicate_matches.has("assertion.return_reference")
+                    or trace.return_value.name in predicate
                 ):
                     # Assertion references return value, which exists
                     continue
@@ -244,10 +248,7 @@ class SemanticValidator:
                 # Assertion doesn't clearly reference any known values
                 # This might be okay (e.g., assertions about parameters)
                 # Only warn if it seems suspicious
-                if any(
-                    keyword in predicate
-                    for keyword in ["result", "output", "computed", "calculated"]
-                ):
+                if predicate_matches.has("assertion.suspicious_reference"):
                     issues.append(
                         SemanticIssue(
                             severity="warning",
@@ -307,32 +308,48 @@ class SemanticValidator:
 
         return False
 
-    def _get_type_keywords(self, type_hint: str) -> list[str]:
+    def _get_type_family(self, type_hint: str) -> str | None:
         """
-        Get keywords associated with a type.
+        Map a type hint to its keyword family.
 
-        E.g., "str" -> ["string", "text", "word"]
-             "int" -> ["integer", "number", "count"]
+        E.g., "str" -> "str" (matches "string", "text", "word")
+             "list[int]" -> "list" (matches "list", "array", "items")
 
         Args:
             type_hint: Type hint string
 
         Returns:
-            List of associated keywords
+            Key into PARAMETER_TYPE_KEYWORDS, or None for unknown types
         """
         type_lower = type_hint.lower()
 
         if "str" in type_lower or "string" in type_lower:
-            return ["string", "text", "word", "character"]
+            return "str"
         elif "int" in type_lower or "integer" in type_lower:
-            return ["integer", "number", "count", "index"]
+            return "int"
         elif "bool" in type_lower:
-            return ["boolean", "true", "false", "flag"]
+            return "bool"
         elif "float" in type_lower or "decimal" in type_lower:
-            return ["float", "decimal", "number"]
+            return "float"
         elif "list" in type_lower or "array" in type_lower:
-            return ["list", "array", "collection", "items", "elements"]
+            return "list"
         elif "dict" in type_lower or "map" in type_lower:
-            return ["dict", "dictionary", "map", "object"]
+            return "dict"
         else:
-            return []
+            return None
+
+    def _get_type_keywords(self, type_hint: str) -> list[str]:
+        """
+        Get keywords associated with a type.
+
+        E.g., "str" -> ["string", "text", "word", "character"]
+             "int" -> ["integer", "number", "count", "index"]
+
+        Args:
+            type_hint: Type hint string
+
+        Returns:
+            List of associated keywords
+        """
+        family = self._get_type_family(type_hint)
+        return list(PARAMETER_TYPE_KEYWORDS[family]) if family else []
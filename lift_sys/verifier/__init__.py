@@ -1,5 +1,6 @@
 """Verifier exports."""
 
+from .batch import BatchSMTVerifier, BatchVerificationResult
 from .smt_checker import SMTChecker, SMTResult
 
-__all__ = ["SMTChecker", "SMTResult"]
+__all__ = ["BatchSMTVerifier", "BatchVerificationResult", "SMTChecker", "SMTResult"]
@@ -0,0 +1,445 @@
+"""Batch SMT verification across a pool of worker processes.
+
+Z3 checks are CPU-bound and hold the GIL, so verifying many IRs from the API
+server serializes every request behind the solver. ``BatchSMTVerifier`` fans
+the checks out to a small pool of long-lived worker processes:
+
+- Only assertion predicates and assumptions are sent to workers, never full
+  IR objects, so per-task pickling stays small.
+- Each worker keeps one incremental ``SMTChecker`` for its lifetime. Tasks
+  with the same affinity key (e.g. a spec session id) are always routed to
+  the same worker, so re-verifying a slightly edited IR reuses its solver
+  scopes.
+- Every check has a soft Z3 timeout and a hard wall-clock timeout. A worker
+  that exceeds the hard timeout is terminated and replaced; the task is
+  reported as timed out instead of blocking the batch.
+- Results are yielded as they complete (``verify_iter``/``averify_iter``) or
+  collected in input order (``verify_all``). Concurrent batches share the
+  pool: a collector thread routes each worker result back to the batch that
+  submitted it.
+
+Usage:
+    with BatchSMTVerifier(max_workers=4, timeout_s=5.0) as verifier:
+        for outcome in verifier.verify_iter(irs):
+            print(outcome.index, outcome.status)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+
+from ..ir.models import IntermediateRepresentation
+from .smt_checker import SMTChecker, SMTResult
+
+_POLL_INTERVAL_S = 0.05
+
+
+def _worker_main(tasks, results, timeout_ms: int | None) -> None:
+    """Worker process loop: verify predicate batches with a persistent checker."""
+    checker = SMTChecker(timeout_ms=timeout_ms)
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, predicates, assumptions = task
+        start = time.perf_counter()
+        try:
+            result = checker.verify_predicates(predicates, assumptions=assumptions)
+            payload = (result.success, result.model, result.reason, result.unsat_core)
+            error = None
+        except Exception as exc:  # noqa: BLE001 - reported back per task
+            payload = None
+            error = f"{type(exc).__name__}: {exc}"
+        results.put((task_id, payload, error, time.perf_counter() - start))
+
+
+@dataclass
+class BatchVerificationResult:
+    """Outcome of verifying one IR in a batch."""
+
+    index: int
+    """Position of the IR in the submitted batch"""
+
+    result: SMTResult | None = None
+    """Solver result, or None if the check errored or timed out"""
+
+    error: str | None = None
+    """Error message when the predicates could not be compiled or checked"""
+
+    timed_out: bool = False
+    """True if the worker exceeded the hard timeout and was restarted"""
+
+    elapsed_s: float = 0.0
+    """Wall-clock seconds spent on the check"""
+
+    @property
+    def status(self) -> str:
+        """One of ``sat``, ``unsat``, ``unknown``, ``timeout`` or ``error``."""
+        if self.timed_out:
+            return "timeout"
+        if self.error is not None or self.result is None:
+            return "error"
+        if self.result.success:
+            return "sat"
+        if self.result.reason and self.result.reason.startswith("unknown"):
+            return "unknown"
+        return "unsat"
+
+
+@dataclass(eq=False)
+class _Task:
+    """One IR check submitted to the pool."""
+
+    index: int
+    predicates: list[str]
+    bindings: list
+    key: Hashable | None
+    deliver: Callable[[BatchVerificationResult], None]
+    started_at: float = 0.0
+    cancelled: bool = False
+
+
+@dataclass
+class _Worker:
+    """Handle to one worker process and the task it is currently running."""
+
+    process: mp.process.BaseProcess
+    tasks: object
+    current: int | None = None
+    pending: deque = field(default_factory=deque)
+
+
+class BatchSMTVerifier:
+    """Verify many IRs in parallel on a reusable pool of SMT worker processes.
+
+    Args:
+        max_workers: Number of worker processes (defaults to min(4, CPU count))
+        timeout_s: Soft per-check Z3 timeout in seconds (None disables it)
+        hard_timeout_s: Wall-clock limit per check after which the worker is
+            killed and replaced (defaults to twice the soft timeout plus 5s)
+        mp_context: multiprocessing start method; "spawn" is safe to use from
+            threaded servers
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout_s: float | None = 10.0,
+        hard_timeout_s: float | None = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.timeout_s = timeout_s
+        if hard_timeout_s is None:
+            hard_timeout_s = (timeout_s or 0) * 2 + 5.0
+        self.hard_timeout_s = hard_timeout_s
+        self._ctx = mp.get_context(mp_context)
+        self._workers: list[_Worker] = []
+        self._results = None
+        # Guards all scheduling state; held only briefly, so batches overlap
+        self._lock = threading.Lock()
+        self._shared: deque[_Task] = deque()
+        self._in_flight: dict[int, tuple[_Task, int]] = {}  # task id -> (task, worker slot)
+        self._collector: threading.Thread | None = None
+        self._task_ids = 0
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def verify_iter(
+        self,
+        irs: Sequence[IntermediateRepresentation],
+        assumptions: Iterable[tuple[str, float]] | None = None,
+        affinity: Sequence[Hashable | None] | None = None,
+    ) -> Iterator[BatchVerificationResult]:
+        """
+        Verify IRs in parallel, yielding each result as soon as it completes.
+
+        Batches submitted concurrently (from other threads or ``averify_iter``)
+        share the pool. Closing the generator early drops the checks that have
+        not started yet.
+
+        Args:
+            irs: IRs whose assertions are verified
+            assumptions: Optional (variable, value) bindings applied to every IR
+            affinity: Optional per-IR routing keys; IRs with the same key are
+                always checked by the same worker
+
+        Yields:
+            BatchVerificationResult per IR, in completion order
+        """
+        batch, keys = self._prepare(irs, assumptions, affinity)
+        outcomes: queue.SimpleQueue = queue.SimpleQueue()
+        tasks = self._submit(batch, keys, outcomes.put)
+        try:
+            for _ in batch:
+                yield outcomes.get()
+        finally:
+            self._cancel(tasks)
+
+    def verify_all(
+        self,
+        irs: Sequence[IntermediateRepresentation],
+        assumptions: Iterable[tuple[str, float]] | None = None,
+        affinity: Sequence[Hashable | None] | None = None,
+    ) -> list[BatchVerificationResult]:
+        """Verify IRs in parallel and return results in input order."""
+        results = list(self.verify_iter(irs, assumptions=assumptions, affinity=affinity))
+        return sorted(results, key=lambda outcome: outcome.index)
+
+    async def averify_iter(
+        self,
+        irs: Sequence[IntermediateRepresentation],
+        assumptions: Iterable[tuple[str, float]] | None = None,
+        affinity: Sequence[Hashable | None] | None = None,
+    ) -> AsyncIterator[BatchVerificationResult]:
+        """Async variant of ``verify_iter`` that never blocks the event loop."""
+        batch, keys = self._prepare(irs, assumptions, affinity)
+        loop = asyncio.get_running_loop()
+        outcomes: asyncio.Queue = asyncio.Queue()
+
+        def deliver(outcome: BatchVerificationResult) -> None:
+            try:
+                loop.call_soon_threadsafe(outcomes.put_nowait, outcome)
+            except RuntimeError:  # pragma: no cover - loop closed, consumer is gone
+                pass
+
+        # Starting workers spawns processes, so submit from a thread
+        tasks = await asyncio.to_thread(self._submit, batch, keys, deliver)
+        try:
+            for _ in batch:
+                yield await outcomes.get()
+        finally:
+            self._cancel(tasks)
+
+    def close(self) -> None:
+        """Stop all worker processes. The verifier cannot be used afterwards."""
+        with self._lock:
+            self._closed = True
+            # Unblock consumers still waiting on results
+            waiting = [task for task, _slot in self._in_flight.values()]
+            waiting.extend(self._shared)
+            for worker in self._workers:
+                waiting.extend(worker.pending)
+            for task in waiting:
+                if not task.cancelled:
+                    task.deliver(
+                        BatchVerificationResult(index=task.index, error="BatchSMTVerifier closed")
+                    )
+            self._in_flight.clear()
+            self._shared.clear()
+            for worker in self._workers:
+                self._stop_worker(worker)
+            self._workers.clear()
+
+    def __enter__(self) -> BatchSMTVerifier:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _prepare(
+        irs: Sequence[IntermediateRepresentation],
+        assumptions: Iterable[tuple[str, float]] | None,
+        affinity: Sequence[Hashable | None] | None,
+    ) -> tuple[list[tuple[int, list[str], list]], list[Hashable | None]]:
+        """Reduce IRs to (index, predicates, bindings) tasks plus routing keys."""
+        if affinity is not None and len(affinity) != len(irs):
+            raise ValueError("affinity must have one entry per IR")
+        bindings = list(assumptions or ())
+        batch = [
+            (index, [assertion.predicate for assertion in ir.assertions], bindings)
+            for index, ir in enumerate(irs)
+        ]
+        keys = list(affinity) if affinity is not None else [None] * len(batch)
+        return batch, keys
+
+    def _submit(
+        self,
+        batch: list[tuple[int, list[str], list]],
+        keys: list[Hashable | None],
+        deliver: Callable[[BatchVerificationResult], None],
+    ) -> list[_Task]:
+        """Queue a batch on the pool; every outcome is passed to ``deliver``."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchSMTVerifier is closed")
+
+            tasks: list[_Task] = []
+            for (index, predicates, bindings), key in zip(batch, keys, strict=True):
+                # IRs without assertions are trivially satisfiable; no need for a worker
+                if not predicates and not bindings:
+                    deliver(BatchVerificationResult(index=index, result=SMTResult(True, {})))
+                else:
+                    tasks.append(_Task(index, predicates, bindings, key, deliver))
+            if not tasks:
+                return tasks
+
+            self._ensure_workers()
+            for task in tasks:
+                if task.key is None:
+                    self._shared.append(task)
+                else:
+                    self._workers[hash(task.key) % len(self._workers)].pending.append(task)
+            self._dispatch()
+            if self._collector is None:
+                self._collector = threading.Thread(
+                    target=self._collect, name="smt-batch-collector", daemon=True
+                )
+                self._collector.start()
+            return tasks
+
+    def _cancel(self, tasks: list[_Task]) -> None:
+        """Drop queued tasks of an abandoned batch and discard its late results.
+
+        Tasks already running finish normally; the collector frees their
+        workers when the results arrive (or the hard timeout expires).
+        """
+        with self._lock:
+            for task in tasks:
+                task.cancelled = True
+
+    def _collect(self) -> None:
+        """Collector thread: route worker results, enforce timeouts, keep workers busy."""
+        while True:
+            try:
+                task_id, payload, error, elapsed = self._results.get(timeout=_POLL_INTERVAL_S)
+            except queue.Empty:
+                task_id = None
+
+            with self._lock:
+                if self._closed:
+                    self._collector = None
+                    return
+                if task_id is not None:
+                    self._complete(task_id, payload, error, elapsed)
+                self._expire()
+                self._ensure_workers()
+                self._dispatch()
+                if not self._in_flight:
+                    # Nothing running means nothing is queued either
+                    self._collector = None
+                    return
+
+    def _dispatch(self) -> None:
+        """Hand the next queued task to every idle worker (caller holds the lock)."""
+        for slot, worker in enumerate(self._workers):
+            if worker.current is not None:
+                continue
+            task = self._next_task(worker)
+            if task is None:
+                continue
+            self._task_ids += 1
+            task_id = self._task_ids
+            worker.current = task_id
+            task.started_at = time.perf_counter()
+            worker.tasks.put((task_id, task.predicates, task.bindings))
+            self._in_flight[task_id] = (task, slot)
+
+    def _next_task(self, worker: _Worker) -> _Task | None:
+        """Pop the next live task for a worker, preferring its pinned tasks."""
+        for source in (worker.pending, self._shared):
+            while source:
+                task = source.popleft()
+                if not task.cancelled:
+                    return task
+        return None
+
+    def _complete(self, task_id: int, payload, error: str | None, elapsed: float) -> None:
+        """Record a worker result (caller holds the lock)."""
+        entry = self._in_flight.pop(task_id, None)
+        if entry is None:
+            # Late result from a worker that was restarted after a timeout
+            return
+        task, slot = entry
+        self._workers[slot].current = None
+        if not task.cancelled:
+            result = SMTResult(*payload) if payload is not None else None
+            task.deliver(
+                BatchVerificationResult(
+                    index=task.index, result=result, error=error, elapsed_s=elapsed
+                )
+            )
+
+    def _expire(self) -> None:
+        """Restart workers whose task exceeded the hard timeout (caller holds the lock)."""
+        now = time.perf_counter()
+        for task, slot in list(self._in_flight.values()):
+            elapsed = now - task.started_at
+            if elapsed < self.hard_timeout_s:
+                continue
+            self._restart_worker(slot)
+            if not task.cancelled:
+                task.deliver(
+                    BatchVerificationResult(index=task.index, timed_out=True, elapsed_s=elapsed)
+                )
+
+    def _ensure_workers(self) -> None:
+        """Start the pool on first use and replace any worker that died."""
+        if self._results is None:
+            self._results = self._ctx.Queue()
+        while len(self._workers) < self.max_workers:
+            self._workers.append(self._start_worker())
+        for slot, worker in enumerate(self._workers):
+            if worker.process.is_alive():
+                continue
+            task = self._restart_worker(slot)
+            if task is not None and not task.cancelled:
+                error = "SMT worker exited unexpectedly"
+                task.deliver(BatchVerificationResult(index=task.index, error=error))
+
+    def _start_worker(self) -> _Worker:
+        timeout_ms = int(self.timeout_s * 1000) if self.timeout_s else None
+        tasks = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main, args=(tasks, self._results, timeout_ms), daemon=True
+        )
+        process.start()
+        return _Worker(process=process, tasks=tasks)
+
+    def _restart_worker(self, slot: int) -> _Task | None:
+        """Kill the worker in a slot and start a fresh one, keeping its queued tasks.
+
+        Returns the task the old worker was running, if any.
+        """
+        old = self._workers[slot]
+        interrupted = None
+        if old.current is not None:
+            interrupted, _slot = self._in_flight.pop(old.current)
+        old.process.terminate()
+        old.process.join(timeout=1.0)
+        if old.process.is_alive():  # pragma: no cover - terminate ignored
+            old.process.kill()
+            old.process.join()
+        replacement = self._start_worker()
+        replacement.pending = old.pending
+        self._workers[slot] = replacement
+        return interrupted
+
+    def _stop_worker(self, worker: _Worker) -> None:
+        if worker.process.is_alive():
+            worker.tasks.put(None)
+            worker.process.join(timeout=1.0)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join(timeout=1.0)
+
+
+__all__ = ["BatchSMTVerifier", "BatchVerificationResult"]
@@ -1,21 +1,32 @@
-"""Z3 SMT solver integration for validating IR assertions."""
+"""Z3 SMT solver integration for validating IR assertions.
+
+The checker is incremental: compiled Z3 terms are cached per predicate
+string, and each assertion lives in its own solver scope (``push()``/
+``pop()``). Re-verifying an IR only pops the scopes whose assertions are no
+longer present and pushes the new ones, so the work done per call scales
+with the size of the change rather than the number of assertions.
+"""
 
 from __future__ import annotations
 
 import ast
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
 
-from z3 import And, BoolVal, IntVal, Not, Or, Real, RealVal, Solver
+from z3 import And, Bool, BoolVal, Implies, IntVal, Not, Or, Real, RealVal, Solver
 
 from ..ir.models import AssertClause, IntermediateRepresentation
 
+_TRACKER_PREFIX = "__lift_assert_"
+
 
 @dataclass
 class SMTResult:
     success: bool
     model: dict[str, str]
     reason: str | None = None
+    unsat_core: list[str] = field(default_factory=list)
+    """Predicates (and ``name == value`` assumptions) in conflict when unsat."""
 
 
 class _ExpressionCompiler(ast.NodeVisitor):
@@ -95,34 +106,84 @@ class _ExpressionCompiler(ast.NodeVisitor):
 
 
 class SMTChecker:
-    """Evaluate IR assertions with Z3 for early verification."""
+    """Evaluate IR assertions with Z3 for early verification.
 
-    def __init__(self) -> None:
+    Args:
+        timeout_ms: Default per-check timeout in milliseconds (None disables it)
+        max_cached_terms: Compiled predicate terms kept before unused ones are evicted
+    """
+
+    def __init__(self, timeout_ms: int | None = None, max_cached_terms: int = 4096) -> None:
         self.solver = Solver()
+        self.timeout_ms = timeout_ms
+        self.max_cached_terms = max_cached_terms
+        # key -> (label, tracker, compiled term); keys are predicate strings
+        # or ("assume", name, value) tuples
+        self._terms: dict[Hashable, tuple[str, object, object]] = {}
+        # One solver scope per asserted key, outermost first
+        self._scopes: list[Hashable] = []
+        self._tracker_count = 0
 
     def verify(
-        self, ir: IntermediateRepresentation, assumptions: Iterable[tuple[str, float]] | None = None
+        self,
+        ir: IntermediateRepresentation,
+        assumptions: Iterable[tuple[str, float]] | None = None,
+        timeout_ms: int | None = None,
     ) -> SMTResult:
-        self.solver.reset()
-        context: dict[str, object] = {}
-        if assumptions:
-            for name, value in assumptions:
-                context[name] = Real(name)
-                self.solver.add(context[name] == value)
-
-        compiler = _ExpressionCompiler(context)
-        for assertion in ir.assertions:
-            expr = self._compile_assertion(assertion, compiler)
-            self.solver.add(expr)
-
-        sat_result = self.solver.check()
+        """
+        Check that the IR's assertions (and assumptions) are satisfiable together.
+
+        Args:
+            ir: IR whose assertions are verified
+            assumptions: Optional (variable, value) bindings
+            timeout_ms: Override the checker's default timeout for this check
+
+        Returns:
+            SMTResult with a model when sat, or the unsat core when unsat
+
+        Raises:
+            ValueError: If a predicate cannot be compiled
+        """
+        return self.verify_predicates(
+            [assertion.predicate for assertion in ir.assertions],
+            assumptions=assumptions,
+            timeout_ms=timeout_ms,
+        )
+
+    def verify_predicates(
+        self,
+        predicates: Iterable[str],
+        assumptions: Iterable[tuple[str, float]] | None = None,
+        timeout_ms: int | None = None,
+    ) -> SMTResult:
+        """Check a list of predicate strings; see ``verify`` for details."""
+        keys: list[Hashable] = [("assume", name, value) for name, value in assumptions or ()]
+        keys.extend(predicates)
+        self._prune_terms(keys)
+        # Compile everything before touching the solver so a bad predicate
+        # leaves the asserted scopes intact
+        for key in keys:
+            self._term(key)
+
+        self._sync_scopes(keys)
+
+        timeout = timeout_ms if timeout_ms is not None else self.timeout_ms
+        # Z3 treats 0 as "no timeout"
+        self.solver.set("timeout", timeout or 0)
+
+        trackers = [self._terms[key][1] for key in dict.fromkeys(keys)]
+        sat_result = self.solver.check(*trackers)
         result_text = str(sat_result)
         success = result_text == "sat"
-        model = (
-            {str(d): str(self.solver.model()[d]) for d in self.solver.model().decls()}
-            if success
-            else {}
-        )
+        model = {}
+        if success:
+            solver_model = self.solver.model()
+            model = {
+                str(d): str(solver_model[d])
+                for d in solver_model.decls()
+                if not str(d).startswith(_TRACKER_PREFIX)
+            }
+        unsat_core: list[str] = []
         if success:
             reason = None
         elif result_text == "unknown":
@@ -130,7 +191,70 @@ class SMTChecker:
             reason = f"unknown: {reason_unknown}" if reason_unknown else "unknown"
         else:
             reason = result_text
-        return SMTResult(success=success, model=model, reason=reason)
+            core = {str(tracker) for tracker in self.solver.unsat_core()}
+            unsat_core = [
+                self._terms[key][0]
+                for key in dict.fromkeys(keys)
+                if str(self._terms[key][1]) in core
+            ]
+        return SMTResult(success=success, model=model, reason=reason, unsat_core=unsat_core)
+
+    def reset(self) -> None:
+        """Drop all asserted scopes and cached terms."""
+        self.solver.reset()
+        self._terms.clear()
+        self._scopes.clear()
+
+    def _sync_scopes(self, keys: list[Hashable]) -> None:
+        """Pop scopes whose keys are no longer wanted and push the missing ones."""
+        wanted = set(keys)
+        keep = 0
+        while keep < len(self._scopes) and self._scopes[keep] in wanted:
+            keep += 1
+        if keep < len(self._scopes):
+            self.solver.pop(len(self._scopes) - keep)
+            del self._scopes[keep:]
+
+        asserted = set(self._scopes)
+        for key in keys:
+            if key in asserted:
+                continue
+            _label, tracker, term = self._terms[key]
+            self.solver.push()
+            self.solver.add(Implies(tracker, term))
+            self._scopes.append(key)
+            asserted.add(key)
+
+    def _prune_terms(self, keys: list[Hashable]) -> None:
+        """Bound the term cache before compiling the keys of a new check.
+
+        Terms that are still asserted or needed by this check are kept;
+        everything else is recompiled on demand.
+        """
+        if len(self._terms) + len(keys) <= self.max_cached_terms:
+            return
+        keep = set(self._scopes).union(keys)
+        self._terms = {k: v for k, v in self._terms.items() if k in keep}
+
+    def _term(self, key: Hashable) -> tuple[str, object, object]:
+        """Return (label, tracker, term) for a key, compiling it on first use."""
+        cached = self._terms.get(key)
+        if cached is not None:
+            return cached
+
+        if isinstance(key, tuple):
+            _, name, value = key
+            label = f"{name} == {value!r}"
+            term = Real(name) == value
+        else:
+            label = key
+            term = self._compile_assertion(AssertClause(predicate=key), _ExpressionCompiler({}))
+
+        self._tracker_count += 1
+        tracker = Bool(f"{_TRACKER_PREFIX}{self._tracker_count}")
+        entry = (label, tracker, term)
+        self._terms[key] = entry
+        return entry
 
     def _compile_assertion(self, assertion: AssertClause, compiler: _ExpressionCompiler):
         try:
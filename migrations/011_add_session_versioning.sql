@@ -0,0 +1,113 @@
+-- Migration 011: Add session versioning and upsert RPC
+-- Description: Optimistic concurrency for session writes and a single-round-trip
+--   upsert used by SupabaseSessionStore.create/update
+-- Author: lift-sys team
+-- Date: 2025-10-22
+
+-- ====================
+-- COLUMN: sessions.version
+-- ====================
+
+ALTER TABLE sessions
+ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+COMMENT ON COLUMN sessions.version IS 'Row version for optimistic concurrency, incremented by upsert_session()';
+
+-- ====================
+-- FUNCTION: upsert_session
+-- ====================
+-- p_expected_version = 0    insert a new session
+-- p_expected_version = N    update only if the stored version is N
+-- p_expected_version = NULL update unconditionally (last writer wins)
+--
+-- Returns the new version plus what is already stored for the child tables,
+-- so the caller can bulk-insert only the new revisions, drafts and resolutions.
+-- Raises SQLSTATE 40001 on a version mismatch and P0002 if the session is missing.
+
+CREATE OR REPLACE FUNCTION upsert_session(
+    p_session JSONB,
+    p_expected_version INTEGER DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_id UUID := (p_session->>'id')::UUID;
+    v_version INTEGER;
+BEGIN
+    IF p_expected_version = 0 THEN
+        INSERT INTO sessions (
+            id, user_id, status, source, original_input, current_ir,
+            revision_count, draft_count, hole_count, metadata,
+            created_at, updated_at, version
+        )
+        VALUES (
+            v_id,
+            (p_session->>'user_id')::UUID,
+            p_session->>'status',
+            p_session->>'source',
+            p_session->>'original_input',
+            p_session->'current_ir',
+            (p_session->>'revision_count')::INTEGER,
+            (p_session->>'draft_count')::INTEGER,
+            (p_session->>'hole_count')::INTEGER,
+            COALESCE(p_session->'metadata', '{}'::jsonb),
+            (p_session->>'created_at')::TIMESTAMPTZ,
+            (p_session->>'updated_at')::TIMESTAMPTZ,
+            1
+        );
+
+        RETURN jsonb_build_object(
+            'version', 1,
+            'revision_number', 0,
+            'draft_number', 0,
+            'hole_ids', '[]'::jsonb
+        );
+    END IF;
+
+    UPDATE sessions
+    SET
+        status = p_session->>'status',
+        current_ir = p_session->'current_ir',
+        revision_count = (p_session->>'revision_count')::INTEGER,
+        draft_count = (p_session->>'draft_count')::INTEGER,
+        hole_count = (p_session->>'hole_count')::INTEGER,
+        metadata = COALESCE(p_session->'metadata', metadata),
+        updated_at = (p_session->>'updated_at')::TIMESTAMPTZ,
+        finalized_at = COALESCE((p_session->>'finalized_at')::TIMESTAMPTZ, finalized_at),
+        version = version + 1
+    WHERE id = v_id
+      AND (p_expected_version IS NULL OR version = p_expected_version)
+    RETURNING version INTO v_version;
+
+    IF NOT FOUND THEN
+        IF EXISTS (SELECT 1 FROM sessions WHERE id = v_id) THEN
+            RAISE EXCEPTION 'Session % was modified concurrently (expected version %)',
+                v_id, p_expected_version
+                USING ERRCODE = '40001';
+        END IF;
+        RAISE EXCEPTION 'Session % not found', v_id USING ERRCODE = 'P0002';
+    END IF;
+
+    RETURN jsonb_build_object(
+        'version', v_version,
+        'revision_number', (
+            SELECT COALESCE(MAX(revision_number), 0)
+            FROM session_revisions
+            WHERE session_id = v_id
+        ),
+        'draft_number', (
+            SELECT COALESCE(MAX(draft_number), 0)
+            FROM session_drafts
+            WHERE session_id = v_id
+        ),
+        'hole_ids', (
+            SELECT COALESCE(jsonb_agg(hole_id), '[]'::jsonb)
+            FROM hole_resolutions
+            WHERE session_id = v_id
+        )
+    );
+END;
+$$ LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public;
+
+COMMENT ON FUNCTION upsert_session(JSONB, INTEGER) IS 'Insert or version-checked update of a session row; returns new version and stored child state (search_path: public)';
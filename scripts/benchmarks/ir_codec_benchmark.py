@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark for the binary IR codec against the JSON round-trip.
+
+Measures, for generated IRs with provenance on every clause and a large
+``metadata.evidence`` list:
+
+- Encode: ``json.dumps(ir.to_dict())`` versus ``encode_ir(ir)``
+- Decode: ``IntermediateRepresentation.from_dict(json.loads(...))`` versus
+  ``decode_ir(data)`` and ``decode_ir(data, load_evidence=False)``
+- Payload size in bytes
+
+Usage:
+    python scripts/benchmarks/ir_codec_benchmark.py
+    python scripts/benchmarks/ir_codec_benchmark.py --sizes 10 100 1000 --runs 20
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from lift_sys.ir.codec import decode_ir, encode_ir
+from lift_sys.ir.models import (
+    AssertClause,
+    EffectClause,
+    IntentClause,
+    IntermediateRepresentation,
+    Metadata,
+    Parameter,
+    Provenance,
+    SigClause,
+    TypedHole,
+)
+
+
+def build_ir(clauses: int) -> IntermediateRepresentation:
+    """Generate an IR with `clauses` effects/assertions and evidence entries."""
+
+    def provenance(index: int) -> Provenance:
+        return Provenance.from_reverse(evidence_refs=[f"ev-{index}"], author="lifter")
+
+    return IntermediateRepresentation(
+        intent=IntentClause(summary="Process records", provenance=provenance(0)),
+        signature=SigClause(
+            name="process",
+            parameters=[
+                Parameter(f"arg{index}", "int", provenance=provenance(index)) for index in range(5)
+            ],
+            returns="dict",
+            provenance=provenance(0),
+        ),
+        effects=[
+            EffectClause(
+                f"step {index} updates record {index}",
+                holes=[TypedHole(f"h{index}", "Effect")] if index % 10 == 0 else [],
+                provenance=provenance(index),
+            )
+            for index in range(clauses)
+        ],
+        assertions=[
+            AssertClause(f"arg0 > {index}", provenance=provenance(index))
+            for index in range(clauses)
+        ],
+        metadata=Metadata(
+            source_path="pkg/module.py",
+            language="python",
+            origin="reverse",
+            evidence=[
+                {"id": f"ev-{index}", "analysis": "codeql", "location": f"line {index}"}
+                for index in range(clauses)
+            ],
+        ),
+    )
+
+
+def median_ms(func, runs: int) -> float:
+    """Median wall-clock milliseconds over `runs` calls."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the binary IR codec")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Number of effects/assertions/evidence entries in each generated IR",
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("IR CODEC BENCHMARK")
+    print("=" * 80)
+    print()
+    print(
+        f"  {'clauses':>8} {'json KB':>8} {'bin KB':>8} {'json enc':>9} {'bin enc':>9} "
+        f"{'json dec':>9} {'bin dec':>9} {'no evid.':>9}"
+    )
+    for clauses in args.sizes:
+        ir = build_ir(clauses)
+        json_data = json.dumps(ir.to_dict())
+        binary = encode_ir(ir)
+        assert decode_ir(binary) == IntermediateRepresentation.from_dict(json.loads(json_data))
+
+        timings = [
+            median_ms(lambda ir=ir: json.dumps(ir.to_dict()), args.runs),
+            median_ms(lambda ir=ir: encode_ir(ir), args.runs),
+            median_ms(
+                lambda data=json_data: IntermediateRepresentation.from_dict(json.loads(data)),
+                args.runs,
+            ),
+            median_ms(lambda data=binary: decode_ir(data), args.runs),
+            median_ms(lambda data=binary: decode_ir(data, load_evidence=False), args.runs),
+        ]
+        print(
+            f"  {clauses:>8} {len(json_data) / 1024:>8.1f} {len(binary) / 1024:>8.1f} "
+            + " ".join(f"{value:>7.2f}ms" for value in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark for IRComparer on large IRs.
+
+Compares an IR with many assertions and effects against:
+
+- an identical copy (fingerprint fast path)
+- a copy with one assertion and one effect inserted at the top
+- a copy with a handful of clauses edited in place
+
+and reports the median comparison time and the number of diffs produced.
+
+Usage:
+    python scripts/benchmarks/ir_diff_benchmark.py
+    python scripts/benchmarks/ir_diff_benchmark.py --sizes 100 1000 5000 --runs 5
+"""
+
+import argparse
+import statistics
+import time
+
+from lift_sys.ir.differ import IRComparer
+from lift_sys.ir.models import (
+    AssertClause,
+    EffectClause,
+    IntentClause,
+    IntermediateRepresentation,
+    Parameter,
+    SigClause,
+)
+
+
+def build_ir(clauses: int) -> IntermediateRepresentation:
+    """Generate an IR with `clauses` assertions and effects."""
+    return IntermediateRepresentation(
+        intent=IntentClause(summary="Process a large batch of records"),
+        signature=SigClause(
+            name="process",
+            parameters=[Parameter("records", "list"), Parameter("limit", "int")],
+            returns="dict",
+        ),
+        effects=[EffectClause(f"step {index} updates record {index}") for index in range(clauses)],
+        assertions=[AssertClause(f"limit > {index}") for index in range(clauses)],
+    )
+
+
+def variants(
+    clauses: int,
+) -> dict[str, tuple[IntermediateRepresentation, IntermediateRepresentation]]:
+    """Build (left, right) pairs for each scenario."""
+    base = build_ir(clauses)
+    identical = IntermediateRepresentation.from_dict(base.to_dict())
+
+    inserted = IntermediateRepresentation.from_dict(base.to_dict())
+    inserted.assertions.insert(0, AssertClause("records != None"))
+    inserted.effects.insert(0, EffectClause("open the input stream"))
+
+    edited = IntermediateRepresentation.from_dict(base.to_dict())
+    for index in range(0, clauses, max(1, clauses // 5)):
+        edited.assertions[index] = AssertClause(f"limit >= {index}")
+        edited.effects[index] = EffectClause(f"step {index} rewrites record {index}")
+
+    return {
+        "identical": (base, identical),
+        "insert_top": (base, inserted),
+        "edit_5": (base, edited),
+    }
+
+
+def median_ms(func, runs: int) -> float:
+    """Median wall-clock milliseconds over `runs` calls."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IRComparer on large IRs")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 5000],
+        help="Number of assertions/effects in each generated IR",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement")
+    args = parser.parse_args()
+
+    comparer = IRComparer()
+
+    print("=" * 80)
+    print("IR DIFF BENCHMARK")
+    print("=" * 80)
+    print(f"  {'clauses':>8} {'scenario':>12} {'median':>10} {'diffs':>7}")
+    for clauses in args.sizes:
+        for scenario, (left, right) in variants(clauses).items():
+            diffs = len(comparer.compare(left, right).all_diffs())
+            elapsed = median_ms(
+                lambda left=left, right=right: comparer.compare(left, right), args.runs
+            )
+            print(f"  {clauses:>8} {scenario:>12} {elapsed:>8.2f}ms {diffs:>7}")
+
+
+if __name__ == "__main__":
+    main()
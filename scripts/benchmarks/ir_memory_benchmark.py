@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Memory benchmark for holding many lifted IRs in memory.
+
+Serialises a batch of generated IRs (typed parameters, holes and provenance
+on every clause, as produced by a bulk lift) to JSON, then loads all of them
+back the way the planner and session store do, one payload at a time, and
+reports the memory retained by the loaded IR objects (``tracemalloc``) and
+the load time:
+
+- with vocabulary interning (type hints, names, authors, evidence refs and
+  metadata strings share one copy across IRs)
+- with interning disabled, for comparison
+
+Usage:
+    python scripts/benchmarks/ir_memory_benchmark.py
+    python scripts/benchmarks/ir_memory_benchmark.py --count 10000 --clauses 10
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from unittest import mock
+
+from lift_sys.ir import models
+from lift_sys.ir.models import (
+    AssertClause,
+    EffectClause,
+    IntentClause,
+    IntermediateRepresentation,
+    Metadata,
+    Parameter,
+    Provenance,
+    SigClause,
+    TypedHole,
+)
+
+TYPE_HINTS = ["int", "str", "list[str]", "dict[str, Any]", "bool"]
+AUTHORS = ["lifter", "planner", "reviewer"]
+
+
+def build_ir(index: int, clauses: int) -> IntermediateRepresentation:
+    """Generate one lifted IR with `clauses` effects and assertions."""
+
+    def provenance(offset: int) -> Provenance:
+        return Provenance.from_reverse(
+            evidence_refs=[f"daikon-{offset % 4}"], author=AUTHORS[(index + offset) % 3]
+        )
+
+    return IntermediateRepresentation(
+        intent=IntentClause(summary=f"Lifted function {index}", provenance=provenance(0)),
+        signature=SigClause(
+            name=f"function_{index}",
+            parameters=[
+                Parameter(f"arg{slot}", TYPE_HINTS[(index + slot) % 5], provenance=provenance(slot))
+                for slot in range(4)
+            ],
+            returns=TYPE_HINTS[index % 5],
+            provenance=provenance(0),
+        ),
+        effects=[
+            EffectClause(
+                f"step {slot} of function {index}",
+                holes=[TypedHole(f"effect_{slot}", "Effect")] if slot % 5 == 0 else [],
+                provenance=provenance(slot),
+            )
+            for slot in range(clauses)
+        ],
+        assertions=[
+            AssertClause(f"arg{slot % 4} >= {index}", provenance=provenance(slot))
+            for slot in range(clauses)
+        ],
+        metadata=Metadata(source_path=f"src/module_{index % 50}.py", language="python"),
+    )
+
+
+def load_all(payloads: list[str]) -> tuple[list[IntermediateRepresentation], int, float]:
+    """Load every payload; return the IRs, retained bytes and elapsed seconds."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    irs = [IntermediateRepresentation.from_dict(json.loads(payload)) for payload in payloads]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return irs, retained, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memory held by loaded IRs")
+    parser.add_argument("--count", type=int, default=10_000, help="Number of IRs to load")
+    parser.add_argument("--clauses", type=int, default=10, help="Effects/assertions per IR")
+    args = parser.parse_args()
+
+    payloads = [json.dumps(build_ir(index, args.clauses).to_dict()) for index in range(args.count)]
+
+    print("=" * 80)
+    print(f"IR MEMORY BENCHMARK ({args.count} IRs, {args.clauses} effects/assertions each)")
+    print("=" * 80)
+
+    with mock.patch.object(models, "_intern", lambda value: value):
+        irs, plain_bytes, plain_s = load_all(payloads)
+    del irs
+    irs, interned_bytes, interned_s = load_all(payloads)
+    del irs
+
+    print(f"  {'':<22} {'retained':>12} {'per IR':>10} {'load':>10}")
+    for label, size, seconds in (
+        ("interning disabled", plain_bytes, plain_s),
+        ("interned vocabulary", interned_bytes, interned_s),
+    ):
+        print(
+            f"  {label:<22} {size / 1024 / 1024:>10.1f}MB {size / args.count / 1024:>8.2f}KB "
+            f"{seconds * 1000:>8.0f}ms"
+        )
+    print(f"  Saved: {(1 - interned_bytes / plain_bytes) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark for IRMerger three-way merges on large IRs.
+
+Builds a base IR with many assertions and effects and two concurrently edited
+branches:
+
+- ours: one clause inserted at the top of each list and every tenth assertion
+  reformatted (whitespace only)
+- theirs: a few clauses edited in place, one moved to the end, one deleted
+  and one appended
+
+and reports the median time of an uncached merge, of a repeated (memoized)
+merge, and the shape of the merged result. With identity-based merging the
+reformatted and edited clauses are neither duplicated nor reported as
+conflicts.
+
+Usage:
+    python scripts/benchmarks/ir_merge_benchmark.py
+    python scripts/benchmarks/ir_merge_benchmark.py --sizes 200 1000 5000 --runs 5
+"""
+
+import argparse
+import statistics
+import time
+
+from lift_sys.ir.merger import IRMerger
+from lift_sys.ir.models import (
+    AssertClause,
+    EffectClause,
+    IntentClause,
+    IntermediateRepresentation,
+    Parameter,
+    SigClause,
+)
+
+
+def build_ir(clauses: int) -> IntermediateRepresentation:
+    """Generate an IR with `clauses` assertions and effects."""
+    return IntermediateRepresentation(
+        intent=IntentClause(summary="Process a large batch of records"),
+        signature=SigClause(
+            name="process",
+            parameters=[Parameter("records", "list"), Parameter("limit", "int")],
+            returns="dict",
+        ),
+        effects=[EffectClause(f"step {index} updates record {index}") for index in range(clauses)],
+        assertions=[AssertClause(f"limit > {index}") for index in range(clauses)],
+    )
+
+
+def branches(
+    clauses: int,
+) -> tuple[IntermediateRepresentation, IntermediateRepresentation, IntermediateRepresentation]:
+    """Build (base, ours, theirs) for the scenario in the module docstring."""
+    base = build_ir(clauses)
+
+    ours = IntermediateRepresentation.from_dict(base.to_dict())
+    ours.assertions.insert(0, AssertClause("records != None"))
+    ours.effects.insert(0, EffectClause("open the input stream"))
+    for index in range(1, len(ours.assertions), 10):
+        ours.assertions[index] = AssertClause(ours.assertions[index].predicate.replace(" ", "  "))
+
+    theirs = IntermediateRepresentation.from_dict(base.to_dict())
+    for index in range(5, clauses, max(5, clauses // 5)):
+        theirs.assertions[index] = AssertClause(
+            theirs.assertions[index].predicate, rationale="bounded by the batch size"
+        )
+        theirs.effects[index] = EffectClause(f"step {index} rewrites record {index}")
+    theirs.assertions.append(theirs.assertions.pop(1))
+    del theirs.effects[2]
+    theirs.effects.append(EffectClause("close the input stream"))
+    return base, ours, theirs
+
+
+def median_ms(func, runs: int) -> float:
+    """Median wall-clock milliseconds over `runs` calls."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def benchmark(sizes: list[int], runs: int) -> list[dict]:
+    rows = []
+    for clauses in sizes:
+        base, ours, theirs = branches(clauses)
+        warm = IRMerger()
+        result = warm.merge(base, ours, theirs)
+        rows.append(
+            {
+                "clauses": clauses,
+                "cold_ms": median_ms(
+                    lambda base=base, ours=ours, theirs=theirs: IRMerger().merge(
+                        base, ours, theirs
+                    ),
+                    runs,
+                ),
+                "memoized_ms": median_ms(
+                    lambda warm=warm, base=base, ours=ours, theirs=theirs: warm.merge(
+                        base, ours, theirs
+                    ),
+                    runs,
+                ),
+                "assertions": len(result.merged_ir.assertions),
+                "effects": len(result.merged_ir.effects),
+                "conflicts": len(result.conflicts),
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IRMerger three-way merges")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[200, 1000, 5000],
+        help="Number of assertions/effects in each generated IR",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("IR MERGE BENCHMARK")
+    print("=" * 80)
+    print(
+        f"  {'clauses':>8} {'merge':>10} {'memoized':>10} "
+        f"{'assertions':>11} {'effects':>8} {'conflicts':>10}"
+    )
+    for row in benchmark(args.sizes, args.runs):
+        print(
+            f"  {row['clauses']:>8} {row['cold_ms']:>8.2f}ms {row['memoized_ms']:>8.2f}ms "
+            f"{row['assertions']:>11} {row['effects']:>8} {row['conflicts']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
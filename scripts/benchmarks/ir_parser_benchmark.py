@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark for IR parser construction and parsing throughput.
+
+Measures:
+
+- Cold construction: compiling the LALR grammar from scratch, loading the
+  parse tables from a serialized on-disk cache, and ``IRParser()`` with the
+  process-wide compiled parser
+- Throughput: parse-tree + ``Transformer`` (two passes) versus the inlined
+  transformer used by ``IRParser`` (one pass), on synthetic ``.ir`` sources
+  with many effects, assertions and typed holes
+
+Usage:
+    python scripts/benchmarks/ir_parser_benchmark.py
+    python scripts/benchmarks/ir_parser_benchmark.py --sizes 100 1000 10000 --runs 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from lark import Lark
+
+from lift_sys.ir.parser import _GRAMMAR, IRParser, _build_parser, _IRTransformer
+
+
+def build_source(clauses: int) -> str:
+    """Generate an IR source with `clauses` effects and assertions, some with holes."""
+    lines = [
+        "ir large_module {",
+        "  intent: Process a large batch of records {<?batch_policy: Policy"
+        ' = "how to batch" @intent?>}',
+        "  signature: process(records: list, limit: int, mode: str) -> dict",
+        "  effects:",
+    ]
+    for index in range(clauses):
+        lines.append(f"    - step {index} reads record {index} and updates the summary")
+        if index % 10 == 0:
+            lines.append(f'        {{<?effect_gap_{index}: Effect = "detail {index}" @effect?>}}')
+    lines.append("  assert:")
+    for index in range(clauses):
+        lines.append(f"    - limit > {index}")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def median_ms(func, runs: int) -> float:
+    """Median wall-clock milliseconds over `runs` calls."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def benchmark_construction(runs: int) -> dict:
+    """Compare the ways of obtaining a ready-to-use parser."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = str(Path(tmp) / "ir_grammar.cache")
+        _build_parser(cache=cache_file)  # populate the table cache
+        return {
+            "compile_grammar_ms": median_ms(
+                lambda: Lark(_GRAMMAR, start="ir", parser="lalr"), runs
+            ),
+            "load_cached_tables_ms": median_ms(lambda: _build_parser(cache=cache_file), runs),
+            "shared_irparser_ms": median_ms(IRParser, runs),
+        }
+
+
+def benchmark_throughput(sizes: list[int], runs: int) -> list[dict]:
+    """Compare two-pass tree transformation against the inlined transformer."""
+    tree_parser = Lark(_GRAMMAR, start="ir", parser="lalr")
+    parser = IRParser()
+    rows = []
+    for clauses in sizes:
+        source = build_source(clauses)
+
+        def two_pass(source=source):
+            return _IRTransformer().transform(tree_parser.parse(source))
+
+        def inlined(source=source):
+            return parser.parse(source)
+
+        assert two_pass().to_dict() == inlined().to_dict()
+        two_pass_ms = median_ms(two_pass, runs)
+        inlined_ms = median_ms(inlined, runs)
+        rows.append(
+            {
+                "clauses": clauses,
+                "kb": len(source) / 1024,
+                "two_pass_ms": two_pass_ms,
+                "inlined_ms": inlined_ms,
+                "mb_per_s": len(source) / 1024 / 1024 / (inlined_ms / 1000),
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the IR parser")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 5000],
+        help="Number of effects/assertions in each generated IR",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("IR PARSER BENCHMARK")
+    print("=" * 80)
+
+    construction = benchmark_construction(args.runs)
+    print("Construction (median):")
+    print(f"  Compile grammar (Lark):        {construction['compile_grammar_ms']:.2f}ms")
+    print(f"  Load serialized parse tables:  {construction['load_cached_tables_ms']:.2f}ms")
+    print(f"  IRParser() (shared parser):    {construction['shared_irparser_ms'] * 1000:.1f}μs")
+    print()
+
+    print("Throughput (median):")
+    print(f"  {'clauses':>8} {'size':>10} {'tree+transform':>15} {'inlined':>10} {'MB/s':>8}")
+    for row in benchmark_throughput(args.sizes, args.runs):
+        print(
+            f"  {row['clauses']:>8} {row['kb']:>8.1f}KB {row['two_pass_ms']:>13.2f}ms "
+            f"{row['inlined_ms']:>8.2f}ms {row['mb_per_s']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark for validating and converting LLM-generated IR JSON.
+
+Generates IR documents of the shape the XGrammar translator receives
+(parameters, effects, assertions and typed holes) and times:
+
+- ``compile_schema`` once per process, then validate + convert per document
+  (what ``XGrammarIRTranslator._json_to_ir`` does)
+- compiling the schema for every document, for comparison
+- ``jsonschema`` validation alone, when the package happens to be installed
+
+Usage:
+    python scripts/benchmarks/schema_validation_benchmark.py
+    python scripts/benchmarks/schema_validation_benchmark.py --clauses 10 100 1000 --runs 20
+"""
+
+import argparse
+import statistics
+import time
+
+from lift_sys.forward_mode import xgrammar_translator
+from lift_sys.ir.schema import IR_JSON_SCHEMA
+from lift_sys.ir.schema_validator import compile_schema
+
+try:
+    import jsonschema
+except ImportError:  # pragma: no cover - optional comparison
+    jsonschema = None
+
+
+def build_document(clauses: int) -> dict:
+    """Generate IR JSON with `clauses` parameters, effects and assertions."""
+    hole = {"identifier": "unknown_bound", "type_hint": "int", "kind": "assertion"}
+    return {
+        "intent": {"summary": f"Process {clauses} records in order", "holes": [hole]},
+        "signature": {
+            "name": "process_records",
+            "parameters": [
+                {"name": f"arg_{i}", "type_hint": "list[int]", "description": f"input {i}"}
+                for i in range(clauses)
+            ],
+            "returns": "int",
+        },
+        "effects": [{"description": f"writes record {i}"} for i in range(clauses)],
+        "assertions": [
+            {"predicate": f"arg_{i} is not None", "holes": [hole] if i % 10 == 0 else []}
+            for i in range(clauses)
+        ],
+        "metadata": {"origin": "benchmark"},
+    }
+
+
+def median_ms(func, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IR schema validation")
+    parser.add_argument(
+        "--clauses", type=int, nargs="+", default=[10, 100, 1000], help="Clauses per IR"
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    translator = xgrammar_translator.XGrammarIRTranslator(provider=None)
+
+    print("=" * 80)
+    print("IR SCHEMA VALIDATION BENCHMARK")
+    print("=" * 80)
+    compile_ms = median_ms(lambda: compile_schema(IR_JSON_SCHEMA), args.runs)
+    print(f"  compile_schema(IR_JSON_SCHEMA): {compile_ms:.3f}ms")
+    header = f"  {'clauses':>8} {'compiled+convert':>18} {'compile per call':>18}"
+    if jsonschema is not None:
+        header += f" {'jsonschema only':>17}"
+    print(header)
+    for clauses in args.clauses:
+        document = build_document(clauses)
+        compiled = median_ms(
+            lambda document=document: translator._json_to_ir(document, "python"), args.runs
+        )
+        per_call = median_ms(
+            lambda document=document: compile_schema(IR_JSON_SCHEMA).validate(document), args.runs
+        )
+        row = f"  {clauses:>8} {compiled:>16.3f}ms {per_call:>16.3f}ms"
+        if jsonschema is not None:
+            validator = jsonschema.Draft7Validator(IR_JSON_SCHEMA)
+            only = median_ms(
+                lambda validator=validator, document=document: validator.validate(document),
+                args.runs,
+            )
+            row += f" {only:>15.3f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
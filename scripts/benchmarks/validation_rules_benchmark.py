@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the shared validation rule engine.
+
+Loads every IR payload recorded under ``benchmark_results/`` and measures:
+
+- Keyword scanning: one pass of the compiled rule set per text field versus
+  the equivalent per-rule ``any(keyword in text ...)`` loops
+- Detector throughput: EffectChainAnalyzer + SemanticValidator +
+  LogicErrorDetector + ConstraintDetector per IR (interpreter cache disabled)
+
+Usage:
+    python scripts/benchmarks/validation_rules_benchmark.py
+    python scripts/benchmarks/validation_rules_benchmark.py --runs 20 --results-dir benchmark_results
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from lift_sys.ir.constraint_detector import ConstraintDetector
+from lift_sys.ir.models import IntermediateRepresentation
+from lift_sys.validation.ir_interpreter import IRInterpreter
+from lift_sys.validation.rules import VALIDATION_RULES, KeywordRuleSet
+
+
+def collect_irs(results_dir: Path) -> list[IntermediateRepresentation]:
+    """Find every serialized IR (any dict with intent + signature) in result files."""
+    payloads: list[dict] = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if "intent" in node and "signature" in node:
+                payloads.append(node)
+                return
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for path in sorted(results_dir.glob("*.json")):
+        try:
+            walk(json.loads(path.read_text()))
+        except json.JSONDecodeError:
+            continue
+
+    irs = []
+    for payload in payloads:
+        try:
+            irs.append(IntermediateRepresentation.from_dict(payload))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return irs
+
+
+def collect_texts(irs: list[IntermediateRepresentation]) -> list[str]:
+    """Collect the lowercased text fields the detectors scan."""
+    texts = []
+    for ir in irs:
+        texts.append(ir.intent.summary.lower())
+        texts.extend(effect.description.lower() for effect in ir.effects)
+        texts.extend(assertion.predicate.lower() for assertion in ir.assertions)
+    return texts
+
+
+def time_runs(func, runs: int) -> list[float]:
+    """Run func `runs` times and return wall-clock seconds for each run."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def benchmark_scanning(texts: list[str], runs: int) -> dict:
+    """Compare single-pass rule scanning against per-rule keyword loops."""
+    rules = VALIDATION_RULES.rules
+
+    def naive():
+        for text in texts:
+            {name for name, keywords in rules.items() if any(kw in text for kw in keywords)}
+
+    def compiled_cold():
+        # Fresh rule set each run so the per-text memo is empty
+        rule_set = KeywordRuleSet(rules)
+        for text in texts:
+            rule_set.scan(text)
+
+    rule_set = KeywordRuleSet(rules)
+
+    def compiled_warm():
+        for text in texts:
+            rule_set.scan(text)
+
+    compiled_warm()
+    return {
+        "texts": len(texts),
+        "rules": len(rules),
+        "naive_ms": statistics.median(time_runs(naive, runs)) * 1000,
+        "compiled_cold_ms": statistics.median(time_runs(compiled_cold, runs)) * 1000,
+        "compiled_warm_ms": statistics.median(time_runs(compiled_warm, runs)) * 1000,
+    }
+
+
+def benchmark_detectors(irs: list[IntermediateRepresentation], runs: int) -> dict:
+    """Measure full detector throughput over all IRs."""
+    interpreter = IRInterpreter(enable_cache=False)
+    detector = ConstraintDetector()
+
+    def run_all():
+        for ir in irs:
+            interpreter.interpret(ir)
+            detector.detect_constraints(ir)
+
+    timings = time_runs(run_all, runs)
+    median_s = statistics.median(timings)
+    return {
+        "irs": len(irs),
+        "total_ms": median_s * 1000,
+        "per_ir_us": median_s / max(len(irs), 1) * 1_000_000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the validation rule engine")
+    parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=Path(__file__).resolve().parents[2] / "benchmark_results",
+        help="Directory of benchmark result JSON files containing IRs",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement")
+    args = parser.parse_args()
+
+    irs = collect_irs(args.results_dir)
+    texts = collect_texts(irs)
+
+    print("=" * 80)
+    print("VALIDATION RULE ENGINE BENCHMARK")
+    print("=" * 80)
+    print(f"IRs loaded: {len(irs)}  text fields: {len(texts)}  runs: {args.runs}")
+    print()
+
+    scanning = benchmark_scanning(texts, args.runs)
+    print("Keyword scanning (all text fields, median):")
+    print(f"  Per-rule keyword loops:     {scanning['naive_ms']:.2f}ms")
+    print(f"  Compiled rule set (cold):   {scanning['compiled_cold_ms']:.2f}ms")
+    print(f"  Compiled rule set (cached): {scanning['compiled_warm_ms']:.2f}ms")
+    print()
+
+    detectors = benchmark_detectors(irs, args.runs)
+    print("Detectors (interpreter + constraint detector, median):")
+    print(f"  Total: {detectors['total_ms']:.2f}ms  per IR: {detectors['per_ir_us']:.1f}μs")
+
+
+if __name__ == "__main__":
+    main()
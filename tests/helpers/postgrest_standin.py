@@ -0,0 +1,255 @@
+"""
+In-memory PostgREST stand-in for exercising Supabase stores without a database.
+
+Implements the subset of the PostgREST HTTP API used by the Supabase client:
+column selection, ``eq``/``neq``/``in``/``is`` filters, ordering,
+``limit``/``offset``, inserts (single and bulk), upserts (merging or ignoring
+duplicates), updates, deletes and RPC calls to Python stand-ins for SQL
+functions. Columns listed in ``unique`` are enforced like a unique
+constraint: a conflicting insert fails as a whole with error 23505. Every
+request is recorded so tests can assert on round trips.
+
+Usage:
+    standin = PostgRESTStandIn(functions=SESSION_FUNCTIONS)
+    client = standin.sync_client()
+    store = SupabaseSessionStore(user_id=user_id, client=client)
+"""
+
+from __future__ import annotations
+
+import copy
+import csv
+import json
+import uuid
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import httpx
+from supabase import Client, create_client
+from supabase.lib.client_options import SyncClientOptions
+
+URL = "http://postgrest.test"
+KEY = "standin-service-key"
+
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "columns", "on_conflict"}
+
+
+class PostgRESTError(Exception):
+    """Raised by function stand-ins; returned to the client as a PostgREST error."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+Function = Callable[["PostgRESTStandIn", dict[str, Any]], Any]
+
+
+class PostgRESTStandIn:
+    """Serves PostgREST requests from in-memory tables."""
+
+    def __init__(
+        self,
+        functions: dict[str, Function] | None = None,
+        unique: dict[str, Sequence[str]] | None = None,
+    ) -> None:
+        self.tables: dict[str, list[dict[str, Any]]] = {}
+        self.functions: dict[str, Function] = dict(functions or {})
+        # table -> columns that must be unique
+        self.unique: dict[str, Sequence[str]] = dict(unique or {})
+        self.requests: list[httpx.Request] = []
+
+    def sync_client(self) -> Client:
+        """Create a Supabase client whose REST calls are served by this stand-in."""
+        http_client = httpx.Client(transport=httpx.MockTransport(self))
+        return create_client(URL, KEY, options=SyncClientOptions(httpx_client=http_client))
+
+    def table(self, name: str) -> list[dict[str, Any]]:
+        return self.tables.setdefault(name, [])
+
+    def reset_requests(self) -> None:
+        self.requests.clear()
+
+    def requests_to(self, table: str, method: str | None = None) -> list[httpx.Request]:
+        """Recorded requests for ``table``, optionally filtered by HTTP method."""
+        return [
+            request
+            for request in self.requests
+            if request.url.path.rsplit("/", 1)[-1] == table
+            and (method is None or request.method == method)
+        ]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        try:
+            return self._handle(request)
+        except PostgRESTError as e:
+            error = {"code": e.code, "message": e.message, "details": None, "hint": None}
+            return httpx.Response(400, json=error)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        params = request.url.params
+        if "/rpc/" in request.url.path:
+            function = self.functions.get(name)
+            if function is None:
+                raise PostgRESTError("PGRST202", f"Could not find the function {name}")
+            return httpx.Response(200, json=function(self, json.loads(request.content or b"{}")))
+
+        rows = self.table(name)
+
+        if request.method == "GET":
+            matched = self._order(self._filter(rows, params), params.get("order"))
+            offset = int(params.get("offset", 0))
+            limit = params.get("limit")
+            matched = matched[offset : offset + int(limit) if limit else None]
+            return httpx.Response(200, json=[self._select(row, params) for row in matched])
+
+        body = json.loads(request.content or b"null")
+        if request.method == "POST":
+            payload = body if isinstance(body, list) else [body]
+            conflict = params.get("on_conflict")
+            ignore = "resolution=ignore-duplicates" in request.headers.get("prefer", "")
+            # Statements are atomic: a failing row leaves the table unchanged
+            snapshot = copy.deepcopy(rows)
+            try:
+                written = [self._insert(name, rows, row, conflict, ignore) for row in payload]
+            except PostgRESTError:
+                rows[:] = snapshot
+                raise
+            return httpx.Response(201, json=[row for row in written if row is not None])
+        if request.method == "PATCH":
+            matched = self._filter(rows, params)
+            for row in matched:
+                row.update(body)
+            return httpx.Response(200, json=matched)
+        if request.method == "DELETE":
+            matched = self._filter(rows, params)
+            self.tables[name] = [row for row in rows if row not in matched]
+            return httpx.Response(200, json=matched)
+        return httpx.Response(405, json={"message": f"Unsupported method {request.method}"})
+
+    def _insert(
+        self,
+        name: str,
+        rows: list[dict[str, Any]],
+        row: dict[str, Any],
+        conflict: str | None,
+        ignore_duplicates: bool = False,
+    ) -> dict[str, Any] | None:
+        """Insert or upsert one row; returns None for an ignored duplicate."""
+        if conflict:
+            keys = conflict.split(",")
+            for existing in rows:
+                if all(existing.get(key) == row.get(key) for key in keys):
+                    if ignore_duplicates:
+                        return None
+                    existing.update(row)
+                    return existing
+        for column in self.unique.get(name, ()):
+            if any(existing.get(column) == row.get(column) for existing in rows):
+                raise PostgRESTError(
+                    "23505", f'duplicate key value violates unique constraint "{name}_{column}_key"'
+                )
+        stored = {"id": str(uuid.uuid4()), **row}
+        rows.append(stored)
+        return stored
+
+    def _filter(self, rows: list[dict[str, Any]], params: httpx.QueryParams) -> list[dict]:
+        matched = rows
+        for column, condition in params.multi_items():
+            if column in _RESERVED_PARAMS:
+                continue
+            operator, _, operand = condition.partition(".")
+            matched = [row for row in matched if _matches(row.get(column), operator, operand)]
+        return matched
+
+    def _order(self, rows: list[dict[str, Any]], order: str | None) -> list[dict[str, Any]]:
+        ordered = list(rows)
+        # Sort by the least significant key first; Python's sort is stable
+        for term in reversed(order.split(",") if order else []):
+            column, _, direction = term.partition(".")
+            ordered.sort(
+                key=lambda row: (row.get(column) is None, row.get(column)),
+                reverse=direction.startswith("desc"),
+            )
+        return ordered
+
+    def _select(self, row: dict[str, Any], params: httpx.QueryParams) -> dict[str, Any]:
+        columns = params.get("select", "*")
+        if columns == "*":
+            return dict(row)
+        return {column: row.get(column) for column in columns.split(",")}
+
+
+def _matches(value: Any, operator: str, operand: str) -> bool:
+    # Filters compare against the JSON/text form of the column value
+    if value is None:
+        text = None
+    elif isinstance(value, bool):
+        text = json.dumps(value)
+    else:
+        text = str(value)
+    if operator == "eq":
+        return text == operand
+    if operator == "neq":
+        return text != operand
+    if operator == "in":
+        return text in next(csv.reader([operand.strip("()")]))
+    if operator == "is":
+        return value is None if operand == "null" else text == operand
+    raise ValueError(f"Unsupported PostgREST operator: {operator}")
+
+
+def _upsert_session(standin: PostgRESTStandIn, params: dict[str, Any]) -> dict[str, Any]:
+    """Python rendition of the upsert_session SQL function (migration 011)."""
+    row = params["p_session"]
+    expected = params.get("p_expected_version")
+    sessions = standin.table("sessions")
+
+    if expected == 0:
+        sessions.append({**row, "version": 1})
+        return {"version": 1, "revision_number": 0, "draft_number": 0, "hole_ids": []}
+
+    existing = next((s for s in sessions if s["id"] == row["id"]), None)
+    if existing is None:
+        raise PostgRESTError("P0002", f"Session {row['id']} not found")
+    if expected is not None and existing["version"] != expected:
+        raise PostgRESTError(
+            "40001", f"Session {row['id']} was modified concurrently (expected version {expected})"
+        )
+
+    for column in _SESSION_UPDATE_COLUMNS:
+        if column in row:
+            existing[column] = row[column]
+    existing["version"] += 1
+
+    def children(table: str) -> list[dict[str, Any]]:
+        return [child for child in standin.table(table) if child["session_id"] == row["id"]]
+
+    return {
+        "version": existing["version"],
+        "revision_number": max(
+            (r["revision_number"] for r in children("session_revisions")), default=0
+        ),
+        "draft_number": max((d["draft_number"] for d in children("session_drafts")), default=0),
+        "hole_ids": [r["hole_id"] for r in children("hole_resolutions")],
+    }
+
+
+_SESSION_UPDATE_COLUMNS = (
+    "status",
+    "current_ir",
+    "revision_count",
+    "draft_count",
+    "hole_count",
+    "metadata",
+    "updated_at",
+    "finalized_at",
+)
+
+SESSION_FUNCTIONS: dict[str, Function] = {"upsert_session": _upsert_session}
+
+
+__all__ = ["PostgRESTStandIn", "PostgRESTError", "SESSION_FUNCTIONS"]
@@ -10,7 +10,7 @@ pytest.importorskip("lark")
 from lark.exceptions import LarkError
 
 from lift_sys.ir.models import AssertClause, HoleKind, TypedHole
-from lift_sys.ir.parser import IRParser
+from lift_sys.ir.parser import IRParser, ParserConfig, _build_parser, get_compiled_parser
 
 pytestmark = pytest.mark.unit
 
@@ -55,3 +55,29 @@ def test_parser_rejects_empty_or_comment_only_files(parser: IRParser, fixtures_d
     comments_only = (fixtures_dir / "comments_only.ir").read_text(encoding="utf8")
     with pytest.raises(LarkError):
         parser.parse(comments_only)
+
+
+def test_parsers_share_the_compiled_grammar() -> None:
+    assert IRParser()._parser is IRParser()._parser
+    assert IRParser()._parser is get_compiled_parser(allow_typed_holes=True)
+
+    strict = IRParser(ParserConfig(allow_typed_holes=False))
+    assert strict._parser is get_compiled_parser(allow_typed_holes=False)
+    assert strict._parser is not IRParser()._parser
+
+
+def test_strict_parser_rejects_typed_holes(parser: IRParser, sample_ir_text: str) -> None:
+    strict = IRParser(ParserConfig(allow_typed_holes=False))
+
+    with pytest.raises(ValueError, match="Typed holes are disabled"):
+        strict.parse(sample_ir_text)
+
+
+def test_serialized_parse_tables_round_trip(tmp_path: Path, sample_ir_text: str) -> None:
+    cache_file = tmp_path / "ir_grammar.cache"
+
+    built = _build_parser(cache=str(cache_file))
+    loaded = _build_parser(cache=str(cache_file))
+
+    assert cache_file.exists()
+    assert loaded.parse(sample_ir_text).to_dict() == built.parse(sample_ir_text).to_dict()
@@ -0,0 +1,89 @@
+"""Tests for SMT verification in SpecSessionManager, which must not block the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("z3")
+
+from lift_sys.ir.models import AssertClause, IntentClause, IntermediateRepresentation, SigClause
+from lift_sys.planner.planner import Planner
+from lift_sys.spec_sessions.manager import SpecSessionManager
+from lift_sys.spec_sessions.models import IRDraft, PromptSession
+from lift_sys.spec_sessions.storage import InMemorySessionStore
+from lift_sys.spec_sessions.translator import PromptToIRTranslator
+from lift_sys.verifier.batch import BatchSMTVerifier
+from lift_sys.verifier.smt_checker import SMTChecker
+
+
+class SlowChecker(SMTChecker):
+    """Checker that takes ``latency`` seconds per check, like a hard solver query."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+
+    def verify(self, ir, assumptions=None, timeout_ms=None):
+        time.sleep(self.latency)
+        return super().verify(ir, assumptions=assumptions, timeout_ms=timeout_ms)
+
+
+def build_ir(*predicates: str) -> IntermediateRepresentation:
+    return IntermediateRepresentation(
+        intent=IntentClause(summary="check"),
+        signature=SigClause(name="demo", parameters=[], returns="int"),
+        assertions=[AssertClause(predicate=predicate) for predicate in predicates],
+    )
+
+
+def make_manager(**kwargs) -> tuple[SpecSessionManager, InMemorySessionStore]:
+    store = InMemorySessionStore()
+    manager = SpecSessionManager(
+        store=store, translator=PromptToIRTranslator(), planner=Planner(), **kwargs
+    )
+    return manager, store
+
+
+def store_session(store: InMemorySessionStore, ir: IntermediateRepresentation) -> str:
+    session = PromptSession.create_new()
+    session.add_draft(IRDraft(version=1, ir=ir, validation_status="valid"))
+    store.create(session)
+    return session.session_id
+
+
+@pytest.mark.asyncio
+async def test_local_verification_runs_off_the_event_loop():
+    manager, _store = make_manager(verifier=SlowChecker(latency=0.2))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    results = await manager._verify_assertions(build_ir("x > 0", "x < 0"))
+    task.cancel()
+
+    assert [result["status"] for result in results] == ["unsat", "unsat"]
+    assert ticks >= 20
+
+
+@pytest.mark.asyncio
+async def test_finalize_verifies_with_the_batch_verifier():
+    with BatchSMTVerifier(max_workers=1, timeout_s=5.0) as pool:
+        manager, store = make_manager(batch_verifier=pool)
+        valid = store_session(store, build_ir("x > 0"))
+        contradictory = store_session(store, build_ir("y > 0", "y < 0"))
+
+        ir = await manager.finalize(valid)
+        with pytest.raises(ValueError, match="SMT verification failed"):
+            await manager.finalize(contradictory)
+
+    assert ir.assertions[0].predicate == "x > 0"
+    assert store.get(valid).status == "finalized"
+    assert store.get(contradictory).status == "active"
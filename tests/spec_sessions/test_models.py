@@ -128,6 +128,25 @@ class TestIRDraft:
         assert restored.validation_status == draft.validation_status
         assert restored.ir.signature.name == draft.ir.signature.name
 
+    def test_lazy_draft_wraps_ir_in_view(self):
+        """Test IRDraft.from_dict(lazy=True) defers IR deserialization."""
+        ir = IntermediateRepresentation(
+            intent=IntentClause(
+                summary="Test",
+                holes=[TypedHole(identifier="fmt", type_hint="str", kind=HoleKind.INTENT)],
+            ),
+            signature=SigClause(name="test", parameters=[], returns="void"),
+        )
+        data = IRDraft(version=1, ir=ir, validation_status="pending").to_dict()
+
+        draft = IRDraft.from_dict(data, lazy=True)
+
+        assert not isinstance(draft.ir, IntermediateRepresentation)
+        assert draft.get_unresolved_holes() == ["fmt"]
+        assert draft.to_dict()["ir"] is data["ir"]
+        assert draft.materialize() == ir
+        assert isinstance(draft.ir, IntermediateRepresentation)
+
 
 @pytest.mark.unit
 class TestHoleResolution:
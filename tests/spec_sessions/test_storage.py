@@ -96,6 +96,43 @@ class TestInMemorySessionStore:
 
         assert len(all_sessions) == 2
 
+    def test_paginated_listing_and_summaries(self):
+        """Test paging through sessions and listing summaries."""
+        store = InMemorySessionStore()
+        sessions = [PromptSession.create_new() for _ in range(5)]
+        sessions[0].finalize()
+        for index, session in enumerate(sessions):
+            session.updated_at = f"2025-01-0{index + 1}T00:00:00Z"
+            store.create(session)
+        newest_first = sessions[::-1]
+
+        page = store.list_all(limit=2, offset=1)
+        summaries = store.list_summaries(status="active", limit=3)
+
+        assert [s.session_id for s in page] == [s.session_id for s in newest_first[1:3]]
+        assert [s.session_id for s in summaries] == [s.session_id for s in newest_first[:3]]
+        assert summaries[0].revision_count == 0
+
+    def test_listings_are_most_recently_updated_first(self):
+        """Test that an updated session moves to the front of every listing."""
+        store = InMemorySessionStore()
+        sessions = [PromptSession.create_new() for _ in range(3)]
+        for index, session in enumerate(sessions):
+            session.updated_at = f"2025-01-0{index + 1}T00:00:00Z"
+            store.create(session)
+
+        sessions[0].updated_at = "2025-02-01T00:00:00Z"
+        store.update(sessions[0])
+        expected = [sessions[0], sessions[2], sessions[1]]
+
+        assert [s.session_id for s in store.list_active()] == [s.session_id for s in expected]
+        assert [s.session_id for s in store.list_all(limit=2)] == [
+            s.session_id for s in expected[:2]
+        ]
+        assert [s.session_id for s in store.list_summaries(offset=1)] == [
+            s.session_id for s in expected[1:]
+        ]
+
     def test_delete_session(self):
         """Test deleting a session."""
         store = InMemorySessionStore()
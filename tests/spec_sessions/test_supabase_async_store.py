@@ -0,0 +1,187 @@
+"""Tests for batched, versioned and async writes in the Supabase session stores."""
+
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+
+from lift_sys.spec_sessions import (
+    AsyncSupabaseSessionStore,
+    HoleResolution,
+    PromptRevision,
+    PromptSession,
+    StaleSessionError,
+    SupabaseSessionStore,
+)
+from tests.helpers.postgrest_standin import SESSION_FUNCTIONS, PostgRESTStandIn
+
+
+class SlowPostgREST(PostgRESTStandIn):
+    """Stand-in that takes ``latency`` seconds per request, like a remote database."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(functions=SESSION_FUNCTIONS)
+        self.latency = latency
+
+    def __call__(self, request):
+        time.sleep(self.latency)
+        return super().__call__(request)
+
+
+@pytest.fixture
+def standin():
+    return PostgRESTStandIn(functions=SESSION_FUNCTIONS)
+
+
+@pytest.fixture
+def store(standin):
+    return SupabaseSessionStore(user_id=str(uuid.uuid4()), client=standin.sync_client())
+
+
+def revision(content: str) -> PromptRevision:
+    return PromptRevision(
+        timestamp="2025-10-20T00:00:00+00:00", content=content, revision_type="hole_fill"
+    )
+
+
+def resolution(hole_id: str) -> HoleResolution:
+    return HoleResolution(hole_id=hole_id, resolution_text="x", resolution_type="clarify_intent")
+
+
+def request_summary(standin: PostgRESTStandIn) -> list[tuple[str, str, int]]:
+    """(method, endpoint, rows in body) for each recorded request."""
+    summary = []
+    for request in standin.requests:
+        body = json.loads(request.content or b"null")
+        rows = len(body) if isinstance(body, list) else 1
+        summary.append((request.method, request.url.path.rsplit("/", 1)[-1], rows))
+    return summary
+
+
+class TestBatchedWrites:
+    def test_create_is_one_rpc_plus_one_insert_per_table(self, store, standin):
+        session = PromptSession.create_new()
+        for i in range(3):
+            session.add_revision(revision(f"r{i}"))
+        session.add_resolution(resolution("h1"))
+
+        store.create(session)
+
+        assert request_summary(standin) == [
+            ("POST", "upsert_session", 1),
+            ("POST", "session_revisions", 3),
+            ("POST", "hole_resolutions", 1),
+        ]
+        assert session.storage_version == 1
+
+    def test_update_inserts_only_new_child_rows(self, store, standin):
+        session = PromptSession.create_new()
+        session.add_revision(revision("initial"))
+        session.add_resolution(resolution("h1"))
+        store.create(session)
+        standin.reset_requests()
+
+        session.add_revision(revision("second"))
+        session.add_revision(revision("third"))
+        session.add_resolution(resolution("h2"))
+        session.finalize()
+        store.update(session)
+
+        assert request_summary(standin) == [
+            ("POST", "upsert_session", 1),
+            ("POST", "session_revisions", 2),
+            ("POST", "hole_resolutions", 1),
+        ]
+        loaded = store.get(session.session_id)
+        assert [r.content for r in loaded.revisions] == ["initial", "second", "third"]
+        assert [r.hole_id for r in loaded.pending_resolutions] == ["h1", "h2"]
+        assert loaded.status == "finalized"
+        assert loaded.storage_version == session.storage_version == 2
+        assert standin.table("sessions")[0]["finalized_at"] is not None
+
+    def test_update_missing_session_raises_key_error(self, store):
+        with pytest.raises(KeyError, match="not found"):
+            store.update(PromptSession.create_new())
+
+
+class TestOptimisticConcurrency:
+    def test_stale_copy_is_rejected(self, store, standin):
+        session = PromptSession.create_new()
+        store.create(session)
+        first = store.get(session.session_id)
+        second = store.get(session.session_id)
+
+        first.add_revision(revision("from first"))
+        store.update(first)
+        second.add_revision(revision("from second"))
+
+        with pytest.raises(StaleSessionError) as excinfo:
+            store.update(second)
+
+        assert excinfo.value.expected_version == 1
+        loaded = store.get(session.session_id)
+        assert [r.content for r in loaded.revisions] == ["from first"]
+
+        # Reloading picks up the new version and the write goes through
+        second = store.get(session.session_id)
+        second.add_revision(revision("from second"))
+        store.update(second)
+        assert store.get(session.session_id).storage_version == 3
+
+    def test_session_without_version_is_last_writer_wins(self, store):
+        session = PromptSession.create_new()
+        store.create(session)
+
+        copy = PromptSession.from_dict(session.to_dict())
+        copy.status = "finalized"
+        store.update(session)
+        store.update(copy)
+
+        assert store.get(session.session_id).status == "finalized"
+
+
+class TestAsyncStore:
+    @pytest.mark.asyncio
+    async def test_writes_run_off_the_event_loop(self):
+        standin = SlowPostgREST(latency=0.1)
+        store = AsyncSupabaseSessionStore(user_id=str(uuid.uuid4()), client=standin.sync_client())
+        session = PromptSession.create_new()
+        session.add_revision(revision("initial"))
+        session.add_resolution(resolution("h1"))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await store.create(session)
+        elapsed = time.perf_counter() - started
+        task.cancel()
+
+        # RPC, then the revision and resolution inserts in parallel
+        assert len(standin.requests) == 3
+        assert elapsed < 0.27
+        assert ticks >= 20
+        assert (await store.get(session.session_id)).revisions[0].content == "initial"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_of_the_same_version_conflict(self, standin):
+        store = AsyncSupabaseSessionStore(user_id=str(uuid.uuid4()), client=standin.sync_client())
+        session = PromptSession.create_new()
+        await store.create(session)
+        copies = await asyncio.gather(*(store.get(session.session_id) for _ in range(2)))
+        for index, copy in enumerate(copies):
+            copy.add_revision(revision(f"writer {index}"))
+
+        results = await asyncio.gather(
+            *(store.update(copy) for copy in copies), return_exceptions=True
+        )
+
+        assert sum(isinstance(result, StaleSessionError) for result in results) == 1
+        assert len((await store.get(session.session_id)).revisions) == 1
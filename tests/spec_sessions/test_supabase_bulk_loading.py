@@ -0,0 +1,122 @@
+"""Tests for bulk session loading in SupabaseSessionStore against a PostgREST stand-in."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from lift_sys.ir.models import IntentClause, IntermediateRepresentation, SigClause
+from lift_sys.spec_sessions import (
+    HoleResolution,
+    IRDraft,
+    PromptRevision,
+    PromptSession,
+    SupabaseSessionStore,
+)
+from tests.helpers.postgrest_standin import SESSION_FUNCTIONS, PostgRESTStandIn
+
+BASE_TIME = datetime(2025, 10, 20, tzinfo=UTC)
+
+
+@pytest.fixture
+def standin():
+    return PostgRESTStandIn(functions=SESSION_FUNCTIONS)
+
+
+@pytest.fixture
+def store(standin):
+    return SupabaseSessionStore(user_id=str(uuid.uuid4()), client=standin.sync_client())
+
+
+def make_session(index: int, status: str = "active") -> PromptSession:
+    session = PromptSession.create_new(metadata={"index": index})
+    for step in range(2):
+        session.add_revision(
+            PromptRevision(
+                timestamp=(BASE_TIME + timedelta(seconds=step)).isoformat(),
+                content=f"session {index} revision {step}",
+                revision_type="initial" if step == 0 else "hole_fill",
+            )
+        )
+    ir = IntermediateRepresentation(
+        intent=IntentClause(summary=f"Function {index}"),
+        signature=SigClause(name=f"func_{index}", parameters=[], returns="int"),
+    )
+    session.add_draft(IRDraft(version=1, ir=ir, validation_status="valid"))
+    session.add_resolution(
+        HoleResolution(hole_id=f"hole_{index}", resolution_text="done", resolution_type="other")
+    )
+    session.status = status
+    # Later sessions are more recently updated
+    session.updated_at = (BASE_TIME + timedelta(minutes=index)).isoformat()
+    return session
+
+
+@pytest.fixture
+def populated(store, standin):
+    sessions = [make_session(i, "finalized" if i % 5 == 0 else "active") for i in range(20)]
+    for session in sessions:
+        store.create(session)
+    standin.reset_requests()
+    return sessions
+
+
+class TestBulkLoading:
+    def test_list_all_uses_constant_number_of_queries(self, store, standin, populated):
+        sessions = store.list_all()
+
+        assert len(sessions) == 20
+        assert len(standin.requests) == 4
+        assert [s.metadata["index"] for s in sessions] == list(range(19, -1, -1))
+
+    def test_bulk_loaded_sessions_match_single_get(self, store, standin, populated):
+        listed = {s.session_id: s for s in store.list_all()}
+
+        for original in populated:
+            single = store.get(original.session_id)
+            bulk = listed[original.session_id]
+            assert bulk.to_dict() == single.to_dict()
+            assert [r.content for r in bulk.revisions] == [r.content for r in original.revisions]
+            index = bulk.metadata["index"]
+            assert bulk.current_draft.ir.signature.name == f"func_{index}"
+            assert [r.hole_id for r in bulk.pending_resolutions] == [f"hole_{index}"]
+
+    def test_get_many_preserves_order_and_skips_unknown_ids(self, store, standin, populated):
+        ids = [populated[3].session_id, str(uuid.uuid4()), populated[7].session_id]
+
+        sessions = store.get_many(ids)
+
+        assert [s.session_id for s in sessions] == [ids[0], ids[2]]
+        assert len(standin.requests) == 4
+
+    def test_missing_session_costs_one_query(self, store, standin):
+        assert store.get(str(uuid.uuid4())) is None
+        assert len(standin.requests) == 1
+
+
+class TestPagination:
+    def test_pages_are_disjoint_and_ordered(self, store, populated):
+        first = store.list_active(limit=5)
+        second = store.list_active(limit=5, offset=5)
+
+        indices = [s.metadata["index"] for s in first + second]
+        assert indices == [19, 18, 17, 16, 14, 13, 12, 11, 9, 8]
+        assert all(s.status == "active" for s in first + second)
+
+    def test_page_past_the_end_is_empty(self, store, standin, populated):
+        assert store.list_all(limit=10, offset=20) == []
+        assert len(standin.requests) == 1
+
+
+class TestSummaries:
+    def test_summaries_read_only_the_sessions_table(self, store, standin, populated):
+        summaries = store.list_summaries(status="finalized")
+
+        assert [s.metadata["index"] for s in summaries] == [15, 10, 5, 0]
+        assert len(standin.requests) == 1
+        assert standin.requests_to("sessions", "GET") == standin.requests
+
+        summary = summaries[0]
+        assert (summary.revision_count, summary.draft_count, summary.hole_count) == (2, 1, 1)
+        assert summary.current_draft.ir.signature.name == "func_15"
+        assert summary.get_unresolved_holes() == []
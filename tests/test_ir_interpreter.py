@@ -1,5 +1,6 @@
 """Comprehensive test suite for IR Interpreter."""
 
+from lift_sys.ir.fingerprint import IRFingerprintCache
 from lift_sys.ir.models import (
     EffectClause,
     IntentClause,
@@ -775,3 +776,79 @@ class TestStringRepresentations:
         issue_str = str(issue)
         assert isinstance(issue_str, str)
         assert "Test error message" in issue_str
+
+
+class TestInterpretationCache:
+    """Test memoization of interpretation results by IR fingerprint."""
+
+    @staticmethod
+    def _make_ir(summary: str = "Double a number") -> IntermediateRepresentation:
+        return IntermediateRepresentation(
+            intent=IntentClause(summary=summary),
+            signature=SigClause(
+                name="double",
+                parameters=[Parameter(name="x", type_hint="int")],
+                returns="int",
+            ),
+            effects=[
+                EffectClause(description="Multiply x by 2 into result"),
+                EffectClause(description="Return the result"),
+            ],
+        )
+
+    def test_equal_irs_hit_cache(self):
+        """Structurally equal IRs share one analysis."""
+        cache: IRFingerprintCache[InterpretationResult] = IRFingerprintCache(max_size=8)
+        interpreter = IRInterpreter(cache=cache)
+
+        first_ir = self._make_ir()
+        second_ir = self._make_ir()
+        first = interpreter.interpret(first_ir)
+        second = interpreter.interpret(second_ir)
+
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert second.ir is second_ir
+        assert second.trace is first.trace
+        assert [i.message for i in second.all_issues] == [i.message for i in first.all_issues]
+        assert interpreter.cache_stats()["hit_rate"] == 0.5
+
+    def test_changed_ir_misses_cache(self):
+        """Any content change produces a fresh analysis."""
+        cache: IRFingerprintCache[InterpretationResult] = IRFingerprintCache(max_size=8)
+        interpreter = IRInterpreter(cache=cache)
+
+        ir = self._make_ir()
+        interpreter.interpret(ir)
+        ir.effects.append(EffectClause(description="Log the result"))
+        interpreter.interpret(ir)
+
+        assert cache.hits == 0
+        assert cache.misses == 2
+        assert len(cache) == 2
+
+    def test_cached_result_matches_uncached(self):
+        """Cached and uncached interpretation report the same issues."""
+        ir = self._make_ir()
+        cached = IRInterpreter(cache=IRFingerprintCache(max_size=8))
+        uncached = IRInterpreter(enable_cache=False)
+
+        cached.interpret(ir)
+        from_cache = cached.interpret(ir)
+        fresh = uncached.interpret(ir)
+
+        assert uncached.cache_stats() == {}
+        assert [(i.category, i.message) for i in from_cache.all_issues] == [
+            (i.category, i.message) for i in fresh.all_issues
+        ]
+
+    def test_issue_list_is_not_shared(self):
+        """Mutating one result's issue list does not leak into the cache."""
+        interpreter = IRInterpreter(cache=IRFingerprintCache(max_size=8))
+        ir = self._make_ir()
+
+        first = interpreter.interpret(ir)
+        count = len(first.all_issues)
+        first.all_issues.append(SemanticIssue(severity="error", category="x", message="injected"))
+
+        assert len(interpreter.interpret(ir).all_issues) == count
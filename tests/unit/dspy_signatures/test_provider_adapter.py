@@ -375,6 +375,28 @@ class TestXGrammarSchemaPassthrough:
         mock_provider.generate_structured_mock.assert_not_called()
         assert result.output == "Text response"
 
+    @pytest.mark.asyncio
+    async def test_schema_with_streaming_provider_validates_stream(self) -> None:
+        """Test that a streaming provider without XGrammar is validated while streaming."""
+        provider = MockProvider(structured_output=False, streaming=True)
+        chunks = ['```json\n{"answer": ', '"42", "extra": ', "true}\n```"]
+
+        async def generate_stream(prompt: str, **kwargs: Any):
+            for chunk in chunks:
+                yield chunk
+
+        provider.generate_stream = generate_stream
+        adapter = ProviderAdapter(provider, config=ProviderConfig(use_xgrammar=False))
+        schema = {"type": "object", "properties": {"answer": {"type": "string"}}}
+
+        result = await adapter("Test prompt", schema=schema)
+        assert result.answer == "42"
+
+        schema["additionalProperties"] = False
+        with pytest.raises(ValueError, match="unexpected property 'extra'"):
+            await adapter("Test prompt", schema=dict(schema))
+        provider.generate_text_mock.assert_not_called()
+
 
 class TestSignatureIntegration:
     """Test integration with DSPy signature field extraction."""
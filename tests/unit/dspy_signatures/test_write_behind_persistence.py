@@ -0,0 +1,254 @@
+"""
+Tests for write-behind buffered state persistence.
+
+Uses the in-memory PostgREST stand-in, so database round trips can be counted
+and slowed down to verify that graph latency excludes them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from lift_sys.dspy_signatures.state_persistence import GraphState, StatePersistence
+from lift_sys.dspy_signatures.write_behind_persistence import WriteBehindStatePersistence
+from tests.helpers.postgrest_standin import PostgRESTStandIn
+
+
+class FlakyPostgREST(PostgRESTStandIn):
+    """Stand-in with configurable per-request latency and an outage switch.
+
+    ``execution_id`` is unique, as in the graph_states table.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(unique={"graph_states": ("execution_id",)})
+        self.latency = 0.0
+        self.down = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.latency)
+        if self.down:
+            self.requests.append(request)
+            return httpx.Response(503, json={"code": "503", "message": "unavailable"})
+        return super().__call__(request)
+
+
+@pytest.fixture
+def standin() -> FlakyPostgREST:
+    return FlakyPostgREST()
+
+
+@pytest.fixture
+def make_persistence(standin, monkeypatch):
+    monkeypatch.setenv("SUPABASE_URL", "http://postgrest.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "standin-key")
+    monkeypatch.setattr(
+        "lift_sys.dspy_signatures.state_persistence.create_client",
+        lambda url, key: standin.sync_client(),
+    )
+    created = []
+
+    def make(**kwargs) -> WriteBehindStatePersistence:
+        kwargs.setdefault("flush_interval", 60)
+        persistence = WriteBehindStatePersistence(**kwargs)
+        created.append(persistence)
+        return persistence
+
+    yield make
+    for persistence in created:
+        if persistence._flusher:
+            persistence._flusher.cancel()
+
+
+def graph_state(execution_id: str) -> GraphState:
+    return GraphState(
+        execution_id=execution_id,
+        state_snapshot={"counter": 0},
+        state_type="test.SimpleTestState",
+        user_id="user-1",
+    )
+
+
+def node_output(index: int) -> dict:
+    return {
+        "signature_name": "TestSig",
+        "inputs": {"step": index},
+        "outputs": {"value": index},
+        "state_updates": {"counter": index},
+    }
+
+
+async def run_graph(persistence, execution_id: str, nodes: int = 10) -> None:
+    await persistence.save(execution_id, graph_state(execution_id))
+    for index in range(1, nodes + 1):
+        await persistence.update_node_output(execution_id, f"Node{index}", node_output(index))
+
+
+@pytest.mark.asyncio
+async def test_graph_writes_are_coalesced_into_one_insert(make_persistence, standin):
+    persistence = make_persistence()
+
+    await run_graph(persistence, "exec-1")
+    assert standin.requests == []
+    assert persistence.buffered_operations == 11
+
+    await persistence.flush()
+
+    assert [request.method for request in standin.requests] == ["POST"]
+    row = standin.table("graph_states")[0]
+    assert [entry["node_name"] for entry in row["provenance"]] == [f"Node{i}" for i in range(1, 11)]
+    assert row["state_snapshot"] == {"counter": 10}
+    assert persistence.buffered_operations == 0
+
+
+@pytest.mark.asyncio
+async def test_updates_across_executions_share_one_upsert(make_persistence, standin):
+    persistence = make_persistence()
+    for execution_id in ("exec-1", "exec-2", "exec-3"):
+        await persistence.save(execution_id, graph_state(execution_id))
+    await persistence.flush()
+    standin.reset_requests()
+
+    for execution_id in ("exec-1", "exec-2", "exec-3"):
+        await persistence.update_node_output(execution_id, "Node1", node_output(1))
+        await persistence.update_node_output(execution_id, "Node2", node_output(2))
+    await persistence.flush()
+
+    # No read-before-write: the last written state is kept in memory
+    assert [request.method for request in standin.requests] == ["POST"]
+    assert "on_conflict=execution_id" in str(standin.requests[0].url)
+    loaded = await persistence.load("exec-2")
+    assert [entry["node_name"] for entry in loaded.provenance] == ["Node1", "Node2"]
+    assert loaded.state_snapshot == {"counter": 2}
+
+
+@pytest.mark.asyncio
+async def test_graph_latency_excludes_database_round_trips(make_persistence, standin):
+    standin.latency = 0.05
+    persistence = make_persistence(flush_interval=0.01)
+
+    started = time.perf_counter()
+    await run_graph(persistence, "exec-1")
+    graph_seconds = time.perf_counter() - started
+    await persistence.aclose()
+
+    # Eleven synchronous writes would take 0.55s
+    assert graph_seconds < 0.05
+    assert len(standin.table("graph_states")[0]["provenance"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_persists_without_explicit_flush(make_persistence, standin):
+    persistence = make_persistence(flush_interval=0.01)
+
+    await run_graph(persistence, "exec-1", nodes=3)
+    await asyncio.sleep(0.1)
+
+    assert persistence.buffered_operations == 0
+    assert len(standin.table("graph_states")[0]["provenance"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_applies_backpressure(make_persistence, standin):
+    standin.latency = 0.02
+    persistence = make_persistence(flush_interval=60, max_pending=4, max_batch=4)
+    await persistence.save("exec-1", graph_state("exec-1"))
+    peak = 0
+
+    for index in range(1, 21):
+        await persistence.update_node_output("exec-1", f"Node{index}", node_output(index))
+        peak = max(peak, persistence.buffered_operations)
+    await persistence.flush()
+
+    assert peak <= 4
+    loaded = await persistence.load("exec-1")
+    assert [entry["node_name"] for entry in loaded.provenance] == [f"Node{i}" for i in range(1, 21)]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_writes_buffered(make_persistence, standin):
+    persistence = make_persistence()
+    await run_graph(persistence, "exec-1", nodes=2)
+    standin.down = True
+
+    with pytest.raises(ValueError, match="Failed to flush"):
+        await persistence.flush()
+    assert persistence.buffered_operations == 3
+
+    # Writes made during the outage are kept in order behind the failed batch
+    await persistence.update_node_output("exec-1", "Node3", node_output(3))
+    standin.down = False
+    await persistence.flush()
+
+    loaded = await persistence.load("exec-1")
+    assert [entry["node_name"] for entry in loaded.provenance] == ["Node1", "Node2", "Node3"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_execution_is_reported_at_flush(make_persistence, standin):
+    persistence = make_persistence()
+    await persistence.update_node_output("missing", "Node1", node_output(1))
+
+    with pytest.raises(KeyError, match="missing"):
+        await persistence.flush()
+    assert persistence.buffered_operations == 0
+
+
+@pytest.mark.asyncio
+async def test_writes_dropped_in_background_are_reported_at_flush(make_persistence, standin):
+    persistence = make_persistence(flush_interval=0.01)
+    await persistence.update_node_output("missing", "Node1", node_output(1))
+    for _ in range(100):
+        if persistence.buffered_operations == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert persistence.buffered_operations == 0
+
+    with pytest.raises(KeyError, match="missing"):
+        await persistence.aclose()
+    # Reported once
+    await persistence.flush()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_save_is_rejected(make_persistence):
+    persistence = make_persistence()
+    await persistence.save("exec-1", graph_state("exec-1"))
+
+    with pytest.raises(ValueError, match="Failed to save state"):
+        await persistence.save("exec-1", graph_state("exec-1"))
+
+
+@pytest.mark.asyncio
+async def test_existing_execution_does_not_block_the_batch(make_persistence, standin):
+    await StatePersistence().save("exec-1", graph_state("exec-1"))
+    persistence = make_persistence(max_pending=30)
+    await run_graph(persistence, "exec-1", nodes=2)
+    await run_graph(persistence, "exec-2", nodes=2)
+
+    with pytest.raises(ValueError, match="exec-1: already exists"):
+        await persistence.flush()
+
+    # Only the conflicting execution is dropped; the stored row is left alone
+    assert persistence.buffered_operations == 0
+    rows = {row["execution_id"]: row for row in standin.table("graph_states")}
+    assert rows["exec-1"]["provenance"] == []
+    assert len(rows["exec-2"]["provenance"]) == 2
+
+    await run_graph(persistence, "exec-3", nodes=2)
+    await persistence.flush()
+    assert len((await persistence.load("exec-3")).provenance) == 2
+
+
+@pytest.mark.asyncio
+async def test_standin_rejects_duplicate_plain_insert(make_persistence, standin):
+    # make_persistence points every StatePersistence at the stand-in
+    await StatePersistence().save("exec-1", graph_state("exec-1"))
+
+    with pytest.raises(ValueError, match="23505"):
+        await StatePersistence().save("exec-1", graph_state("exec-1"))
+    assert len(standin.table("graph_states")) == 1
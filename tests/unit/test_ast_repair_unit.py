@@ -5,9 +5,12 @@ These tests run in <0.1s total with no external dependencies.
 No Modal calls, no network, just pure logic testing.
 """
 
+import ast
+
 import pytest
 
-from lift_sys.codegen.ast_repair import ASTRepairEngine
+from lift_sys.codegen.ast_repair import REPAIR_PASSES, ASTRepairEngine
+from lift_sys.ir.fingerprint import IRFingerprintCache
 
 
 @pytest.mark.unit
@@ -249,6 +252,126 @@ def test_repair_with_context():
     assert result is None
 
 
+PASS_MANAGER_SAMPLES = [
+    # loop return + enumerate
+    """def find_index(lst: list[int], value: int) -> int:
+    for index, item in enumerate(lst):
+        if item == value:
+            return index
+        return -1""",
+    # type().__name__
+    """def get_type_name(value) -> str:
+    return type(value).__name__.lower()""",
+    # nested min/max
+    """def min_max(numbers: list[int]) -> tuple[int, int]:
+    lo = numbers[0]
+    hi = numbers[0]
+    for number in numbers:
+        if number < lo:
+            lo = number
+            if number > hi:
+                hi = number
+    return (lo, hi)""",
+    # missing import + missing return
+    """def has_digits(text: str) -> bool:
+    found = re.search(r"\\d", text) is not None""",
+    # email adjacency
+    """def is_valid_email(email: str) -> bool:
+    if email.index('@') > email.rindex('.'):
+        return False
+    return True""",
+    # enumerate accumulating last match
+    """def first_match(items: list[int], target: int) -> int:
+    result = -1
+    for i, item in enumerate(items):
+        if item == target:
+            result = i
+    return result""",
+    # nothing to repair
+    """def add(a: int, b: int) -> int:
+    return a + b""",
+]
+
+
+def _repair_all_passes(code: str, function_name: str) -> str | None:
+    """Reference behaviour: run every pass unconditionally, in order."""
+    engine = ASTRepairEngine(enable_cache=False)
+    tree = ast.parse(code)
+    modifications = []
+    for _name, method in REPAIR_PASSES:
+        if method == "_add_missing_imports":
+            tree, fixes = engine._add_missing_imports(tree, code)
+        else:
+            tree, fixes = getattr(engine, method)(tree, function_name)
+        modifications.extend(fixes)
+    return ast.unparse(tree) if modifications else None
+
+
+@pytest.mark.unit
+@pytest.mark.ast_repair
+class TestRepairPassManager:
+    """Test candidate scanning, pass skipping, caching and timing."""
+
+    @pytest.mark.parametrize("code", PASS_MANAGER_SAMPLES)
+    def test_matches_running_every_pass(self, code):
+        """Skipping passes without candidates must not change the result."""
+        function_name = code.split("def ", 1)[1].split("(", 1)[0]
+        engine = ASTRepairEngine(enable_cache=False)
+
+        assert engine.repair(code, function_name) == _repair_all_passes(code, function_name)
+
+    def test_skips_passes_without_candidates(self):
+        """Clean code should run no transformer and never unparse."""
+        engine = ASTRepairEngine(enable_cache=False)
+
+        assert engine.repair(PASS_MANAGER_SAMPLES[-1], "add") is None
+
+        stats = engine.pass_stats()
+        assert stats["parse"]["runs"] == 1
+        assert stats["scan"]["runs"] == 1
+        assert all(stats[name]["skipped"] == 1 for name, _ in REPAIR_PASSES)
+        assert stats["unparse"]["runs"] == 0
+
+    def test_records_pass_timings_and_modifications(self):
+        """Passes that run report their modifications and elapsed time."""
+        engine = ASTRepairEngine(enable_cache=False)
+
+        engine.repair(PASS_MANAGER_SAMPLES[1], "get_type_name")
+
+        stats = engine.pass_stats()
+        assert stats["type_checks"]["runs"] == 1
+        assert stats["type_checks"]["modifications"] == 1
+        assert stats["type_checks"]["total_ms"] >= 0.0
+        assert stats["unparse"]["runs"] == 1
+
+        engine.reset_stats()
+        assert engine.pass_stats()["type_checks"]["runs"] == 0
+
+    def test_caches_results_by_source(self):
+        """Repeated repairs of the same source are served from the cache."""
+        cache = IRFingerprintCache(max_size=8)
+        engine = ASTRepairEngine(cache=cache)
+        code = PASS_MANAGER_SAMPLES[0]
+
+        first = engine.repair(code, "find_index")
+        second = engine.repair(code, "find_index")
+        clean = engine.repair(PASS_MANAGER_SAMPLES[-1], "add")
+        clean_again = engine.repair(PASS_MANAGER_SAMPLES[-1], "add")
+
+        assert first == second
+        assert clean is None and clean_again is None
+        assert engine.cache_stats()["hits"] == 2
+        assert engine.pass_stats()["parse"]["runs"] == 2
+
+    def test_cache_key_includes_function_name(self):
+        """The enumerate pass only targets the named function."""
+        engine = ASTRepairEngine(cache=IRFingerprintCache(max_size=8))
+        code = PASS_MANAGER_SAMPLES[5]
+
+        assert engine.repair(code, "first_match") is not None
+        assert engine.repair(code, "other_function") is None
+
+
 # Run time: Should be <0.1s for all tests
 # No external dependencies, no network calls, no Modal API
 # Can run these constantly during development
@@ -0,0 +1,160 @@
+"""Tests for the shared pooled HTTP client layer."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from lift_sys.client import SessionClient
+from lift_sys.providers.modal_provider import ModalProvider
+from lift_sys.services.http_pool import HTTPClientPool, RetryPolicy, get_http_pool
+
+NO_BACKOFF = RetryPolicy(backoff_base=0)
+
+
+class FlakyHandler:
+    """MockTransport handler answering with queued statuses, then 200."""
+
+    def __init__(self, *statuses: int | Exception):
+        self.outcomes = list(statuses)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.outcomes:
+            outcome = self.outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome, headers={"retry-after": "0"})
+        return httpx.Response(200, json={"ok": True})
+
+
+class SessionsHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 server answering the session list endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"sessions": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SessionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestRetryPolicy:
+    def test_retryable_statuses_depend_on_method(self):
+        pool = HTTPClientPool(retry=NO_BACKOFF)
+
+        for method, status, calls in [("POST", 503, 2), ("POST", 502, 1), ("GET", 502, 2)]:
+            handler = FlakyHandler(status)
+            client = pool.create_client(inner_transport=httpx.MockTransport(handler))
+            client.request(method, "http://api.test/")
+            assert handler.calls == calls, (method, status)
+
+    def test_connect_errors_are_retried_until_budget_runs_out(self):
+        pool = HTTPClientPool(retry=NO_BACKOFF)
+        error = httpx.ConnectError("refused")
+        handler = FlakyHandler(error, error, error)
+        client = pool.create_client(inner_transport=httpx.MockTransport(handler))
+
+        with pytest.raises(httpx.ConnectError):
+            client.post("http://down.test/")
+
+        assert handler.calls == 3
+        metrics = pool.connection_metrics()["down.test"]
+        assert metrics["retries"] == 2
+        assert metrics["errors"] == 1
+
+    def test_backoff_has_jitter_and_honours_retry_after(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0)
+
+        delays = {policy.backoff(3) for _ in range(20)}
+
+        assert len(delays) > 1
+        assert all(0 <= delay <= 2.0 for delay in delays)
+        assert policy.backoff(0, retry_after=1.5) == 1.5
+        assert policy.backoff(0, retry_after=60) == 2.0
+
+    @pytest.mark.asyncio
+    async def test_async_client_retries(self):
+        pool = HTTPClientPool(retry=NO_BACKOFF)
+        handler = FlakyHandler(429)
+        client = pool.create_async_client(inner_transport=httpx.MockTransport(handler))
+
+        response = await client.post("http://api.test/generate", json={})
+        await client.aclose()
+
+        assert response.json() == {"ok": True}
+        assert pool.connection_metrics()["api.test"]["requests"] == 2
+
+
+class TestSharedClients:
+    @pytest.mark.asyncio
+    async def test_async_client_is_shared_within_a_loop(self):
+        pool = HTTPClientPool()
+
+        client = pool.async_client()
+        assert pool.async_client() is client
+
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.async_client() is not client
+        await pool.aclose()
+
+    def test_modal_provider_uses_the_client_of_the_running_loop(self):
+        provider = ModalProvider("https://rand--qwen-80b-generate.modal.run")
+
+        async def current_client() -> httpx.AsyncClient:
+            return await provider._ensure_client()
+
+        async def initialize() -> httpx.AsyncClient:
+            await provider.initialize({})
+            return await current_client()
+
+        first = asyncio.run(initialize())
+        second = asyncio.run(current_client())
+
+        # The first loop's client is bound to a closed loop and must not be reused
+        assert second is not first
+        assert provider._client is None
+
+
+class TestSessionClientConnectionReuse:
+    def test_sync_calls_reuse_one_connection(self, api_server):
+        metrics = get_http_pool().metrics_for("127.0.0.1")
+        opened = metrics.connections_opened
+
+        with SessionClient(api_server) as client:
+            for _ in range(3):
+                assert client.list_sessions().sessions == []
+
+        assert metrics.connections_opened - opened == 1
+
+    @pytest.mark.asyncio
+    async def test_async_calls_reuse_one_connection(self, api_server):
+        metrics = get_http_pool().metrics_for("127.0.0.1")
+        opened = metrics.connections_opened
+
+        async with SessionClient(api_server) as client:
+            for _ in range(3):
+                assert (await client.alist_sessions()).sessions == []
+
+        assert metrics.connections_opened - opened == 1
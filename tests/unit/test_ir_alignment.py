@@ -0,0 +1,83 @@
+"""Tests for content-keyed sequence alignment."""
+
+import random
+
+from lift_sys.ir.alignment import align_sequences, lcs_matches
+
+
+def _lcs_length(left, right):
+    """Reference dynamic-programming LCS length."""
+    table = [[0] * (len(right) + 1) for _ in range(len(left) + 1)]
+    for i, a in enumerate(left):
+        for j, b in enumerate(right):
+            if a == b:
+                table[i + 1][j + 1] = table[i][j] + 1
+            else:
+                table[i + 1][j + 1] = max(table[i][j + 1], table[i + 1][j])
+    return table[-1][-1]
+
+
+class TestLCSMatches:
+    """Tests for lcs_matches."""
+
+    def test_identical_sequences_match_everything(self):
+        assert lcs_matches("abc", "abc") == [(0, 0), (1, 1), (2, 2)]
+
+    def test_empty_sequences(self):
+        assert lcs_matches([], []) == []
+        assert lcs_matches("abc", "") == []
+
+    def test_matches_are_valid_and_maximal(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            left = [rng.choice("abcde") for _ in range(rng.randint(0, 15))]
+            right = [rng.choice("abcde") for _ in range(rng.randint(0, 15))]
+
+            matches = lcs_matches(left, right)
+
+            assert len(matches) == _lcs_length(left, right)
+            assert all(left[i] == right[j] for i, j in matches)
+            assert [i for i, _ in matches] == sorted({i for i, _ in matches})
+            assert [j for _, j in matches] == sorted({j for _, j in matches})
+
+
+class TestAlignSequences:
+    """Tests for align_sequences."""
+
+    def test_insert_at_top_is_single_insert(self):
+        ops = align_sequences(["a", "b", "c"], ["x", "a", "b", "c"])
+
+        assert [op.kind for op in ops] == ["insert", "equal", "equal", "equal"]
+        assert ops[0].right_index == 0
+
+    def test_removal_is_single_delete(self):
+        ops = align_sequences(["a", "b", "c"], ["a", "c"])
+
+        assert [(op.kind, op.left_index, op.right_index) for op in ops] == [
+            ("equal", 0, 0),
+            ("delete", 1, None),
+            ("equal", 2, 1),
+        ]
+
+    def test_swap_is_reported_as_move(self):
+        ops = align_sequences(["a", "b"], ["b", "a"])
+
+        kinds = sorted(op.kind for op in ops)
+        assert kinds == ["equal", "move"]
+
+    def test_in_place_edit_is_modify(self):
+        ops = align_sequences(["a", "b", "c"], ["a", "B", "c"])
+
+        assert [op.kind for op in ops] == ["equal", "modify", "equal"]
+        assert (ops[1].left_index, ops[1].right_index) == (1, 1)
+
+    def test_identity_pairs_elements_across_gaps(self):
+        ops = align_sequences(
+            [("x", "int"), ("y", "int")],
+            [("y", "str"), ("x", "int")],
+            left_ids=["x", "y"],
+            right_ids=["y", "x"],
+        )
+
+        modified = [op for op in ops if op.kind == "modify"]
+        assert [(op.left_index, op.right_index) for op in modified] == [(1, 0)]
@@ -0,0 +1,120 @@
+"""Tests for the compact binary IR codec."""
+
+import json
+
+import pytest
+
+from lift_sys.ir.codec import (
+    FORMAT_VERSION,
+    IRCodecError,
+    decode_evidence,
+    decode_ir,
+    encode_ir,
+    is_binary_ir,
+)
+from lift_sys.ir.constraints import ReturnConstraint
+from lift_sys.ir.models import (
+    AssertClause,
+    EffectClause,
+    HoleKind,
+    IntentClause,
+    IntermediateRepresentation,
+    Metadata,
+    Parameter,
+    Provenance,
+    RelationshipClause,
+    SigClause,
+    TypedHole,
+)
+
+
+@pytest.fixture
+def full_ir():
+    """IR exercising every clause type, provenance, holes and constraints."""
+    provenance = Provenance.from_agent(
+        author="planner", evidence_refs=["ev-1"], metadata={"model": "m1"}
+    )
+    return IntermediateRepresentation(
+        intent=IntentClause(
+            summary="Count matching records",
+            rationale="Used by the report",
+            holes=[TypedHole("policy", "Policy", "how to match", {"k": "v"}, HoleKind.INTENT)],
+            provenance=provenance,
+        ),
+        signature=SigClause(
+            name="count_matches",
+            parameters=[
+                Parameter("records", "list[str]", "input rows", provenance),
+                Parameter("needle", "str"),
+            ],
+            returns="int",
+            holes=[TypedHole("ret", "int", kind=HoleKind.SIGNATURE)],
+        ),
+        effects=[EffectClause("iterate over records", provenance=provenance)],
+        assertions=[AssertClause("count >= 0", rationale="non-negative")],
+        relationships=[RelationshipClause("count", "records", "OPERATES_ON", 0.9)],
+        metadata=Metadata(
+            source_path="pkg/report.py",
+            language="python",
+            origin="reverse",
+            evidence=[{"id": "ev-1", "analysis": "codeql", "lines": [3, 7]}],
+        ),
+        constraints=[ReturnConstraint(value_name="count", description="return the count")],
+    )
+
+
+def test_roundtrip_preserves_every_field(full_ir):
+    data = encode_ir(full_ir)
+
+    assert is_binary_ir(data)
+    assert decode_ir(data) == full_ir
+    assert IntermediateRepresentation.from_bytes(full_ir.to_bytes()) == full_ir
+
+
+def test_payload_is_smaller_than_json(full_ir):
+    full_ir.effects = [EffectClause(f"step {n}", provenance=Provenance()) for n in range(50)]
+
+    assert len(encode_ir(full_ir)) < len(json.dumps(full_ir.to_dict()))
+
+
+def test_evidence_section_can_be_skipped_or_read_alone(full_ir):
+    data = encode_ir(full_ir)
+
+    without_evidence = decode_ir(data, load_evidence=False)
+
+    assert without_evidence.metadata.evidence == []
+    assert without_evidence.metadata.source_path == "pkg/report.py"
+    assert decode_evidence(data) == full_ir.metadata.evidence
+
+
+def test_rejects_foreign_and_damaged_payloads(full_ir):
+    data = encode_ir(full_ir)
+
+    assert not is_binary_ir(b'{"intent": {}}')
+    with pytest.raises(IRCodecError, match="magic"):
+        decode_ir(b"XXXX" + data[4:])
+    with pytest.raises(IRCodecError, match="truncated"):
+        decode_ir(data[:-5])
+    with pytest.raises(IRCodecError, match="version"):
+        decode_ir(data[:4] + bytes([FORMAT_VERSION + 1]) + data[5:])
+    with pytest.raises(IRCodecError, match="flags"):
+        decode_ir(data[:5] + b"\x01" + data[6:])
+
+
+def test_sections_are_plain_json(full_ir):
+    data = encode_ir(full_ir)
+    strings_len = int.from_bytes(data[6:10], "big")
+
+    strings = json.loads(data[18 : 18 + strings_len])
+
+    assert data[5] == 0
+    assert full_ir.intent.summary in strings
+
+
+def test_decoded_irs_share_strings(full_ir):
+    data = encode_ir(full_ir)
+
+    first, second = decode_ir(data), decode_ir(bytes(data))
+
+    assert first.signature.parameters[0].type_hint is second.signature.parameters[0].type_hint
+    assert first.intent.provenance.author is second.intent.provenance.author
@@ -521,3 +521,88 @@ class TestIRComparer:
         assert 0.85 < result.overall_similarity < 0.95
         assert result.signature_comparison.similarity < 1.0
         assert result.has_breaking_changes()  # Name change is ERROR severity
+
+
+class TestAlignedComparison:
+    """Tests for content-aligned clause comparison."""
+
+    @staticmethod
+    def _ir(predicates=(), effects=(), parameters=()):
+        return IntermediateRepresentation(
+            intent=IntentClause(summary="Test"),
+            signature=SigClause(name="func", parameters=list(parameters), returns="int"),
+            assertions=[AssertClause(predicate) for predicate in predicates],
+            effects=[EffectClause(description) for description in effects],
+        )
+
+    def test_assertion_inserted_at_top_is_single_addition(self):
+        """Inserting one assertion does not shift-report the following ones."""
+        comparer = IRComparer()
+        left = self._ir(predicates=["x > 0", "y > 0", "z > 0"])
+        right = self._ir(predicates=["w > 0", "x > 0", "y > 0", "z > 0"])
+
+        result = comparer.compare(left, right)
+
+        kinds = [d.kind for d in result.assertion_comparison.diffs]
+        assert kinds == [DiffKind.ASSERTION_COUNT, DiffKind.ASSERTION_ADDED]
+        added = result.assertion_comparison.diffs[1]
+        assert added.path == "assertions[0]"
+        assert added.right_value == "w > 0"
+
+    def test_effect_removed_from_middle(self):
+        comparer = IRComparer()
+        left = self._ir(effects=["read", "validate", "write"])
+        right = self._ir(effects=["read", "write"])
+
+        result = comparer.compare(left, right)
+
+        removed = [d for d in result.all_diffs() if d.kind == DiffKind.EFFECT_REMOVED]
+        assert len(removed) == 1
+        assert removed[0].left_value == "validate"
+        assert not any(d.kind == DiffKind.EFFECT_DESCRIPTION for d in result.all_diffs())
+
+    def test_reordered_assertions_are_moves(self):
+        comparer = IRComparer()
+        left = self._ir(predicates=["x > 0", "y > 0"])
+        right = self._ir(predicates=["y > 0", "x > 0"])
+
+        result = comparer.compare(left, right)
+
+        diffs = result.assertion_comparison.diffs
+        assert [d.kind for d in diffs] == [DiffKind.ASSERTION_MOVED]
+        assert diffs[0].severity == DiffSeverity.INFO
+        assert result.assertion_comparison.similarity == 1.0
+
+    def test_parameter_type_change_paired_by_name(self):
+        comparer = IRComparer()
+        left = self._ir(parameters=[Parameter("a", "int"), Parameter("b", "int")])
+        right = self._ir(
+            parameters=[Parameter("c", "int"), Parameter("a", "int"), Parameter("b", "str")]
+        )
+
+        result = comparer.compare(left, right)
+
+        kinds = {d.kind for d in result.signature_comparison.diffs}
+        assert kinds == {
+            DiffKind.PARAMETER_COUNT,
+            DiffKind.PARAMETER_ADDED,
+            DiffKind.PARAMETER_TYPE,
+        }
+        type_diff = next(
+            d for d in result.signature_comparison.diffs if d.kind == DiffKind.PARAMETER_TYPE
+        )
+        assert type_diff.path == "signature.parameters[2].type_hint"
+
+    def test_equal_fingerprints_short_circuit(self):
+        comparer = IRComparer()
+        left = self._ir(predicates=["x > 0"], effects=["read"], parameters=[Parameter("x", "int")])
+        right = IntermediateRepresentation.from_dict(left.to_dict())
+
+        result = comparer.compare(left, right)
+
+        assert result.is_identical()
+        assert result.overall_similarity == 1.0
+        full = comparer._compare_assertions(left, right)
+        assert result.assertion_comparison.total_fields == full.total_fields
+        full = comparer._compare_signature(left, right)
+        assert result.signature_comparison.total_fields == full.total_fields
@@ -0,0 +1,84 @@
+"""Tests for IR content fingerprints and the fingerprint-keyed LRU cache."""
+
+import pytest
+
+from lift_sys.ir.fingerprint import IRFingerprintCache, ir_fingerprint
+from lift_sys.ir.models import (
+    AssertClause,
+    IntentClause,
+    IntermediateRepresentation,
+    Parameter,
+    SigClause,
+)
+
+
+def _make_ir(predicate: str = "x > 0") -> IntermediateRepresentation:
+    return IntermediateRepresentation(
+        intent=IntentClause(summary="Check positive"),
+        signature=SigClause(
+            name="check",
+            parameters=[Parameter(name="x", type_hint="int")],
+            returns="bool",
+        ),
+        assertions=[AssertClause(predicate=predicate)],
+    )
+
+
+class TestIRFingerprint:
+    """Tests for ir_fingerprint."""
+
+    def test_equal_content_equal_fingerprint(self):
+        assert ir_fingerprint(_make_ir()) == ir_fingerprint(_make_ir())
+
+    def test_content_change_changes_fingerprint(self):
+        assert ir_fingerprint(_make_ir("x > 0")) != ir_fingerprint(_make_ir("x >= 0"))
+
+    def test_roundtrip_preserves_fingerprint(self):
+        ir = _make_ir()
+        restored = IntermediateRepresentation.from_dict(ir.to_dict())
+        assert ir_fingerprint(restored) == ir_fingerprint(ir)
+
+    def test_fingerprint_is_hex_digest(self):
+        fingerprint = ir_fingerprint(_make_ir())
+        assert len(fingerprint) == 64
+        int(fingerprint, 16)
+
+
+class TestIRFingerprintCache:
+    """Tests for IRFingerprintCache."""
+
+    def test_hit_and_miss_counting(self):
+        cache: IRFingerprintCache[str] = IRFingerprintCache(max_size=4)
+        assert cache.get("a") is None
+        cache.put("a", "value")
+        assert cache.get("a") == "value"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        cache: IRFingerprintCache[int] = IRFingerprintCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+
+    def test_clear_resets_stats(self):
+        cache: IRFingerprintCache[int] = IRFingerprintCache(max_size=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            IRFingerprintCache(max_size=0)
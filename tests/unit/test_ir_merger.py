@@ -884,3 +884,208 @@ class TestProvenancePreservation:
         assert len(result.merged_ir.effects) == 1
         assert result.merged_ir.effects[0].provenance is not None
         assert result.merged_ir.effects[0].provenance.author == "claude"
+
+
+class TestStructuralClauseMerging:
+    """Tests for identity-based merging of clause lists."""
+
+    @staticmethod
+    def _with_assertions(base_ir, assertions):
+        return IntermediateRepresentation(
+            intent=base_ir.intent,
+            signature=base_ir.signature,
+            effects=base_ir.effects,
+            assertions=assertions,
+            metadata=base_ir.metadata,
+        )
+
+    def test_clause_identity_ignores_whitespace(self):
+        """Test that reformatting a clause keeps its content hash."""
+        assert (
+            AssertClause(predicate="a >= 0").identity
+            == AssertClause(predicate="  a  >=   0 ").identity
+        )
+        assert AssertClause(predicate="a >= 0").identity != AssertClause(predicate="a > 0").identity
+
+    def test_whitespace_edit_is_not_delete_and_add(self, base_ir):
+        """Test that a reformatted assertion merges with an edit from the other branch."""
+        ours = self._with_assertions(
+            base_ir, [AssertClause(predicate="a  >=  0"), AssertClause(predicate="b >= 0")]
+        )
+        theirs = self._with_assertions(
+            base_ir,
+            [
+                AssertClause(predicate="a >= 0"),
+                AssertClause(predicate="b >= 0", rationale="Inputs are counts"),
+            ],
+        )
+
+        result = IRMerger().merge(base_ir, ours, theirs)
+
+        assert result.is_clean_merge()
+        assert [(a.predicate, a.rationale) for a in result.merged_ir.assertions] == [
+            ("a  >=  0", None),
+            ("b >= 0", "Inputs are counts"),
+        ]
+
+    def test_move_and_edit_merge_cleanly(self, base_ir):
+        """Test that a move in one branch combines with an edit in the other."""
+        base = self._with_assertions(
+            base_ir, [AssertClause(predicate=f"x{i} > 0") for i in range(4)]
+        )
+        # Theirs moves the first assertion to the end
+        theirs = self._with_assertions(
+            base_ir, [AssertClause(predicate=f"x{i} > 0") for i in (1, 2, 3, 0)]
+        )
+        ours = self._with_assertions(
+            base_ir,
+            [
+                AssertClause(predicate="x0 > 0", rationale="edited"),
+                *[AssertClause(predicate=f"x{i} > 0") for i in (1, 2, 3)],
+            ],
+        )
+
+        result = IRMerger().merge(base, ours, theirs)
+
+        assert result.is_clean_merge()
+        merged = result.merged_ir.assertions
+        assert [a.predicate for a in merged] == ["x1 > 0", "x2 > 0", "x3 > 0", "x0 > 0"]
+        assert merged[-1].rationale == "edited"
+
+    def test_provenance_identity_pairs_edited_clauses(self, base_ir):
+        """Test that an edited clause is tracked by its provenance id."""
+        from lift_sys.ir import Provenance
+
+        prov = Provenance.from_human(author="alice")
+        base = self._with_assertions(base_ir, [AssertClause(predicate="n > 0", provenance=prov)])
+        ours = self._with_assertions(
+            base_ir,
+            [AssertClause(predicate="n > 0", rationale="positive", provenance=prov)],
+        )
+        theirs = self._with_assertions(
+            base_ir,
+            [
+                AssertClause(predicate="m > 0"),
+                AssertClause(predicate="n >= 1", provenance=prov),
+            ],
+        )
+
+        result = IRMerger().merge(base, ours, theirs)
+
+        assert result.is_clean_merge()
+        assert [(a.predicate, a.rationale) for a in result.merged_ir.assertions] == [
+            ("m > 0", None),
+            ("n >= 1", "positive"),
+        ]
+
+    def test_delete_versus_edit_conflict(self, base_ir):
+        """Test that deleting a clause the other branch edited is a conflict."""
+        ours = self._with_assertions(base_ir, [AssertClause(predicate="a >= 0")])
+        theirs = self._with_assertions(
+            base_ir,
+            [AssertClause(predicate="a >= 0"), AssertClause(predicate="b >= 1")],
+        )
+
+        result = IRMerger().merge(base_ir, ours, theirs)
+        assert result.has_conflicts
+        conflict = result.unresolved_conflicts()[0]
+        assert conflict.path == "assertions[predicate=b >= 0]"
+        assert [a.predicate for a in result.merged_ir.assertions] == ["a >= 0", "b >= 1"]
+
+        result = IRMerger(strategy=MergeStrategy.OURS).merge(base_ir, ours, theirs)
+        assert [a.predicate for a in result.merged_ir.assertions] == ["a >= 0"]
+
+    def test_identical_additions_are_inserted_once(self, base_ir):
+        """Test that both branches adding the same clause yields one copy."""
+        added = [
+            AssertClause(predicate="a >= 0"),
+            AssertClause(predicate="b >= 0"),
+            AssertClause(predicate="a + b >= 0"),
+        ]
+        ours = self._with_assertions(base_ir, added)
+        theirs = self._with_assertions(
+            base_ir, [AssertClause(predicate=a.predicate) for a in added]
+        )
+
+        result = IRMerger().merge(base_ir, ours, theirs)
+
+        assert [a.predicate for a in result.merged_ir.assertions] == [
+            "a >= 0",
+            "b >= 0",
+            "a + b >= 0",
+        ]
+
+    def test_additions_keep_their_position(self, base_ir):
+        """Test that additions are inserted after the clause they follow."""
+        ours = self._with_assertions(
+            base_ir,
+            [
+                AssertClause(predicate="ours first"),
+                AssertClause(predicate="a >= 0"),
+                AssertClause(predicate="b >= 0"),
+            ],
+        )
+        theirs = self._with_assertions(
+            base_ir,
+            [
+                AssertClause(predicate="a >= 0"),
+                AssertClause(predicate="theirs middle"),
+                AssertClause(predicate="b >= 0"),
+            ],
+        )
+
+        result = IRMerger().merge(base_ir, ours, theirs)
+
+        assert [a.predicate for a in result.merged_ir.assertions] == [
+            "ours first",
+            "a >= 0",
+            "theirs middle",
+            "b >= 0",
+        ]
+
+    def test_parameters_pair_by_name(self, base_ir):
+        """Test that reordered parameters are merged by name, not position."""
+        ours = IntermediateRepresentation(
+            intent=base_ir.intent,
+            signature=SigClause(
+                name="add",
+                parameters=[
+                    Parameter(name="b", type_hint="int"),
+                    Parameter(name="a", type_hint="int"),
+                ],
+                returns="int",
+            ),
+        )
+        theirs = IntermediateRepresentation(
+            intent=base_ir.intent,
+            signature=SigClause(
+                name="add",
+                parameters=[
+                    Parameter(name="a", type_hint="int", description="First"),
+                    Parameter(name="b", type_hint="int"),
+                ],
+                returns="int",
+            ),
+        )
+        base = IntermediateRepresentation(intent=base_ir.intent, signature=base_ir.signature)
+
+        result = IRMerger().merge(base, ours, theirs)
+
+        assert result.is_clean_merge()
+        params = result.merged_ir.signature.parameters
+        assert [(p.name, p.description) for p in params] == [("b", None), ("a", "First")]
+
+    def test_merge_results_are_memoized(self, base_ir, ours_ir_conflict, theirs_ir_conflict):
+        """Test that repeated merges hit the cache and return independent results."""
+        merger = IRMerger()
+        first = merger.merge(base_ir, ours_ir_conflict, theirs_ir_conflict)
+        first.conflicts[0].resolution = ConflictResolution.TOOK_OURS
+
+        second = merger.merge(base_ir, ours_ir_conflict, theirs_ir_conflict)
+
+        assert merger.cache_stats()["hits"] == 1
+        assert second.conflicts[0].resolution == ConflictResolution.MANUAL_REQUIRED
+        assert second.to_dict() != first.to_dict()
+
+        merger.merge(base_ir, ours_ir_conflict, theirs_ir_conflict, strategy=MergeStrategy.OURS)
+        assert merger.cache_stats()["misses"] == 2
@@ -1,5 +1,7 @@
 """Tests for IR versioning system."""
 
+import json
+
 import pytest
 
 from lift_sys.ir import (
@@ -8,9 +10,13 @@ from lift_sys.ir import (
     IntermediateRepresentation,
     IRVersion,
     Parameter,
+    Provenance,
     SigClause,
+    TypedHole,
     VersionedIR,
     VersionMetadata,
+    apply_patch,
+    diff_documents,
 )
 
 
@@ -409,3 +415,116 @@ class TestVersionedIR:
         assert v2.version_metadata.metadata["review_status"] == "approved"
         assert v2.version_metadata.metadata["reviewer"] == "charlie"
         assert v2.version_metadata.metadata["test_coverage"] == 0.95
+
+
+class TestDeltaStorage:
+    """Tests for keyframe + patch version storage."""
+
+    @staticmethod
+    def _history(count, keyframe_interval=4):
+        """Build a history where each version appends one assertion."""
+        versioned_ir = VersionedIR(keyframe_interval=keyframe_interval, cache_size=2)
+        snapshots = []
+        for index in range(count):
+            ir = IntermediateRepresentation(
+                intent=IntentClause(summary="Validate input"),
+                signature=SigClause(
+                    name="check", parameters=[Parameter(name="x", type_hint="int")], returns="bool"
+                ),
+                assertions=[AssertClause(predicate=f"x > {n}") for n in range(index + 1)],
+            )
+            versioned_ir.create_version(ir=ir, author=f"user{index % 2}")
+            snapshots.append(ir.to_dict())
+        return versioned_ir, snapshots
+
+    def test_versions_are_stored_as_keyframes_and_patches(self):
+        versioned_ir, _ = self._history(10, keyframe_interval=4)
+
+        stats = versioned_ir.cache_stats()
+
+        assert stats["keyframes"] == 3  # versions 1, 5 and 9
+        assert stats["deltas"] == 7
+        data = versioned_ir.to_dict()
+        assert "ir" in data["versions"][4] and "patch" not in data["versions"][4]
+        assert "patch" in data["versions"][5] and "ir" not in data["versions"][5]
+
+    def test_historical_versions_are_reconstructed(self):
+        versioned_ir, snapshots = self._history(10)
+
+        # The LRU only holds two versions, so most of these are rebuilt
+        for version in (7, 2, 10, 1, 6):
+            ir_version = versioned_ir.get_version(version)
+            assert ir_version.ir.to_dict() == snapshots[version - 1]
+
+        diff = versioned_ir.get_version(6).version_metadata.diff_from_parent
+        assert diff.left_ir.to_dict() == snapshots[4]
+        assert len(diff.assertion_comparison.diffs) == 2  # count + one added
+        assert [v.ir.to_dict() for v in versioned_ir.versions] == snapshots
+
+    def test_serialized_history_excludes_diff_snapshots(self):
+        versioned_ir, snapshots = self._history(20)
+
+        data = versioned_ir.to_dict()
+        restored = VersionedIR.from_dict(data)
+
+        assert "left_ir" not in str(data)
+        assert [v.ir.to_dict() for v in restored.versions] == snapshots
+        assert restored.get_version(12).version_metadata.diff_from_parent is not None
+
+    def test_loads_legacy_full_snapshot_format(self):
+        versioned_ir, snapshots = self._history(6)
+        legacy = {
+            "current_version": 6,
+            "versions": [v.to_dict() for v in versioned_ir.versions],
+        }
+
+        restored = VersionedIR.from_dict(legacy)
+
+        assert restored.cache_stats()["keyframes"] == 1
+        assert [v.ir.to_dict() for v in restored.versions] == snapshots
+        assert restored.get_version(3).version_metadata.diff_from_parent.overall_similarity < 1.0
+
+    def test_compare_versions_is_cached(self):
+        versioned_ir, _ = self._history(5)
+
+        first = versioned_ir.compare_versions(1, 5)
+        second = versioned_ir.compare_versions(1, 5)
+
+        assert first is second
+        assert versioned_ir.cache_stats()["comparison_cache"]["hits"] == 1
+
+    def test_historical_versions_keep_their_nested_values(self):
+        versioned_ir = VersionedIR(keyframe_interval=10, cache_size=1)
+        for step in range(3):
+            ir = IntermediateRepresentation(
+                intent=IntentClause(
+                    summary="Validate input",
+                    holes=[TypedHole("limit", "int", constraints={"max": str(step)})],
+                    provenance=Provenance(timestamp="t", metadata={"step": step}),
+                ),
+                signature=SigClause(name="check", parameters=[], returns="bool"),
+            )
+            versioned_ir.create_version(ir=ir)
+
+        # Rebuild every version by replaying patches, then read them back
+        for restored in (versioned_ir, VersionedIR.from_dict(versioned_ir.to_dict())):
+            restored._version_cache.clear()
+            versions = list(restored.versions)
+            for step, version in enumerate(versions):
+                intent = version.ir.intent
+                assert intent.provenance.metadata == {"step": step}
+                assert intent.holes[0].constraints == {"max": str(step)}
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ({"flag": 1}, {"flag": True}),
+            ({"flag": True}, {"flag": 1}),
+            ({"bound": 1}, {"bound": 1.0}),
+            ({"values": [0, 1]}, {"values": [False, True]}),
+        ],
+    )
+    def test_patch_round_trip_keeps_scalar_types(self, old, new):
+        # json.dumps tells 1, 1.0 and true apart where == does not
+        assert json.dumps(apply_patch(old, diff_documents(old, new))) == json.dumps(new)
+        assert json.dumps(apply_patch(new, diff_documents(new, old))) == json.dumps(old)
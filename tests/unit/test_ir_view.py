@@ -0,0 +1,125 @@
+"""Tests for read-only lazy IR views."""
+
+import dataclasses
+import json
+
+import pytest
+
+from lift_sys.analysis import AgentAdvisor
+from lift_sys.ir.codec import encode_ir
+from lift_sys.ir.models import (
+    AssertClause,
+    EffectClause,
+    HoleKind,
+    IntentClause,
+    IntermediateRepresentation,
+    Metadata,
+    Parameter,
+    Provenance,
+    ProvenanceSource,
+    RelationshipClause,
+    SigClause,
+    TypedHole,
+)
+from lift_sys.ir.view import IRView
+
+
+@pytest.fixture
+def ir():
+    provenance = Provenance.from_reverse(evidence_refs=["ev-1"], author="lifter")
+    return IntermediateRepresentation(
+        intent=IntentClause(
+            summary="Find a user",
+            rationale="lookup",
+            holes=[TypedHole("policy", "Policy", "matching", kind=HoleKind.INTENT)],
+            provenance=provenance,
+        ),
+        signature=SigClause(
+            name="find_user",
+            parameters=[Parameter("user_id", "int", "primary key", provenance)],
+            returns="User",
+        ),
+        effects=[EffectClause("query the users table", provenance=Provenance.from_human("ann"))],
+        assertions=[
+            AssertClause("user_id > 0", holes=[TypedHole("bound", "int", kind=HoleKind.ASSERTION)])
+        ],
+        relationships=[RelationshipClause("find_user", "users", "READS")],
+        metadata=Metadata(source_path="app/users.py", origin="reverse", evidence=[{"id": "ev-1"}]),
+    )
+
+
+def assert_matches(view, expected, path="ir"):
+    """Compare a view against a dataclass tree field by field."""
+    if dataclasses.is_dataclass(expected):
+        for field in dataclasses.fields(expected):
+            assert_matches(
+                getattr(view, field.name), getattr(expected, field.name), f"{path}.{field.name}"
+            )
+    elif isinstance(expected, list):
+        assert len(view) == len(expected), path
+        for index, (item, expected_item) in enumerate(zip(view, expected, strict=True)):
+            assert_matches(item, expected_item, f"{path}[{index}]")
+    else:
+        assert view == expected, path
+
+
+@pytest.mark.parametrize("form", ["dict", "json", "binary"])
+def test_view_exposes_dataclass_attributes(ir, form):
+    payload = {
+        "dict": ir.to_dict(),
+        "json": json.dumps(ir.to_dict()),
+        "binary": encode_ir(ir),
+    }[form]
+
+    view = IRView(payload)
+
+    assert view.is_binary == (form == "binary")
+    for name in ("intent", "signature", "effects", "assertions", "relationships"):
+        assert_matches(getattr(view, name), getattr(ir, name), name)
+    assert view.effects[0].provenance.source is ProvenanceSource.HUMAN
+    assert list(view.metadata.evidence) == ir.metadata.evidence
+    assert [hole.identifier for hole in view.typed_holes()] == ["policy", "bound"]
+    assert view.to_ir() == ir
+
+
+def test_binary_view_decodes_sections_on_first_access(ir):
+    view = IRView(encode_ir(ir))
+
+    assert view._core is None
+    assert view.signature.name == "find_user"
+    assert view._core is not None
+    assert "evidence" not in view.metadata._cache
+    assert view.metadata.evidence == ({"id": "ev-1"},)
+
+
+def test_json_view_returns_wrapped_payload(ir):
+    payload = ir.to_dict()
+
+    assert IRView(payload).to_dict() is payload
+
+
+def test_view_is_read_only(ir):
+    view = IRView(ir.to_dict())
+
+    with pytest.raises(AttributeError):
+        view.intent.summary = "changed"
+    with pytest.raises(AttributeError):
+        view.signature = None
+    with pytest.raises(AttributeError):
+        view.intent.unknown_field  # noqa: B018
+
+
+def test_legacy_string_effects(ir):
+    payload = ir.to_dict()
+    payload["effects"] = ["writes a log line"]
+
+    assert IRView(payload).effects[0].description == "writes a log line"
+
+
+def test_agent_advisor_accepts_view(ir):
+    advisor = AgentAdvisor()
+
+    from_view = advisor.analyze(IRView(encode_ir(ir)))
+    from_ir = advisor.analyze(ir)
+
+    assert from_view.to_dict() == from_ir.to_dict()
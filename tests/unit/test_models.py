@@ -316,3 +316,40 @@ class TestIRModels:
 
         # Check assertions preserved
         assert len(ir_dict["assertions"]) == len(complex_ir.assertions)
+
+    def test_from_dict_shares_vocabulary_strings(self):
+        """Test that separately loaded IRs share interned type hints and authors."""
+        import json
+
+        from lift_sys.ir.models import Provenance
+
+        ir = IntermediateRepresentation(
+            intent=IntentClause(summary="test"),
+            signature=SigClause(
+                name="test",
+                parameters=[
+                    Parameter(
+                        name="records",
+                        type_hint="list[dict[str, int]]",
+                        provenance=Provenance.from_reverse(
+                            evidence_refs=["daikon-1"], author="lifter"
+                        ),
+                    )
+                ],
+                returns="dict[str, int]",
+            ),
+            metadata=Metadata(language="python"),
+        )
+        payload = json.dumps(ir.to_dict())
+
+        first = IntermediateRepresentation.from_dict(json.loads(payload))
+        second = IntermediateRepresentation.from_dict(json.loads(payload))
+
+        first_param = first.signature.parameters[0]
+        second_param = second.signature.parameters[0]
+        assert first_param.type_hint is second_param.type_hint
+        assert first_param.provenance.author is second_param.provenance.author
+        assert first_param.provenance.evidence_refs[0] is second_param.provenance.evidence_refs[0]
+        assert first.signature.returns is second.signature.returns
+        assert first.metadata.language is second.metadata.language
+        assert first.to_dict() == ir.to_dict()
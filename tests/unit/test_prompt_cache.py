@@ -0,0 +1,135 @@
+"""Tests for prompt-prefix caching of IR and code generation prompts."""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from lift_sys.codegen.code_schema import (
+    CODE_GENERATION_INSTRUCTIONS,
+    get_prompt_for_code_generation,
+)
+from lift_sys.forward_mode.xgrammar_translator import XGrammarIRTranslator
+from lift_sys.ir.schema import IR_GENERATION_INSTRUCTIONS, get_prompt_for_ir_generation
+from lift_sys.providers.anthropic_provider import AnthropicProvider
+from lift_sys.providers.mock import MockProvider
+from lift_sys.providers.modal_provider import ModalProvider
+from lift_sys.providers.prompt_cache import PromptCacheMetrics, split_prompt
+
+IR_DOCUMENT = {
+    "intent": {"summary": "Add two integers"},
+    "signature": {
+        "name": "add",
+        "parameters": [{"name": "a", "type_hint": "int"}, {"name": "b", "type_hint": "int"}],
+        "returns": "int",
+    },
+}
+
+
+class RecordingProvider(MockProvider):
+    """Mock provider that remembers the keyword arguments of each call."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[dict] = []
+        self.set_structured_response(IR_DOCUMENT)
+
+    async def generate_structured(self, prompt, schema, **kwargs):
+        self.calls.append({"prompt": prompt, **kwargs})
+        return await super().generate_structured(prompt, schema)
+
+
+class TestPromptSplit:
+    @pytest.mark.parametrize("request_text", ["add two numbers", "{braces} and\nnewlines"])
+    def test_prompts_start_with_stable_instructions(self, request_text):
+        ir_prompt = get_prompt_for_ir_generation(request_text)
+        code_prompt = get_prompt_for_code_generation(request_text, "def f():", [request_text])
+
+        assert ir_prompt.startswith(IR_GENERATION_INSTRUCTIONS)
+        assert request_text not in IR_GENERATION_INSTRUCTIONS
+        assert request_text in ir_prompt[len(IR_GENERATION_INSTRUCTIONS) :]
+        assert code_prompt.startswith(CODE_GENERATION_INSTRUCTIONS)
+        assert "def f():" in code_prompt[len(CODE_GENERATION_INSTRUCTIONS) :]
+
+    def test_split_prompt(self):
+        assert split_prompt("prefix + rest", "prefix") == ("prefix", " + rest")
+        assert split_prompt("other prompt", "prefix") is None
+        assert split_prompt("prefix", "prefix") is None
+        assert split_prompt("prompt", None) is None
+
+    def test_metrics(self):
+        metrics = PromptCacheMetrics()
+        metrics.record(1000, cache_write_tokens=900)
+        metrics.record(1000, cached_tokens=900)
+
+        assert metrics.hit_rate == 0.5
+        assert metrics.token_savings == 0.45
+        assert metrics.to_dict()["cache_write_tokens"] == 900
+
+
+class TestAnthropicPromptCaching:
+    def test_prefix_sent_with_cache_breakpoint(self):
+        prompt = get_prompt_for_ir_generation("add two numbers")
+
+        kwargs = AnthropicProvider()._message_kwargs(
+            prompt, 1024, 0.3, None, None, cache_prefix=IR_GENERATION_INSTRUCTIONS
+        )
+
+        prefix_block, suffix_block = kwargs["messages"][0]["content"]
+        assert prefix_block == {
+            "type": "text",
+            "text": IR_GENERATION_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert prefix_block["text"] + suffix_block["text"] == prompt
+        assert "cache_control" not in suffix_block
+
+    def test_prompt_without_prefix_is_sent_unchanged(self):
+        kwargs = AnthropicProvider()._message_kwargs("hello", 16, 0.0, None, None, "prefix")
+
+        assert kwargs["messages"][0]["content"] == "hello"
+
+    def test_usage_is_recorded(self):
+        provider = AnthropicProvider()
+        provider._record_usage(
+            SimpleNamespace(
+                input_tokens=50, cache_read_input_tokens=1100, cache_creation_input_tokens=0
+            )
+        )
+
+        metrics = provider.prompt_cache_metrics
+        assert metrics.prompt_tokens == 1150
+        assert metrics.cached_tokens == 1100
+        assert metrics.cache_hits == 1
+
+
+class TestModalPromptCaching:
+    @pytest.mark.asyncio
+    async def test_cached_token_counts_are_recorded(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["prompt"].startswith(IR_GENERATION_INSTRUCTIONS)
+            return httpx.Response(
+                200, json={"text": IR_DOCUMENT, "prompt_tokens": 1200, "cached_tokens": 1184}
+            )
+
+        provider = ModalProvider("http://modal.test/generate", batch_window=0)
+        provider._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        ir = await XGrammarIRTranslator(provider).translate("add two numbers")
+        await provider.aclose()
+
+        assert ir.signature.name == "add"
+        assert provider.prompt_cache_metrics.token_savings == pytest.approx(1184 / 1200)
+
+
+class TestPrefixPassedToProviders:
+    @pytest.mark.asyncio
+    async def test_translator_passes_cache_prefix(self):
+        provider = RecordingProvider()
+
+        await XGrammarIRTranslator(provider).translate("add two numbers")
+
+        call = provider.calls[0]
+        assert call["cache_prefix"] == IR_GENERATION_INSTRUCTIONS
+        assert call["prompt"].startswith(call["cache_prefix"])
@@ -0,0 +1,184 @@
+"""Tests for micro-batching of concurrent structured-generation calls."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from lift_sys.providers.batching import MicroBatcher
+from lift_sys.providers.modal_provider import ModalProvider
+
+
+class FakeModalEndpoint:
+    """httpx transport handler standing in for the generate and batch endpoints."""
+
+    def __init__(self, batch_status: int = 200):
+        self.batch_status = batch_status
+        self.requests: list[tuple[str, dict]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append((request.url.path, body))
+        if request.url.path == "/generate_batch":
+            if self.batch_status != 200:
+                return httpx.Response(self.batch_status, text="not found")
+            results = [self._result(item) for item in body["requests"]]
+            return httpx.Response(200, json={"results": results})
+        return httpx.Response(200, json=self._result(body))
+
+    @staticmethod
+    def _result(body: dict) -> dict:
+        if body["prompt"] == "bad":
+            return {"error": "Invalid JSON generated", "raw_output": "{"}
+        return {"text": {"echo": body["prompt"], "temperature": body["temperature"]}}
+
+
+def modal_provider(endpoint: FakeModalEndpoint, **kwargs) -> ModalProvider:
+    provider = ModalProvider("http://modal.test/generate", **kwargs)
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(endpoint))
+    return provider
+
+
+class TestMicroBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_a_batch(self):
+        batches = []
+
+        async def send(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(send, window=0.01, max_batch_size=10)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+        assert results == [0, 2, 4, 6]
+        assert batches == [[0, 1, 2, 3]]
+        assert batcher.avg_batch_size == 4
+
+    @pytest.mark.asyncio
+    async def test_full_queue_sends_without_waiting_for_window(self):
+        batches = []
+
+        async def send(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(send, window=60, max_batch_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert batches == [[0, 1], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_their_own_caller(self):
+        async def send(items):
+            return [ValueError(item) if item == "bad" else item for item in items]
+
+        batcher = MicroBatcher(send, window=0.01)
+        good, bad = await asyncio.gather(
+            batcher.submit("good"), batcher.submit("bad"), return_exceptions=True
+        )
+
+        assert good == "good"
+        assert isinstance(bad, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_caller(self):
+        async def send(items):
+            raise ConnectionError("down")
+
+        batcher = MicroBatcher(send, window=0.01)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_is_dropped_before_send(self):
+        batches = []
+
+        async def send(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(send, window=0.05)
+        cancelled = asyncio.ensure_future(batcher.submit("cancelled"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await batcher.submit("kept") == "kept"
+        assert batches == [["kept"]]
+
+
+class TestModalBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_use_one_batch_request(self):
+        endpoint = FakeModalEndpoint()
+        provider = modal_provider(endpoint)
+        schema = {"type": "object"}
+
+        results = await asyncio.gather(
+            *(provider.generate_structured(f"p{i}", schema, temperature=0.1 * i) for i in range(3))
+        )
+        await provider.aclose()
+
+        assert [result["echo"] for result in results] == ["p0", "p1", "p2"]
+        assert results[2]["temperature"] == pytest.approx(0.2)
+        assert [path for path, _ in endpoint.requests] == ["/generate_batch"]
+        assert len(endpoint.requests[0][1]["requests"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_single_call_uses_generate_endpoint(self):
+        endpoint = FakeModalEndpoint()
+        provider = modal_provider(endpoint)
+
+        result = await provider.generate_structured("solo", {"type": "object"})
+        await provider.aclose()
+
+        assert result["echo"] == "solo"
+        assert [path for path, _ in endpoint.requests] == ["/generate"]
+
+    @pytest.mark.asyncio
+    async def test_item_error_only_fails_its_caller(self):
+        provider = modal_provider(FakeModalEndpoint())
+
+        good, bad = await asyncio.gather(
+            provider.generate_structured("good", {}),
+            provider.generate_structured("bad", {}),
+            return_exceptions=True,
+        )
+        await provider.aclose()
+
+        assert good["echo"] == "good"
+        assert isinstance(bad, ValueError) and "Invalid JSON generated" in str(bad)
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_endpoint_falls_back_to_single_requests(self):
+        endpoint = FakeModalEndpoint(batch_status=404)
+        provider = modal_provider(endpoint)
+
+        first = await asyncio.gather(*(provider.generate_structured(p, {}) for p in "ab"))
+        second = await asyncio.gather(*(provider.generate_structured(p, {}) for p in "cd"))
+        await provider.aclose()
+
+        assert [result["echo"] for result in first + second] == ["a", "b", "c", "d"]
+        paths = [path for path, _ in endpoint.requests]
+        assert paths.count("/generate_batch") == 1
+        assert paths.count("/generate") == 4
+
+    @pytest.mark.asyncio
+    async def test_batching_can_be_disabled(self):
+        endpoint = FakeModalEndpoint()
+        provider = modal_provider(endpoint, batch_window=0)
+
+        await asyncio.gather(*(provider.generate_structured(p, {}) for p in "ab"))
+        await provider.aclose()
+
+        assert [path for path, _ in endpoint.requests] == ["/generate", "/generate"]
+
+    def test_batch_url_derived_from_label_url(self):
+        provider = ModalProvider("https://rand--qwen-80b-generate.modal.run")
+
+        assert provider.batch_url == "https://rand--qwen-80b-generate-batch.modal.run"
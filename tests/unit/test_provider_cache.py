@@ -0,0 +1,178 @@
+"""Tests for the caching provider decorator and its disk store."""
+
+import os
+
+import pytest
+
+from lift_sys.providers.caching import (
+    CacheMode,
+    CachingProvider,
+    DiskResponseStore,
+    ReplayMissError,
+)
+from lift_sys.providers.mock import MockProvider
+
+
+class CountingProvider(MockProvider):
+    """Mock provider that numbers its responses so repeats are visible."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def generate_text(self, prompt: str, max_tokens=1000, temperature=0.7, **kwargs):
+        self.calls += 1
+        return f"{prompt} #{self.calls}"
+
+    async def generate_structured(self, prompt: str, schema: dict, temperature=0.0, **kwargs):
+        self.calls += 1
+        return {"answer": prompt, "call": self.calls}
+
+    async def generate_stream(self, prompt: str, temperature=0.0, **kwargs):
+        self.calls += 1
+        for word in ["def ", "add", "()"]:
+            yield word
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DiskResponseStore(tmp_path / "responses")
+
+
+class TestCachingProvider:
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_are_cached(self, store):
+        inner = CountingProvider()
+        provider = CachingProvider(inner, store)
+
+        first = await provider.generate_text("hello", temperature=0.0)
+        second = await provider.generate_text("hello", temperature=0.0)
+        other = await provider.generate_text("hello", temperature=0.0, max_tokens=5)
+
+        assert first == second == "hello #1"
+        assert other == "hello #2"
+        assert provider.cache_stats() == {"hits": 1, "misses": 2, "bypassed": 0}
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_bypass_unless_seeded(self, store):
+        inner = CountingProvider()
+        provider = CachingProvider(inner, store)
+
+        assert await provider.generate_text("hi") != await provider.generate_text("hi")
+        seeded = await provider.generate_text("hi", temperature=0.9, seed=7)
+
+        assert await provider.generate_text("hi", temperature=0.9, seed=7) == seeded
+        assert provider.bypassed == 2
+        assert provider.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_key_includes_schema_and_model(self, store):
+        provider = CachingProvider(CountingProvider(), store, model_id="model-a")
+        schema = {"type": "object"}
+
+        first = await provider.generate_structured("q", schema)
+        assert await provider.generate_structured("q", schema) == first
+        assert await provider.generate_structured("q", {"type": "array"}) != first
+        assert await provider.generate_structured("q", schema, model="model-b") != first
+
+        other_model = CachingProvider(CountingProvider(), store, model_id="model-c")
+        assert (await other_model.generate_structured("q", schema))["call"] == 1
+
+    @pytest.mark.asyncio
+    async def test_text_calls_keep_inner_provider_defaults(self, store):
+        class GreedyProvider(CountingProvider):
+            async def generate_text(self, prompt: str, max_tokens=4096, temperature=0.0, **kwargs):
+                self.received = {"max_tokens": max_tokens, "temperature": temperature, **kwargs}
+                return await super().generate_text(prompt)
+
+        inner = GreedyProvider()
+        provider = CachingProvider(inner, store)
+
+        first = await provider.generate_text("hello")
+        second = await provider.generate_text("hello")
+
+        assert inner.received == {"max_tokens": 4096, "temperature": 0.0}
+        # The inner default temperature is deterministic, so the response is cached
+        assert first == second
+        assert provider.cache_stats() == {"hits": 1, "misses": 1, "bypassed": 0}
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay_offline(self, store):
+        recorder = CachingProvider(CountingProvider(), store, mode=CacheMode.RECORD)
+        recorded = await recorder.generate_text("sampled", temperature=0.8)
+        await recorder.generate_text("sampled", temperature=0.8)
+
+        inner = CountingProvider()
+        replayer = CachingProvider(inner, store, mode="replay")
+
+        assert await replayer.generate_text("sampled", temperature=0.8) == "sampled #2"
+        assert recorded == "sampled #1"
+        assert inner.calls == 0
+        with pytest.raises(ReplayMissError):
+            await replayer.generate_text("never recorded")
+
+    @pytest.mark.asyncio
+    async def test_stream_is_recorded_and_replayed(self, store):
+        inner = CountingProvider()
+        provider = CachingProvider(inner, store)
+
+        chunks = [chunk async for chunk in provider.generate_stream("p")]
+        replayed = [chunk async for chunk in provider.generate_stream("p")]
+
+        assert chunks == ["def ", "add", "()"]
+        assert replayed == ["def add()"]
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_stream_is_not_stored(self, store):
+        inner = CountingProvider()
+        provider = CachingProvider(inner, store)
+
+        stream = provider.generate_stream("p")
+        await stream.__anext__()
+        await stream.aclose()
+        _ = [chunk async for chunk in provider.generate_stream("p")]
+
+        assert inner.calls == 2
+
+    def test_delegates_provider_attributes(self, store):
+        inner = CountingProvider()
+        provider = CachingProvider(inner, store)
+
+        assert provider.name == "mock"
+        assert provider.capabilities is inner.capabilities
+        assert provider.stream_metrics is inner.stream_metrics
+        assert provider.set_response == inner.set_response
+
+
+class TestDiskResponseStore:
+    def test_round_trip_survives_new_instance(self, tmp_path):
+        DiskResponseStore(tmp_path).put("ab" * 32, {"x": [1, 2]}, {"prompt": "p"})
+
+        assert DiskResponseStore(tmp_path).get("ab" * 32) == {"x": [1, 2]}
+        assert DiskResponseStore(tmp_path).get("cd" * 32) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        writer = DiskResponseStore(tmp_path)
+        for key, response in zip(keys[:2], ["zero", "one"], strict=True):
+            writer.put(key, response, {})
+        for path in tmp_path.glob("*/*.json"):
+            os.utime(path, (1_000_000, 1_000_000))
+
+        store = DiskResponseStore(tmp_path, max_entries=2)
+        store.get(keys[0])
+
+        store.put(keys[2], "two", {})
+
+        assert len(store) == 2
+        assert store.get(keys[1]) is None
+        assert store.get(keys[0]) == "zero"
+
+    def test_evicts_by_size(self, tmp_path):
+        store = DiskResponseStore(tmp_path, max_entries=None, max_bytes=600)
+        for i in range(5):
+            store.put(f"{i:02d}" * 32, "x" * 100, {})
+
+        assert 0 < len(store) < 5
+        assert store.get("04" * 32) == "x" * 100
@@ -0,0 +1,235 @@
+"""Tests for hedged requests, failover and circuit breaking across providers."""
+
+import asyncio
+
+import pytest
+
+from lift_sys.providers.hedging import (
+    BackendStats,
+    CircuitBreaker,
+    CircuitState,
+    HedgedProvider,
+    NoBackendAvailableError,
+)
+from lift_sys.providers.mock import MockProvider
+
+
+class TimedProvider(MockProvider):
+    """Mock backend with a fixed delay that can be told to fail."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_text(self, prompt: str, max_tokens=1000, temperature=0.7, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ConnectionError(f"{self.name} unavailable")
+        return f"{self.name}: {prompt}"
+
+    async def generate_stream(self, prompt: str, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError(f"{self.name} unavailable")
+        for word in [self.name, " says ", prompt]:
+            yield word
+
+
+class StructuredProvider(TimedProvider):
+    """Timed backend whose structured output names the backend that produced it."""
+
+    async def generate_structured(self, prompt: str, schema: dict, **kwargs):
+        await self.generate_text(prompt)
+        return {"backend": self.name}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBackendStats:
+    def test_percentiles_and_error_rate(self):
+        stats = BackendStats(window=10)
+        for latency in [0.1, 0.2, 0.3, 0.4, 1.0]:
+            stats.record(True, latency)
+        stats.record(False)
+
+        assert stats.p50 == 0.3
+        assert stats.p95 == 1.0
+        assert stats.error_rate == pytest.approx(1 / 6)
+        assert stats.to_dict()["p95_ms"] == 1000.0
+
+
+class TestCircuitBreaker:
+    def test_opens_on_error_rate_then_probes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(error_threshold=0.5, min_requests=4, reset_timeout=10, clock=clock)
+        stats = BackendStats()
+        for success in [True, False, True, False]:
+            stats.record(success, 0.1)
+            breaker.record(success, stats)
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.acquire()
+
+        clock.now = 10
+        assert breaker.acquire()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert not breaker.acquire()  # only one probe at a time
+
+        stats.record(True, 0.1)
+        breaker.record(True, stats)
+        assert breaker.state is CircuitState.CLOSED
+        assert stats.error_rate == 0.0
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_requests=1, reset_timeout=5, clock=clock)
+        stats = BackendStats()
+        stats.record(False)
+        breaker.record(False, stats)
+        clock.now = 5
+        assert breaker.acquire()
+
+        stats.record(False)
+        breaker.record(False, stats)
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.available()
+
+
+class TestHedgedProvider:
+    @pytest.mark.asyncio
+    async def test_fast_primary_sends_no_hedge(self):
+        primary, secondary = TimedProvider("primary"), TimedProvider("secondary")
+        provider = HedgedProvider([primary, secondary], initial_hedge_delay=0.5)
+
+        assert await provider.generate_text("hi") == "primary: hi"
+        assert secondary.calls == 0
+        assert provider.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        primary = TimedProvider("primary", delay=5.0)
+        secondary = TimedProvider("secondary", delay=0.01)
+        provider = HedgedProvider([primary, secondary], initial_hedge_delay=0.05)
+
+        result = await asyncio.wait_for(provider.generate_text("hi"), timeout=1)
+
+        assert result == "secondary: hi"
+        assert primary.cancelled == 1
+        assert provider.hedges == provider.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_follows_primary_percentile(self):
+        primary = TimedProvider("primary", delay=0.01)
+        secondary = TimedProvider("secondary")
+        provider = HedgedProvider([primary, secondary], min_samples=3, min_hedge_delay=0.0)
+        for _ in range(3):
+            await provider.generate_text("warm")
+
+        delay = provider._hedge_delay(provider.backends[0])
+
+        assert 0.01 <= delay < 0.5
+        assert secondary.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_over_immediately(self):
+        primary = TimedProvider("primary", fail=True)
+        secondary = TimedProvider("secondary")
+        provider = HedgedProvider([primary, secondary], initial_hedge_delay=10)
+
+        result = await asyncio.wait_for(provider.generate_text("hi"), timeout=1)
+
+        assert result == "secondary: hi"
+        assert provider.failovers == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_result_loses(self):
+        primary, secondary = TimedProvider("primary"), TimedProvider("secondary")
+        provider = HedgedProvider(
+            [primary, secondary], validator=lambda text: text.startswith("secondary")
+        )
+
+        assert await provider.generate_text("hi") == "secondary: hi"
+        assert provider.backends[0].stats.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_degraded_backend_trips_circuit(self):
+        primary = TimedProvider("primary", fail=True)
+        secondary = TimedProvider("secondary")
+        provider = HedgedProvider([primary, secondary], min_samples=3, reset_timeout=60)
+
+        for _ in range(5):
+            await provider.generate_text("hi")
+
+        assert primary.calls == 3
+        assert provider.backend_stats()["backends"]["primary"]["circuit"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_all_backends_failing_raises(self):
+        provider = HedgedProvider([TimedProvider("a", fail=True), TimedProvider("b", fail=True)])
+
+        with pytest.raises(NoBackendAvailableError) as excinfo:
+            await provider.generate_text("hi")
+
+        assert isinstance(excinfo.value.__cause__, ConnectionError)
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_first_chunk(self):
+        provider = HedgedProvider([TimedProvider("primary", fail=True), TimedProvider("secondary")])
+
+        chunks = [chunk async for chunk in provider.generate_stream("hi")]
+
+        assert "".join(chunks) == "secondary says hi"
+        assert provider.failovers == 1
+
+    @pytest.mark.asyncio
+    async def test_structured_requests_only_race_capable_backends(self):
+        text_only = TimedProvider("text")
+        text_only.capabilities.structured_output = False
+        structured = StructuredProvider("structured", delay=0.05)
+        provider = HedgedProvider([text_only, structured], initial_hedge_delay=0.01)
+
+        result = await provider.generate_structured("hi", {"type": "object"})
+
+        assert provider.capabilities.structured_output
+        assert result == {"backend": "structured"}
+        assert text_only.calls == 0
+        assert provider.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_no_capable_backend_raises(self):
+        text_only = TimedProvider("text")
+        text_only.capabilities.streaming = False
+        provider = HedgedProvider([text_only])
+
+        assert not provider.capabilities.streaming
+        with pytest.raises(NoBackendAvailableError, match="streaming"):
+            _ = [chunk async for chunk in provider.generate_stream("hi")]
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open_raises_without_sending(self):
+        backend = TimedProvider("a", fail=True)
+        provider = HedgedProvider([backend], min_samples=2, reset_timeout=60)
+        for _ in range(2):
+            with pytest.raises(NoBackendAvailableError):
+                await provider.generate_text("hi")
+
+        with pytest.raises(NoBackendAvailableError, match="circuit is open"):
+            await provider.generate_text("hi")
+
+        assert backend.calls == 2
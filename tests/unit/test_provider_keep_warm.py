@@ -0,0 +1,197 @@
+"""Tests for predictive keep-warm scheduling and cold-start masking."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from lift_sys.providers.keep_warm import DemandForecaster, KeepWarmProvider, WarmState
+from lift_sys.providers.mock import MockProvider
+from lift_sys.providers.modal_provider import ModalProvider
+
+HOUR = 3600.0
+WEEK = 7 * 24 * HOUR
+
+
+class FakeClock:
+    def __init__(self, now: float = 10 * WEEK):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ColdStartEndpoint:
+    """Fake Modal app whose GPU container takes ``cold_start`` seconds to load.
+
+    The health endpoint never starts the container; warmup and generate
+    requests wait for it to load. ``scale_down()`` simulates the idle timeout.
+    """
+
+    def __init__(self, cold_start: float = 0.3):
+        self.cold_start = cold_start
+        self.paths: list[str] = []
+        self.boots = 0
+        self._container: asyncio.Task | None = None
+
+    def scale_down(self) -> None:
+        self._container = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "healthy"})
+        if self._container is None:
+            self.boots += 1
+            self._container = asyncio.ensure_future(asyncio.sleep(self.cold_start))
+        await asyncio.shield(self._container)
+        if request.url.path == "/warmup":
+            return httpx.Response(200, json={"status": "warm"})
+        return httpx.Response(200, json={"text": {"backend": "modal"}})
+
+
+def modal_provider(endpoint: ColdStartEndpoint) -> ModalProvider:
+    provider = ModalProvider("http://modal.test/generate", batch_window=0)
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(endpoint))
+    return provider
+
+
+def fallback_provider() -> MockProvider:
+    fallback = MockProvider()
+    fallback.set_structured_response({"backend": "fallback"})
+    return fallback
+
+
+class TestDemandForecaster:
+    def test_recent_traffic_decays(self):
+        clock = FakeClock()
+        forecaster = DemandForecaster(half_life=60, clock=clock)
+        for _ in range(10):
+            forecaster.record()
+
+        busy = forecaster.demand_probability(horizon=120)
+        clock.now += 600
+        idle = forecaster.demand_probability(horizon=120)
+
+        assert busy > 0.9
+        assert idle < 0.05
+
+    def test_same_slot_last_week_predicts_demand(self):
+        clock = FakeClock(10 * WEEK + 9 * HOUR)
+        forecaster = DemandForecaster(half_life=60, clock=clock)
+        for minute in range(10):
+            forecaster.record(clock.now + minute * 60)
+
+        # A week later, ten minutes before the usual 9:00 traffic
+        clock.now += WEEK - 600
+        assert forecaster.demand_probability(horizon=120) < 0.05
+        assert forecaster.demand_probability(horizon=120, lead=600) > 0.5
+
+
+class TestColdStartMasking:
+    @pytest.mark.asyncio
+    async def test_cold_primary_is_masked_by_fallback_while_warming(self):
+        endpoint = ColdStartEndpoint(cold_start=0.3)
+        provider = KeepWarmProvider(
+            modal_provider(endpoint), fallback=fallback_provider(), cold_start_threshold=0.2
+        )
+
+        first = await provider.generate_structured("prompt", {})
+        assert first == {"backend": "fallback"}
+        assert provider.state is WarmState.WARMING
+
+        assert await provider.warm_up()
+        second = await provider.generate_structured("prompt", {})
+        await provider.stop()
+
+        assert second == {"backend": "modal"}
+        assert endpoint.paths == ["/warmup", "/generate"]
+        stats = provider.keep_warm_stats()
+        assert stats["state"] == "warm"
+        assert stats["fallback_requests"] == 1
+        assert stats["primary_requests"] == 1
+        assert stats["cold_starts"] == 1
+        assert stats["cold_start_requests"] == 0
+        assert stats["max_cold_start_seconds"] >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_request_that_hits_a_cold_container_is_counted(self):
+        endpoint = ColdStartEndpoint(cold_start=0.3)
+        clock = FakeClock()
+        provider = KeepWarmProvider(
+            modal_provider(endpoint), cold_start_threshold=0.2, scaledown_window=120, clock=clock
+        )
+        await provider.warm_up()
+
+        # Believed warm, but the container was reclaimed early
+        endpoint.scale_down()
+        clock.now += 10
+        result = await provider.generate_structured("prompt", {})
+        await provider.stop()
+
+        assert result == {"backend": "modal"}
+        assert provider.metrics.cold_start_requests == 1
+        assert provider.metrics.cold_start_rate == 1.0
+
+
+class TestKeepWarmScheduler:
+    @pytest.mark.asyncio
+    async def test_pings_only_while_demand_is_expected(self):
+        endpoint = ColdStartEndpoint(cold_start=0)
+        clock = FakeClock()
+        provider = KeepWarmProvider(
+            modal_provider(endpoint),
+            scaledown_window=120,
+            forecaster=DemandForecaster(half_life=60, clock=clock),
+            clock=clock,
+        )
+
+        # No traffic yet: let the container stay cold
+        assert not await provider.tick()
+
+        for _ in range(5):
+            provider.forecaster.record()
+        assert await provider.tick()
+        assert provider.state is WarmState.WARM
+
+        # Recently pinged: no need to ping again
+        clock.now += 30
+        assert not await provider.tick()
+
+        clock.now += 40
+        assert await provider.tick()
+
+        # Traffic stopped: pings stop so the container can scale down
+        clock.now += 1800
+        assert not await provider.tick()
+        assert provider.state is WarmState.COLD
+        assert provider.metrics.warmup_pings == 2
+        assert endpoint.paths == ["/warmup", "/warmup"]
+
+    @pytest.mark.asyncio
+    async def test_scheduler_task_warms_ahead_of_weekly_traffic(self):
+        endpoint = ColdStartEndpoint(cold_start=0)
+        clock = FakeClock(10 * WEEK + 9 * HOUR)
+        forecaster = DemandForecaster(half_life=60, clock=clock)
+        for minute in range(10):
+            forecaster.record(clock.now + minute * 60)
+        clock.now += WEEK - 300
+        provider = KeepWarmProvider(
+            modal_provider(endpoint),
+            expected_cold_start=420,
+            check_interval=0.01,
+            forecaster=forecaster,
+            clock=clock,
+        )
+
+        provider.start()
+        await asyncio.sleep(0.05)
+        await provider.stop()
+
+        assert endpoint.paths[0] == "/warmup"
+        assert provider.state is WarmState.WARM
+
+    def test_warmup_url_derived_from_label_url(self):
+        provider = ModalProvider("https://rand--qwen-80b-generate.modal.run")
+
+        assert provider.warmup_url == "https://rand--qwen-80b-warmup.modal.run"
@@ -0,0 +1,256 @@
+"""Tests for incremental provider streaming against a local fake SSE server."""
+
+import asyncio
+import inspect
+import json
+
+import pytest
+from anthropic.resources.messages import AsyncMessages
+
+from lift_sys.providers.anthropic_provider import AnthropicProvider
+from lift_sys.providers.modal_provider import ModalProvider
+from lift_sys.providers.streaming import StreamMetrics, iter_sse, measure_stream
+
+
+class FakeSSEServer:
+    """Minimal HTTP server that answers every POST with a server-sent event stream."""
+
+    def __init__(self, events: list[str], delay: float = 0.0, first_delay: float = 0.0):
+        self.events = events
+        self.delay = delay
+        self.first_delay = first_delay
+        self.requests: list[tuple[str, dict]] = []
+        self.sent = 0
+        self.client_closed = asyncio.Event()
+
+    async def __aenter__(self) -> "FakeSSEServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request_line = (await reader.readline()).decode()
+        headers = {}
+        while (line := (await reader.readline()).decode().strip()) != "":
+            name, _, value = line.partition(":")
+            headers[name.lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        self.requests.append((request_line.split()[1], json.loads(body or b"{}")))
+
+        async def watch_disconnect() -> None:
+            await reader.read()
+            self.client_closed.set()
+
+        watcher = asyncio.create_task(watch_disconnect())
+        writer.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+            b"cache-control: no-cache\r\nconnection: close\r\n\r\n"
+        )
+        try:
+            await asyncio.sleep(self.first_delay)
+            for event in self.events:
+                if self.client_closed.is_set():
+                    break
+                writer.write(event.encode())
+                await writer.drain()
+                self.sent += 1
+                await asyncio.sleep(self.delay)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            watcher.cancel()
+
+
+def sse(data: dict | str, event: str | None = None) -> str:
+    payload = data if isinstance(data, str) else json.dumps(data)
+    return (f"event: {event}\n" if event else "") + f"data: {payload}\n\n"
+
+
+def anthropic_events(words: list[str]) -> list[str]:
+    message = {
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "content": [],
+        "model": "claude-test",
+        "stop_reason": None,
+        "stop_sequence": None,
+        "usage": {"input_tokens": 3, "output_tokens": 1},
+    }
+    events = [
+        sse({"type": "message_start", "message": message}, "message_start"),
+        sse(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+            "content_block_start",
+        ),
+    ]
+    events += [
+        sse(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": word},
+            },
+            "content_block_delta",
+        )
+        for word in words
+    ]
+    events += [
+        sse({"type": "content_block_stop", "index": 0}, "content_block_stop"),
+        sse(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": len(words)},
+            },
+            "message_delta",
+        ),
+        sse({"type": "message_stop"}, "message_stop"),
+    ]
+    return events
+
+
+async def modal_provider(server: FakeSSEServer) -> ModalProvider:
+    provider = ModalProvider(f"{server.url}/generate", stream_url=f"{server.url}/generate_stream")
+    await provider.initialize({})
+    return provider
+
+
+class TestSSEHelpers:
+    @pytest.mark.asyncio
+    async def test_iter_sse_parses_events(self):
+        async def lines():
+            for line in [": keep-alive", "event: delta", "data: a", "data: b", "", "data: c"]:
+                yield line
+
+        assert [event async for event in iter_sse(lines())] == [
+            ("delta", "a\nb"),
+            ("message", "c"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_measure_stream_records_outcomes(self):
+        async def chunks():
+            for chunk in ["", "a", "b", "c"]:
+                yield chunk
+
+        metrics = StreamMetrics()
+        assert [chunk async for chunk in measure_stream(chunks(), metrics)] == ["a", "b", "c"]
+
+        stream = measure_stream(chunks(), metrics)
+        assert await stream.__anext__() == "a"
+        await stream.aclose()
+
+        assert metrics.streams_started == 2
+        assert metrics.streams_completed == 1
+        assert metrics.streams_cancelled == 1
+        assert metrics.chunks == 4
+        assert metrics.ttft_count == 2
+        assert metrics.to_dict()["time_to_first_token"]["count"] == 2
+
+
+class TestModalStreaming:
+    @pytest.mark.asyncio
+    async def test_streams_tokens_incrementally(self):
+        events = [sse({"text": "def "}), sse({"choices": [{"text": "add"}]}), sse("[DONE]")]
+        async with FakeSSEServer(events, first_delay=0.05) as server:
+            provider = await modal_provider(server)
+            try:
+                chunks = [c async for c in provider.generate_stream("prompt", max_tokens=8)]
+            finally:
+                await provider.aclose()
+
+        assert chunks == ["def ", "add"]
+        path, payload = server.requests[0]
+        assert path == "/generate_stream"
+        assert payload["stream"] is True and payload["max_tokens"] == 8
+        assert provider.stream_metrics.streams_completed == 1
+        assert provider.stream_metrics.last_ttft >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_disconnects(self):
+        events = [sse({"text": f"token{i} "}) for i in range(200)]
+        async with FakeSSEServer(events, delay=0.01) as server:
+            provider = await modal_provider(server)
+            try:
+                stream = provider.generate_stream("prompt")
+                received = [await stream.__anext__(), await stream.__anext__()]
+                await stream.aclose()
+                await asyncio.wait_for(server.client_closed.wait(), timeout=2)
+            finally:
+                await provider.aclose()
+
+        assert received == ["token0 ", "token1 "]
+        assert server.sent < len(events)
+        assert provider.stream_metrics.streams_cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_error_event_raises(self):
+        async with FakeSSEServer([sse({"error": "model overloaded"})]) as server:
+            provider = await modal_provider(server)
+            try:
+                with pytest.raises(ValueError, match="model overloaded"):
+                    _ = [c async for c in provider.generate_stream("prompt")]
+            finally:
+                await provider.aclose()
+
+        assert provider.stream_metrics.streams_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_streaming_requires_configured_endpoint(self):
+        provider = ModalProvider("https://rand--qwen-80b-generate.modal.run")
+
+        assert provider.stream_url is None
+        assert not provider.supports_streaming
+        assert not provider.capabilities.streaming
+        with pytest.raises(NotImplementedError, match="stream_url"):
+            _ = [c async for c in provider.generate_stream("prompt")]
+
+
+@pytest.mark.skipif(
+    "temperature" not in inspect.signature(AsyncMessages.stream).parameters,
+    reason="installed anthropic SDK does not accept temperature",
+)
+class TestAnthropicStreaming:
+    @pytest.mark.asyncio
+    async def test_streams_text_deltas(self):
+        async with FakeSSEServer(anthropic_events(["Hello", ", ", "world"])) as server:
+            provider = AnthropicProvider()
+            await provider.initialize({"api_key": "test-key", "base_url": server.url})
+            try:
+                chunks = [c async for c in provider.generate_stream("Hi", max_tokens=16)]
+            finally:
+                await provider.aclose()
+
+        assert chunks == ["Hello", ", ", "world"]
+        path, payload = server.requests[0]
+        assert path == "/v1/messages"
+        assert payload["stream"] is True
+        assert payload["max_tokens"] == 16
+        assert provider.stream_metrics.ttft_count == 1
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_disconnects(self):
+        words = [f"w{i} " for i in range(200)]
+        async with FakeSSEServer(anthropic_events(words), delay=0.01) as server:
+            provider = AnthropicProvider()
+            await provider.initialize({"api_key": "test-key", "base_url": server.url})
+            try:
+                stream = provider.generate_stream("Hi")
+                assert await stream.__anext__() == "w0 "
+                await stream.aclose()
+                await asyncio.wait_for(server.client_closed.wait(), timeout=2)
+            finally:
+                await provider.aclose()
+
+        assert server.sent < len(words)
+        assert provider.stream_metrics.streams_cancelled == 1
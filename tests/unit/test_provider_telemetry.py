@@ -0,0 +1,144 @@
+"""Tests for per-call provider telemetry and the Prometheus export."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from lift_sys.api.server import app
+from lift_sys.providers.caching import CachingProvider, DiskResponseStore
+from lift_sys.providers.mock import MockProvider
+from lift_sys.providers.modal_provider import ModalProvider
+from lift_sys.providers.telemetry import TELEMETRY, Histogram, record_usage
+from lift_sys.services.http_pool import get_http_pool
+
+
+@pytest.fixture(autouse=True)
+def clean_telemetry():
+    TELEMETRY.reset()
+    yield
+    TELEMETRY.reset()
+
+
+class SlowStreamProvider(MockProvider):
+    """Mock provider that reports usage and streams chunks with a delay."""
+
+    async def generate_stream(self, prompt: str, **kwargs):
+        await asyncio.sleep(0.05)
+        record_usage(input_tokens=120, output_tokens=3)
+        for chunk in ("a", "b", "c"):
+            yield chunk
+            await asyncio.sleep(0.01)
+
+
+class RecordingProvider(MockProvider):
+    async def generate_text(self, prompt: str, **kwargs):
+        return await super().generate_text(prompt, **kwargs)
+
+
+def modal_provider(handler) -> ModalProvider:
+    provider = ModalProvider("http://modal.test/generate", batch_window=0)
+    provider._client = get_http_pool().create_async_client(
+        inner_transport=httpx.MockTransport(handler)
+    )
+    return provider
+
+
+class TestHistogram:
+    def test_percentiles_have_bounded_relative_error(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.record(value / 1000)
+
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=1 / 32)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=1 / 32)
+        assert histogram.percentile(100) == 1.0
+
+    def test_cumulative_buckets(self):
+        histogram = Histogram(bounds=(1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.record(value)
+
+        assert histogram.cumulative_buckets() == [(1, 2), (10, 3), (float("inf"), 4)]
+
+
+class TestCallTelemetry:
+    @pytest.mark.asyncio
+    async def test_modal_usage_retries_and_cost_are_recorded(self):
+        responses = iter(
+            [
+                httpx.Response(503, headers={"retry-after": "0"}),
+                httpx.Response(200, json={"text": {}, "prompt_tokens": 900, "tokens_used": 40}),
+            ]
+        )
+        provider = modal_provider(lambda request: next(responses))
+
+        await provider.generate_structured("prompt", {})
+        await provider.aclose()
+
+        series = TELEMETRY.summary()["modal.generate_structured"]
+        assert series["requests"] == {"success": 1}
+        assert series["retries"] == 1
+        assert (series["input_tokens"], series["output_tokens"]) == (900, 40)
+        assert series["cost_usd"] > 0
+
+    @pytest.mark.asyncio
+    async def test_stream_time_to_first_chunk(self):
+        provider = SlowStreamProvider()
+
+        chunks = [chunk async for chunk in provider.generate_stream("prompt")]
+
+        assert chunks == ["a", "b", "c"]
+        series = TELEMETRY.summary()["mock.generate_stream"]
+        assert series["input_tokens"] == 120
+        ttft = series["ttft_seconds"]["p50"]
+        assert 0.04 <= ttft < series["latency_seconds"]["p50"]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_and_errors_are_counted(self):
+        provider = SlowStreamProvider()
+        stream = provider.generate_stream("prompt")
+        await stream.__anext__()
+        await stream.aclose()
+
+        provider = modal_provider(lambda request: httpx.Response(500, text="boom"))
+        with pytest.raises(ValueError):
+            await provider.generate_structured("prompt", {})
+
+        summary = TELEMETRY.summary()
+        assert summary["mock.generate_stream"]["requests"] == {"cancelled": 1}
+        assert summary["modal.generate_structured"]["requests"] == {"error": 1}
+
+    @pytest.mark.asyncio
+    async def test_super_calls_are_recorded_once(self):
+        await RecordingProvider().generate_text("prompt")
+
+        assert TELEMETRY.summary()["mock.generate_text"]["requests"] == {"success": 1}
+
+    @pytest.mark.asyncio
+    async def test_caching_wrapper_has_its_own_series(self, tmp_path):
+        provider = CachingProvider(MockProvider(), DiskResponseStore(tmp_path))
+
+        await provider.generate_text("prompt", temperature=0.0)
+        await provider.generate_text("prompt", temperature=0.0)
+
+        summary = TELEMETRY.summary()
+        assert summary["mock.generate_text"]["requests"] == {"success": 1}
+        assert summary["cache-mock.generate_text"]["requests"] == {"success": 2}
+
+
+class TestPrometheusEndpoint:
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_exports_provider_series(self):
+        await MockProvider().generate_text("prompt")
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        labels = 'provider="mock",operation="generate_text"'
+        assert f'lift_sys_provider_requests_total{{{labels},outcome="success"}} 1' in body
+        assert f'lift_sys_provider_latency_seconds_bucket{{{labels},le="+Inf"}} 1' in body
+        assert "# TYPE lift_sys_provider_latency_seconds histogram" in body
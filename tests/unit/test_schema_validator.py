@@ -0,0 +1,153 @@
+"""Tests for compiled JSON-schema validation."""
+
+import pytest
+
+from lift_sys.codegen.languages.typescript_schema import TYPESCRIPT_GENERATION_SCHEMA
+from lift_sys.forward_mode.xgrammar_translator import XGrammarIRTranslator
+from lift_sys.ir.models import HoleKind, IntentClause, SigClause, TypedHole
+from lift_sys.ir.schema import IR_JSON_SCHEMA
+from lift_sys.ir.schema_validator import SchemaValidationError, compile_schema
+
+PERSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2},
+        "role": {"enum": ["admin", "user"]},
+        "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1},
+        "manager": {"$ref": "#"},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+
+@pytest.fixture
+def ir_json():
+    return {
+        "intent": {
+            "summary": "Add two integers together",
+            "holes": [{"identifier": "overflow", "type_hint": "bool", "kind": "intent"}],
+        },
+        "signature": {
+            "name": "add",
+            "parameters": [
+                {"name": "a", "type_hint": "int"},
+                {"name": "b", "type_hint": "int", "description": "second operand"},
+            ],
+            "returns": "int",
+        },
+        "effects": [{"description": "Pure function"}],
+        "assertions": [{"predicate": "result == a + b"}],
+        "metadata": {"origin": "test"},
+    }
+
+
+class TestCompiledSchema:
+    def test_valid_document_is_returned_unchanged(self):
+        validator = compile_schema(PERSON_SCHEMA)
+        document = {"name": "Ada", "role": "admin", "tags": ["math"]}
+
+        assert validator.validate(document) is document
+        assert validator.is_valid(document)
+
+    def test_collects_every_error_with_paths(self):
+        validator = compile_schema(PERSON_SCHEMA)
+        errors = validator.errors({"role": "root", "tags": [], "extra": 1})
+
+        assert [str(error) for error in errors] == [
+            "Missing 'name'",
+            "role: must be one of ['admin', 'user']",
+            "tags: cannot be empty",
+            "unexpected property 'extra'",
+        ]
+
+    def test_nested_paths_and_recursive_refs(self):
+        validator = compile_schema(PERSON_SCHEMA)
+        errors = validator.errors({"name": "Ada", "manager": {"name": "B", "tags": ["x", 3]}})
+
+        assert [str(error) for error in errors] == [
+            "manager.name: must be at least 2 characters",
+            "manager.tags[1]: expected string, got integer",
+        ]
+
+    def test_validate_raises_value_error_listing_errors(self):
+        validator = compile_schema(PERSON_SCHEMA)
+
+        with pytest.raises(ValueError, match="Missing 'name'") as exc_info:
+            validator.validate({"tags": [1]})
+
+        assert isinstance(exc_info.value, SchemaValidationError)
+        assert len(exc_info.value.errors) == 2
+
+    def test_error_message_is_truncated(self):
+        validator = compile_schema({"type": "array", "items": {"type": "string"}})
+
+        with pytest.raises(SchemaValidationError, match=r"\(\+3 more\)"):
+            validator.validate(list(range(8)))
+
+    def test_one_of_reports_closest_branch(self):
+        validator = compile_schema(
+            {
+                "oneOf": [
+                    {"type": "object", "required": ["a", "b"]},
+                    {"type": "object", "required": ["c"]},
+                ]
+            }
+        )
+
+        assert validator.is_valid({"c": 1})
+        assert [str(error) for error in validator.errors({"a": 1})] == ["Missing 'b'"]
+
+    def test_factories_convert_valid_nodes(self):
+        validator = compile_schema(
+            PERSON_SCHEMA, factories={"#/properties/tags": lambda tags: tuple(tags)}
+        )
+
+        converted = validator.validate({"name": "Ada", "tags": ["x"]})
+
+        assert converted == {"name": "Ada", "tags": ("x",)}
+        with pytest.raises(ValueError, match="unknown schema nodes"):
+            compile_schema(PERSON_SCHEMA, factories={"#/properties/missing": dict})
+
+    def test_factory_skipped_when_subtree_invalid(self):
+        calls = []
+        validator = compile_schema(
+            PERSON_SCHEMA, factories={"#": lambda value: calls.append(value) or "converted"}
+        )
+
+        assert validator.validate({"name": "Ada"}) == "converted"
+        assert validator.errors({"name": 1})
+        assert len(calls) == 1
+
+
+class TestGenerationSchemas:
+    def test_ir_schema_converts_to_clauses(self, ir_json):
+        ir = XGrammarIRTranslator(provider=None)._json_to_ir(ir_json, language="python")
+
+        assert isinstance(ir.intent, IntentClause)
+        assert isinstance(ir.signature, SigClause)
+        assert ir.intent.holes == [
+            TypedHole(identifier="overflow", type_hint="bool", kind=HoleKind.INTENT)
+        ]
+        assert [p.name for p in ir.signature.parameters] == ["a", "b"]
+        assert ir.signature.parameters[1].description == "second operand"
+        assert ir.effects[0].description == "Pure function"
+        assert ir.assertions[0].predicate == "result == a + b"
+        assert ir.metadata.language == "python"
+        assert ir.metadata.origin == "test"
+
+    def test_ir_schema_errors_point_at_clause(self, ir_json):
+        ir_json["signature"]["parameters"][1] = {"name": "B"}
+
+        errors = compile_schema(IR_JSON_SCHEMA).errors(ir_json)
+
+        assert [str(error) for error in errors] == [
+            "signature.parameters[1]: Missing 'type_hint'",
+            "signature.parameters[1].name: does not match pattern '^[a-z_][a-z0-9_]*$'",
+        ]
+
+    def test_typescript_schema(self):
+        validator = compile_schema(TYPESCRIPT_GENERATION_SCHEMA)
+
+        with pytest.raises(SchemaValidationError, match="Missing 'implementation'"):
+            validator.validate({})
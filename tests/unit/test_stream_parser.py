@@ -0,0 +1,180 @@
+"""Tests for incremental JSON parsing of streamed LLM output."""
+
+import json
+
+import pytest
+
+from lift_sys.codegen.xgrammar_generator import XGrammarCodeGenerator
+from lift_sys.forward_mode.xgrammar_translator import XGrammarIRTranslator
+from lift_sys.ir.models import SigClause
+from lift_sys.ir.schema import IR_JSON_SCHEMA
+from lift_sys.ir.schema_validator import SchemaValidationError, compile_schema
+from lift_sys.ir.stream_parser import JSONStreamError, StreamingJSONParser
+from lift_sys.providers.mock import MockProvider
+
+IR_DOCUMENT = {
+    "intent": {"summary": "Add two integers together"},
+    "signature": {
+        "name": "add",
+        "parameters": [
+            {"name": "a", "type_hint": "int"},
+            {"name": "b", "type_hint": "int", "description": 'quote " and \\ escapes'},
+        ],
+        "returns": "int",
+    },
+    "effects": [{"description": "Pure function"}],
+    "assertions": [{"predicate": "result == a + b"}],
+    "metadata": {"origin": "test", "evidence": [{"values": [1, -2.5e3, True, None]}]},
+}
+
+
+class ChunkedProvider(MockProvider):
+    """Mock provider that streams its response in small chunks."""
+
+    def __init__(self, response: str, chunk_size: int = 4):
+        super().__init__()
+        self.capabilities.structured_output = False
+        self.response = response
+        self.chunk_size = chunk_size
+        self.sent = 0
+        self.closed = False
+
+    async def generate_stream(self, prompt: str, **kwargs):
+        try:
+            for start in range(0, len(self.response), self.chunk_size):
+                self.sent = start + self.chunk_size
+                yield self.response[start : start + self.chunk_size]
+        finally:
+            self.closed = True
+
+
+def fenced(document) -> str:
+    return f"Here is the IR:\n```json\n{json.dumps(document, indent=2)}\n```\nDone."
+
+
+class TestStreamingJSONParser:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 10_000])
+    def test_parses_fenced_output_in_any_chunking(self, chunk_size):
+        text = fenced(IR_DOCUMENT)
+        parser = StreamingJSONParser(compile_schema(IR_JSON_SCHEMA))
+
+        for start in range(0, len(text), chunk_size):
+            parser.feed(text[start : start + chunk_size])
+
+        assert parser.done
+        assert parser.finish() == IR_DOCUMENT
+
+    def test_delivers_completed_fields_before_the_end(self):
+        text = json.dumps(IR_DOCUMENT)
+        delivered = []
+        parser = StreamingJSONParser(
+            compile_schema(IR_JSON_SCHEMA),
+            on_value=lambda path, value: delivered.append((path, value)),
+        )
+
+        parser.feed(text[: text.index('"effects"')])
+
+        assert delivered == [
+            (("intent",), IR_DOCUMENT["intent"]),
+            (("signature",), IR_DOCUMENT["signature"]),
+        ]
+        assert not parser.done
+
+    def test_unexpected_property_fails_on_its_name(self):
+        parser = StreamingJSONParser(compile_schema(IR_JSON_SCHEMA))
+
+        with pytest.raises(SchemaValidationError, match="signature: unexpected property 'ret'"):
+            parser.feed('{"signature": {"name": "add", "ret"')
+
+    def test_wrong_container_type_fails_on_open_bracket(self):
+        parser = StreamingJSONParser(compile_schema(IR_JSON_SCHEMA))
+
+        with pytest.raises(SchemaValidationError, match="effects: expected array, got object"):
+            parser.feed('{"effects": {')
+
+    def test_completed_value_is_validated(self):
+        parser = StreamingJSONParser(compile_schema(IR_JSON_SCHEMA))
+
+        with pytest.raises(SchemaValidationError, match=r"signature.parameters\[0\]: Missing"):
+            parser.feed('{"signature": {"name": "add", "parameters": [{"name": "a"}')
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ('{"a": 1 "b"', "expected ',' or a closing bracket"),
+            ('{"a" 1}', "expected ':'"),
+            ('{"a": [1,]}', r"in a: expected a value"),
+            ('{"a": 1.}', "invalid token '1.'"),
+            ('{"a": nul!}', "expected a value"),
+        ],
+    )
+    def test_syntax_errors(self, text, message):
+        with pytest.raises(JSONStreamError, match=message):
+            StreamingJSONParser().feed(text)
+
+    def test_incomplete_output(self):
+        parser = StreamingJSONParser()
+        parser.feed('{"a": [1, 2')
+
+        with pytest.raises(JSONStreamError, match="ended before"):
+            parser.finish()
+        with pytest.raises(JSONStreamError, match="No JSON object"):
+            StreamingJSONParser().finish()
+
+    @pytest.mark.asyncio
+    async def test_consume_stops_stream_after_document(self):
+        provider = ChunkedProvider('{"a": 1}' + " trailing" * 100)
+        parser = StreamingJSONParser()
+
+        assert await parser.consume(provider.generate_stream("prompt")) == {"a": 1}
+        assert provider.closed
+        assert provider.sent < 20
+
+
+class TestStreamingGeneration:
+    @pytest.mark.asyncio
+    async def test_translator_streams_and_delivers_signature(self):
+        provider = ChunkedProvider(fenced(IR_DOCUMENT))
+        delivered = []
+
+        ir = await XGrammarIRTranslator(provider).translate(
+            "add numbers", on_clause=lambda field, value: delivered.append((field, value))
+        )
+
+        assert [field for field, _ in delivered] == [
+            "intent",
+            "signature",
+            "effects",
+            "assertions",
+            "metadata",
+        ]
+        assert isinstance(delivered[1][1], SigClause)
+        assert ir.signature.name == "add"
+        assert ir.signature.parameters[1].description == 'quote " and \\ escapes'
+
+    @pytest.mark.asyncio
+    async def test_translator_aborts_diverging_stream(self):
+        document = dict(IR_DOCUMENT, signature={"name": "add", "params": []})
+        provider = ChunkedProvider(json.dumps(document) + " " * 1000)
+
+        with pytest.raises(ValueError, match="unexpected property 'params'"):
+            await XGrammarIRTranslator(provider).translate("add numbers", max_retries=1)
+
+        assert provider.closed
+        assert provider.sent < len(provider.response) // 2
+
+    @pytest.mark.asyncio
+    async def test_code_generator_aborts_diverging_stream(self):
+        body = [{"type": "print", "code": "print(a)"}] + [{"type": "return", "code": "x"}] * 50
+        provider = ChunkedProvider(json.dumps({"implementation": {"body_statements": body}}))
+        ir = XGrammarIRTranslator(provider=None)._json_to_ir(IR_DOCUMENT, "python")
+
+        with pytest.raises(
+            SchemaValidationError, match=r"implementation.body_statements\[0\].type: must be one of"
+        ):
+            await XGrammarCodeGenerator(provider)._generate_implementation(
+                ir, {"signature": "def add(a: int, b: int) -> int:"}, attempt=0
+            )
+
+        assert provider.closed
+        assert provider.sent < len(provider.response) // 10
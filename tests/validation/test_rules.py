@@ -0,0 +1,66 @@
+"""Tests for the shared validation keyword rule engine."""
+
+import pytest
+
+from lift_sys.validation.rules import (
+    OPERATION_RULES,
+    VALIDATION_RULES,
+    KeywordRuleSet,
+)
+
+
+class TestKeywordRuleSet:
+    """Test single-pass rule scanning."""
+
+    def test_matches_substring_semantics(self):
+        """A rule matches when any keyword is a substring of the text."""
+        rules = KeywordRuleSet({"loop": ["iterate", "for each"], "cond": ["if"]})
+
+        matches = rules.scan("verify each item, then iterate")
+
+        assert matches.has("loop")
+        assert matches.has("cond")  # "if" inside "verify"
+        assert matches.keywords == {"iterate", "if"}
+
+    def test_reports_overlapping_and_prefix_keywords(self):
+        """Keywords sharing a start position or overlapping are all reported."""
+        rules = KeywordRuleSet({"first": ["first"], "find_first": ["find first"], "find": ["find"]})
+
+        matches = rules.scan("find first match")
+
+        assert matches.rules == {"first", "find_first", "find"}
+
+    def test_agrees_with_naive_scan(self):
+        """Shared rules agree with per-rule any(keyword in text) checks."""
+        texts = [
+            "return the first index immediately when found",
+            "check that dot position is after @ position",
+            "iterate through the list and count the elements",
+            "",
+            "e-mail address must contain at sign",
+        ]
+        for text in texts:
+            expected = {
+                name
+                for name, keywords in VALIDATION_RULES.rules.items()
+                if any(keyword in text for keyword in keywords)
+            }
+            assert VALIDATION_RULES.scan(text).rules == expected
+
+    def test_first_of_respects_priority(self):
+        """first_of returns the earliest matching rule in the given order."""
+        matches = VALIDATION_RULES.scan("split the text and return the words")
+
+        assert matches.first_of(OPERATION_RULES) == "op.split"
+        assert matches.first_of(["op.return", "op.split"]) == "op.return"
+        assert matches.first_of(["op.else"]) is None
+
+    def test_scan_results_are_memoized(self):
+        """Scanning the same text twice reuses the first result."""
+        rules = KeywordRuleSet({"a": ["alpha"]})
+
+        assert rules.scan("alpha beta") is rules.scan("alpha beta")
+
+    def test_empty_keyword_rejected(self):
+        with pytest.raises(ValueError):
+            KeywordRuleSet({"bad": [""]})
@@ -0,0 +1,147 @@
+"""Tests for the process-pool batch SMT verifier."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("z3")
+
+from lift_sys.ir.models import (
+    AssertClause,
+    IntentClause,
+    IntermediateRepresentation,
+    SigClause,
+)
+from lift_sys.verifier.batch import BatchSMTVerifier
+
+pytestmark = pytest.mark.unit
+
+
+def build_ir(*predicates: str) -> IntermediateRepresentation:
+    return IntermediateRepresentation(
+        intent=IntentClause(summary="batch check"),
+        signature=SigClause(name="demo", parameters=[], returns="int"),
+        assertions=[AssertClause(predicate=predicate) for predicate in predicates],
+    )
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    with BatchSMTVerifier(max_workers=2, timeout_s=5.0) as pool:
+        yield pool
+
+
+def test_verify_all_returns_results_in_input_order(verifier: BatchSMTVerifier) -> None:
+    irs = [
+        build_ir("x > 0"),
+        build_ir("x > 0", "x < 0"),
+        build_ir(),
+        build_ir("y >= 2", "y <= 2"),
+    ]
+
+    results = verifier.verify_all(irs)
+
+    assert [outcome.index for outcome in results] == [0, 1, 2, 3]
+    assert [outcome.status for outcome in results] == ["sat", "unsat", "sat", "sat"]
+    assert sorted(results[1].result.unsat_core) == ["x < 0", "x > 0"]
+    assert results[3].result.model["y"] == "2"
+
+
+def test_unsupported_predicate_reports_error(verifier: BatchSMTVerifier) -> None:
+    results = verifier.verify_all([build_ir("len(items) > 0"), build_ir("z == 1")])
+
+    assert results[0].status == "error"
+    assert "ValueError" in results[0].error
+    assert results[1].status == "sat"
+
+
+def test_affinity_keeps_incremental_checks_consistent(verifier: BatchSMTVerifier) -> None:
+    first = verifier.verify_all([build_ir("a > 1"), build_ir("b > 1")], affinity=["s1", "s2"])
+    second = verifier.verify_all(
+        [build_ir("a > 1", "a < 0"), build_ir("b > 1")], affinity=["s1", "s2"]
+    )
+
+    assert [outcome.status for outcome in first] == ["sat", "sat"]
+    assert [outcome.status for outcome in second] == ["unsat", "sat"]
+
+    with pytest.raises(ValueError):
+        verifier.verify_all([build_ir("a > 1")], affinity=["s1", "s2"])
+
+
+def test_assumptions_are_applied_to_every_ir(verifier: BatchSMTVerifier) -> None:
+    results = verifier.verify_all([build_ir("x > 0"), build_ir("x < 0")], assumptions=[("x", 3)])
+
+    assert [outcome.status for outcome in results] == ["sat", "unsat"]
+    assert "x == 3" in results[1].result.unsat_core
+
+
+@pytest.mark.asyncio
+async def test_averify_iter_streams_every_result(verifier: BatchSMTVerifier) -> None:
+    irs = [build_ir(f"v > {n}") for n in range(6)]
+
+    seen = [outcome async for outcome in verifier.averify_iter(irs)]
+
+    assert sorted(outcome.index for outcome in seen) == list(range(6))
+    assert all(outcome.status == "sat" for outcome in seen)
+
+
+def test_concurrent_batches_share_the_pool(verifier: BatchSMTVerifier) -> None:
+    def run(offset: int) -> list[str]:
+        irs = [build_ir(f"w > {offset + n}", f"w < {offset + n}") for n in range(3)]
+        return [outcome.status for outcome in verifier.verify_all(irs)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        statuses = list(executor.map(run, range(4)))
+
+    assert statuses == [["unsat"] * 3] * 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_batches_are_routed_to_their_caller(
+    verifier: BatchSMTVerifier,
+) -> None:
+    async def run(key: str, predicate: str) -> list[str]:
+        return [
+            outcome.status
+            async for outcome in verifier.averify_iter([build_ir(predicate)], affinity=[key])
+        ]
+
+    results = await asyncio.gather(run("s1", "m > 0"), run("s2", "m > 0 and m < 0"))
+
+    assert results == [["sat"], ["unsat"]]
+
+
+def test_abandoned_generator_frees_workers() -> None:
+    with BatchSMTVerifier(max_workers=1, timeout_s=5.0) as pool:
+        outcomes = pool.verify_iter([build_ir(f"x > {n}") for n in range(4)])
+        next(outcomes)
+        outcomes.close()
+
+        [outcome] = pool.verify_all([build_ir("y > 0")])
+
+        assert outcome.status == "sat"
+        assert pool._workers[0].current is None
+        assert not pool._in_flight
+
+
+def test_hard_timeout_restarts_worker() -> None:
+    with BatchSMTVerifier(max_workers=1, timeout_s=None, hard_timeout_s=0.0) as pool:
+        # Nothing can finish within a zero-second budget
+        [outcome] = pool.verify_all([build_ir("x > 0")])
+        assert outcome.status == "timeout"
+        assert outcome.result is None
+
+        pool.hard_timeout_s = 60.0
+        [outcome] = pool.verify_all([build_ir("x > 0")])
+        assert outcome.status == "sat"
+
+
+def test_closed_verifier_rejects_work() -> None:
+    pool = BatchSMTVerifier(max_workers=1)
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.verify_all([build_ir("x > 0")])
@@ -56,3 +56,103 @@ def test_verifier_returns_model_for_counterexample() -> None:
 
     assert status == "SAT"
     assert result.model  # A witness should be produced for the counterexample search.
+
+
+def test_unsat_core_names_conflicting_assertions() -> None:
+    """Only the contradictory assertions are reported in the unsat core."""
+
+    ir = build_ir_with_assertions("x > 5", "x < 3", "y > 0")
+
+    result = SMTChecker().verify(ir)
+
+    assert not result.success
+    assert sorted(result.unsat_core) == ["x < 3", "x > 5"]
+
+
+def test_model_excludes_tracking_literals() -> None:
+    """Internal assertion trackers never leak into the reported model."""
+
+    result = SMTChecker().verify(build_ir_with_assertions("x > 5"))
+
+    assert set(result.model) == {"x"}
+
+
+def test_reverification_reuses_compiled_terms_and_scopes() -> None:
+    """Changing one assertion only pops and pushes the affected scopes."""
+
+    checker = SMTChecker()
+    checker.verify(build_ir_with_assertions("x > 0", "x < 10", "x != 5"))
+    assert checker.solver.num_scopes() == 3
+
+    compiled_before = dict(checker._terms)
+    result = checker.verify(build_ir_with_assertions("x > 0", "x < 10", "x != 6"))
+
+    assert result.success
+    assert checker.solver.num_scopes() == 3
+    assert checker._scopes == ["x > 0", "x < 10", "x != 6"]
+    assert checker._terms["x > 0"] is compiled_before["x > 0"]
+
+
+def test_term_cache_eviction_keeps_terms_of_current_check() -> None:
+    """A check larger than the cache still compiles and evicts only unused terms."""
+
+    checker = SMTChecker(max_cached_terms=2)
+    checker.verify(build_ir_with_assertions("x > 1"))
+
+    result = checker.verify(build_ir_with_assertions("x > 2", "x > 3", "x > 4"))
+
+    assert result.success
+    assert checker._scopes == ["x > 2", "x > 3", "x > 4"]
+
+    assert not checker.verify(build_ir_with_assertions("x > 2", "x < 0")).success
+    assert "x > 1" not in checker._terms
+
+
+def test_removed_assertions_no_longer_constrain() -> None:
+    """Dropping a conflicting assertion makes the IR satisfiable again."""
+
+    checker = SMTChecker()
+    assert not checker.verify(build_ir_with_assertions("x > 5", "x < 3")).success
+
+    result = checker.verify(build_ir_with_assertions("x > 5"))
+
+    assert result.success
+    assert result.unsat_core == []
+
+
+def test_assumptions_participate_in_unsat_core() -> None:
+    """Assumption bindings are reported in the core when they conflict."""
+
+    result = SMTChecker().verify(build_ir_with_assertions("x > 5"), assumptions=[("x", 1)])
+
+    assert not result.success
+    assert sorted(result.unsat_core) == ["x == 1", "x > 5"]
+
+
+def test_invalid_predicate_keeps_existing_scopes() -> None:
+    """A predicate that fails to compile does not disturb the solver state."""
+
+    checker = SMTChecker()
+    checker.verify(build_ir_with_assertions("x > 0"))
+
+    with pytest.raises(ValueError):
+        checker.verify(build_ir_with_assertions("x > 0", "len(x) > 0"))
+
+    assert checker._scopes == ["x > 0"]
+
+
+def test_per_check_timeout_reports_unknown() -> None:
+    """A tight per-check timeout yields an unknown result instead of hanging."""
+
+    checker = SMTChecker(timeout_ms=60_000)
+    ir = build_ir_with_assertions(
+        "a > 0 and b > 0 and c > 0",
+        "a * a * a + b * b * b == c * c * c",
+        "a * b * c > 1000",
+    )
+
+    result = checker.verify(ir, timeout_ms=1)
+
+    assert result.success or result.reason is not None
+    if not result.success:
+        assert result.reason.startswith(("unknown", "unsat"))